@@ -156,12 +156,12 @@ public class InvestmentController : ControllerBase
 
             var positions = await _investmentRepository.GetByUserIdAsync(userId);
 
+            // One batch for the whole portfolio; snapshots are reused until each position's next sync
+            var rewards = _rewardCalculation.GetPortfolioRewards(positions);
+
             var response = positions.Select(p =>
             {
-                var daysHeld = _rewardCalculation.CalculateDaysHeld(p.StartDate ?? p.CreatedAt);
-                var dailyReward = _rewardCalculation.CalculateDailyReward(p.PrincipalAmount, p.Apy);
-                var monthlyReward = _rewardCalculation.CalculateProjectedReward(p.PrincipalAmount, p.Apy, 30);
-                var yearlyReward = _rewardCalculation.CalculateProjectedReward(p.PrincipalAmount, p.Apy, 365);
+                rewards.TryGetValue(p.Id, out var snapshot);
 
                 return new InvestmentPositionResponse
                 {
@@ -175,10 +175,10 @@ public class InvestmentController : ControllerBase
                     Status = p.Status.ToString(),
                     StartDate = p.StartDate,
                     LastSyncedAt = p.LastSyncedAt,
-                    DaysHeld = daysHeld,
-                    EstimatedDailyReward = dailyReward,
-                    EstimatedMonthlyReward = monthlyReward,
-                    EstimatedYearlyReward = yearlyReward
+                    DaysHeld = snapshot?.DaysHeld ?? 0,
+                    EstimatedDailyReward = snapshot?.DailyReward ?? 0,
+                    EstimatedMonthlyReward = snapshot?.GetProjectedReward(30) ?? 0,
+                    EstimatedYearlyReward = snapshot?.GetProjectedReward(365) ?? 0
                 };
             }).ToList();
 
@@ -207,10 +207,11 @@ public class InvestmentController : ControllerBase
                 return NotFound(new { error = "Investment position not found" });
             }
 
-            var daysHeld = _rewardCalculation.CalculateDaysHeld(position.StartDate ?? position.CreatedAt);
-            var dailyReward = _rewardCalculation.CalculateDailyReward(position.PrincipalAmount, position.Apy);
-            var monthlyReward = _rewardCalculation.CalculateProjectedReward(position.PrincipalAmount, position.Apy, 30);
-            var yearlyReward = _rewardCalculation.CalculateProjectedReward(position.PrincipalAmount, position.Apy, 365);
+            var rewards = _rewardCalculation.GetPortfolioRewards(new[] { position });
+            if (!rewards.TryGetValue(position.Id, out var snapshot))
+            {
+                return StatusCode(500, new { error = "Failed to calculate position rewards" });
+            }
 
             var transactions = position.Transactions.Select(t => new InvestmentTransactionResponse
             {
@@ -235,16 +236,18 @@ public class InvestmentController : ControllerBase
                 StartDate = position.StartDate,
                 EndDate = position.EndDate,
                 LastSyncedAt = position.LastSyncedAt,
-                DaysHeld = daysHeld,
-                EstimatedDailyReward = dailyReward,
-                EstimatedMonthlyReward = monthlyReward,
-                EstimatedYearlyReward = yearlyReward,
+                DaysHeld = snapshot.DaysHeld,
+                EstimatedDailyReward = snapshot.DailyReward,
+                EstimatedMonthlyReward = snapshot.GetProjectedReward(30),
+                EstimatedYearlyReward = snapshot.GetProjectedReward(365),
                 Transactions = transactions,
                 ProjectedRewards = new ProjectedRewardsResponse
                 {
-                    Daily = dailyReward,
-                    Monthly = monthlyReward,
-                    Yearly = yearlyReward
+                    Daily = snapshot.DailyReward,
+                    Weekly = snapshot.GetProjectedReward(7),
+                    Monthly = snapshot.GetProjectedReward(30),
+                    Quarterly = snapshot.GetProjectedReward(90),
+                    Yearly = snapshot.GetProjectedReward(365)
                 }
             };
 
@@ -80,29 +80,13 @@ public class SwapController : ControllerBase
                 return BadRequest(new { error = "Slippage must be between 0.1% and 50%" });
             }
 
-            // Check cache first
-            var cachedQuote = await _cacheService.GetCachedQuoteAsync(
-                fromToken,
-                toToken,
-                amount,
-                slippage);
-
-            if (cachedQuote != null)
-            {
-                _logger.LogInformation("Returning cached quote for {From} -> {To}", fromToken, toToken);
-                return Ok(MapToQuoteResponse(cachedQuote));
-            }
-
-            // Get fresh quote
+            // Get quote (DEX quotes are served from the quote cache when possible)
             var quote = await _quoteService.GetBestQuoteAsync(
                 fromToken,
                 toToken,
                 amount,
                 slippage);
 
-            // Cache the quote
-            await _cacheService.SetCachedQuoteAsync(quote, fromToken, toToken, amount, slippage);
-
             var response = MapToQuoteResponse(quote);
             return Ok(response);
         }
@@ -173,6 +157,9 @@ public class SwapController : ControllerBase
                 request.FromAmount,
                 request.SlippageTolerance);
 
+            // The swap moves the pool price, so cached quotes for the pair are no longer accurate
+            await _cacheService.InvalidateCacheAsync(request.FromToken, request.ToToken);
+
             var response = MapToExecutionResponse(result, request);
 
             _logger.LogInformation(
@@ -217,10 +204,13 @@ public class SwapController : ControllerBase
     /// <param name="pageSize">Items per page (default: 20)</param>
     /// <param name="sortBy">Sort field (createdAt, fromAmount)</param>
     /// <param name="sortOrder">Sort order (desc, asc)</param>
+    /// <param name="cursor">Cursor from a previous response's NextCursor; takes precedence over page</param>
+    /// <param name="includeTotal">Include total item and page counts (default: true)</param>
     /// <returns>Paginated swap history</returns>
     [HttpGet("history")]
     [Authorize]
     [ProducesResponseType(typeof(SwapHistoryResponse), 200)]
+    [ProducesResponseType(400)]
     [ProducesResponseType(401)]
     [ProducesResponseType(500)]
     public async Task<IActionResult> GetSwapHistory(
@@ -228,10 +218,27 @@ public class SwapController : ControllerBase
         [FromQuery] int page = 1,
         [FromQuery] int pageSize = 20,
         [FromQuery] string sortBy = "createdAt",
-        [FromQuery] string sortOrder = "desc")
+        [FromQuery] string sortOrder = "desc",
+        [FromQuery] string? cursor = null,
+        [FromQuery] bool includeTotal = true)
     {
         try
         {
+            if (page < 1) page = 1;
+            if (pageSize < 1) pageSize = 20;
+            if (pageSize > 100) pageSize = 100;
+
+            HistoryCursor? after = null;
+            if (!string.IsNullOrEmpty(cursor))
+            {
+                if (!HistoryCursor.TryParse(cursor, out var parsedCursor))
+                {
+                    return BadRequest(new { error = "Invalid cursor" });
+                }
+
+                after = parsedCursor;
+            }
+
             var userId = GetUserIdFromClaims();
             if (userId == Guid.Empty)
             {
@@ -248,22 +255,26 @@ public class SwapController : ControllerBase
             };
 
             // Get swaps
-            var swaps = await _swapRepository.GetByUserIdAsync(
+            var historyPage = await _swapRepository.GetHistoryPageByUserAsync(
                 userId,
+                statusFilter,
+                after,
                 page,
-                pageSize,
-                statusFilter);
+                pageSize);
 
-            // Get total count
-            var totalCount = await _swapRepository.GetSwapCountByUserAsync(userId, statusFilter);
+            // Get total count (cached per user and status)
+            int? totalCount = includeTotal
+                ? await _swapRepository.GetSwapCountByUserAsync(userId, statusFilter)
+                : null;
 
             var response = new SwapHistoryResponse
             {
-                Swaps = swaps.Select(MapToHistoryItem).ToList(),
+                Swaps = historyPage.Items,
                 TotalItems = totalCount,
                 Page = page,
                 PageSize = pageSize,
-                TotalPages = (int)Math.Ceiling(totalCount / (double)pageSize)
+                TotalPages = totalCount.HasValue ? (int)Math.Ceiling(totalCount.Value / (double)pageSize) : null,
+                NextCursor = historyPage.NextCursor
             };
 
             return Ok(response);
@@ -375,26 +386,6 @@ public class SwapController : ControllerBase
         };
     }
 
-    private SwapHistoryItem MapToHistoryItem(SwapTransaction swap)
-    {
-        return new SwapHistoryItem
-        {
-            Id = swap.Id,
-            FromToken = swap.FromToken,
-            FromTokenSymbol = swap.FromTokenSymbol,
-            ToToken = swap.ToToken,
-            ToTokenSymbol = swap.ToTokenSymbol,
-            FromAmount = swap.FromAmount,
-            ToAmount = swap.ToAmount,
-            ExchangeRate = swap.ExchangeRate,
-            PlatformFee = swap.PlatformFee,
-            Status = swap.Status.ToString().ToLower(),
-            TransactionHash = swap.TransactionHash,
-            CreatedAt = swap.CreatedAt,
-            ConfirmedAt = swap.ConfirmedAt
-        };
-    }
-
     private SwapDetailsResponse MapToDetailsResponse(SwapTransaction swap)
     {
         return new SwapDetailsResponse
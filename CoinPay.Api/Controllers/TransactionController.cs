@@ -236,6 +236,7 @@ public class TransactionController : ControllerBase
             GasUsed = transaction.GasUsed,
             BlockNumber = transaction.BlockNumber,
             Confirmations = transaction.Confirmations,
+            ChainId = transaction.ChainId,
             SubmittedAt = transaction.SubmittedAt ?? transaction.CreatedAt,
             ConfirmedAt = transaction.ConfirmedAt,
             ErrorMessage = transaction.ErrorMessage,
@@ -407,7 +408,7 @@ public class TransactionController : ControllerBase
     /// <summary>
     /// Get transaction history for authenticated user's wallet with advanced filtering
     /// </summary>
-    /// <param name="page">Page number (default: 1)</param>
+    /// <param name="page">Page number (default: 1); ignored when a cursor is supplied</param>
     /// <param name="pageSize">Page size (default: 20, max: 100)</param>
     /// <param name="status">Filter by status (Pending, Confirmed, Failed)</param>
     /// <param name="startDate">Filter by start date</param>
@@ -416,11 +417,14 @@ public class TransactionController : ControllerBase
     /// <param name="maxAmount">Filter by maximum amount</param>
     /// <param name="sortBy">Sort by field (CreatedAt, Amount, Status, ConfirmedAt)</param>
     /// <param name="sortDescending">Sort descending (default: true)</param>
+    /// <param name="cursor">Cursor from a previous response's NextCursor (CreatedAt sort only)</param>
+    /// <param name="includeTotal">Include the total count (default: true); totals are cached briefly</param>
     /// <param name="cancellationToken">Cancellation token</param>
     /// <returns>Transaction history with pagination</returns>
     [HttpGet("history")]
-    [ResponseCache(Duration = 60, VaryByQueryKeys = new[] { "page", "pageSize", "status", "startDate", "endDate", "minAmount", "maxAmount", "sortBy", "sortDescending" })]
+    [ResponseCache(Duration = 60, VaryByQueryKeys = new[] { "page", "pageSize", "status", "startDate", "endDate", "minAmount", "maxAmount", "sortBy", "sortDescending", "cursor", "includeTotal" })]
     [ProducesResponseType(typeof(TransactionHistoryResponse), StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
     [ProducesResponseType(StatusCodes.Status404NotFound)]
     public async Task<ActionResult<TransactionHistoryResponse>> GetTransactionHistory(
         [FromQuery] int page = 1,
@@ -432,6 +436,8 @@ public class TransactionController : ControllerBase
         [FromQuery] decimal? maxAmount = null,
         [FromQuery] string sortBy = "CreatedAt",
         [FromQuery] bool sortDescending = true,
+        [FromQuery] string? cursor = null,
+        [FromQuery] bool includeTotal = true,
         CancellationToken cancellationToken = default)
     {
         _logger.LogInformation(
@@ -443,6 +449,17 @@ public class TransactionController : ControllerBase
         if (pageSize < 1) pageSize = 20;
         if (pageSize > 100) pageSize = 100;
 
+        HistoryCursor? after = null;
+        if (!string.IsNullOrEmpty(cursor))
+        {
+            if (!HistoryCursor.TryParse(cursor, out var parsedCursor))
+            {
+                return BadRequest(new { error = "Invalid cursor" });
+            }
+
+            after = parsedCursor;
+        }
+
         var userId = GetUserId();
         if (userId == null)
         {
@@ -458,62 +475,48 @@ public class TransactionController : ControllerBase
             return NotFound(new { error = "Wallet not found" });
         }
 
-        // Use the enhanced GetHistoryAsync method with filtering
-        var (transactions, totalCount) = await _transactionRepository.GetHistoryAsync(
-            wallet.Id,
-            page,
-            pageSize,
-            status,
+        var filter = new TransactionHistoryFilter(
+            !string.IsNullOrEmpty(status) && Enum.TryParse<TransactionStatus>(status, true, out var statusEnum) ? statusEnum : null,
             startDate,
             endDate,
             minAmount,
-            maxAmount,
+            maxAmount);
+
+        var historyPage = await _transactionRepository.GetHistoryPageAsync(
+            wallet.Id,
+            filter,
+            after,
+            page,
+            pageSize,
             sortBy,
             sortDescending,
             cancellationToken);
 
-        var response = new TransactionHistoryResponse
+        int? totalCount = includeTotal
+            ? await _transactionRepository.GetHistoryCountAsync(wallet.Id, filter, cancellationToken)
+            : null;
+
+        // Generate explorer URLs
+        foreach (var transaction in historyPage.Items)
         {
-            Transactions = transactions.Select(t =>
+            if (!string.IsNullOrEmpty(transaction.TransactionHash))
             {
-                // Generate explorer URLs
-                string? explorerUrl = null;
-                string? userOpExplorerUrl = null;
-
-                if (!string.IsNullOrEmpty(t.TransactionHash))
-                {
-                    explorerUrl = GetBlockExplorerUrl(t.ChainId, t.TransactionHash, "tx");
-                }
+                transaction.ExplorerUrl = GetBlockExplorerUrl(transaction.ChainId, transaction.TransactionHash, "tx");
+            }
 
-                if (!string.IsNullOrEmpty(t.UserOpHash))
-                {
-                    userOpExplorerUrl = GetJiffyScanUrl(t.ChainId, t.UserOpHash);
-                }
+            if (!string.IsNullOrEmpty(transaction.UserOpHash))
+            {
+                transaction.UserOpExplorerUrl = GetJiffyScanUrl(transaction.ChainId, transaction.UserOpHash);
+            }
+        }
 
-                return new TransactionStatusResponse
-                {
-                    TransactionId = t.Id,
-                    UserOpHash = t.UserOpHash,
-                    TransactionHash = t.TransactionHash,
-                    Status = t.Status.ToString(),
-                    FromAddress = t.FromAddress,
-                    ToAddress = t.ToAddress,
-                    Amount = t.AmountDecimal,
-                    TokenAddress = t.TokenAddress,
-                    IsGasless = t.IsGasless,
-                    GasUsed = t.GasUsed,
-                    BlockNumber = t.BlockNumber,
-                    Confirmations = t.Confirmations,
-                    SubmittedAt = t.SubmittedAt ?? t.CreatedAt,
-                    ConfirmedAt = t.ConfirmedAt,
-                    ErrorMessage = t.ErrorMessage,
-                    ExplorerUrl = explorerUrl,
-                    UserOpExplorerUrl = userOpExplorerUrl
-                };
-            }).ToList(),
+        var response = new TransactionHistoryResponse
+        {
+            Transactions = historyPage.Items,
             TotalCount = totalCount,
             Page = page,
-            PageSize = pageSize
+            PageSize = pageSize,
+            NextCursor = historyPage.NextCursor
         };
 
         return Ok(response);
@@ -148,7 +148,9 @@ public class InvestmentPositionDetailResponse : InvestmentPositionResponse
 public class ProjectedRewardsResponse
 {
     public decimal Daily { get; set; }
+    public decimal Weekly { get; set; }
     public decimal Monthly { get; set; }
+    public decimal Quarterly { get; set; }
     public decimal Yearly { get; set; }
 }
 
@@ -74,10 +74,11 @@ public class SwapExecutionResponse
 public class SwapHistoryResponse
 {
     public List<SwapHistoryItem> Swaps { get; set; } = new();
-    public int TotalItems { get; set; }
+    public int? TotalItems { get; set; } // Null when the total was not requested
     public int Page { get; set; }
     public int PageSize { get; set; }
-    public int TotalPages { get; set; }
+    public int? TotalPages { get; set; }
+    public string? NextCursor { get; set; } // Pass as 'cursor' to fetch the next page; null on the last page
 }
 
 /// <summary>
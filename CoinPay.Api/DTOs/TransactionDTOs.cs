@@ -66,6 +66,7 @@ public class TransactionStatusResponse
     public decimal GasUsed { get; set; }
     public long? BlockNumber { get; set; }
     public int Confirmations { get; set; }
+    public int ChainId { get; set; }
     public DateTime SubmittedAt { get; set; }
     public DateTime? ConfirmedAt { get; set; }
     public string? ErrorMessage { get; set; }
@@ -79,9 +80,10 @@ public class TransactionStatusResponse
 public class TransactionHistoryResponse
 {
     public List<TransactionStatusResponse> Transactions { get; set; } = new();
-    public int TotalCount { get; set; }
+    public int? TotalCount { get; set; } // Null when the total was not requested
     public int Page { get; set; }
     public int PageSize { get; set; }
+    public string? NextCursor { get; set; } // Pass as 'cursor' to fetch the next page; null on the last page
 }
 
 /// <summary>
@@ -14,8 +14,13 @@ public class AppDbContext : DbContext
     public DbSet<User> Users { get; set; }
     public DbSet<Wallet> Wallets { get; set; }
     public DbSet<BlockchainTransaction> BlockchainTransactions { get; set; }
+    public DbSet<ArchivedBlockchainTransaction> ArchivedBlockchainTransactions { get; set; }
     public DbSet<WebhookRegistration> WebhookRegistrations { get; set; }
     public DbSet<WebhookDeliveryLog> WebhookDeliveryLogs { get; set; }
+    public DbSet<WebhookOutboxMessage> WebhookOutboxMessages { get; set; }
+    public DbSet<ProcessedCircleNotification> ProcessedCircleNotifications { get; set; }
+    public DbSet<WorkerLease> WorkerLeases { get; set; }
+    public DbSet<WorkerNode> WorkerNodes { get; set; }
 
     // Sprint N03: Phase 3 - Fiat Off-Ramp
     public DbSet<BankAccount> BankAccounts { get; set; }
@@ -50,8 +55,39 @@ public class AppDbContext : DbContext
         modelBuilder.Entity<BlockchainTransaction>()
             .HasIndex(t => t.WalletId);
 
+        // Pending-work index for TransactionMonitoringService keyset scans.
+        // Partial, so it only holds pending rows and settled rows cost nothing to maintain.
         modelBuilder.Entity<BlockchainTransaction>()
-            .HasIndex(t => t.Status);
+            .HasIndex(t => new { t.WalletId, t.Id })
+            .HasDatabaseName("IX_BlockchainTransactions_Pending_WalletId_Id")
+            .HasFilter("\"Status\" = 0");
+
+        // Keyset index for wallet transaction history ordered by (CreatedAt, Id)
+        modelBuilder.Entity<BlockchainTransaction>()
+            .HasIndex(t => new { t.WalletId, t.CreatedAt, t.Id })
+            .HasDatabaseName("IX_BlockchainTransactions_WalletId_CreatedAt_Id");
+
+        // Configure the blockchain transaction archive (cold tier, range-partitioned by month of CreatedAt).
+        // Partitioned tables need the partition key in the primary key and in every unique index.
+        modelBuilder.Entity<ArchivedBlockchainTransaction>()
+            .ToTable("BlockchainTransactionArchive")
+            .HasKey(t => new { t.Id, t.CreatedAt });
+
+        modelBuilder.Entity<ArchivedBlockchainTransaction>()
+            .Property(t => t.Id)
+            .ValueGeneratedNever();
+
+        modelBuilder.Entity<ArchivedBlockchainTransaction>()
+            .HasIndex(t => new { t.WalletId, t.CreatedAt, t.Id })
+            .HasDatabaseName("IX_BlockchainTransactionArchive_WalletId_CreatedAt_Id");
+
+        modelBuilder.Entity<ArchivedBlockchainTransaction>()
+            .HasIndex(t => t.UserOpHash)
+            .HasDatabaseName("IX_BlockchainTransactionArchive_UserOpHash");
+
+        modelBuilder.Entity<ArchivedBlockchainTransaction>()
+            .HasIndex(t => t.TransactionHash)
+            .HasDatabaseName("IX_BlockchainTransactionArchive_TransactionHash");
 
         // Configure Wallet indexes
         modelBuilder.Entity<Wallet>()
@@ -78,6 +114,65 @@ public class AppDbContext : DbContext
         modelBuilder.Entity<WebhookDeliveryLog>()
             .HasIndex(l => l.Timestamp);
 
+        // Configure webhook outbox (dispatcher scans due pending rows)
+        modelBuilder.Entity<WebhookOutboxMessage>()
+            .Property(m => m.EventName)
+            .IsRequired()
+            .HasMaxLength(100);
+
+        modelBuilder.Entity<WebhookOutboxMessage>()
+            .HasIndex(m => new { m.Status, m.NextAttemptAt })
+            .HasDatabaseName("IX_WebhookOutboxMessages_Status_NextAttemptAt");
+
+        modelBuilder.Entity<WebhookOutboxMessage>()
+            .HasOne(m => m.Webhook)
+            .WithMany()
+            .HasForeignKey(m => m.WebhookId)
+            .OnDelete(DeleteBehavior.Cascade);
+
+        // Configure processed Circle notifications (webhook deduplication)
+        modelBuilder.Entity<ProcessedCircleNotification>()
+            .HasKey(n => n.NotificationId);
+
+        modelBuilder.Entity<ProcessedCircleNotification>()
+            .Property(n => n.NotificationId)
+            .HasMaxLength(100);
+
+        modelBuilder.Entity<ProcessedCircleNotification>()
+            .Property(n => n.NotificationType)
+            .IsRequired()
+            .HasMaxLength(100);
+
+        modelBuilder.Entity<ProcessedCircleNotification>()
+            .Property(n => n.CircleTransactionId)
+            .HasMaxLength(100);
+
+        modelBuilder.Entity<ProcessedCircleNotification>()
+            .HasIndex(n => n.ReceivedAt);
+
+        // Configure background worker partition leasing
+        modelBuilder.Entity<WorkerLease>()
+            .HasKey(l => new { l.WorkerName, l.Partition });
+
+        modelBuilder.Entity<WorkerLease>()
+            .Property(l => l.WorkerName)
+            .HasMaxLength(100);
+
+        modelBuilder.Entity<WorkerLease>()
+            .Property(l => l.OwnerId)
+            .HasMaxLength(200);
+
+        modelBuilder.Entity<WorkerNode>()
+            .HasKey(n => new { n.WorkerName, n.NodeId });
+
+        modelBuilder.Entity<WorkerNode>()
+            .Property(n => n.WorkerName)
+            .HasMaxLength(100);
+
+        modelBuilder.Entity<WorkerNode>()
+            .Property(n => n.NodeId)
+            .HasMaxLength(200);
+
         // Configure relationships
         modelBuilder.Entity<WebhookDeliveryLog>()
             .HasOne(l => l.Webhook)
@@ -85,12 +180,6 @@ public class AppDbContext : DbContext
             .HasForeignKey(l => l.WebhookId)
             .OnDelete(DeleteBehavior.Cascade);
 
-        modelBuilder.Entity<WebhookDeliveryLog>()
-            .HasOne(l => l.Transaction)
-            .WithMany()
-            .HasForeignKey(l => l.TransactionId)
-            .OnDelete(DeleteBehavior.Restrict);
-
         // Configure ExchangeConnection indexes (Sprint N04)
         modelBuilder.Entity<ExchangeConnection>()
             .HasIndex(e => e.UserId);
@@ -181,6 +270,30 @@ public class AppDbContext : DbContext
             .HasIndex(t => t.Status)
             .HasDatabaseName("IX_Transactions_Status");
 
+        // Pending-work index for the Circle fallback poller: only pending POL transfers, ordered by next check
+        modelBuilder.Entity<Transaction>()
+            .HasIndex(t => t.NextStatusCheckAt)
+            .HasDatabaseName("IX_Transactions_PendingPol_NextStatusCheckAt")
+            .HasFilter("\"Status\" = 'Pending' AND \"Currency\" = 'POL'");
+
+        // Circle wallet + status index so the Circle monitor can group pending transfers by wallet
+        modelBuilder.Entity<Transaction>()
+            .HasIndex(t => new { t.CircleWalletId, t.Status })
+            .HasDatabaseName("IX_Transactions_CircleWalletId_Status");
+
+        // Circle transaction ID lookups from webhooks and the Circle sync tool
+        modelBuilder.Entity<Transaction>()
+            .HasIndex(t => t.TransactionId)
+            .HasDatabaseName("IX_Transactions_TransactionId");
+
+        modelBuilder.Entity<Transaction>()
+            .Property(t => t.TxHash)
+            .HasMaxLength(100);
+
+        modelBuilder.Entity<Transaction>()
+            .Property(t => t.CircleState)
+            .HasMaxLength(50);
+
         // Investment position indexes for user queries and status filtering
         modelBuilder.Entity<InvestmentPosition>()
             .HasIndex(i => new { i.UserId, i.Status })
@@ -35,8 +35,9 @@ public class PayoutAuditLogConfiguration : IEntityTypeConfiguration<PayoutAuditL
             .IsRequired();
 
         // Indexes
-        builder.HasIndex(a => a.PayoutTransactionId)
-            .HasDatabaseName("IX_PayoutAuditLogs_PayoutTransactionId");
+        // Audit trail reads filter by payout and order by time
+        builder.HasIndex(a => new { a.PayoutTransactionId, a.CreatedAt })
+            .HasDatabaseName("IX_PayoutAuditLogs_PayoutTransactionId_CreatedAt");
 
         builder.HasIndex(a => a.CreatedAt)
             .HasDatabaseName("IX_PayoutAuditLogs_CreatedAt");
@@ -1,8 +1,10 @@
+using System.Diagnostics;
+
 namespace CoinPay.Api.Middleware;
 
 /// <summary>
 /// Middleware that manages correlation IDs for request tracking across the application.
-/// Adds X-Correlation-ID header to all responses and enriches logs with correlation context.
+/// Adds X-Correlation-ID header to all responses and enriches logs and the request span with correlation context.
 /// </summary>
 public class CorrelationIdMiddleware
 {
@@ -28,6 +30,9 @@ public class CorrelationIdMiddleware
         var correlationId = context.Request.Headers[CorrelationIdHeader].FirstOrDefault()
             ?? Guid.NewGuid().ToString();
 
+        // Tag the request span so traces can be found by correlation ID
+        Activity.Current?.SetTag("coinpay.correlation_id", correlationId);
+
         // Add correlation ID to log context for all logs within this request
         using (Serilog.Context.LogContext.PushProperty("CorrelationId", correlationId))
         {
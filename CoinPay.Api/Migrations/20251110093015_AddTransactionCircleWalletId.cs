@@ -0,0 +1,37 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace CoinPay.Api.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddTransactionCircleWalletId : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.AddColumn<string>(
+                name: "CircleWalletId",
+                table: "Transactions",
+                type: "text",
+                nullable: true);
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Transactions_CircleWalletId_Status",
+                table: "Transactions",
+                columns: new[] { "CircleWalletId", "Status" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Transactions_CircleWalletId_Status",
+                table: "Transactions");
+
+            migrationBuilder.DropColumn(
+                name: "CircleWalletId",
+                table: "Transactions");
+        }
+    }
+}
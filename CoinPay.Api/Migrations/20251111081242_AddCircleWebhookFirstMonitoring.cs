@@ -0,0 +1,72 @@
+﻿using System;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace CoinPay.Api.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddCircleWebhookFirstMonitoring : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.AddColumn<DateTime>(
+                name: "LastWebhookAt",
+                table: "Transactions",
+                type: "timestamp with time zone",
+                nullable: true);
+
+            migrationBuilder.AddColumn<DateTime>(
+                name: "NextStatusCheckAt",
+                table: "Transactions",
+                type: "timestamp with time zone",
+                nullable: true);
+
+            migrationBuilder.AddColumn<int>(
+                name: "StatusCheckAttempts",
+                table: "Transactions",
+                type: "integer",
+                nullable: false,
+                defaultValue: 0);
+
+            migrationBuilder.CreateTable(
+                name: "ProcessedCircleNotifications",
+                columns: table => new
+                {
+                    NotificationId = table.Column<string>(type: "character varying(100)", maxLength: 100, nullable: false),
+                    NotificationType = table.Column<string>(type: "character varying(100)", maxLength: 100, nullable: false),
+                    CircleTransactionId = table.Column<string>(type: "character varying(100)", maxLength: 100, nullable: true),
+                    ReceivedAt = table.Column<DateTime>(type: "timestamp with time zone", nullable: false)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_ProcessedCircleNotifications", x => x.NotificationId);
+                });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_ProcessedCircleNotifications_ReceivedAt",
+                table: "ProcessedCircleNotifications",
+                column: "ReceivedAt");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropTable(
+                name: "ProcessedCircleNotifications");
+
+            migrationBuilder.DropColumn(
+                name: "LastWebhookAt",
+                table: "Transactions");
+
+            migrationBuilder.DropColumn(
+                name: "NextStatusCheckAt",
+                table: "Transactions");
+
+            migrationBuilder.DropColumn(
+                name: "StatusCheckAttempts",
+                table: "Transactions");
+        }
+    }
+}
@@ -0,0 +1,27 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace CoinPay.Api.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddBlockchainTransactionPendingWorkIndex : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateIndex(
+                name: "IX_BlockchainTransactions_Status_WalletId_Id",
+                table: "BlockchainTransactions",
+                columns: new[] { "Status", "WalletId", "Id" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_BlockchainTransactions_Status_WalletId_Id",
+                table: "BlockchainTransactions");
+        }
+    }
+}
@@ -0,0 +1,27 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace CoinPay.Api.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddBlockchainTransactionHistoryIndex : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateIndex(
+                name: "IX_BlockchainTransactions_WalletId_CreatedAt_Id",
+                table: "BlockchainTransactions",
+                columns: new[] { "WalletId", "CreatedAt", "Id" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_BlockchainTransactions_WalletId_CreatedAt_Id",
+                table: "BlockchainTransactions");
+        }
+    }
+}
@@ -0,0 +1,36 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace CoinPay.Api.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddPayoutAuditLogTimelineIndex : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_PayoutAuditLogs_PayoutTransactionId",
+                table: "PayoutAuditLogs");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_PayoutAuditLogs_PayoutTransactionId_CreatedAt",
+                table: "PayoutAuditLogs",
+                columns: new[] { "PayoutTransactionId", "CreatedAt" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_PayoutAuditLogs_PayoutTransactionId_CreatedAt",
+                table: "PayoutAuditLogs");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_PayoutAuditLogs_PayoutTransactionId",
+                table: "PayoutAuditLogs",
+                column: "PayoutTransactionId");
+        }
+    }
+}
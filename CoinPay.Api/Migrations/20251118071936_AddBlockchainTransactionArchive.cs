@@ -0,0 +1,130 @@
+﻿using System;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace CoinPay.Api.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddBlockchainTransactionArchive : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Delivery logs outlive the hot row once the archiver moves it
+            migrationBuilder.DropForeignKey(
+                name: "FK_WebhookDeliveryLogs_BlockchainTransactions_TransactionId",
+                table: "WebhookDeliveryLogs");
+
+            // Replaced by a partial index that only covers pending rows
+            migrationBuilder.DropIndex(
+                name: "IX_BlockchainTransactions_Status_WalletId_Id",
+                table: "BlockchainTransactions");
+
+            migrationBuilder.DropIndex(
+                name: "IX_BlockchainTransactions_Status",
+                table: "BlockchainTransactions");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_BlockchainTransactions_Pending_WalletId_Id",
+                table: "BlockchainTransactions",
+                columns: new[] { "WalletId", "Id" },
+                filter: "\"Status\" = 0");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Transactions_PendingPol_NextStatusCheckAt",
+                table: "Transactions",
+                column: "NextStatusCheckAt",
+                filter: "\"Status\" = 'Pending' AND \"Currency\" = 'POL'");
+
+            // EF cannot declare table partitioning; monthly partitions are created by TransactionArchiverService
+            migrationBuilder.Sql(@"
+                CREATE TABLE ""BlockchainTransactionArchive"" (
+                    ""Id"" integer NOT NULL,
+                    ""WalletId"" integer NOT NULL,
+                    ""UserOpHash"" text NOT NULL,
+                    ""TransactionHash"" text NULL,
+                    ""FromAddress"" text NOT NULL,
+                    ""ToAddress"" text NOT NULL,
+                    ""TokenAddress"" text NOT NULL,
+                    ""Amount"" text NOT NULL,
+                    ""AmountDecimal"" numeric NOT NULL,
+                    ""Status"" integer NOT NULL,
+                    ""ChainId"" integer NOT NULL,
+                    ""TransactionType"" text NOT NULL,
+                    ""GasUsed"" numeric NOT NULL,
+                    ""IsGasless"" boolean NOT NULL,
+                    ""ErrorMessage"" text NULL,
+                    ""BlockNumber"" bigint NULL,
+                    ""Confirmations"" integer NOT NULL,
+                    ""CreatedAt"" timestamp with time zone NOT NULL,
+                    ""SubmittedAt"" timestamp with time zone NULL,
+                    ""ConfirmedAt"" timestamp with time zone NULL,
+                    ""ArchivedAt"" timestamp with time zone NOT NULL,
+                    CONSTRAINT ""PK_BlockchainTransactionArchive"" PRIMARY KEY (""Id"", ""CreatedAt"")
+                ) PARTITION BY RANGE (""CreatedAt"");");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_BlockchainTransactionArchive_WalletId_CreatedAt_Id",
+                table: "BlockchainTransactionArchive",
+                columns: new[] { "WalletId", "CreatedAt", "Id" });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_BlockchainTransactionArchive_UserOpHash",
+                table: "BlockchainTransactionArchive",
+                column: "UserOpHash");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_BlockchainTransactionArchive_TransactionHash",
+                table: "BlockchainTransactionArchive",
+                column: "TransactionHash");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            // Move archived rows back before the archive (and all its partitions) is dropped
+            migrationBuilder.Sql(@"
+                INSERT INTO ""BlockchainTransactions"" (
+                    ""Id"", ""WalletId"", ""UserOpHash"", ""TransactionHash"", ""FromAddress"", ""ToAddress"",
+                    ""TokenAddress"", ""Amount"", ""AmountDecimal"", ""Status"", ""ChainId"", ""TransactionType"",
+                    ""GasUsed"", ""IsGasless"", ""ErrorMessage"", ""BlockNumber"", ""Confirmations"",
+                    ""CreatedAt"", ""SubmittedAt"", ""ConfirmedAt"")
+                SELECT
+                    ""Id"", ""WalletId"", ""UserOpHash"", ""TransactionHash"", ""FromAddress"", ""ToAddress"",
+                    ""TokenAddress"", ""Amount"", ""AmountDecimal"", ""Status"", ""ChainId"", ""TransactionType"",
+                    ""GasUsed"", ""IsGasless"", ""ErrorMessage"", ""BlockNumber"", ""Confirmations"",
+                    ""CreatedAt"", ""SubmittedAt"", ""ConfirmedAt""
+                FROM ""BlockchainTransactionArchive"";");
+
+            migrationBuilder.DropTable(
+                name: "BlockchainTransactionArchive");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Transactions_PendingPol_NextStatusCheckAt",
+                table: "Transactions");
+
+            migrationBuilder.DropIndex(
+                name: "IX_BlockchainTransactions_Pending_WalletId_Id",
+                table: "BlockchainTransactions");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_BlockchainTransactions_Status",
+                table: "BlockchainTransactions",
+                column: "Status");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_BlockchainTransactions_Status_WalletId_Id",
+                table: "BlockchainTransactions",
+                columns: new[] { "Status", "WalletId", "Id" });
+
+            migrationBuilder.AddForeignKey(
+                name: "FK_WebhookDeliveryLogs_BlockchainTransactions_TransactionId",
+                table: "WebhookDeliveryLogs",
+                column: "TransactionId",
+                principalTable: "BlockchainTransactions",
+                principalColumn: "Id",
+                onDelete: ReferentialAction.Restrict);
+        }
+    }
+}
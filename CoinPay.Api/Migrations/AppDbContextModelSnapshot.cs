@@ -22,6 +22,91 @@ namespace CoinPay.Api.Migrations
 
             NpgsqlModelBuilderExtensions.UseIdentityByDefaultColumns(modelBuilder);
 
+            modelBuilder.Entity("CoinPay.Api.Models.ArchivedBlockchainTransaction", b =>
+                {
+                    b.Property<int>("Id")
+                        .HasColumnType("integer");
+
+                    b.Property<DateTime>("CreatedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<string>("Amount")
+                        .IsRequired()
+                        .HasColumnType("text");
+
+                    b.Property<decimal>("AmountDecimal")
+                        .HasColumnType("numeric");
+
+                    b.Property<DateTime>("ArchivedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<long?>("BlockNumber")
+                        .HasColumnType("bigint");
+
+                    b.Property<int>("ChainId")
+                        .HasColumnType("integer");
+
+                    b.Property<int>("Confirmations")
+                        .HasColumnType("integer");
+
+                    b.Property<DateTime?>("ConfirmedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<string>("ErrorMessage")
+                        .HasColumnType("text");
+
+                    b.Property<string>("FromAddress")
+                        .IsRequired()
+                        .HasColumnType("text");
+
+                    b.Property<decimal>("GasUsed")
+                        .HasColumnType("numeric");
+
+                    b.Property<bool>("IsGasless")
+                        .HasColumnType("boolean");
+
+                    b.Property<int>("Status")
+                        .HasColumnType("integer");
+
+                    b.Property<DateTime?>("SubmittedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<string>("ToAddress")
+                        .IsRequired()
+                        .HasColumnType("text");
+
+                    b.Property<string>("TokenAddress")
+                        .IsRequired()
+                        .HasColumnType("text");
+
+                    b.Property<string>("TransactionHash")
+                        .HasColumnType("text");
+
+                    b.Property<string>("TransactionType")
+                        .IsRequired()
+                        .HasColumnType("text");
+
+                    b.Property<string>("UserOpHash")
+                        .IsRequired()
+                        .HasColumnType("text");
+
+                    b.Property<int>("WalletId")
+                        .HasColumnType("integer");
+
+                    b.HasKey("Id", "CreatedAt");
+
+                    b.HasIndex("TransactionHash")
+                        .HasDatabaseName("IX_BlockchainTransactionArchive_TransactionHash");
+
+                    b.HasIndex("UserOpHash")
+                        .HasDatabaseName("IX_BlockchainTransactionArchive_UserOpHash");
+
+                    b.HasIndex("WalletId", "CreatedAt", "Id")
+                        .HasDatabaseName("IX_BlockchainTransactionArchive_WalletId_CreatedAt_Id");
+
+                    b.ToTable("BlockchainTransactionArchive");
+                });
+
             modelBuilder.Entity("CoinPay.Api.Models.BankAccount", b =>
                 {
                     b.Property<Guid>("Id")
@@ -161,8 +246,6 @@ namespace CoinPay.Api.Migrations
 
                     b.HasKey("Id");
 
-                    b.HasIndex("Status");
-
                     b.HasIndex("TransactionHash");
 
                     b.HasIndex("UserOpHash")
@@ -170,6 +253,13 @@ namespace CoinPay.Api.Migrations
 
                     b.HasIndex("WalletId");
 
+                    b.HasIndex("WalletId", "CreatedAt", "Id")
+                        .HasDatabaseName("IX_BlockchainTransactions_WalletId_CreatedAt_Id");
+
+                    b.HasIndex("WalletId", "Id")
+                        .HasDatabaseName("IX_BlockchainTransactions_Pending_WalletId_Id")
+                        .HasFilter("\"Status\" = 0");
+
                     b.ToTable("BlockchainTransactions");
                 });
 
@@ -397,8 +487,8 @@ namespace CoinPay.Api.Migrations
                     b.HasIndex("CreatedAt")
                         .HasDatabaseName("IX_PayoutAuditLogs_CreatedAt");
 
-                    b.HasIndex("PayoutTransactionId")
-                        .HasDatabaseName("IX_PayoutAuditLogs_PayoutTransactionId");
+                    b.HasIndex("PayoutTransactionId", "CreatedAt")
+                        .HasDatabaseName("IX_PayoutAuditLogs_PayoutTransactionId_CreatedAt");
 
                     b.ToTable("PayoutAuditLogs", (string)null);
                 });
@@ -491,6 +581,31 @@ namespace CoinPay.Api.Migrations
                     b.ToTable("PayoutTransactions", (string)null);
                 });
 
+            modelBuilder.Entity("CoinPay.Api.Models.ProcessedCircleNotification", b =>
+                {
+                    b.Property<string>("NotificationId")
+                        .HasMaxLength(100)
+                        .HasColumnType("character varying(100)");
+
+                    b.Property<string>("CircleTransactionId")
+                        .HasMaxLength(100)
+                        .HasColumnType("character varying(100)");
+
+                    b.Property<string>("NotificationType")
+                        .IsRequired()
+                        .HasMaxLength(100)
+                        .HasColumnType("character varying(100)");
+
+                    b.Property<DateTime>("ReceivedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.HasKey("NotificationId");
+
+                    b.HasIndex("ReceivedAt");
+
+                    b.ToTable("ProcessedCircleNotifications");
+                });
+
             modelBuilder.Entity("CoinPay.Api.Models.SwapTransaction", b =>
                 {
                     b.Property<Guid>("Id")
@@ -601,6 +716,13 @@ namespace CoinPay.Api.Migrations
                     b.Property<decimal>("Amount")
                         .HasColumnType("numeric");
 
+                    b.Property<string>("CircleState")
+                        .HasMaxLength(50)
+                        .HasColumnType("character varying(50)");
+
+                    b.Property<string>("CircleWalletId")
+                        .HasColumnType("text");
+
                     b.Property<DateTime?>("CompletedAt")
                         .HasColumnType("timestamp with time zone");
 
@@ -614,6 +736,12 @@ namespace CoinPay.Api.Migrations
                     b.Property<string>("Description")
                         .HasColumnType("text");
 
+                    b.Property<DateTime?>("LastWebhookAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<DateTime?>("NextStatusCheckAt")
+                        .HasColumnType("timestamp with time zone");
+
                     b.Property<string>("ReceiverName")
                         .HasColumnType("text");
 
@@ -624,9 +752,16 @@ namespace CoinPay.Api.Migrations
                         .IsRequired()
                         .HasColumnType("text");
 
+                    b.Property<int>("StatusCheckAttempts")
+                        .HasColumnType("integer");
+
                     b.Property<string>("TransactionId")
                         .HasColumnType("text");
 
+                    b.Property<string>("TxHash")
+                        .HasMaxLength(100)
+                        .HasColumnType("character varying(100)");
+
                     b.Property<string>("Type")
                         .IsRequired()
                         .HasColumnType("text");
@@ -636,6 +771,16 @@ namespace CoinPay.Api.Migrations
                     b.HasIndex("Status")
                         .HasDatabaseName("IX_Transactions_Status");
 
+                    b.HasIndex("TransactionId")
+                        .HasDatabaseName("IX_Transactions_TransactionId");
+
+                    b.HasIndex("CircleWalletId", "Status")
+                        .HasDatabaseName("IX_Transactions_CircleWalletId_Status");
+
+                    b.HasIndex("NextStatusCheckAt")
+                        .HasDatabaseName("IX_Transactions_PendingPol_NextStatusCheckAt")
+                        .HasFilter("\"Status\" = 'Pending' AND \"Currency\" = 'POL'");
+
                     b.ToTable("Transactions");
 
                     b.HasData(
@@ -650,6 +795,7 @@ namespace CoinPay.Api.Migrations
                             ReceiverName = "Jane Smith",
                             SenderName = "John Doe",
                             Status = "Completed",
+                            StatusCheckAttempts = 0,
                             TransactionId = "TXN001",
                             Type = "Payment"
                         },
@@ -664,6 +810,7 @@ namespace CoinPay.Api.Migrations
                             ReceiverName = "Bob Wilson",
                             SenderName = "Alice Johnson",
                             Status = "Completed",
+                            StatusCheckAttempts = 0,
                             TransactionId = "TXN002",
                             Type = "Transfer"
                         },
@@ -677,6 +824,7 @@ namespace CoinPay.Api.Migrations
                             ReceiverName = "David Lee",
                             SenderName = "Charlie Brown",
                             Status = "Pending",
+                            StatusCheckAttempts = 0,
                             TransactionId = "TXN003",
                             Type = "Payment"
                         });
@@ -817,6 +965,57 @@ namespace CoinPay.Api.Migrations
                     b.ToTable("WebhookDeliveryLogs");
                 });
 
+            modelBuilder.Entity("CoinPay.Api.Models.WebhookOutboxMessage", b =>
+                {
+                    b.Property<long>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bigint");
+
+                    NpgsqlPropertyBuilderExtensions.UseIdentityByDefaultColumn(b.Property<long>("Id"));
+
+                    b.Property<int>("AttemptCount")
+                        .HasColumnType("integer");
+
+                    b.Property<DateTime>("CreatedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<DateTime?>("DeliveredAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<string>("EventName")
+                        .IsRequired()
+                        .HasMaxLength(100)
+                        .HasColumnType("character varying(100)");
+
+                    b.Property<string>("LastError")
+                        .HasColumnType("text");
+
+                    b.Property<DateTime>("NextAttemptAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<string>("Payload")
+                        .IsRequired()
+                        .HasColumnType("text");
+
+                    b.Property<int>("Status")
+                        .HasColumnType("integer");
+
+                    b.Property<int>("TransactionId")
+                        .HasColumnType("integer");
+
+                    b.Property<int>("WebhookId")
+                        .HasColumnType("integer");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("WebhookId");
+
+                    b.HasIndex("Status", "NextAttemptAt")
+                        .HasDatabaseName("IX_WebhookOutboxMessages_Status_NextAttemptAt");
+
+                    b.ToTable("WebhookOutboxMessages");
+                });
+
             modelBuilder.Entity("CoinPay.Api.Models.WebhookRegistration", b =>
                 {
                     b.Property<int>("Id")
@@ -858,6 +1057,45 @@ namespace CoinPay.Api.Migrations
                     b.ToTable("WebhookRegistrations");
                 });
 
+            modelBuilder.Entity("CoinPay.Api.Models.WorkerLease", b =>
+                {
+                    b.Property<string>("WorkerName")
+                        .HasMaxLength(100)
+                        .HasColumnType("character varying(100)");
+
+                    b.Property<int>("Partition")
+                        .HasColumnType("integer");
+
+                    b.Property<DateTime>("ExpiresAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<string>("OwnerId")
+                        .HasMaxLength(200)
+                        .HasColumnType("character varying(200)");
+
+                    b.HasKey("WorkerName", "Partition");
+
+                    b.ToTable("WorkerLeases");
+                });
+
+            modelBuilder.Entity("CoinPay.Api.Models.WorkerNode", b =>
+                {
+                    b.Property<string>("WorkerName")
+                        .HasMaxLength(100)
+                        .HasColumnType("character varying(100)");
+
+                    b.Property<string>("NodeId")
+                        .HasMaxLength(200)
+                        .HasColumnType("character varying(200)");
+
+                    b.Property<DateTime>("HeartbeatAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.HasKey("WorkerName", "NodeId");
+
+                    b.ToTable("WorkerNodes");
+                });
+
             modelBuilder.Entity("CoinPay.Api.Models.BankAccount", b =>
                 {
                     b.HasOne("CoinPay.Api.Models.User", "User")
@@ -985,19 +1223,22 @@ namespace CoinPay.Api.Migrations
 
             modelBuilder.Entity("CoinPay.Api.Models.WebhookDeliveryLog", b =>
                 {
-                    b.HasOne("CoinPay.Api.Models.BlockchainTransaction", "Transaction")
-                        .WithMany()
-                        .HasForeignKey("TransactionId")
-                        .OnDelete(DeleteBehavior.Restrict)
-                        .IsRequired();
-
                     b.HasOne("CoinPay.Api.Models.WebhookRegistration", "Webhook")
                         .WithMany("DeliveryLogs")
                         .HasForeignKey("WebhookId")
                         .OnDelete(DeleteBehavior.Cascade)
                         .IsRequired();
 
-                    b.Navigation("Transaction");
+                    b.Navigation("Webhook");
+                });
+
+            modelBuilder.Entity("CoinPay.Api.Models.WebhookOutboxMessage", b =>
+                {
+                    b.HasOne("CoinPay.Api.Models.WebhookRegistration", "Webhook")
+                        .WithMany()
+                        .HasForeignKey("WebhookId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
 
                     b.Navigation("Webhook");
                 });
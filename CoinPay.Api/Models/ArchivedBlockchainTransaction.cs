@@ -0,0 +1,114 @@
+namespace CoinPay.Api.Models;
+
+/// <summary>
+/// A finished blockchain transaction moved out of BlockchainTransactions by the transaction archiver.
+/// Stored in BlockchainTransactionArchive, which is range-partitioned by month of CreatedAt,
+/// so the live table only holds recent and pending rows.
+/// </summary>
+public class ArchivedBlockchainTransaction
+{
+    /// <summary>
+    /// Internal database ID (same as in BlockchainTransactions)
+    /// </summary>
+    public int Id { get; set; }
+
+    /// <summary>
+    /// User's wallet ID
+    /// </summary>
+    public int WalletId { get; set; }
+
+    /// <summary>
+    /// UserOperation hash from bundler
+    /// </summary>
+    public string UserOpHash { get; set; } = string.Empty;
+
+    /// <summary>
+    /// On-chain transaction hash
+    /// </summary>
+    public string? TransactionHash { get; set; }
+
+    /// <summary>
+    /// Sender wallet address
+    /// </summary>
+    public string FromAddress { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Receiver wallet address
+    /// </summary>
+    public string ToAddress { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Token contract address (e.g., USDC)
+    /// </summary>
+    public string TokenAddress { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Transfer amount (stored as string to preserve precision)
+    /// </summary>
+    public string Amount { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Amount in decimal format for display
+    /// </summary>
+    public decimal AmountDecimal { get; set; }
+
+    /// <summary>
+    /// Final transaction status: Confirmed or Failed
+    /// </summary>
+    public TransactionStatus Status { get; set; }
+
+    /// <summary>
+    /// Chain ID (80002 for Polygon Amoy testnet)
+    /// </summary>
+    public int ChainId { get; set; }
+
+    /// <summary>
+    /// Transaction type (Transfer, Swap, etc.)
+    /// </summary>
+    public string TransactionType { get; set; } = "Transfer";
+
+    /// <summary>
+    /// Gas used (0 for gasless transactions)
+    /// </summary>
+    public decimal GasUsed { get; set; }
+
+    /// <summary>
+    /// Whether gas was sponsored by paymaster
+    /// </summary>
+    public bool IsGasless { get; set; }
+
+    /// <summary>
+    /// Error message if transaction failed
+    /// </summary>
+    public string? ErrorMessage { get; set; }
+
+    /// <summary>
+    /// Block number where transaction was included
+    /// </summary>
+    public long? BlockNumber { get; set; }
+
+    /// <summary>
+    /// Number of confirmations
+    /// </summary>
+    public int Confirmations { get; set; }
+
+    /// <summary>
+    /// Transaction creation timestamp (partition key)
+    /// </summary>
+    public DateTime CreatedAt { get; set; }
+
+    /// <summary>
+    /// Transaction submitted to bundler timestamp
+    /// </summary>
+    public DateTime? SubmittedAt { get; set; }
+
+    /// <summary>
+    /// Transaction confirmation timestamp
+    /// </summary>
+    public DateTime? ConfirmedAt { get; set; }
+
+    /// <summary>
+    /// When the row was moved to the archive
+    /// </summary>
+    public DateTime ArchivedAt { get; set; }
+}
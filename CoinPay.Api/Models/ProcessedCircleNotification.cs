@@ -0,0 +1,28 @@
+namespace CoinPay.Api.Models;
+
+/// <summary>
+/// Records a Circle webhook notification that has already been applied,
+/// so redelivered notifications are ignored
+/// </summary>
+public class ProcessedCircleNotification
+{
+    /// <summary>
+    /// Circle notification ID (primary key)
+    /// </summary>
+    public string NotificationId { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Notification type (e.g., "transactions.updated")
+    /// </summary>
+    public string NotificationType { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Circle transaction ID the notification referred to
+    /// </summary>
+    public string? CircleTransactionId { get; set; }
+
+    /// <summary>
+    /// When the notification was processed
+    /// </summary>
+    public DateTime ReceivedAt { get; set; } = DateTime.UtcNow;
+}
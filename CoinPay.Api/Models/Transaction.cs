@@ -11,6 +11,12 @@ public class Transaction
     public string? SenderName { get; set; }
     public string? ReceiverName { get; set; }
     public string? Description { get; set; }
+    public string? CircleWalletId { get; set; } // Circle wallet that submitted the transfer (used by status monitoring)
+    public string? TxHash { get; set; } // On-chain hash reported by Circle once the transfer is broadcast
+    public string? CircleState { get; set; } // Last Circle transaction state seen (INITIATED, SENT, CONFIRMED, ...)
     public DateTime CreatedAt { get; set; } = DateTime.UtcNow;
     public DateTime? CompletedAt { get; set; }
+    public DateTime? LastWebhookAt { get; set; } // Last Circle webhook received for this transaction
+    public DateTime? NextStatusCheckAt { get; set; } // When the fallback poller should next check this transaction
+    public int StatusCheckAttempts { get; set; } // Polls since the last status change or webhook
 }
@@ -0,0 +1,79 @@
+namespace CoinPay.Api.Models;
+
+/// <summary>
+/// A webhook delivery waiting to be sent (transactional outbox).
+/// Rows are written when an event is raised and drained by the webhook dispatcher,
+/// so delivery never runs on the request path and survives restarts.
+/// </summary>
+public class WebhookOutboxMessage
+{
+    /// <summary>
+    /// Outbox message ID
+    /// </summary>
+    public long Id { get; set; }
+
+    /// <summary>
+    /// Webhook registration ID
+    /// </summary>
+    public int WebhookId { get; set; }
+
+    /// <summary>
+    /// Event name (e.g., "transaction.confirmed")
+    /// </summary>
+    public string EventName { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Transaction ID that triggered the webhook
+    /// </summary>
+    public int TransactionId { get; set; }
+
+    /// <summary>
+    /// Signed JSON payload, serialized when the event was raised
+    /// </summary>
+    public string Payload { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Delivery status
+    /// </summary>
+    public WebhookDeliveryStatus Status { get; set; } = WebhookDeliveryStatus.Pending;
+
+    /// <summary>
+    /// Number of delivery attempts made so far
+    /// </summary>
+    public int AttemptCount { get; set; }
+
+    /// <summary>
+    /// When the next delivery attempt is due
+    /// </summary>
+    public DateTime NextAttemptAt { get; set; } = DateTime.UtcNow;
+
+    /// <summary>
+    /// Error from the last failed attempt
+    /// </summary>
+    public string? LastError { get; set; }
+
+    /// <summary>
+    /// Event timestamp
+    /// </summary>
+    public DateTime CreatedAt { get; set; } = DateTime.UtcNow;
+
+    /// <summary>
+    /// When the webhook was delivered successfully
+    /// </summary>
+    public DateTime? DeliveredAt { get; set; }
+
+    /// <summary>
+    /// Navigation property to webhook registration
+    /// </summary>
+    public WebhookRegistration? Webhook { get; set; }
+}
+
+/// <summary>
+/// Webhook outbox delivery status
+/// </summary>
+public enum WebhookDeliveryStatus
+{
+    Pending,
+    Delivered,
+    Failed
+}
@@ -73,7 +73,8 @@ public class WebhookDeliveryLog
     public string EventName { get; set; } = string.Empty;
 
     /// <summary>
-    /// Transaction ID that triggered the webhook
+    /// Transaction ID that triggered the webhook. Not a foreign key, since the transaction
+    /// may have moved to BlockchainTransactionArchive.
     /// </summary>
     public int TransactionId { get; set; }
 
@@ -111,9 +112,4 @@ public class WebhookDeliveryLog
     /// Navigation property to webhook registration
     /// </summary>
     public WebhookRegistration? Webhook { get; set; }
-
-    /// <summary>
-    /// Navigation property to transaction
-    /// </summary>
-    public BlockchainTransaction? Transaction { get; set; }
 }
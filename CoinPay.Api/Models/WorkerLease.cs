@@ -0,0 +1,28 @@
+namespace CoinPay.Api.Models;
+
+/// <summary>
+/// Lease on one hash partition of a background worker's items. The API replica that holds an unexpired
+/// lease is the only one that processes the partition's items.
+/// </summary>
+public class WorkerLease
+{
+    /// <summary>
+    /// Background worker the partition belongs to (e.g., "transaction_monitoring")
+    /// </summary>
+    public string WorkerName { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Partition number, from 0 to the configured partition count minus one
+    /// </summary>
+    public int Partition { get; set; }
+
+    /// <summary>
+    /// Node currently holding the lease, or null when the partition is free
+    /// </summary>
+    public string? OwnerId { get; set; }
+
+    /// <summary>
+    /// When the lease lapses unless the owner renews it (database clock)
+    /// </summary>
+    public DateTime ExpiresAt { get; set; }
+}
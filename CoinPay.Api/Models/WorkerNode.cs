@@ -0,0 +1,23 @@
+namespace CoinPay.Api.Models;
+
+/// <summary>
+/// Heartbeat of an API replica taking part in a background worker's partition leasing.
+/// Live nodes are used to work out each node's fair share of partitions.
+/// </summary>
+public class WorkerNode
+{
+    /// <summary>
+    /// Background worker the node runs
+    /// </summary>
+    public string WorkerName { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Node identifier, unique per API process
+    /// </summary>
+    public string NodeId { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Last heartbeat (database clock)
+    /// </summary>
+    public DateTime HeartbeatAt { get; set; }
+}
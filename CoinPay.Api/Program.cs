@@ -18,11 +18,15 @@ using CoinPay.Api.Services.FiatGateway;
 using CoinPay.Api.Services.ExchangeRate;
 using CoinPay.Api.Services.Fees;
 using CoinPay.Api.Services.Vault;
+using CoinPay.Api.Services.Telemetry;
 using StackExchange.Redis;
 using Serilog;
 using Serilog.Events;
 using Microsoft.Extensions.Diagnostics.HealthChecks;
 using AspNetCoreRateLimit;
+using OpenTelemetry.Metrics;
+using OpenTelemetry.Resources;
+using OpenTelemetry.Trace;
 
 // Configure Serilog before building the application
 Log.Logger = new LoggerConfiguration()
@@ -139,7 +143,7 @@ if (!string.IsNullOrEmpty(redisConnectionString))
         });
         builder.Services.AddScoped<ICachingService, RedisCachingService>();
 
-        // Add IDistributedCache for SwapQuoteCacheService
+        // Add IDistributedCache for the shared exchange rate cache
         builder.Services.AddStackExchangeRedisCache(options =>
         {
             options.Configuration = redisConnectionString;
@@ -162,6 +166,33 @@ else
 builder.Services.AddHealthChecks()
     .AddCheck<DatabaseHealthCheck>("database", tags: new[] { "db", "ready" });
 
+// Metrics and traces: upstream latency/retries, cache hit ratios and worker cycles from the CoinPay.Api meter,
+// plus ASP.NET Core, HttpClient, Npgsql and runtime instrumentation. Traces continue the Gateway's traceparent.
+builder.Services.Configure<TelemetryOptions>(builder.Configuration.GetSection("Telemetry"));
+var telemetryOptions = builder.Configuration.GetSection("Telemetry").Get<TelemetryOptions>() ?? new TelemetryOptions();
+builder.Services.AddOpenTelemetry()
+    .ConfigureResource(resource => resource.AddService(CoinPayTelemetry.Name))
+    .WithMetrics(metrics => metrics
+        .AddMeter(CoinPayTelemetry.Name, "CoinPay.Api.SwapQuoteCache", "Npgsql", "System.Runtime")
+        .AddAspNetCoreInstrumentation()
+        .AddHttpClientInstrumentation()
+        .AddPrometheusExporter())
+    .WithTracing(tracing =>
+    {
+        tracing
+            .SetSampler(new ParentBasedSampler(new TraceIdRatioBasedSampler(telemetryOptions.TraceSampleRatio)))
+            .AddSource(CoinPayTelemetry.Name, "Npgsql")
+            .AddAspNetCoreInstrumentation(options =>
+                options.Filter = context => !context.Request.Path.StartsWithSegments("/health") &&
+                                            !context.Request.Path.StartsWithSegments(telemetryOptions.MetricsPath))
+            .AddHttpClientInstrumentation();
+
+        if (!string.IsNullOrEmpty(telemetryOptions.OtlpEndpoint))
+        {
+            tracing.AddOtlpExporter(otlp => otlp.Endpoint = new Uri(telemetryOptions.OtlpEndpoint));
+        }
+    });
+
 // Add CORS with environment-specific policies (read from configuration)
 builder.Services.AddCors(options =>
 {
@@ -215,6 +246,10 @@ builder.Services.AddCors(options =>
 builder.Services.Configure<CircleOptions>(
     builder.Configuration.GetSection("Circle"));
 
+// Configure Circle status tracking (webhook-first, polling as fallback)
+builder.Services.Configure<CircleMonitoringOptions>(
+    builder.Configuration.GetSection("CircleMonitoring"));
+
 // Configure JWT Authentication
 builder.Services.AddAuthentication("Bearer")
     .AddJwtBearer(options =>
@@ -260,18 +295,52 @@ builder.Services.AddScoped<ICircleService>(serviceProvider =>
 });
 
 // Register both implementations so they can be resolved
+// CircleService streams responses from a pooled client; the handler is never recycled
+builder.Services.AddHttpClient(CircleService.HttpClientName, client =>
+{
+    client.Timeout = TimeSpan.FromSeconds(30);
+})
+.ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler
+{
+    PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+    AutomaticDecompression = System.Net.DecompressionMethods.All
+})
+.AddHttpMessageHandler(() => new UpstreamTelemetryHandler("circle", TimeSpan.FromSeconds(30)))
+.SetHandlerLifetime(Timeout.InfiniteTimeSpan);
 builder.Services.AddScoped<CircleService>();
 builder.Services.AddScoped<MockCircleService>();
 
 builder.Services.AddScoped<ICircleWebhookHandler, CircleWebhookHandler>();
+builder.Services.AddScoped<ICircleWebhookSignatureVerifier, CircleWebhookSignatureVerifier>();
 builder.Services.AddScoped<IAuthService, AuthService>();
 builder.Services.AddScoped<IJwtTokenService, JwtTokenService>();
 builder.Services.AddScoped<IWalletService, WalletService>();
 
-// Use PolygonAmoyRpcService for real blockchain balance queries
-builder.Services.AddScoped<IBlockchainRpcService, PolygonAmoyRpcService>();
+// Block-tagged wallet balance cache used by swap validation; invalidated by receipts and submissions
+builder.Services.Configure<WalletBalanceCacheOptions>(builder.Configuration.GetSection("WalletBalanceCache"));
+builder.Services.AddSingleton<IWalletBalanceCache, WalletBalanceCache>();
+
+// Use PolygonAmoyRpcService for real blockchain balance queries.
+// Singleton so concurrent requests share JSON-RPC batches and block-scoped caches.
+builder.Services.Configure<PolygonAmoyRpcOptions>(builder.Configuration.GetSection("Blockchain:PolygonAmoy"));
+builder.Services.AddHttpClient(JsonRpcBatchClient.HttpClientName, (sp, client) =>
+{
+    var rpcOptions = sp.GetRequiredService<Microsoft.Extensions.Options.IOptions<PolygonAmoyRpcOptions>>().Value;
+    client.Timeout = TimeSpan.FromSeconds(rpcOptions.RequestTimeoutSeconds);
+})
+.ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler
+{
+    PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+    AutomaticDecompression = System.Net.DecompressionMethods.All
+})
+.AddHttpMessageHandler(sp => new UpstreamTelemetryHandler(
+    "polygon_rpc",
+    TimeSpan.FromSeconds(sp.GetRequiredService<Microsoft.Extensions.Options.IOptions<PolygonAmoyRpcOptions>>().Value.RequestTimeoutSeconds)))
+.SetHandlerLifetime(Timeout.InfiniteTimeSpan);
+builder.Services.AddSingleton<JsonRpcBatchClient>();
+builder.Services.AddSingleton<IBlockchainRpcService, PolygonAmoyRpcService>();
 // For testing with mock data:
-// builder.Services.AddScoped<IBlockchainRpcService, MockBlockchainRpcService>();
+// builder.Services.AddSingleton<IBlockchainRpcService, MockBlockchainRpcService>();
 
 // Direct blockchain transfer service (for testing/development)
 // Only register if valid private key is configured
@@ -306,20 +375,30 @@ builder.Services.AddScoped<CoinPay.Api.Repositories.IInvestmentRepository, CoinP
 builder.Services.AddSingleton<IEncryptionService, AesEncryptionService>();
 
 // Sprint N04: Phase 4 - Exchange Investment services
+builder.Services.AddHttpClient(CoinPay.Api.Services.Exchange.WhiteBit.WhiteBitApiClient.HttpClientName)
+    .AddHttpMessageHandler(() => new UpstreamTelemetryHandler("whitebit", TimeSpan.FromSeconds(100)));
 builder.Services.AddScoped<CoinPay.Api.Services.Exchange.WhiteBit.IWhiteBitApiClient, CoinPay.Api.Services.Exchange.WhiteBit.WhiteBitApiClient>();
 builder.Services.AddScoped<CoinPay.Api.Services.Exchange.WhiteBit.IWhiteBitAuthService, CoinPay.Api.Services.Exchange.WhiteBit.WhiteBitAuthService>();
 builder.Services.AddSingleton<CoinPay.Api.Services.Encryption.IExchangeCredentialEncryptionService, CoinPay.Api.Services.Encryption.ExchangeCredentialEncryptionService>();
+builder.Services.AddSingleton<CoinPay.Api.Services.Encryption.IExchangeCredentialCache, CoinPay.Api.Services.Encryption.ExchangeCredentialCache>();
+builder.Services.Configure<InvestmentSyncOptions>(builder.Configuration.GetSection("InvestmentSync"));
 builder.Services.AddScoped<CoinPay.Api.Services.Investment.IRewardCalculationService, CoinPay.Api.Services.Investment.RewardCalculationService>();
 Log.Information("Sprint N04: Exchange Investment services registered");
 
 // Sprint N05: Phase 5 - Basic Swap (DEX Integration) services
+builder.Services.AddHttpClient(CoinPay.Api.Services.Swap.OneInchAggregatorService.HttpClientName, client =>
+{
+    client.Timeout = TimeSpan.FromSeconds(10);
+})
+.AddHttpMessageHandler(() => new UpstreamTelemetryHandler("oneinch", TimeSpan.FromSeconds(10)));
 builder.Services.AddScoped<CoinPay.Api.Services.Swap.IDexAggregatorService, CoinPay.Api.Services.Swap.OneInchAggregatorService>();
 builder.Services.AddScoped<CoinPay.Api.Services.Swap.OneInchAggregatorService>();
 builder.Services.AddScoped<CoinPay.Api.Services.Swap.DexAggregatorFactory>();
 builder.Services.AddScoped<CoinPay.Api.Services.Swap.IFeeCalculationService, CoinPay.Api.Services.Swap.FeeCalculationService>();
 builder.Services.AddScoped<CoinPay.Api.Services.Swap.ISlippageToleranceService, CoinPay.Api.Services.Swap.SlippageToleranceService>();
 builder.Services.AddScoped<CoinPay.Api.Services.Swap.ISwapQuoteService, CoinPay.Api.Services.Swap.SwapQuoteService>();
-builder.Services.AddScoped<CoinPay.Api.Services.Caching.ISwapQuoteCacheService, CoinPay.Api.Services.Caching.SwapQuoteCacheService>();
+builder.Services.Configure<CoinPay.Api.Services.Caching.SwapQuoteCacheOptions>(builder.Configuration.GetSection("Swap"));
+builder.Services.AddSingleton<CoinPay.Api.Services.Caching.ISwapQuoteCacheService, CoinPay.Api.Services.Caching.SwapQuoteCacheService>();
 builder.Services.AddScoped<CoinPay.Api.Repositories.ISwapTransactionRepository, CoinPay.Api.Repositories.SwapTransactionRepository>();
 builder.Services.AddScoped<CoinPay.Api.Services.Swap.ITokenBalanceValidationService, CoinPay.Api.Services.Swap.TokenBalanceValidationService>();
 builder.Services.AddScoped<CoinPay.Api.Services.Swap.IPlatformFeeCollectionService, CoinPay.Api.Services.Swap.PlatformFeeCollectionService>();
@@ -338,11 +417,16 @@ builder.Services.AddScoped<IFiatGatewayService, MockFiatGatewayService>();
 // Register memory cache for exchange rate service (Phase 3)
 builder.Services.AddMemoryCache();
 
-// Register new exchange rate service with memory cache (Phase 3)
+// Register shared two-level rate cache (memory L1, Redis L2 when configured) and its upstream source
+builder.Services.Configure<ExchangeRateOptions>(builder.Configuration.GetSection("ExchangeRate"));
+builder.Services.AddSingleton<IRateCache, RateCache>();
+builder.Services.AddScoped<IRateSource, ConfiguredRateSource>();
+
+// Register new exchange rate service on top of the shared rate cache (Phase 3)
 builder.Services.AddScoped<CoinPay.Api.Services.ExchangeRate.IExchangeRateService, CoinPay.Api.Services.ExchangeRate.ExchangeRateService>();
 
 // Register legacy exchange rate service for fiat gateway (Phase 3)
-// This uses Redis caching and delegates to IFiatGatewayService
+// Reads the same shared rate cache; payout previews come straight from IFiatGatewayService
 builder.Services.AddScoped<CoinPay.Api.Services.FiatGateway.IExchangeRateService, CoinPay.Api.Services.FiatGateway.ExchangeRateService>();
 
 // Register conversion fee calculator (Phase 3)
@@ -352,6 +436,9 @@ builder.Services.AddScoped<CoinPay.Api.Services.Fees.IConversionFeeCalculator, C
 builder.Services.AddScoped<CoinPay.Api.Services.Payout.IPayoutStatusService, CoinPay.Api.Services.Payout.PayoutStatusService>();
 
 // Register payout audit service (Phase 3)
+// Entries are queued in memory and bulk-inserted into PayoutAuditLogs by PayoutAuditWriterService
+builder.Services.Configure<PayoutAuditOptions>(builder.Configuration.GetSection("PayoutAudit"));
+builder.Services.AddSingleton<CoinPay.Api.Services.Payout.PayoutAuditQueue>();
 builder.Services.AddSingleton<CoinPay.Api.Services.Payout.IPayoutAuditService, CoinPay.Api.Services.Payout.PayoutAuditService>();
 
 // Register transaction services
@@ -374,23 +461,60 @@ builder.Services.AddHttpClient("CircleBundler", client =>
     client.BaseAddress = new Uri(builder.Configuration["Circle:BundlerUrl"] ?? "https://bundler.circle.com");
     client.DefaultRequestHeaders.Add("Authorization", $"Bearer {builder.Configuration["Circle:ApiKey"]}");
     client.Timeout = TimeSpan.FromSeconds(30);
-});
+})
+.AddHttpMessageHandler(() => new UpstreamTelemetryHandler("circle_bundler", TimeSpan.FromSeconds(30)));
 
 builder.Services.AddHttpClient("CirclePaymaster", client =>
 {
     client.BaseAddress = new Uri(builder.Configuration["Circle:PaymasterUrl"] ?? "https://paymaster.circle.com");
     client.DefaultRequestHeaders.Add("Authorization", $"Bearer {builder.Configuration["Circle:ApiKey"]}");
     client.Timeout = TimeSpan.FromSeconds(30);
-});
+})
+.AddHttpMessageHandler(() => new UpstreamTelemetryHandler("circle_paymaster", TimeSpan.FromSeconds(30)));
+
+// Configure pooled keep-alive HTTP client for outbound webhook deliveries.
+// The handler is never recycled; PooledConnectionLifetime picks up DNS changes instead.
+builder.Services.Configure<WebhookDeliveryOptions>(builder.Configuration.GetSection("WebhookDelivery"));
+builder.Services.AddHttpClient(WebhookDispatcherService.HttpClientName, (sp, client) =>
+{
+    var webhookOptions = sp.GetRequiredService<Microsoft.Extensions.Options.IOptions<WebhookDeliveryOptions>>().Value;
+    client.Timeout = TimeSpan.FromSeconds(webhookOptions.RequestTimeoutSeconds);
+})
+.ConfigurePrimaryHttpMessageHandler(sp => new SocketsHttpHandler
+{
+    PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+    PooledConnectionIdleTimeout = TimeSpan.FromSeconds(90),
+    MaxConnectionsPerServer = sp.GetRequiredService<Microsoft.Extensions.Options.IOptions<WebhookDeliveryOptions>>().Value.MaxConcurrencyPerEndpoint
+})
+.AddHttpMessageHandler(sp => new UpstreamTelemetryHandler(
+    "webhook",
+    TimeSpan.FromSeconds(sp.GetRequiredService<Microsoft.Extensions.Options.IOptions<WebhookDeliveryOptions>>().Value.RequestTimeoutSeconds)))
+.SetHandlerLifetime(Timeout.InfiniteTimeSpan);
 
 // Add MVC Controllers for new endpoints
 builder.Services.AddControllers();
 
+// Worker partition leasing: each replica processes only the wallet/connection partitions it leases
+builder.Services.Configure<CoinPay.Api.Services.Coordination.WorkPartitioningOptions>(builder.Configuration.GetSection("WorkPartitioning"));
+builder.Services.AddSingleton<CoinPay.Api.Services.Coordination.IWorkPartitionCoordinator, CoinPay.Api.Services.Coordination.WorkPartitionCoordinator>();
+
 // Register background services
+// The heartbeat service is registered first so it stops last and releases leases after the workers finish
+builder.Services.AddHostedService<WorkPartitionHeartbeatService>();
+Log.Information("Work Partition Heartbeat background service registered");
 builder.Services.AddHostedService<TransactionMonitoringService>();
 Log.Information("Transaction Monitoring background service registered");
 builder.Services.AddHostedService<CircleTransactionMonitoringService>();
 Log.Information("Circle Transaction Monitoring background service registered");
+builder.Services.AddHostedService<WebhookDispatcherService>();
+Log.Information("Webhook Dispatcher background service registered");
+builder.Services.AddHostedService<PayoutAuditWriterService>();
+Log.Information("Payout Audit Writer background service registered");
+
+// Finished blockchain transactions move to the monthly-partitioned BlockchainTransactionArchive
+builder.Services.Configure<TransactionArchiveOptions>(builder.Configuration.GetSection("TransactionArchive"));
+builder.Services.AddHostedService<TransactionArchiverService>();
+Log.Information("Transaction Archiver background service registered");
 
 // Sprint N04: Phase 4 - Investment Position Sync Worker
 builder.Services.AddHostedService<CoinPay.Api.Services.BackgroundWorkers.InvestmentPositionSyncService>();
@@ -497,9 +621,79 @@ app.MapHealthChecks("/health/live", new Microsoft.AspNetCore.Diagnostics.HealthC
     Predicate = _ => false // No checks, just responds if app is running
 });
 
+// Prometheus scrape endpoint, served only on the internal metrics listener
+var metricsOptions = app.Services.GetRequiredService<Microsoft.Extensions.Options.IOptions<TelemetryOptions>>().Value;
+if (metricsOptions.MetricsEnabled)
+{
+    app.UseOpenTelemetryPrometheusScrapingEndpoint(context =>
+        context.Connection.LocalPort == metricsOptions.MetricsPort &&
+        context.Request.Path == metricsOptions.MetricsPath);
+    Log.Information("Prometheus metrics endpoint mapped at {MetricsPath} on port {MetricsPort}",
+        metricsOptions.MetricsPath, metricsOptions.MetricsPort);
+}
+
 // Map controllers for transaction endpoints
 app.MapControllers();
 
+// POST: Circle webhook endpoint for transaction status updates
+// Primary status source for Circle transfers - CircleTransactionMonitoringService only polls rows that go silent
+app.MapPost("/api/webhooks/circle", async (
+    HttpRequest request,
+    ICircleWebhookSignatureVerifier signatureVerifier,
+    ICircleWebhookHandler webhookHandler,
+    CancellationToken cancellationToken) =>
+{
+    // The signature covers the exact bytes Circle sent, so read the body before deserializing it
+    using var buffer = new MemoryStream();
+    await request.Body.CopyToAsync(buffer, cancellationToken);
+    var body = buffer.ToArray();
+
+    if (!await signatureVerifier.VerifyAsync(
+            request.Headers["X-Circle-Key-Id"].ToString(),
+            request.Headers["X-Circle-Signature"].ToString(),
+            body,
+            cancellationToken))
+    {
+        return Results.Unauthorized();
+    }
+
+    CircleWebhookNotification? notification;
+    try
+    {
+        notification = System.Text.Json.JsonSerializer.Deserialize<CircleWebhookNotification>(body);
+    }
+    catch (System.Text.Json.JsonException ex)
+    {
+        Log.Warning(ex, "Circle webhook body could not be parsed");
+        return Results.BadRequest(new { error = "Invalid notification payload" });
+    }
+
+    if (notification == null)
+    {
+        return Results.BadRequest(new { error = "Invalid notification payload" });
+    }
+
+    try
+    {
+        Log.Information("Received Circle webhook notification: Type={Type}, NotificationId={NotificationId}",
+            notification.NotificationType, notification.NotificationId);
+
+        await webhookHandler.ProcessWebhookAsync(notification, cancellationToken);
+
+        return Results.Ok(new { success = true, message = "Webhook processed successfully" });
+    }
+    catch (Exception ex)
+    {
+        Log.Error(ex, "Error processing Circle webhook {NotificationId}", notification.NotificationId);
+        return Results.StatusCode(500);
+    }
+})
+.AllowAnonymous() // Circle webhooks don't use JWT; they are authenticated by Circle's notification signature
+.WithName("CircleWebhook")
+.WithTags("Webhooks")
+.WithSummary("Circle webhook endpoint for transaction updates")
+.WithDescription("Receives transaction status updates from Circle API. Requests must carry a valid X-Circle-Signature for the X-Circle-Key-Id header; unsigned or tampered notifications get 401. Notifications are deduplicated by NotificationId.");
+
 // API Endpoints
 
 // GET: Get all transactions
@@ -586,6 +780,7 @@ app.MapPost("/api/transactions", async (
                 var mockTransactionId = $"mock-circle-tx-{Guid.NewGuid().ToString("N").Substring(0, 12)}";
 
                 transaction.TransactionId = mockTransactionId;
+                transaction.CircleWalletId = wallet.CircleWalletId;
                 transaction.CreatedAt = DateTime.UtcNow;
                 transaction.Status = "Pending"; // Simulate pending status
 
@@ -620,6 +815,7 @@ app.MapPost("/api/transactions", async (
 
             // Store transaction with Circle transaction ID
             transaction.TransactionId = circleResponse.TransactionId;
+            transaction.CircleWalletId = wallet.CircleWalletId;
             transaction.CreatedAt = DateTime.UtcNow;
             transaction.Status = circleResponse.Status == "PENDING" ? "Pending" :
                                 circleResponse.Status == "CONFIRMED" ? "Completed" :
@@ -26,6 +26,15 @@ public class ExchangeConnectionRepository : IExchangeConnectionRepository
             .FirstOrDefaultAsync(e => e.Id == id);
     }
 
+    public async Task<List<ExchangeConnection>> GetByIdsAsync(IEnumerable<Guid> ids)
+    {
+        var idList = ids.Distinct().ToList();
+
+        return await _context.ExchangeConnections
+            .Where(e => idList.Contains(e.Id))
+            .ToListAsync();
+    }
+
     public async Task<ExchangeConnection?> GetByUserAndExchangeAsync(Guid userId, string exchangeName)
     {
         return await _context.ExchangeConnections
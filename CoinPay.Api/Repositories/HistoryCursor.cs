@@ -0,0 +1,66 @@
+using System.Globalization;
+using System.Text;
+using Microsoft.AspNetCore.WebUtilities;
+
+namespace CoinPay.Api.Repositories;
+
+/// <summary>
+/// Opaque keyset cursor for history queries ordered by (CreatedAt, Id).
+/// Encodes the position of the last item of a page so the next page can seek past it
+/// instead of skipping rows.
+/// </summary>
+public readonly record struct HistoryCursor(DateTime CreatedAt, string Id)
+{
+    /// <summary>
+    /// Encode the cursor as a URL-safe token
+    /// </summary>
+    public string Encode()
+    {
+        var raw = $"{CreatedAt.Ticks.ToString(CultureInfo.InvariantCulture)}:{Id}";
+        return WebEncoders.Base64UrlEncode(Encoding.UTF8.GetBytes(raw));
+    }
+
+    /// <summary>
+    /// Decode a token produced by <see cref="Encode"/>. Returns false for missing or malformed tokens.
+    /// </summary>
+    public static bool TryParse(string? token, out HistoryCursor cursor)
+    {
+        cursor = default;
+
+        if (string.IsNullOrWhiteSpace(token))
+            return false;
+
+        try
+        {
+            var raw = Encoding.UTF8.GetString(WebEncoders.Base64UrlDecode(token));
+            var separator = raw.IndexOf(':');
+
+            if (separator <= 0 ||
+                !long.TryParse(raw.AsSpan(0, separator), NumberStyles.None, CultureInfo.InvariantCulture, out var ticks) ||
+                ticks > DateTime.MaxValue.Ticks)
+            {
+                return false;
+            }
+
+            cursor = new HistoryCursor(new DateTime(ticks, DateTimeKind.Utc), raw[(separator + 1)..]);
+            return true;
+        }
+        catch (FormatException)
+        {
+            return false;
+        }
+    }
+}
+
+/// <summary>
+/// One page of history items with the cursor for the following page
+/// </summary>
+public class HistoryPage<T>
+{
+    public List<T> Items { get; set; } = new();
+
+    /// <summary>
+    /// Cursor for the next page, or null when this is the last page (or the sort order has no keyset)
+    /// </summary>
+    public string? NextCursor { get; set; }
+}
@@ -8,6 +8,7 @@ namespace CoinPay.Api.Repositories;
 public interface IExchangeConnectionRepository
 {
     Task<ExchangeConnection?> GetByIdAsync(Guid id);
+    Task<List<ExchangeConnection>> GetByIdsAsync(IEnumerable<Guid> ids);
     Task<ExchangeConnection?> GetByUserAndExchangeAsync(Guid userId, string exchangeName);
     Task<List<ExchangeConnection>> GetByUserIdAsync(Guid userId);
     Task<ExchangeConnection> CreateAsync(ExchangeConnection connection);
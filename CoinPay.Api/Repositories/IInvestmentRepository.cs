@@ -13,6 +13,7 @@ public interface IInvestmentRepository
     Task<List<InvestmentPosition>> GetActivePositionsByUserAsync(Guid userId);
     Task<InvestmentPosition> CreateAsync(InvestmentPosition position);
     Task<InvestmentPosition> UpdateAsync(InvestmentPosition position);
+    Task<int> UpdateRangeAsync(IReadOnlyCollection<InvestmentPosition> positions);
     Task DeleteAsync(Guid id);
 
     // Transaction operations
@@ -1,3 +1,4 @@
+using CoinPay.Api.DTOs;
 using CoinPay.Api.Models;
 
 namespace CoinPay.Api.Repositories;
@@ -42,6 +43,23 @@ public interface ISwapTransactionRepository
         int pageSize = 20,
         SwapStatus? status = null);
 
+    /// <summary>
+    /// Gets one page of a user's swap history (newest first) projected straight into history items (untracked).
+    /// Seeks past <paramref name="after"/> on (CreatedAt, Id) when a cursor is given; otherwise pages by offset.
+    /// </summary>
+    /// <param name="userId">User ID</param>
+    /// <param name="status">Filter by status (optional)</param>
+    /// <param name="after">Cursor from the previous page (optional)</param>
+    /// <param name="page">Page number (1-based), used when no cursor is given</param>
+    /// <param name="pageSize">Items per page</param>
+    /// <returns>Page of swap history items with the next page cursor</returns>
+    Task<HistoryPage<SwapHistoryItem>> GetHistoryPageByUserAsync(
+        Guid userId,
+        SwapStatus? status = null,
+        HistoryCursor? after = null,
+        int page = 1,
+        int pageSize = 20);
+
     /// <summary>
     /// Gets swap transactions for a wallet address with pagination
     /// </summary>
@@ -61,7 +79,7 @@ public interface ISwapTransactionRepository
     Task UpdateAsync(SwapTransaction transaction);
 
     /// <summary>
-    /// Gets total count of swaps for a user
+    /// Gets total count of swaps for a user (cached briefly per user and status)
     /// </summary>
     /// <param name="userId">User ID</param>
     /// <param name="status">Filter by status (optional)</param>
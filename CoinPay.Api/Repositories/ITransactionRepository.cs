@@ -1,3 +1,4 @@
+using CoinPay.Api.DTOs;
 using CoinPay.Api.Models;
 
 namespace CoinPay.Api.Repositories;
@@ -13,7 +14,7 @@ public interface ITransactionRepository
     Task<BlockchainTransaction> CreateAsync(BlockchainTransaction transaction, CancellationToken cancellationToken = default);
 
     /// <summary>
-    /// Get transaction by internal ID
+    /// Get transaction by internal ID. Archived transactions are returned detached.
     /// </summary>
     Task<BlockchainTransaction?> GetByIdAsync(int id, CancellationToken cancellationToken = default);
 
@@ -28,12 +29,12 @@ public interface ITransactionRepository
     Task<BlockchainTransaction?> GetByTransactionHashAsync(string txHash, CancellationToken cancellationToken = default);
 
     /// <summary>
-    /// Get all transactions for a specific wallet
+    /// Get the most recent transactions for a specific wallet, including archived ones
     /// </summary>
     Task<List<BlockchainTransaction>> GetByWalletIdAsync(int walletId, int limit = 20, CancellationToken cancellationToken = default);
 
     /// <summary>
-    /// Get transactions by wallet address
+    /// Get recent transactions by wallet address (live tier only)
     /// </summary>
     Task<List<BlockchainTransaction>> GetByWalletAddressAsync(string address, int limit = 20, CancellationToken cancellationToken = default);
 
@@ -58,18 +59,73 @@ public interface ITransactionRepository
     Task<List<BlockchainTransaction>> GetPendingByWalletIdAsync(int walletId, CancellationToken cancellationToken = default);
 
     /// <summary>
-    /// Get transaction history with pagination, sorting, and filtering
+    /// Get a batch of pending transactions across all wallets, ordered by wallet and then by ID so that
+    /// each wallet's transactions are contiguous. Uses a keyset cursor: pass the (WalletId, Id) of the last
+    /// row of the previous batch, or zeros for the first batch. When <paramref name="walletPartitions"/> is given,
+    /// only wallets whose ID modulo <paramref name="partitionCount"/> is in the list are returned.
     /// </summary>
-    Task<(List<BlockchainTransaction> transactions, int totalCount)> GetHistoryAsync(
+    Task<List<BlockchainTransaction>> GetPendingBatchAsync(
+        int afterWalletId,
+        int afterId,
+        int batchSize,
+        DateTime? createdAfter = null,
+        int[]? walletPartitions = null,
+        int partitionCount = 0,
+        CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Mark a set of transactions as confirmed with their receipt information in a single save
+    /// </summary>
+    Task<int> UpdateWithReceiptsAsync(IReadOnlyCollection<BlockchainReceiptUpdate> updates, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Get one page of transaction history projected straight into response DTOs (untracked).
+    /// When sorting by CreatedAt and a cursor is given, the page seeks past the cursor on (CreatedAt, Id);
+    /// otherwise it falls back to offset paging by page number.
+    /// </summary>
+    Task<HistoryPage<TransactionStatusResponse>> GetHistoryPageAsync(
         int walletId,
+        TransactionHistoryFilter filter,
+        HistoryCursor? after = null,
         int page = 1,
         int pageSize = 20,
-        string? status = null,
-        DateTime? startDate = null,
-        DateTime? endDate = null,
-        decimal? minAmount = null,
-        decimal? maxAmount = null,
         string sortBy = "CreatedAt",
         bool sortDescending = true,
         CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Get the total number of history rows matching a filter. Counts are cached briefly per wallet and filter.
+    /// </summary>
+    Task<int> GetHistoryCountAsync(int walletId, TransactionHistoryFilter filter, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Get the creation time of the oldest finished transaction created before a cutoff, or null if there is none
+    /// </summary>
+    Task<DateTime?> GetOldestArchivableAsync(DateTime createdBefore, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Create the archive partition for the month containing <paramref name="month"/> if it does not exist yet
+    /// </summary>
+    Task EnsureArchivePartitionAsync(DateTime month, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Move up to <paramref name="batchSize"/> confirmed or failed transactions created before a cutoff
+    /// from BlockchainTransactions into the archive. Returns the number of rows moved.
+    /// </summary>
+    Task<int> ArchiveFinishedAsync(DateTime createdBefore, int batchSize, CancellationToken cancellationToken = default);
 }
+
+/// <summary>
+/// Receipt information used to confirm a pending blockchain transaction
+/// </summary>
+public record BlockchainReceiptUpdate(int TransactionId, string TransactionHash, long BlockNumber, decimal GasUsed);
+
+/// <summary>
+/// Filters applied to transaction history queries
+/// </summary>
+public record TransactionHistoryFilter(
+    TransactionStatus? Status = null,
+    DateTime? StartDate = null,
+    DateTime? EndDate = null,
+    decimal? MinAmount = null,
+    decimal? MaxAmount = null);
@@ -42,6 +42,12 @@ public interface IWebhookRepository
     /// </summary>
     Task<WebhookDeliveryLog> LogDeliveryAsync(WebhookDeliveryLog log, CancellationToken cancellationToken = default);
 
+    /// <summary>
+    /// Stage webhook deliveries in the outbox for the background dispatcher.
+    /// Nothing is saved here: the caller's SaveChanges writes the rows together with the change that raised the event.
+    /// </summary>
+    void AddDeliveries(IReadOnlyCollection<WebhookOutboxMessage> messages);
+
     /// <summary>
     /// Get delivery logs for a webhook
     /// </summary>
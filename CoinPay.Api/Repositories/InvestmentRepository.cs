@@ -78,6 +78,27 @@ public class InvestmentRepository : IInvestmentRepository
         return position;
     }
 
+    public async Task<int> UpdateRangeAsync(IReadOnlyCollection<InvestmentPosition> positions)
+    {
+        if (positions.Count == 0)
+        {
+            return 0;
+        }
+
+        var updatedAt = DateTime.UtcNow;
+        foreach (var position in positions)
+        {
+            position.UpdatedAt = updatedAt;
+        }
+
+        _context.InvestmentPositions.UpdateRange(positions);
+        await _context.SaveChangesAsync();
+
+        _logger.LogInformation("Updated {Count} investment positions", positions.Count);
+
+        return positions.Count;
+    }
+
     public async Task DeleteAsync(Guid id)
     {
         var position = await GetByIdAsync(id);
@@ -1,6 +1,8 @@
 using CoinPay.Api.Data;
+using CoinPay.Api.DTOs;
 using CoinPay.Api.Models;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Caching.Memory;
 using Microsoft.Extensions.Logging;
 
 namespace CoinPay.Api.Repositories;
@@ -12,13 +14,18 @@ public class SwapTransactionRepository : ISwapTransactionRepository
 {
     private readonly AppDbContext _context;
     private readonly ILogger<SwapTransactionRepository> _logger;
+    private readonly IMemoryCache _cache;
+
+    private static readonly TimeSpan CountCacheDuration = TimeSpan.FromSeconds(30);
 
     public SwapTransactionRepository(
         AppDbContext context,
-        ILogger<SwapTransactionRepository> logger)
+        ILogger<SwapTransactionRepository> logger,
+        IMemoryCache cache)
     {
         _context = context;
         _logger = logger;
+        _cache = cache;
     }
 
     public async Task<SwapTransaction> CreateAsync(SwapTransaction transaction)
@@ -79,6 +86,78 @@ public class SwapTransactionRepository : ISwapTransactionRepository
         return swaps;
     }
 
+    public async Task<HistoryPage<SwapHistoryItem>> GetHistoryPageByUserAsync(
+        Guid userId,
+        SwapStatus? status = null,
+        HistoryCursor? after = null,
+        int page = 1,
+        int pageSize = 20)
+    {
+        var query = _context.SwapTransactions
+            .AsNoTracking()
+            .Where(s => s.UserId == userId);
+
+        if (status.HasValue)
+        {
+            query = query.Where(s => s.Status == status.Value);
+        }
+
+        var cursor = after.GetValueOrDefault();
+        var afterId = Guid.Empty;
+        var seek = after.HasValue && Guid.TryParse(cursor.Id, out afterId);
+
+        if (seek)
+        {
+            var afterCreatedAt = cursor.CreatedAt;
+            query = query.Where(s => s.CreatedAt < afterCreatedAt ||
+                                     (s.CreatedAt == afterCreatedAt && s.Id.CompareTo(afterId) < 0));
+        }
+
+        query = query
+            .OrderByDescending(s => s.CreatedAt)
+            .ThenByDescending(s => s.Id);
+
+        if (!seek)
+        {
+            query = query.Skip((page - 1) * pageSize);
+        }
+
+        // Fetch one extra row to know whether another page exists
+        var items = await query
+            .Take(pageSize + 1)
+            .Select(s => new SwapHistoryItem
+            {
+                Id = s.Id,
+                FromToken = s.FromToken,
+                FromTokenSymbol = s.FromTokenSymbol,
+                ToToken = s.ToToken,
+                ToTokenSymbol = s.ToTokenSymbol,
+                FromAmount = s.FromAmount,
+                ToAmount = s.ToAmount,
+                ExchangeRate = s.ExchangeRate,
+                PlatformFee = s.PlatformFee,
+                Status = s.Status.ToString().ToLower(),
+                TransactionHash = s.TransactionHash,
+                CreatedAt = s.CreatedAt,
+                ConfirmedAt = s.ConfirmedAt
+            })
+            .ToListAsync();
+
+        var hasMore = items.Count > pageSize;
+        if (hasMore)
+        {
+            items.RemoveAt(items.Count - 1);
+        }
+
+        return new HistoryPage<SwapHistoryItem>
+        {
+            Items = items,
+            NextCursor = hasMore
+                ? new HistoryCursor(items[^1].CreatedAt, items[^1].Id.ToString()).Encode()
+                : null
+        };
+    }
+
     public async Task<List<SwapTransaction>> GetByWalletAddressAsync(
         string walletAddress,
         int page = 1,
@@ -110,6 +189,13 @@ public class SwapTransactionRepository : ISwapTransactionRepository
 
     public async Task<int> GetSwapCountByUserAsync(Guid userId, SwapStatus? status = null)
     {
+        var cacheKey = $"swap-count:{userId}:{status}";
+
+        if (_cache.TryGetValue(cacheKey, out int cachedCount))
+        {
+            return cachedCount;
+        }
+
         var query = _context.SwapTransactions
             .Where(s => s.UserId == userId);
 
@@ -118,7 +204,11 @@ public class SwapTransactionRepository : ISwapTransactionRepository
             query = query.Where(s => s.Status == status.Value);
         }
 
-        return await query.CountAsync();
+        var count = await query.CountAsync();
+
+        _cache.Set(cacheKey, count, CountCacheDuration);
+
+        return count;
     }
 
     public async Task<decimal> GetTotalVolumeByUserAsync(Guid userId)
@@ -1,21 +1,32 @@
+using System.Globalization;
+using System.Linq.Expressions;
 using CoinPay.Api.Data;
+using CoinPay.Api.DTOs;
 using CoinPay.Api.Models;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Caching.Memory;
 
 namespace CoinPay.Api.Repositories;
 
 /// <summary>
-/// Repository implementation for blockchain transaction operations
+/// Repository implementation for blockchain transaction operations.
+/// Transactions live in two tiers: BlockchainTransactions holds pending and recently finished rows,
+/// and BlockchainTransactionArchive holds finished rows moved there by the archiver. Lookups and history
+/// cover both tiers; pending-work queries only touch the live tier.
 /// </summary>
 public class TransactionRepository : ITransactionRepository
 {
     private readonly AppDbContext _context;
     private readonly ILogger<TransactionRepository> _logger;
+    private readonly IMemoryCache _cache;
 
-    public TransactionRepository(AppDbContext context, ILogger<TransactionRepository> logger)
+    private static readonly TimeSpan HistoryCountCacheDuration = TimeSpan.FromSeconds(30);
+
+    public TransactionRepository(AppDbContext context, ILogger<TransactionRepository> logger, IMemoryCache cache)
     {
         _context = context;
         _logger = logger;
+        _cache = cache;
     }
 
     public async Task<BlockchainTransaction> CreateAsync(BlockchainTransaction transaction, CancellationToken cancellationToken = default)
@@ -38,30 +49,52 @@ public class TransactionRepository : ITransactionRepository
     {
         return await _context.BlockchainTransactions
             .Include(t => t.Wallet)
-            .FirstOrDefaultAsync(t => t.Id == id, cancellationToken);
+            .FirstOrDefaultAsync(t => t.Id == id, cancellationToken)
+            ?? await FindArchivedAsync(t => t.Id == id, cancellationToken);
     }
 
     public async Task<BlockchainTransaction?> GetByUserOpHashAsync(string userOpHash, CancellationToken cancellationToken = default)
     {
         return await _context.BlockchainTransactions
             .Include(t => t.Wallet)
-            .FirstOrDefaultAsync(t => t.UserOpHash == userOpHash, cancellationToken);
+            .FirstOrDefaultAsync(t => t.UserOpHash == userOpHash, cancellationToken)
+            ?? await FindArchivedAsync(t => t.UserOpHash == userOpHash, cancellationToken);
     }
 
     public async Task<BlockchainTransaction?> GetByTransactionHashAsync(string txHash, CancellationToken cancellationToken = default)
     {
         return await _context.BlockchainTransactions
             .Include(t => t.Wallet)
-            .FirstOrDefaultAsync(t => t.TransactionHash == txHash, cancellationToken);
+            .FirstOrDefaultAsync(t => t.TransactionHash == txHash, cancellationToken)
+            ?? await FindArchivedAsync(t => t.TransactionHash == txHash, cancellationToken);
     }
 
     public async Task<List<BlockchainTransaction>> GetByWalletIdAsync(int walletId, int limit = 20, CancellationToken cancellationToken = default)
     {
-        return await _context.BlockchainTransactions
+        var transactions = await _context.BlockchainTransactions
+            .Where(t => t.WalletId == walletId)
+            .OrderByDescending(t => t.CreatedAt)
+            .Take(limit)
+            .ToListAsync(cancellationToken);
+
+        if (transactions.Count == limit)
+        {
+            return transactions;
+        }
+
+        // Short on live rows: top up from the archive
+        var archived = await _context.ArchivedBlockchainTransactions
+            .AsNoTracking()
             .Where(t => t.WalletId == walletId)
             .OrderByDescending(t => t.CreatedAt)
             .Take(limit)
             .ToListAsync(cancellationToken);
+
+        return transactions
+            .Concat(archived.Select(ToBlockchainTransaction))
+            .OrderByDescending(t => t.CreatedAt)
+            .Take(limit)
+            .ToList();
     }
 
     public async Task<List<BlockchainTransaction>> GetByWalletAddressAsync(string address, int limit = 20, CancellationToken cancellationToken = default)
@@ -126,7 +159,9 @@ public class TransactionRepository : ITransactionRepository
     public async Task<bool> ExistsAsync(string userOpHash, CancellationToken cancellationToken = default)
     {
         return await _context.BlockchainTransactions
-            .AnyAsync(t => t.UserOpHash == userOpHash, cancellationToken);
+                   .AnyAsync(t => t.UserOpHash == userOpHash, cancellationToken)
+               || await _context.ArchivedBlockchainTransactions
+                   .AnyAsync(t => t.UserOpHash == userOpHash, cancellationToken);
     }
 
     public async Task<List<BlockchainTransaction>> GetPendingByWalletIdAsync(int walletId, CancellationToken cancellationToken = default)
@@ -137,86 +172,404 @@ public class TransactionRepository : ITransactionRepository
             .ToListAsync(cancellationToken);
     }
 
-    public async Task<(List<BlockchainTransaction> transactions, int totalCount)> GetHistoryAsync(
-        int walletId,
-        int page = 1,
-        int pageSize = 20,
-        string? status = null,
-        DateTime? startDate = null,
-        DateTime? endDate = null,
-        decimal? minAmount = null,
-        decimal? maxAmount = null,
-        string sortBy = "CreatedAt",
-        bool sortDescending = true,
+    public async Task<List<BlockchainTransaction>> GetPendingBatchAsync(
+        int afterWalletId,
+        int afterId,
+        int batchSize,
+        DateTime? createdAfter = null,
+        int[]? walletPartitions = null,
+        int partitionCount = 0,
         CancellationToken cancellationToken = default)
     {
-        _logger.LogInformation(
-            "Fetching transaction history for wallet {WalletId}: Page={Page}, PageSize={PageSize}, Status={Status}, SortBy={SortBy}",
-            walletId, page, pageSize, status, sortBy);
-
-        // Start with base query
+        // Keyset scan over the partial IX_BlockchainTransactions_Pending_WalletId_Id, which holds pending rows only
         var query = _context.BlockchainTransactions
-            .Include(t => t.Wallet)
-            .Where(t => t.WalletId == walletId);
+            .AsNoTracking()
+            .Where(t => t.Status == TransactionStatus.Pending &&
+                        (t.WalletId > afterWalletId || (t.WalletId == afterWalletId && t.Id > afterId)));
 
-        // Apply status filter
-        if (!string.IsNullOrEmpty(status) && Enum.TryParse<TransactionStatus>(status, true, out var statusEnum))
+        if (createdAfter.HasValue)
         {
-            query = query.Where(t => t.Status == statusEnum);
+            query = query.Where(t => t.CreatedAt >= createdAfter.Value);
         }
 
-        // Apply date range filter
-        if (startDate.HasValue)
+        if (walletPartitions != null && partitionCount > 0)
         {
-            query = query.Where(t => t.CreatedAt >= startDate.Value);
+            query = query.Where(t => walletPartitions.Contains(t.WalletId % partitionCount));
         }
 
-        if (endDate.HasValue)
+        return await query
+            .OrderBy(t => t.WalletId)
+            .ThenBy(t => t.Id)
+            .Take(batchSize)
+            .ToListAsync(cancellationToken);
+    }
+
+    public async Task<int> UpdateWithReceiptsAsync(IReadOnlyCollection<BlockchainReceiptUpdate> updates, CancellationToken cancellationToken = default)
+    {
+        if (updates.Count == 0)
         {
-            query = query.Where(t => t.CreatedAt <= endDate.Value);
+            return 0;
         }
 
-        // Apply amount range filter
-        if (minAmount.HasValue)
+        var updatesById = updates.ToDictionary(u => u.TransactionId);
+        var ids = updatesById.Keys.ToList();
+
+        // Only rows that are still pending are confirmed, so a concurrent status change is not overwritten
+        var transactions = await _context.BlockchainTransactions
+            .Where(t => ids.Contains(t.Id) && t.Status == TransactionStatus.Pending)
+            .ToListAsync(cancellationToken);
+
+        var confirmedAt = DateTime.UtcNow;
+
+        foreach (var transaction in transactions)
         {
-            query = query.Where(t => t.AmountDecimal >= minAmount.Value);
+            var update = updatesById[transaction.Id];
+
+            transaction.TransactionHash = update.TransactionHash;
+            transaction.BlockNumber = update.BlockNumber;
+            transaction.GasUsed = update.GasUsed;
+            transaction.Status = TransactionStatus.Confirmed;
+            transaction.ConfirmedAt = confirmedAt;
         }
 
-        if (maxAmount.HasValue)
+        await _context.SaveChangesAsync(cancellationToken);
+
+        _logger.LogInformation("Confirmed {Count} of {Requested} transactions with receipts",
+            transactions.Count, updates.Count);
+
+        return transactions.Count;
+    }
+
+    public async Task<HistoryPage<TransactionStatusResponse>> GetHistoryPageAsync(
+        int walletId,
+        TransactionHistoryFilter filter,
+        HistoryCursor? after = null,
+        int page = 1,
+        int pageSize = 20,
+        string sortBy = "CreatedAt",
+        bool sortDescending = true,
+        CancellationToken cancellationToken = default)
+    {
+        _logger.LogInformation(
+            "Fetching transaction history for wallet {WalletId}: Page={Page}, PageSize={PageSize}, Cursor={HasCursor}, Status={Status}, SortBy={SortBy}",
+            walletId, page, pageSize, after.HasValue, filter.Status, sortBy);
+
+        var query = ApplyHistoryFilter(QueryHistoryRows(walletId), filter);
+
+        // Keyset paging is only possible for the (CreatedAt, Id) order backed by the (WalletId, CreatedAt, Id) index of each tier
+        var keysetOrder = string.Equals(sortBy, "CreatedAt", StringComparison.OrdinalIgnoreCase);
+        var cursor = after.GetValueOrDefault();
+        var afterId = 0;
+        var seek = keysetOrder && after.HasValue && int.TryParse(cursor.Id, out afterId);
+
+        if (seek)
         {
-            query = query.Where(t => t.AmountDecimal <= maxAmount.Value);
-        }
+            var afterCreatedAt = cursor.CreatedAt;
 
-        // Get total count before pagination
-        var totalCount = await query.CountAsync(cancellationToken);
+            query = sortDescending
+                ? query.Where(t => t.CreatedAt < afterCreatedAt || (t.CreatedAt == afterCreatedAt && t.Id < afterId))
+                : query.Where(t => t.CreatedAt > afterCreatedAt || (t.CreatedAt == afterCreatedAt && t.Id > afterId));
+        }
 
-        // Apply sorting
+        // Apply sorting (Id breaks ties so pages never overlap)
         query = sortBy.ToLower() switch
         {
             "amount" => sortDescending
-                ? query.OrderByDescending(t => t.AmountDecimal)
-                : query.OrderBy(t => t.AmountDecimal),
+                ? query.OrderByDescending(t => t.AmountDecimal).ThenByDescending(t => t.Id)
+                : query.OrderBy(t => t.AmountDecimal).ThenBy(t => t.Id),
             "status" => sortDescending
-                ? query.OrderByDescending(t => t.Status)
-                : query.OrderBy(t => t.Status),
+                ? query.OrderByDescending(t => t.Status).ThenByDescending(t => t.Id)
+                : query.OrderBy(t => t.Status).ThenBy(t => t.Id),
             "confirmedat" => sortDescending
-                ? query.OrderByDescending(t => t.ConfirmedAt)
-                : query.OrderBy(t => t.ConfirmedAt),
+                ? query.OrderByDescending(t => t.ConfirmedAt).ThenByDescending(t => t.Id)
+                : query.OrderBy(t => t.ConfirmedAt).ThenBy(t => t.Id),
             _ => sortDescending
-                ? query.OrderByDescending(t => t.CreatedAt)
-                : query.OrderBy(t => t.CreatedAt)
+                ? query.OrderByDescending(t => t.CreatedAt).ThenByDescending(t => t.Id)
+                : query.OrderBy(t => t.CreatedAt).ThenBy(t => t.Id)
         };
 
-        // Apply pagination
-        var transactions = await query
-            .Skip((page - 1) * pageSize)
-            .Take(pageSize)
+        // Offset paging when there is no usable cursor
+        if (!seek)
+        {
+            query = query.Skip((page - 1) * pageSize);
+        }
+
+        // Fetch one extra row to know whether another page exists
+        var rows = await query
+            .Take(pageSize + 1)
             .ToListAsync(cancellationToken);
 
+        var hasMore = rows.Count > pageSize;
+        if (hasMore)
+        {
+            rows.RemoveAt(rows.Count - 1);
+        }
+
+        var result = new HistoryPage<TransactionStatusResponse>
+        {
+            Items = rows.Select(r => new TransactionStatusResponse
+            {
+                TransactionId = r.Id,
+                UserOpHash = r.UserOpHash,
+                TransactionHash = r.TransactionHash,
+                Status = r.Status.ToString(),
+                FromAddress = r.FromAddress,
+                ToAddress = r.ToAddress,
+                Amount = r.AmountDecimal,
+                TokenAddress = r.TokenAddress,
+                IsGasless = r.IsGasless,
+                GasUsed = r.GasUsed,
+                BlockNumber = r.BlockNumber,
+                Confirmations = r.Confirmations,
+                ChainId = r.ChainId,
+                SubmittedAt = r.SubmittedAt ?? r.CreatedAt,
+                ConfirmedAt = r.ConfirmedAt,
+                ErrorMessage = r.ErrorMessage
+            }).ToList(),
+            NextCursor = hasMore && keysetOrder
+                ? new HistoryCursor(rows[^1].CreatedAt, rows[^1].Id.ToString()).Encode()
+                : null
+        };
+
         _logger.LogInformation(
-            "Retrieved {Count} transactions out of {Total} total for wallet {WalletId}",
-            transactions.Count, totalCount, walletId);
+            "Retrieved {Count} transactions for wallet {WalletId} (more: {HasMore})",
+            result.Items.Count, walletId, hasMore);
+
+        return result;
+    }
 
-        return (transactions, totalCount);
+    public async Task<int> GetHistoryCountAsync(int walletId, TransactionHistoryFilter filter, CancellationToken cancellationToken = default)
+    {
+        var cacheKey = $"tx-history-count:{walletId}:{filter}";
+
+        if (_cache.TryGetValue(cacheKey, out int cachedCount))
+        {
+            return cachedCount;
+        }
+
+        var count = await ApplyHistoryFilter(QueryHistoryRows(walletId), filter)
+            .CountAsync(cancellationToken);
+
+        _cache.Set(cacheKey, count, HistoryCountCacheDuration);
+
+        return count;
+    }
+
+    public async Task<DateTime?> GetOldestArchivableAsync(DateTime createdBefore, CancellationToken cancellationToken = default)
+    {
+        return await _context.BlockchainTransactions
+            .Where(t => t.Status != TransactionStatus.Pending && t.CreatedAt < createdBefore)
+            .MinAsync(t => (DateTime?)t.CreatedAt, cancellationToken);
+    }
+
+    public async Task EnsureArchivePartitionAsync(DateTime month, CancellationToken cancellationToken = default)
+    {
+        var from = new DateTime(month.Year, month.Month, 1, 0, 0, 0, DateTimeKind.Utc);
+        var to = from.AddMonths(1);
+
+        // Partition name and bounds come from the month only, never from user input
+        var sql = string.Format(
+            CultureInfo.InvariantCulture,
+            "CREATE TABLE IF NOT EXISTS \"BlockchainTransactionArchive_{0:yyyy_MM}\" " +
+            "PARTITION OF \"BlockchainTransactionArchive\" FOR VALUES FROM ('{0:yyyy-MM-dd}') TO ('{1:yyyy-MM-dd}')",
+            from, to);
+
+        await _context.Database.ExecuteSqlRawAsync(sql, cancellationToken);
+    }
+
+    public async Task<int> ArchiveFinishedAsync(DateTime createdBefore, int batchSize, CancellationToken cancellationToken = default)
+    {
+        // Delete and insert in one statement so a row is never in both tiers or in neither.
+        // SKIP LOCKED leaves rows another transaction is updating right now for the next run.
+        var archived = await _context.Database.ExecuteSqlAsync($"""
+            WITH moved AS (
+                DELETE FROM "BlockchainTransactions"
+                WHERE "Id" IN (
+                    SELECT "Id" FROM "BlockchainTransactions"
+                    WHERE "Status" <> 0 AND "CreatedAt" < {createdBefore}
+                    ORDER BY "Id"
+                    LIMIT {batchSize}
+                    FOR UPDATE SKIP LOCKED)
+                RETURNING *
+            )
+            INSERT INTO "BlockchainTransactionArchive" (
+                "Id", "WalletId", "UserOpHash", "TransactionHash", "FromAddress", "ToAddress", "TokenAddress",
+                "Amount", "AmountDecimal", "Status", "ChainId", "TransactionType", "GasUsed", "IsGasless",
+                "ErrorMessage", "BlockNumber", "Confirmations", "CreatedAt", "SubmittedAt", "ConfirmedAt", "ArchivedAt")
+            SELECT
+                "Id", "WalletId", "UserOpHash", "TransactionHash", "FromAddress", "ToAddress", "TokenAddress",
+                "Amount", "AmountDecimal", "Status", "ChainId", "TransactionType", "GasUsed", "IsGasless",
+                "ErrorMessage", "BlockNumber", "Confirmations", "CreatedAt", "SubmittedAt", "ConfirmedAt", now()
+            FROM moved
+            """, cancellationToken);
+
+        if (archived > 0)
+        {
+            _logger.LogInformation("Archived {Count} finished blockchain transactions created before {CreatedBefore}",
+                archived, createdBefore);
+        }
+
+        return archived;
+    }
+
+    private async Task<BlockchainTransaction?> FindArchivedAsync(
+        Expression<Func<ArchivedBlockchainTransaction, bool>> predicate,
+        CancellationToken cancellationToken)
+    {
+        var archived = await _context.ArchivedBlockchainTransactions
+            .AsNoTracking()
+            .FirstOrDefaultAsync(predicate, cancellationToken);
+
+        if (archived == null)
+        {
+            return null;
+        }
+
+        // Archived rows come back detached: they are final and never updated again
+        var transaction = ToBlockchainTransaction(archived);
+        transaction.Wallet = await _context.Wallets
+            .AsNoTracking()
+            .FirstOrDefaultAsync(w => w.Id == archived.WalletId, cancellationToken);
+
+        return transaction;
+    }
+
+    private static BlockchainTransaction ToBlockchainTransaction(ArchivedBlockchainTransaction archived) => new()
+    {
+        Id = archived.Id,
+        WalletId = archived.WalletId,
+        UserOpHash = archived.UserOpHash,
+        TransactionHash = archived.TransactionHash,
+        FromAddress = archived.FromAddress,
+        ToAddress = archived.ToAddress,
+        TokenAddress = archived.TokenAddress,
+        Amount = archived.Amount,
+        AmountDecimal = archived.AmountDecimal,
+        Status = archived.Status,
+        ChainId = archived.ChainId,
+        TransactionType = archived.TransactionType,
+        GasUsed = archived.GasUsed,
+        IsGasless = archived.IsGasless,
+        ErrorMessage = archived.ErrorMessage,
+        BlockNumber = archived.BlockNumber,
+        Confirmations = archived.Confirmations,
+        CreatedAt = archived.CreatedAt,
+        SubmittedAt = archived.SubmittedAt,
+        ConfirmedAt = archived.ConfirmedAt
+    };
+
+    /// <summary>
+    /// History rows of a wallet from both tiers as a single UNION ALL query
+    /// </summary>
+    private IQueryable<HistoryRow> QueryHistoryRows(int walletId)
+    {
+        var live = _context.BlockchainTransactions
+            .AsNoTracking()
+            .Where(t => t.WalletId == walletId)
+            .Select(t => new HistoryRow
+            {
+                Id = t.Id,
+                UserOpHash = t.UserOpHash,
+                TransactionHash = t.TransactionHash,
+                Status = t.Status,
+                FromAddress = t.FromAddress,
+                ToAddress = t.ToAddress,
+                AmountDecimal = t.AmountDecimal,
+                TokenAddress = t.TokenAddress,
+                IsGasless = t.IsGasless,
+                GasUsed = t.GasUsed,
+                BlockNumber = t.BlockNumber,
+                Confirmations = t.Confirmations,
+                ChainId = t.ChainId,
+                CreatedAt = t.CreatedAt,
+                SubmittedAt = t.SubmittedAt,
+                ConfirmedAt = t.ConfirmedAt,
+                ErrorMessage = t.ErrorMessage
+            });
+
+        var archived = _context.ArchivedBlockchainTransactions
+            .AsNoTracking()
+            .Where(t => t.WalletId == walletId)
+            .Select(t => new HistoryRow
+            {
+                Id = t.Id,
+                UserOpHash = t.UserOpHash,
+                TransactionHash = t.TransactionHash,
+                Status = t.Status,
+                FromAddress = t.FromAddress,
+                ToAddress = t.ToAddress,
+                AmountDecimal = t.AmountDecimal,
+                TokenAddress = t.TokenAddress,
+                IsGasless = t.IsGasless,
+                GasUsed = t.GasUsed,
+                BlockNumber = t.BlockNumber,
+                Confirmations = t.Confirmations,
+                ChainId = t.ChainId,
+                CreatedAt = t.CreatedAt,
+                SubmittedAt = t.SubmittedAt,
+                ConfirmedAt = t.ConfirmedAt,
+                ErrorMessage = t.ErrorMessage
+            });
+
+        return live.Concat(archived);
+    }
+
+    private static IQueryable<HistoryRow> ApplyHistoryFilter(
+        IQueryable<HistoryRow> query,
+        TransactionHistoryFilter filter)
+    {
+        // Apply status filter
+        if (filter.Status.HasValue)
+        {
+            query = query.Where(t => t.Status == filter.Status.Value);
+        }
+
+        // Apply date range filter
+        if (filter.StartDate.HasValue)
+        {
+            query = query.Where(t => t.CreatedAt >= filter.StartDate.Value);
+        }
+
+        if (filter.EndDate.HasValue)
+        {
+            query = query.Where(t => t.CreatedAt <= filter.EndDate.Value);
+        }
+
+        // Apply amount range filter
+        if (filter.MinAmount.HasValue)
+        {
+            query = query.Where(t => t.AmountDecimal >= filter.MinAmount.Value);
+        }
+
+        if (filter.MaxAmount.HasValue)
+        {
+            query = query.Where(t => t.AmountDecimal <= filter.MaxAmount.Value);
+        }
+
+        return query;
+    }
+
+    /// <summary>
+    /// Columns shared by both tiers that history filtering, sorting and paging need
+    /// </summary>
+    private sealed class HistoryRow
+    {
+        public int Id { get; set; }
+        public string UserOpHash { get; set; } = string.Empty;
+        public string? TransactionHash { get; set; }
+        public TransactionStatus Status { get; set; }
+        public string FromAddress { get; set; } = string.Empty;
+        public string ToAddress { get; set; } = string.Empty;
+        public decimal AmountDecimal { get; set; }
+        public string TokenAddress { get; set; } = string.Empty;
+        public bool IsGasless { get; set; }
+        public decimal GasUsed { get; set; }
+        public long? BlockNumber { get; set; }
+        public int Confirmations { get; set; }
+        public int ChainId { get; set; }
+        public DateTime CreatedAt { get; set; }
+        public DateTime? SubmittedAt { get; set; }
+        public DateTime? ConfirmedAt { get; set; }
+        public string? ErrorMessage { get; set; }
     }
 }
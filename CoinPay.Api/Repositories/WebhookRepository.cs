@@ -88,6 +88,18 @@ public class WebhookRepository : IWebhookRepository
         return log;
     }
 
+    public void AddDeliveries(IReadOnlyCollection<WebhookOutboxMessage> messages)
+    {
+        if (messages.Count == 0)
+        {
+            return;
+        }
+
+        _context.WebhookOutboxMessages.AddRange(messages);
+
+        _logger.LogDebug("Staged {Count} webhook deliveries", messages.Count);
+    }
+
     public async Task<List<WebhookDeliveryLog>> GetDeliveryLogsAsync(int webhookId, int limit = 100, CancellationToken cancellationToken = default)
     {
         return await _context.WebhookDeliveryLogs
@@ -0,0 +1,48 @@
+namespace CoinPay.Api.Services.BackgroundWorkers;
+
+/// <summary>
+/// Configuration options for Circle transaction status tracking.
+/// Webhooks are the primary status source; polling only covers rows that have gone quiet.
+/// </summary>
+public class CircleMonitoringOptions
+{
+    /// <summary>
+    /// How often the fallback poller wakes up to look for due rows (default: 30)
+    /// </summary>
+    public int PollingIntervalSeconds { get; set; } = 30;
+
+    /// <summary>
+    /// How long a pending transaction may go without a webhook before the poller checks it (default: 120)
+    /// </summary>
+    public int SilenceWindowSeconds { get; set; } = 120;
+
+    /// <summary>
+    /// Delay before the first re-check of a row that is still pending after a poll (default: 30)
+    /// </summary>
+    public int InitialBackoffSeconds { get; set; } = 30;
+
+    /// <summary>
+    /// Upper bound for the per-row poll backoff (default: 600)
+    /// </summary>
+    public int MaxBackoffSeconds { get; set; } = 600;
+
+    /// <summary>
+    /// How long processed webhook notification IDs are kept for deduplication (default: 7)
+    /// </summary>
+    public int NotificationRetentionDays { get; set; } = 7;
+
+    public TimeSpan PollingInterval => TimeSpan.FromSeconds(PollingIntervalSeconds);
+
+    public TimeSpan SilenceWindow => TimeSpan.FromSeconds(SilenceWindowSeconds);
+
+    /// <summary>
+    /// Gets the delay before the next poll of a row that has already been polled <paramref name="attempts"/> times.
+    /// Doubles per attempt, capped at <see cref="MaxBackoffSeconds"/>.
+    /// </summary>
+    public TimeSpan GetPollBackoff(int attempts)
+    {
+        var exponent = Math.Clamp(attempts - 1, 0, 16);
+        var seconds = Math.Min(InitialBackoffSeconds * Math.Pow(2, exponent), MaxBackoffSeconds);
+        return TimeSpan.FromSeconds(seconds);
+    }
+}
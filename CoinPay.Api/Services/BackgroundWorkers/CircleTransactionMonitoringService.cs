@@ -1,50 +1,75 @@
 using CoinPay.Api.Data;
 using CoinPay.Api.Models;
 using CoinPay.Api.Services.Circle;
+using CoinPay.Api.Services.Circle.Models;
+using CoinPay.Api.Services.Coordination;
+using CoinPay.Api.Services.Telemetry;
+using CoinPay.Api.Services.Wallet;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Options;
 
 namespace CoinPay.Api.Services.BackgroundWorkers;
 
 /// <summary>
-/// Background service that monitors pending Circle API transactions and updates their status
+/// Background service that monitors pending Circle API transactions and updates their status.
+/// Circle webhooks (<see cref="CircleWebhookHandler"/>) are the primary status source; this poller is a
+/// fallback that only revisits rows which have had no webhook within the configured silence window,
+/// backing off per row while they stay pending. Rows are hash-partitioned by Circle wallet and each replica
+/// only polls the partitions it leases.
 /// </summary>
 public class CircleTransactionMonitoringService : BackgroundService
 {
     private readonly IServiceProvider _serviceProvider;
     private readonly ILogger<CircleTransactionMonitoringService> _logger;
-    private readonly TimeSpan _pollingInterval = TimeSpan.FromSeconds(30);
+    private readonly CircleMonitoringOptions _options;
+    private readonly IWorkPartitionCoordinator _partitions;
     private readonly TimeSpan _maxTransactionAge = TimeSpan.FromHours(24);
+    private readonly TimeSpan _cursorClockSkew = TimeSpan.FromMinutes(5);
+
+    private const string WorkerName = "circle_transaction_monitoring";
+    private const int PageSize = 50;
+    private const int MaxPagesPerWallet = 20;
 
     public CircleTransactionMonitoringService(
         IServiceProvider serviceProvider,
-        ILogger<CircleTransactionMonitoringService> logger)
+        ILogger<CircleTransactionMonitoringService> logger,
+        IOptions<CircleMonitoringOptions> options,
+        IWorkPartitionCoordinator partitions)
     {
         _serviceProvider = serviceProvider;
         _logger = logger;
+        _options = options.Value;
+        _partitions = partitions;
     }
 
     protected override async Task ExecuteAsync(CancellationToken stoppingToken)
     {
-        _logger.LogInformation("Circle Transaction Monitoring Service started. Polling interval: {Interval}s",
-            _pollingInterval.TotalSeconds);
+        _logger.LogInformation(
+            "Circle Transaction Monitoring Service started. Polling interval: {Interval}s, webhook silence window: {SilenceWindow}s",
+            _options.PollingInterval.TotalSeconds,
+            _options.SilenceWindow.TotalSeconds);
 
         // Wait a bit before starting to allow the application to fully initialize
         await Task.Delay(TimeSpan.FromSeconds(15), stoppingToken);
 
         while (!stoppingToken.IsCancellationRequested)
         {
-            try
-            {
-                await MonitorPendingCircleTransactionsAsync(stoppingToken);
-            }
-            catch (Exception ex)
+            using (var cycle = CoinPayTelemetry.StartWorkerCycle(WorkerName))
             {
-                _logger.LogError(ex, "Error occurred while monitoring Circle transactions");
+                try
+                {
+                    await MonitorPendingCircleTransactionsAsync(stoppingToken);
+                }
+                catch (Exception ex)
+                {
+                    cycle.Fail(ex);
+                    _logger.LogError(ex, "Error occurred while monitoring Circle transactions");
+                }
             }
 
             try
             {
-                await Task.Delay(_pollingInterval, stoppingToken);
+                await Task.Delay(_options.PollingInterval, stoppingToken);
             }
             catch (TaskCanceledException)
             {
@@ -56,36 +81,68 @@ public class CircleTransactionMonitoringService : BackgroundService
         _logger.LogInformation("Circle Transaction Monitoring Service stopped");
     }
 
-    private async Task MonitorPendingCircleTransactionsAsync(CancellationToken cancellationToken)
+    internal async Task MonitorPendingCircleTransactionsAsync(CancellationToken cancellationToken)
     {
+        using var assignment = await _partitions.AcquireAsync(WorkerName, cancellationToken);
+        if (assignment.IsEmpty)
+        {
+            _logger.LogDebug("No Circle wallet partitions leased by this node, skipping cycle");
+            CoinPayTelemetry.SetWorkerBacklog(WorkerName, 0);
+            return;
+        }
+
         using var scope = _serviceProvider.CreateScope();
         var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
         var circleService = scope.ServiceProvider.GetRequiredService<ICircleService>();
-        var walletRepository = scope.ServiceProvider.GetRequiredService<CoinPay.Api.Repositories.IWalletRepository>();
+        var balanceCache = scope.ServiceProvider.GetService<IWalletBalanceCache>();
+
+        var now = DateTime.UtcNow;
+        var silenceCutoff = now - _options.SilenceWindow;
+
+        // Housekeeping runs on whichever node leases partition 0
+        if (assignment.Partitions.Contains(0))
+        {
+            await PruneProcessedNotificationsAsync(db, now, cancellationToken);
+        }
 
-        // Get all pending Circle transactions (POL transfers)
+        // Get pending Circle transactions (POL transfers) that are due for a fallback poll:
+        // rows never scheduled are due once they have been silent for the whole window since creation
         // Note: Also includes transactions with empty/null TransactionId to mark them as failed
         var pendingTransactions = await db.Transactions
             .Where(t => t.Status == "Pending" &&
-                       t.Currency == "POL")
+                       t.Currency == "POL" &&
+                       (t.NextStatusCheckAt == null
+                           ? t.CreatedAt <= silenceCutoff
+                           : t.NextStatusCheckAt <= now))
             .ToListAsync(cancellationToken);
 
+        // Rows without a wallet hash to the empty key so exactly one node reports them
+        if (!assignment.OwnsAll)
+        {
+            pendingTransactions = pendingTransactions
+                .Where(t => assignment.Owns(t.CircleWalletId ?? string.Empty))
+                .ToList();
+        }
+
+        CoinPayTelemetry.SetWorkerBacklog(WorkerName, pendingTransactions.Count);
+
         if (pendingTransactions.Count == 0)
         {
-            _logger.LogDebug("No pending Circle transactions to monitor");
+            _logger.LogDebug("No silent pending Circle transactions due for polling");
             return;
         }
 
-        _logger.LogInformation("Monitoring {Count} pending Circle transactions", pendingTransactions.Count);
+        _logger.LogInformation("Polling {Count} pending Circle transactions with no recent webhook", pendingTransactions.Count);
 
         int updatedCount = 0;
         int failedCount = 0;
+        int rescheduledCount = 0;
+        int skippedCount = 0;
+        var settledAddresses = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+        var transactionsToCheck = new List<CoinPay.Api.Models.Transaction>();
 
         foreach (var transaction in pendingTransactions)
         {
-            if (cancellationToken.IsCancellationRequested)
-                break;
-
             // Skip very old transactions (likely stuck)
             if ((DateTime.UtcNow - transaction.CreatedAt) > _maxTransactionAge)
             {
@@ -110,37 +167,76 @@ public class CircleTransactionMonitoringService : BackgroundService
                 continue;
             }
 
+            // Rows created before the submitting wallet was stored cannot be attributed to a wallet.
+            // They are not polled; webhooks can still settle them, otherwise they age out as stuck.
+            if (string.IsNullOrEmpty(transaction.CircleWalletId))
+            {
+                _logger.LogWarning(
+                    "Circle transaction {Id} ({CircleTransactionId}) has no Circle wallet recorded, skipping fallback poll",
+                    transaction.Id, transaction.TransactionId);
+
+                ScheduleNextCheck(transaction, now);
+                skippedCount++;
+                continue;
+            }
+
+            transactionsToCheck.Add(transaction);
+        }
+
+        var transactionsByWallet = transactionsToCheck.GroupBy(t => t.CircleWalletId!);
+
+        foreach (var walletGroup in transactionsByWallet)
+        {
+            if (cancellationToken.IsCancellationRequested)
+                break;
+
+            Dictionary<string, CircleTransactionResponse> circleTransactions;
             try
             {
-                // For developer-controlled wallets, we need to query all wallet transactions
-                // TODO: Store wallet ID with transaction to avoid hardcoding user ID
-                var userId = 1; // Hardcoded for now
-                var wallet = await walletRepository.GetByUserIdAsync(userId);
+                circleTransactions = await FetchWalletTransactionsAsync(
+                    circleService,
+                    walletGroup.Key,
+                    walletGroup.ToList(),
+                    cancellationToken);
+            }
+            catch (Exception ex)
+            {
+                failedCount += walletGroup.Count();
+                _logger.LogWarning(ex, "Failed to fetch Circle transactions for wallet {WalletId} ({Count} pending transactions)",
+                    walletGroup.Key, walletGroup.Count());
 
-                if (wallet == null || string.IsNullOrEmpty(wallet.CircleWalletId))
+                foreach (var transaction in walletGroup)
                 {
-                    _logger.LogWarning("No Circle wallet found for transaction {Id}", transaction.Id);
-                    continue;
+                    ScheduleNextCheck(transaction, now);
                 }
+                continue;
+            }
 
-                // Get all transactions for this wallet
-                var walletTransactions = await circleService.GetWalletTransactionsAsync(
-                    wallet.CircleWalletId,
-                    cancellationToken);
-
+            foreach (var transaction in walletGroup)
+            {
                 // Find our transaction by ID
-                var circleStatus = walletTransactions.FirstOrDefault(t => t.TransactionId == transaction.TransactionId);
-
-                if (circleStatus == null)
+                if (!circleTransactions.TryGetValue(transaction.TransactionId!, out var circleStatus))
                 {
                     _logger.LogDebug("Transaction {CircleTransactionId} not found in wallet transactions (may not be synced yet)",
                         transaction.TransactionId);
+                    ScheduleNextCheck(transaction, now);
+                    rescheduledCount++;
                     continue;
                 }
 
                 _logger.LogDebug("Circle transaction {Id} status from API: {Status}",
                     transaction.Id, circleStatus.Status);
 
+                if (!string.IsNullOrEmpty(circleStatus.TxHash))
+                {
+                    transaction.TxHash = circleStatus.TxHash;
+                }
+
+                if (!string.IsNullOrEmpty(circleStatus.Status))
+                {
+                    transaction.CircleState = circleStatus.Status.ToUpperInvariant();
+                }
+
                 // Update transaction status based on Circle response
                 var previousStatus = transaction.Status;
                 transaction.Status = circleStatus.Status?.ToUpper() switch
@@ -157,6 +253,8 @@ public class CircleTransactionMonitoringService : BackgroundService
                 {
                     transaction.CompletedAt = DateTime.UtcNow;
                     updatedCount++;
+                    settledAddresses.Add(circleStatus.From);
+                    settledAddresses.Add(circleStatus.To);
 
                     _logger.LogInformation(
                         "Circle transaction {Id} status updated: {OldStatus} → {NewStatus}, CircleTransactionId: {CircleTransactionId}",
@@ -165,22 +263,110 @@ public class CircleTransactionMonitoringService : BackgroundService
                         transaction.Status,
                         transaction.TransactionId);
                 }
+                else
+                {
+                    ScheduleNextCheck(transaction, now);
+                    rescheduledCount++;
+                }
             }
-            catch (Exception ex)
-            {
-                failedCount++;
-                _logger.LogWarning(ex, "Failed to check Circle API status for transaction {Id} (CircleTransactionId: {CircleTransactionId})",
-                    transaction.Id, transaction.TransactionId);
-            }
         }
 
-        // Save all changes
-        if (updatedCount > 0 || failedCount > 0)
+        // Save all changes (including the per-row poll schedule)
+        await db.SaveChangesAsync(cancellationToken);
+
+        foreach (var address in settledAddresses)
+        {
+            balanceCache?.Invalidate(address);
+        }
+
+        if (updatedCount > 0 || failedCount > 0 || skippedCount > 0)
         {
-            await db.SaveChangesAsync(cancellationToken);
             _logger.LogInformation(
-                "Circle monitoring cycle complete: {Updated} transactions updated, {Failed} checks failed",
-                updatedCount, failedCount);
+                "Circle monitoring cycle complete: {Updated} transactions updated, {Failed} checks failed, {Rescheduled} still pending, {Skipped} skipped without a wallet",
+                updatedCount, failedCount, rescheduledCount, skippedCount);
         }
     }
+
+    /// <summary>
+    /// Backs off the next fallback poll for a row that is still pending after being polled.
+    /// </summary>
+    private void ScheduleNextCheck(CoinPay.Api.Models.Transaction transaction, DateTime now)
+    {
+        transaction.StatusCheckAttempts++;
+        transaction.NextStatusCheckAt = now + _options.GetPollBackoff(transaction.StatusCheckAttempts);
+    }
+
+    /// <summary>
+    /// Removes webhook deduplication records older than the retention period.
+    /// </summary>
+    private async Task PruneProcessedNotificationsAsync(AppDbContext db, DateTime now, CancellationToken cancellationToken)
+    {
+        // ExecuteDelete needs a relational provider; the in-memory provider (tests) keeps everything
+        if (!db.Database.IsRelational())
+        {
+            return;
+        }
+
+        var retentionCutoff = now.AddDays(-_options.NotificationRetentionDays);
+
+        var pruned = await db.ProcessedCircleNotifications
+            .Where(n => n.ReceivedAt < retentionCutoff)
+            .ExecuteDeleteAsync(cancellationToken);
+
+        if (pruned > 0)
+        {
+            _logger.LogDebug("Pruned {Count} processed Circle notifications older than {Days} days",
+                pruned, _options.NotificationRetentionDays);
+        }
+    }
+
+    /// <summary>
+    /// Fetches a wallet's recent Circle transactions once for all of its pending rows and indexes them by Circle transaction ID.
+    /// Only transactions created since the oldest pending row are requested, and paging stops as soon as every
+    /// pending row has been matched.
+    /// </summary>
+    private async Task<Dictionary<string, CircleTransactionResponse>> FetchWalletTransactionsAsync(
+        ICircleService circleService,
+        string circleWalletId,
+        List<CoinPay.Api.Models.Transaction> pendingTransactions,
+        CancellationToken cancellationToken)
+    {
+        var outstandingIds = new HashSet<string>(pendingTransactions.Select(t => t.TransactionId!));
+        var from = pendingTransactions.Min(t => t.CreatedAt) - _cursorClockSkew;
+        var result = new Dictionary<string, CircleTransactionResponse>();
+
+        string? pageAfter = null;
+        var pageCount = 0;
+
+        do
+        {
+            var page = await circleService.GetWalletTransactionsPageAsync(
+                circleWalletId,
+                from,
+                pageAfter,
+                PageSize,
+                cancellationToken);
+
+            pageCount++;
+
+            foreach (var circleTransaction in page.Transactions)
+            {
+                if (string.IsNullOrEmpty(circleTransaction.TransactionId))
+                    continue;
+
+                result[circleTransaction.TransactionId] = circleTransaction;
+                outstandingIds.Remove(circleTransaction.TransactionId);
+            }
+
+            pageAfter = page.NextPageAfter;
+        }
+        while (pageAfter != null && outstandingIds.Count > 0 && pageCount < MaxPagesPerWallet &&
+               !cancellationToken.IsCancellationRequested);
+
+        _logger.LogDebug(
+            "Fetched {PageCount} page(s) for Circle wallet {WalletId}: {Matched}/{Pending} pending transactions matched",
+            pageCount, circleWalletId, pendingTransactions.Count - outstandingIds.Count, pendingTransactions.Count);
+
+        return result;
+    }
 }
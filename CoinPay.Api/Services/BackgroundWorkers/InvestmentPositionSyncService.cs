@@ -1,27 +1,41 @@
+using System.Collections.Concurrent;
 using CoinPay.Api.Models;
 using CoinPay.Api.Repositories;
+using CoinPay.Api.Services.Coordination;
 using CoinPay.Api.Services.Investment;
-using CoinPay.Api.Services.Exchange.WhiteBit;
 using CoinPay.Api.Services.Encryption;
+using CoinPay.Api.Services.Telemetry;
+using Microsoft.Extensions.Options;
 
 namespace CoinPay.Api.Services.BackgroundWorkers;
 
 /// <summary>
 /// Background service that syncs investment positions with WhiteBit exchange
-/// Runs every 60 seconds to update positions, calculate rewards, and sync balances
+/// Runs every 60 seconds to update positions, calculate rewards, and sync balances.
+/// Positions are grouped by exchange connection and connections are synced concurrently,
+/// with all changes saved in one batch.
+/// Rewards for the whole sweep are calculated up front in one portfolio batch.
+/// Connections are hash-partitioned and each replica only syncs the partitions it leases.
 /// </summary>
 public class InvestmentPositionSyncService : BackgroundService
 {
     private readonly IServiceProvider _serviceProvider;
     private readonly ILogger<InvestmentPositionSyncService> _logger;
-    private readonly TimeSpan _syncInterval = TimeSpan.FromSeconds(60);
+    private readonly InvestmentSyncOptions _options;
+    private readonly IWorkPartitionCoordinator _partitions;
+
+    private const string WorkerName = "investment_position_sync";
 
     public InvestmentPositionSyncService(
         IServiceProvider serviceProvider,
-        ILogger<InvestmentPositionSyncService> logger)
+        ILogger<InvestmentPositionSyncService> logger,
+        IOptions<InvestmentSyncOptions> options,
+        IWorkPartitionCoordinator partitions)
     {
         _serviceProvider = serviceProvider;
         _logger = logger;
+        _options = options.Value;
+        _partitions = partitions;
     }
 
     protected override async Task ExecuteAsync(CancellationToken stoppingToken)
@@ -33,18 +47,22 @@ public class InvestmentPositionSyncService : BackgroundService
 
         while (!stoppingToken.IsCancellationRequested)
         {
-            try
-            {
-                await SyncPositionsAsync(stoppingToken);
-            }
-            catch (Exception ex)
+            using (var cycle = CoinPayTelemetry.StartWorkerCycle(WorkerName))
             {
-                _logger.LogError(ex, "Error occurred during position sync cycle");
+                try
+                {
+                    await SyncPositionsAsync(stoppingToken);
+                }
+                catch (Exception ex)
+                {
+                    cycle.Fail(ex);
+                    _logger.LogError(ex, "Error occurred during position sync cycle");
+                }
             }
 
             try
             {
-                await Task.Delay(_syncInterval, stoppingToken);
+                await Task.Delay(_options.SyncInterval, stoppingToken);
             }
             catch (OperationCanceledException)
             {
@@ -54,18 +72,34 @@ public class InvestmentPositionSyncService : BackgroundService
         }
     }
 
-    private async Task SyncPositionsAsync(CancellationToken cancellationToken)
+    internal async Task SyncPositionsAsync(CancellationToken cancellationToken)
     {
+        using var assignment = await _partitions.AcquireAsync(WorkerName, cancellationToken);
+        if (assignment.IsEmpty)
+        {
+            _logger.LogDebug("No connection partitions leased by this node, skipping sync");
+            CoinPayTelemetry.SetWorkerBacklog(WorkerName, 0);
+            return;
+        }
+
         using var scope = _serviceProvider.CreateScope();
 
         var investmentRepository = scope.ServiceProvider.GetRequiredService<IInvestmentRepository>();
         var connectionRepository = scope.ServiceProvider.GetRequiredService<IExchangeConnectionRepository>();
-        var whiteBitClient = scope.ServiceProvider.GetRequiredService<IWhiteBitApiClient>();
         var rewardCalculation = scope.ServiceProvider.GetRequiredService<IRewardCalculationService>();
-        var encryptionService = scope.ServiceProvider.GetRequiredService<IExchangeCredentialEncryptionService>();
+        var credentialCache = scope.ServiceProvider.GetRequiredService<IExchangeCredentialCache>();
 
         var activePositions = await investmentRepository.GetActivePositionsAsync();
 
+        if (!assignment.OwnsAll)
+        {
+            activePositions = activePositions
+                .Where(p => assignment.Owns(p.ExchangeConnectionId))
+                .ToList();
+        }
+
+        CoinPayTelemetry.SetWorkerBacklog(WorkerName, activePositions.Count);
+
         if (!activePositions.Any())
         {
             _logger.LogDebug("No active positions to sync");
@@ -74,134 +108,145 @@ public class InvestmentPositionSyncService : BackgroundService
 
         _logger.LogInformation("Starting sync for {Count} active positions", activePositions.Count);
 
+        // Load every connection once, then sync each connection's positions as a group
+        var connections = (await connectionRepository.GetByIdsAsync(
+                activePositions.Select(p => p.ExchangeConnectionId)))
+            .ToDictionary(c => c.Id);
+
+        var positionsByConnection = activePositions
+            .GroupBy(p => p.ExchangeConnectionId)
+            .ToList();
+
+        var now = DateTime.UtcNow;
+        var rewards = rewardCalculation.CalculatePortfolio(activePositions, now);
+
+        var changedPositions = new ConcurrentBag<InvestmentPosition>();
         var syncedCount = 0;
         var errorCount = 0;
 
-        foreach (var position in activePositions)
+        var parallelOptions = new ParallelOptions
         {
-            if (cancellationToken.IsCancellationRequested)
-            {
-                _logger.LogWarning("Sync cancelled during position processing");
-                break;
-            }
+            MaxDegreeOfParallelism = _options.MaxConcurrentConnections,
+            CancellationToken = cancellationToken
+        };
 
-            try
-            {
-                await SyncSinglePositionAsync(
-                    position,
-                    connectionRepository,
-                    whiteBitClient,
-                    rewardCalculation,
-                    encryptionService,
-                    investmentRepository);
-
-                syncedCount++;
-            }
-            catch (Exception ex)
+        try
+        {
+            // Only in-memory entities are touched in parallel; the DbContext is used before and after
+            await Parallel.ForEachAsync(positionsByConnection, parallelOptions, async (group, ct) =>
             {
-                _logger.LogError(ex, "Failed to sync position {PositionId}", position.Id);
-                errorCount++;
-            }
+                var positions = group.ToList();
+                connections.TryGetValue(group.Key, out var connection);
+
+                try
+                {
+                    var synced = await SyncConnectionPositionsAsync(
+                        connection,
+                        positions,
+                        rewards,
+                        credentialCache,
+                        changedPositions,
+                        now,
+                        ct);
+
+                    Interlocked.Add(ref syncedCount, synced);
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    _logger.LogError(ex, "Failed to sync {Count} positions for connection {ConnectionId}",
+                        positions.Count, group.Key);
+                    Interlocked.Add(ref errorCount, positions.Count);
+                }
+            });
+        }
+        catch (OperationCanceledException)
+        {
+            _logger.LogWarning("Sync cancelled during position processing");
         }
 
+        // Flush all position changes in one SaveChanges
+        var updatedCount = await investmentRepository.UpdateRangeAsync(changedPositions.ToList());
+
         _logger.LogInformation(
-            "Position sync completed: {Synced} synced, {Errors} errors",
-            syncedCount, errorCount);
+            "Position sync completed: {Synced} synced, {Updated} updated, {Errors} errors across {Connections} connections",
+            syncedCount, updatedCount, errorCount, positionsByConnection.Count);
     }
 
-    private async Task SyncSinglePositionAsync(
-        InvestmentPosition position,
-        IExchangeConnectionRepository connectionRepository,
-        IWhiteBitApiClient whiteBitClient,
-        IRewardCalculationService rewardCalculation,
-        IExchangeCredentialEncryptionService encryptionService,
-        IInvestmentRepository investmentRepository)
+    /// <summary>
+    /// Syncs all positions that share an exchange connection. Credentials are checked at most once for
+    /// the whole group. Changed positions are collected for the bulk save instead of being written here.
+    /// </summary>
+    private async Task<int> SyncConnectionPositionsAsync(
+        ExchangeConnection? connection,
+        List<InvestmentPosition> positions,
+        IReadOnlyDictionary<Guid, PositionRewardSnapshot> rewards,
+        IExchangeCredentialCache credentialCache,
+        ConcurrentBag<InvestmentPosition> changedPositions,
+        DateTime now,
+        CancellationToken cancellationToken)
     {
-        // Get exchange connection
-        var connection = await connectionRepository.GetByIdAsync(position.ExchangeConnectionId);
         if (connection == null)
         {
-            _logger.LogWarning("Connection not found for position {PositionId}", position.Id);
-            return;
+            _logger.LogWarning("Connection not found for {Count} positions", positions.Count);
+            return 0;
         }
 
         if (!connection.IsActive)
         {
-            _logger.LogWarning("Connection inactive for position {PositionId}", position.Id);
-            return;
+            _logger.LogWarning("Connection {ConnectionId} inactive for {Count} positions", connection.Id, positions.Count);
+            return 0;
         }
 
-        // Decrypt credentials
-        string apiKey, apiSecret;
-        try
+        // Positions behind credentials that no longer decrypt are left untouched
+        if (!await credentialCache.CanDecryptAsync(connection))
         {
-            apiKey = await encryptionService.DecryptAsync(connection.ApiKeyEncrypted, position.UserId);
-            apiSecret = await encryptionService.DecryptAsync(connection.ApiSecretEncrypted, position.UserId);
-        }
-        catch (Exception ex)
-        {
-            _logger.LogError(ex, "Failed to decrypt credentials for position {PositionId}", position.Id);
-            return;
+            return 0;
         }
 
-        // Calculate accrued rewards locally
-        var startDate = position.StartDate ?? position.CreatedAt;
-        var accruedRewards = rewardCalculation.CalculateAccruedReward(
-            position.PrincipalAmount,
-            position.Apy,
-            startDate);
+        // Rewards are calculated locally; positions are not verified against WhiteBit
+        var syncedCount = 0;
 
-        var currentValue = rewardCalculation.CalculateCurrentValue(
-            position.PrincipalAmount,
-            accruedRewards);
+        foreach (var position in positions)
+        {
+            // Positions the reward batch rejected were already logged there
+            if (!rewards.TryGetValue(position.Id, out var snapshot))
+            {
+                continue;
+            }
 
-        // Update position
-        var hasChanges = false;
+            if (ApplyAccruedRewards(position, snapshot, now))
+            {
+                changedPositions.Add(position);
+            }
 
-        if (position.AccruedRewards != accruedRewards)
-        {
-            position.AccruedRewards = accruedRewards;
-            hasChanges = true;
+            syncedCount++;
         }
 
-        if (position.CurrentValue != currentValue)
-        {
-            position.CurrentValue = currentValue;
-            hasChanges = true;
-        }
+        return syncedCount;
+    }
 
-        if (hasChanges)
-        {
-            position.LastSyncedAt = DateTime.UtcNow;
-            await investmentRepository.UpdateAsync(position);
+    /// <summary>
+    /// Applies the locally calculated accrued rewards and current value. Returns true when the position changed.
+    /// </summary>
+    private bool ApplyAccruedRewards(InvestmentPosition position, PositionRewardSnapshot snapshot, DateTime now)
+    {
+        var accruedRewards = snapshot.AccruedRewards;
+        var currentValue = snapshot.CurrentValue;
 
-            _logger.LogDebug(
-                "Updated position {PositionId}: CurrentValue={CurrentValue:F8}, AccruedRewards={AccruedRewards:F8}",
-                position.Id, currentValue, accruedRewards);
+        if (position.AccruedRewards == accruedRewards && position.CurrentValue == currentValue)
+        {
+            return false;
         }
 
-        // Optional: Verify with WhiteBit API (may have rate limits)
-        // For MVP, we're calculating rewards locally
-        // In production, you may want to periodically verify with exchange
-        /*
-        try
-        {
-            var whiteBitResponse = await whiteBitClient.GetInvestmentStatusAsync(
-                apiKey, apiSecret, position.ExternalPositionId);
+        position.AccruedRewards = accruedRewards;
+        position.CurrentValue = currentValue;
+        position.LastSyncedAt = now;
 
-            if (whiteBitResponse.Status == "closed")
-            {
-                position.Status = InvestmentStatus.Closed;
-                position.EndDate = DateTime.UtcNow;
-                await investmentRepository.UpdateAsync(position);
-            }
-        }
-        catch (Exception ex)
-        {
-            // Don't fail the entire sync if WhiteBit API call fails
-            _logger.LogWarning(ex, "Failed to verify position {PositionId} with WhiteBit", position.Id);
-        }
-        */
+        _logger.LogDebug(
+            "Updated position {PositionId}: CurrentValue={CurrentValue:F8}, AccruedRewards={AccruedRewards:F8}",
+            position.Id, currentValue, accruedRewards);
+
+        return true;
     }
 
     public override async Task StopAsync(CancellationToken cancellationToken)
@@ -0,0 +1,26 @@
+namespace CoinPay.Api.Services.BackgroundWorkers;
+
+/// <summary>
+/// Configuration options for the investment position sync worker
+/// </summary>
+public class InvestmentSyncOptions
+{
+    /// <summary>
+    /// How often positions are synced (default: 60)
+    /// </summary>
+    public int SyncIntervalSeconds { get; set; } = 60;
+
+    /// <summary>
+    /// Maximum number of exchange connections synced concurrently (default: 16)
+    /// </summary>
+    public int MaxConcurrentConnections { get; set; } = 16;
+
+    /// <summary>
+    /// How long a successful credential decryption check is remembered; the plaintext is never kept (default: 300)
+    /// </summary>
+    public int CredentialCacheSeconds { get; set; } = 300;
+
+    public TimeSpan SyncInterval => TimeSpan.FromSeconds(SyncIntervalSeconds);
+
+    public TimeSpan CredentialCacheDuration => TimeSpan.FromSeconds(CredentialCacheSeconds);
+}
@@ -0,0 +1,24 @@
+namespace CoinPay.Api.Services.BackgroundWorkers;
+
+/// <summary>
+/// Configuration options for the payout audit log writer
+/// </summary>
+public class PayoutAuditOptions
+{
+    /// <summary>
+    /// Maximum audit entries waiting to be written; keeps API memory bounded (default: 10000)
+    /// </summary>
+    public int QueueCapacity { get; set; } = 10000;
+
+    /// <summary>
+    /// Maximum audit entries inserted in one SaveChanges (default: 500)
+    /// </summary>
+    public int BatchSize { get; set; } = 500;
+
+    /// <summary>
+    /// How long the writer waits for more entries before saving a partial batch (default: 200)
+    /// </summary>
+    public int FlushIntervalMilliseconds { get; set; } = 200;
+
+    public TimeSpan FlushInterval => TimeSpan.FromMilliseconds(FlushIntervalMilliseconds);
+}
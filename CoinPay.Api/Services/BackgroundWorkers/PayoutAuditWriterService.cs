@@ -0,0 +1,112 @@
+using CoinPay.Api.Data;
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.Payout;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Services.BackgroundWorkers;
+
+/// <summary>
+/// Background service that drains <see cref="PayoutAuditQueue"/> and bulk-inserts the entries
+/// into PayoutAuditLogs. Entries are saved in batches of up to <see cref="PayoutAuditOptions.BatchSize"/>,
+/// or after <see cref="PayoutAuditOptions.FlushInterval"/> when fewer are waiting.
+/// </summary>
+public class PayoutAuditWriterService : BackgroundService
+{
+    private readonly IServiceProvider _serviceProvider;
+    private readonly PayoutAuditQueue _queue;
+    private readonly ILogger<PayoutAuditWriterService> _logger;
+    private readonly PayoutAuditOptions _options;
+
+    public PayoutAuditWriterService(
+        IServiceProvider serviceProvider,
+        PayoutAuditQueue queue,
+        ILogger<PayoutAuditWriterService> logger,
+        IOptions<PayoutAuditOptions> options)
+    {
+        _serviceProvider = serviceProvider;
+        _queue = queue;
+        _logger = logger;
+        _options = options.Value;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        _logger.LogInformation("Payout Audit Writer Service started");
+
+        var batch = new List<PayoutAuditLog>(_options.BatchSize);
+
+        while (!stoppingToken.IsCancellationRequested)
+        {
+            try
+            {
+                if (!await _queue.Reader.WaitToReadAsync(stoppingToken))
+                    break;
+
+                // Give a burst a moment to fill the batch before writing
+                if (_queue.Reader.Count < _options.BatchSize)
+                {
+                    await Task.Delay(_options.FlushInterval, stoppingToken);
+                }
+            }
+            catch (OperationCanceledException)
+            {
+                break;
+            }
+
+            await DrainAsync(batch);
+        }
+
+        // Write whatever was queued before shutdown
+        await DrainAsync(batch);
+
+        _logger.LogInformation("Payout Audit Writer Service stopped");
+    }
+
+    private async Task DrainAsync(List<PayoutAuditLog> batch)
+    {
+        while (true)
+        {
+            while (batch.Count < _options.BatchSize && _queue.Reader.TryRead(out var entry))
+            {
+                batch.Add(entry);
+            }
+
+            if (batch.Count == 0)
+                return;
+
+            await SaveBatchAsync(batch);
+            batch.Clear();
+        }
+    }
+
+    private async Task SaveBatchAsync(List<PayoutAuditLog> batch)
+    {
+        try
+        {
+            using var scope = _serviceProvider.CreateScope();
+            var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+            db.PayoutAuditLogs.AddRange(batch);
+            await db.SaveChangesAsync();
+
+            _logger.LogDebug("Wrote {Count} payout audit entries", batch.Count);
+        }
+        catch (DbUpdateException ex) when (batch.Count > 1)
+        {
+            // One bad row (e.g. an unknown payout) must not lose the rest of the batch
+            _logger.LogWarning(ex, "Bulk insert of {Count} payout audit entries failed, retrying individually", batch.Count);
+
+            foreach (var entry in batch)
+            {
+                await SaveBatchAsync(new List<PayoutAuditLog> { entry });
+            }
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex,
+                "Failed to write {Count} payout audit entries. First: payout {PayoutId}, event {EventType}",
+                batch.Count, batch[0].PayoutTransactionId, batch[0].EventType);
+        }
+    }
+}
@@ -0,0 +1,31 @@
+namespace CoinPay.Api.Services.BackgroundWorkers;
+
+/// <summary>
+/// Configuration options for the blockchain transaction archiver
+/// </summary>
+public class TransactionArchiveOptions
+{
+    /// <summary>
+    /// Whether finished transactions are moved to the archive (default: true)
+    /// </summary>
+    public bool Enabled { get; set; } = true;
+
+    /// <summary>
+    /// Age after which confirmed or failed transactions leave the live table (default: 30)
+    /// </summary>
+    public int ArchiveAfterDays { get; set; } = 30;
+
+    /// <summary>
+    /// Maximum transactions moved per statement; keeps each delete/insert transaction short (default: 1000)
+    /// </summary>
+    public int BatchSize { get; set; } = 1000;
+
+    /// <summary>
+    /// How often the archiver runs (default: 10)
+    /// </summary>
+    public int IntervalMinutes { get; set; } = 10;
+
+    public TimeSpan ArchiveAfter => TimeSpan.FromDays(ArchiveAfterDays);
+
+    public TimeSpan Interval => TimeSpan.FromMinutes(IntervalMinutes);
+}
@@ -0,0 +1,143 @@
+using CoinPay.Api.Data;
+using CoinPay.Api.Repositories;
+using CoinPay.Api.Services.Coordination;
+using CoinPay.Api.Services.Telemetry;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Services.BackgroundWorkers;
+
+/// <summary>
+/// Background service that moves confirmed and failed blockchain transactions older than
+/// <see cref="TransactionArchiveOptions.ArchiveAfter"/> into BlockchainTransactionArchive, which is
+/// range-partitioned by month. Keeping finished rows out of BlockchainTransactions keeps the live table and
+/// its pending-work index small, so the monitors stay proportional to the pending backlog. Monthly
+/// partitions are created on demand before rows are moved into them. Runs on the node leasing partition 0.
+/// </summary>
+public class TransactionArchiverService : BackgroundService
+{
+    private readonly IServiceProvider _serviceProvider;
+    private readonly ILogger<TransactionArchiverService> _logger;
+    private readonly TransactionArchiveOptions _options;
+    private readonly IWorkPartitionCoordinator _partitions;
+    private readonly HashSet<DateTime> _ensuredPartitions = new();
+
+    private const string WorkerName = "transaction_archiver";
+
+    public TransactionArchiverService(
+        IServiceProvider serviceProvider,
+        ILogger<TransactionArchiverService> logger,
+        IOptions<TransactionArchiveOptions> options,
+        IWorkPartitionCoordinator partitions)
+    {
+        _serviceProvider = serviceProvider;
+        _logger = logger;
+        _options = options.Value;
+        _partitions = partitions;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        if (!_options.Enabled)
+        {
+            _logger.LogInformation("Transaction archiving disabled; finished transactions stay in the live table");
+            return;
+        }
+
+        _logger.LogInformation(
+            "Transaction Archiver Service started. Archive after: {Days} days, batch size: {BatchSize}, interval: {Interval}m",
+            _options.ArchiveAfterDays,
+            _options.BatchSize,
+            _options.Interval.TotalMinutes);
+
+        // Wait a bit before starting to allow the application to fully initialize
+        await Task.Delay(TimeSpan.FromSeconds(30), stoppingToken);
+
+        while (!stoppingToken.IsCancellationRequested)
+        {
+            using (var cycle = CoinPayTelemetry.StartWorkerCycle(WorkerName))
+            {
+                try
+                {
+                    await ArchiveFinishedTransactionsAsync(stoppingToken);
+                }
+                catch (Exception ex)
+                {
+                    cycle.Fail(ex);
+                    _logger.LogError(ex, "Error occurred while archiving finished transactions");
+                }
+            }
+
+            try
+            {
+                await Task.Delay(_options.Interval, stoppingToken);
+            }
+            catch (TaskCanceledException)
+            {
+                // Expected when cancellation is requested
+                break;
+            }
+        }
+
+        _logger.LogInformation("Transaction Archiver Service stopped");
+    }
+
+    internal async Task ArchiveFinishedTransactionsAsync(CancellationToken cancellationToken)
+    {
+        // One archiver per cluster: whichever node leases partition 0
+        using var assignment = await _partitions.AcquireAsync(WorkerName, cancellationToken);
+        if (!assignment.Partitions.Contains(0))
+        {
+            return;
+        }
+
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+        // The archive is a partitioned Postgres table; the in-memory provider (tests) has nothing to move
+        if (!db.Database.IsRelational())
+        {
+            return;
+        }
+
+        var repository = scope.ServiceProvider.GetRequiredService<ITransactionRepository>();
+        var cutoff = DateTime.UtcNow - _options.ArchiveAfter;
+
+        var oldest = await repository.GetOldestArchivableAsync(cutoff, cancellationToken);
+        if (oldest == null)
+        {
+            CoinPayTelemetry.SetWorkerBacklog(WorkerName, 0);
+            return;
+        }
+
+        // Every month a moved row can land in needs its partition first
+        var month = new DateTime(oldest.Value.Year, oldest.Value.Month, 1, 0, 0, 0, DateTimeKind.Utc);
+        while (month <= cutoff)
+        {
+            if (!_ensuredPartitions.Contains(month))
+            {
+                await repository.EnsureArchivePartitionAsync(month, cancellationToken);
+                _ensuredPartitions.Add(month);
+            }
+
+            month = month.AddMonths(1);
+        }
+
+        var total = 0;
+        int moved;
+        do
+        {
+            moved = await repository.ArchiveFinishedAsync(cutoff, _options.BatchSize, cancellationToken);
+            total += moved;
+        }
+        while (moved == _options.BatchSize && !cancellationToken.IsCancellationRequested);
+
+        CoinPayTelemetry.SetWorkerBacklog(WorkerName, 0);
+
+        if (total > 0)
+        {
+            _logger.LogInformation("Moved {Count} finished transactions created before {Cutoff} to the archive",
+                total, cutoff);
+        }
+    }
+}
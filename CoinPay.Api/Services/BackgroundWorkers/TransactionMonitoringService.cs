@@ -1,26 +1,40 @@
+using System.Collections.Concurrent;
 using CoinPay.Api.Repositories;
 using CoinPay.Api.Services.UserOperation;
 using CoinPay.Api.Services.Caching;
+using CoinPay.Api.Services.Coordination;
+using CoinPay.Api.Services.Telemetry;
+using CoinPay.Api.Services.Wallet;
 using CoinPay.Api.Models;
 
 namespace CoinPay.Api.Services.BackgroundWorkers;
 
 /// <summary>
-/// Background service that monitors pending transactions and updates their status
+/// Background service that monitors pending transactions and updates their status.
+/// Each cycle walks all pending transactions in keyset batches, checks receipts with bounded
+/// parallelism and confirms each batch in a single write.
+/// Wallets are hash-partitioned by ID and each replica only scans the partitions it leases.
 /// </summary>
 public class TransactionMonitoringService : BackgroundService
 {
     private readonly IServiceProvider _serviceProvider;
     private readonly ILogger<TransactionMonitoringService> _logger;
+    private readonly IWorkPartitionCoordinator _partitions;
     private readonly TimeSpan _pollingInterval = TimeSpan.FromSeconds(30);
     private readonly TimeSpan _maxTransactionAge = TimeSpan.FromHours(24);
 
+    private const string WorkerName = "transaction_monitoring";
+    private const int BatchSize = 200;
+    private const int MaxConcurrentReceiptChecks = 8;
+
     public TransactionMonitoringService(
         IServiceProvider serviceProvider,
-        ILogger<TransactionMonitoringService> logger)
+        ILogger<TransactionMonitoringService> logger,
+        IWorkPartitionCoordinator partitions)
     {
         _serviceProvider = serviceProvider;
         _logger = logger;
+        _partitions = partitions;
     }
 
     protected override async Task ExecuteAsync(CancellationToken stoppingToken)
@@ -33,13 +47,17 @@ public class TransactionMonitoringService : BackgroundService
 
         while (!stoppingToken.IsCancellationRequested)
         {
-            try
+            using (var cycle = CoinPayTelemetry.StartWorkerCycle(WorkerName))
             {
-                await MonitorPendingTransactionsAsync(stoppingToken);
-            }
-            catch (Exception ex)
-            {
-                _logger.LogError(ex, "Error occurred while monitoring transactions");
+                try
+                {
+                    await MonitorPendingTransactionsAsync(stoppingToken);
+                }
+                catch (Exception ex)
+                {
+                    cycle.Fail(ex);
+                    _logger.LogError(ex, "Error occurred while monitoring transactions");
+                }
             }
 
             try
@@ -56,85 +74,73 @@ public class TransactionMonitoringService : BackgroundService
         _logger.LogInformation("Transaction Monitoring Service stopped");
     }
 
-    private async Task MonitorPendingTransactionsAsync(CancellationToken cancellationToken)
+    internal async Task MonitorPendingTransactionsAsync(CancellationToken cancellationToken)
     {
+        using var assignment = await _partitions.AcquireAsync(WorkerName, cancellationToken);
+        if (assignment.IsEmpty)
+        {
+            _logger.LogDebug("No wallet partitions leased by this node, skipping cycle");
+            CoinPayTelemetry.SetWorkerBacklog(WorkerName, 0);
+            return;
+        }
+
+        // Owning every partition needs no filter
+        var walletPartitions = assignment.OwnsAll ? null : assignment.Partitions.ToArray();
+
         using var scope = _serviceProvider.CreateScope();
         var transactionRepository = scope.ServiceProvider.GetRequiredService<ITransactionRepository>();
         var userOpService = scope.ServiceProvider.GetRequiredService<IUserOperationService>();
         var cachingService = scope.ServiceProvider.GetService<ICachingService>();
+        var balanceCache = scope.ServiceProvider.GetService<IWalletBalanceCache>();
 
-        // Get all wallets with pending transactions
-        var allWallets = await GetAllWalletIdsWithPendingTransactionsAsync(transactionRepository, cancellationToken);
-
-        if (allWallets.Count == 0)
-        {
-            _logger.LogDebug("No pending transactions to monitor");
-            return;
-        }
-
-        _logger.LogInformation("Monitoring {Count} wallets with pending transactions", allWallets.Count);
+        // Very old transactions are likely stuck and are no longer scanned
+        var createdAfter = DateTime.UtcNow - _maxTransactionAge;
 
+        int scannedCount = 0;
+        int walletCount = 0;
         int updatedCount = 0;
         int failedCount = 0;
+        int afterWalletId = 0;
+        int afterId = 0;
 
-        foreach (var walletId in allWallets)
+        while (!cancellationToken.IsCancellationRequested)
         {
-            if (cancellationToken.IsCancellationRequested)
+            // Pending work across all wallets, one keyset batch at a time
+            var batch = await transactionRepository.GetPendingBatchAsync(
+                afterWalletId, afterId, BatchSize, createdAfter,
+                walletPartitions, assignment.PartitionCount, cancellationToken);
+
+            if (batch.Count == 0)
                 break;
 
-            var pendingTransactions = await transactionRepository.GetPendingByWalletIdAsync(walletId, cancellationToken);
+            scannedCount += batch.Count;
+            walletCount += batch.Select(t => t.WalletId).Distinct().Count(w => w != afterWalletId);
 
-            foreach (var transaction in pendingTransactions)
-            {
-                if (cancellationToken.IsCancellationRequested)
-                    break;
+            var (updated, failed) = await ProcessBatchAsync(
+                batch, transactionRepository, userOpService, cachingService, balanceCache, cancellationToken);
 
-                // Skip very old transactions (likely stuck)
-                if ((DateTime.UtcNow - transaction.CreatedAt) > _maxTransactionAge)
-                {
-                    _logger.LogWarning("Transaction {Id} is older than {Hours} hours, skipping",
-                        transaction.Id, _maxTransactionAge.TotalHours);
-                    continue;
-                }
+            updatedCount += updated;
+            failedCount += failed;
 
-                try
-                {
-                    var receipt = await userOpService.GetReceiptAsync(transaction.UserOpHash, cancellationToken);
-
-                    if (receipt != null)
-                    {
-                        // Transaction confirmed!
-                        await transactionRepository.UpdateWithReceiptAsync(
-                            transaction.Id,
-                            receipt.TransactionHash,
-                            receipt.BlockNumber,
-                            receipt.ActualGasUsed,
-                            cancellationToken);
-
-                        // Invalidate balance cache for affected wallets
-                        if (cachingService != null)
-                        {
-                            var cacheKeyFrom = $"wallet:balance:{transaction.FromAddress}";
-                            var cacheKeyTo = $"wallet:balance:{transaction.ToAddress}";
-                            await cachingService.RemoveAsync(cacheKeyFrom);
-                            await cachingService.RemoveAsync(cacheKeyTo);
-                        }
-
-                        updatedCount++;
-
-                        _logger.LogInformation(
-                            "Transaction {Id} confirmed: TxHash={TxHash}, Block={BlockNumber}",
-                            transaction.Id, receipt.TransactionHash, receipt.BlockNumber);
-                    }
-                }
-                catch (Exception ex)
-                {
-                    failedCount++;
-                    _logger.LogWarning(ex, "Failed to check receipt for transaction {Id}", transaction.Id);
-                }
-            }
+            var last = batch[^1];
+            afterWalletId = last.WalletId;
+            afterId = last.Id;
+
+            if (batch.Count < BatchSize)
+                break;
+        }
+
+        CoinPayTelemetry.SetWorkerBacklog(WorkerName, scannedCount);
+
+        if (scannedCount == 0)
+        {
+            _logger.LogDebug("No pending transactions to monitor");
+            return;
         }
 
+        _logger.LogInformation("Monitored {Count} pending transactions across {Wallets} wallets",
+            scannedCount, walletCount);
+
         if (updatedCount > 0 || failedCount > 0)
         {
             _logger.LogInformation(
@@ -143,27 +149,85 @@ public class TransactionMonitoringService : BackgroundService
         }
     }
 
-    private async Task<List<int>> GetAllWalletIdsWithPendingTransactionsAsync(
-        ITransactionRepository repository,
+    /// <summary>
+    /// Checks receipts for a batch of pending transactions with bounded parallelism, then confirms all
+    /// transactions that have a receipt in one bulk update.
+    /// </summary>
+    private async Task<(int Updated, int Failed)> ProcessBatchAsync(
+        List<BlockchainTransaction> batch,
+        ITransactionRepository transactionRepository,
+        IUserOperationService userOpService,
+        ICachingService? cachingService,
+        IWalletBalanceCache? balanceCache,
         CancellationToken cancellationToken)
     {
-        // This is a simplified approach - in production you might want a more efficient query
-        var walletIds = new List<int>();
+        var confirmed = new ConcurrentBag<(BlockchainTransaction Transaction, UserOperationReceipt Receipt)>();
+        int failedCount = 0;
+
+        var parallelOptions = new ParallelOptions
+        {
+            MaxDegreeOfParallelism = MaxConcurrentReceiptChecks,
+            CancellationToken = cancellationToken
+        };
 
-        // Get a sample of recent pending transactions to find active wallets
-        // In production, you'd have a better way to track which wallets have pending transactions
-        for (int walletId = 1; walletId <= 100; walletId++)
+        await Parallel.ForEachAsync(batch, parallelOptions, async (transaction, ct) =>
         {
-            var pending = await repository.GetPendingByWalletIdAsync(walletId, cancellationToken);
-            if (pending.Count > 0)
+            try
+            {
+                var receipt = await userOpService.GetReceiptAsync(transaction.UserOpHash, ct);
+
+                if (receipt != null)
+                {
+                    confirmed.Add((transaction, receipt));
+                }
+            }
+            catch (Exception ex) when (ex is not OperationCanceledException)
             {
-                walletIds.Add(walletId);
+                Interlocked.Increment(ref failedCount);
+                _logger.LogWarning(ex, "Failed to check receipt for transaction {Id}", transaction.Id);
             }
+        });
 
-            if (walletIds.Count >= 50) // Limit to prevent too many concurrent checks
-                break;
+        if (confirmed.IsEmpty)
+            return (0, failedCount);
+
+        // Transaction confirmed!
+        var updates = confirmed
+            .Select(c => new BlockchainReceiptUpdate(
+                c.Transaction.Id,
+                c.Receipt.TransactionHash,
+                c.Receipt.BlockNumber,
+                c.Receipt.ActualGasUsed))
+            .ToList();
+
+        var updatedCount = await transactionRepository.UpdateWithReceiptsAsync(updates, cancellationToken);
+
+        foreach (var (transaction, receipt) in confirmed)
+        {
+            _logger.LogInformation(
+                "Transaction {Id} confirmed: TxHash={TxHash}, Block={BlockNumber}",
+                transaction.Id, receipt.TransactionHash, receipt.BlockNumber);
+        }
+
+        // Invalidate balance caches for affected wallets; block-tagged snapshots taken after the receipt's block are kept
+        foreach (var (transaction, receipt) in confirmed)
+        {
+            balanceCache?.Invalidate(transaction.FromAddress, receipt.BlockNumber);
+            balanceCache?.Invalidate(transaction.ToAddress, receipt.BlockNumber);
+        }
+
+        if (cachingService != null)
+        {
+            var addresses = confirmed
+                .SelectMany(c => new[] { c.Transaction.FromAddress, c.Transaction.ToAddress })
+                .Distinct();
+
+            foreach (var address in addresses)
+            {
+                await cachingService.RemoveAsync($"wallet:balance:{address}");
+            }
         }
 
-        return walletIds;
+        return (updatedCount, failedCount);
     }
 }
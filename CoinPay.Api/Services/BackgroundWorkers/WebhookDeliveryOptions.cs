@@ -0,0 +1,81 @@
+namespace CoinPay.Api.Services.BackgroundWorkers;
+
+/// <summary>
+/// Configuration options for the webhook outbox dispatcher
+/// </summary>
+public class WebhookDeliveryOptions
+{
+    /// <summary>
+    /// How often the dispatcher looks for due outbox rows (default: 1)
+    /// </summary>
+    public int PollingIntervalSeconds { get; set; } = 1;
+
+    /// <summary>
+    /// Maximum due rows loaded per polling cycle (default: 200)
+    /// </summary>
+    public int BatchSize { get; set; } = 200;
+
+    /// <summary>
+    /// How long a claimed row stays hidden from other dispatchers; a row whose dispatcher stops
+    /// before saving a result is delivered again after this (default: 120)
+    /// </summary>
+    public int ClaimTimeoutSeconds { get; set; } = 120;
+
+    /// <summary>
+    /// Maximum concurrent deliveries to one endpoint (scheme, host and port) (default: 4)
+    /// </summary>
+    public int MaxConcurrencyPerEndpoint { get; set; } = 4;
+
+    /// <summary>
+    /// Timeout for a single delivery request (default: 10)
+    /// </summary>
+    public int RequestTimeoutSeconds { get; set; } = 10;
+
+    /// <summary>
+    /// Attempts before a delivery is marked as failed (default: 8)
+    /// </summary>
+    public int MaxAttempts { get; set; } = 8;
+
+    /// <summary>
+    /// Base delay before the first retry (default: 5)
+    /// </summary>
+    public int RetryBaseDelaySeconds { get; set; } = 5;
+
+    /// <summary>
+    /// Upper bound for the retry delay (default: 3600)
+    /// </summary>
+    public int RetryMaxDelaySeconds { get; set; } = 3600;
+
+    /// <summary>
+    /// Consecutive failed deliveries to an endpoint before its circuit opens (default: 5)
+    /// </summary>
+    public int CircuitBreakerFailureThreshold { get; set; } = 5;
+
+    /// <summary>
+    /// How long an endpoint's circuit stays open (default: 60)
+    /// </summary>
+    public int CircuitBreakerDurationSeconds { get; set; } = 60;
+
+    /// <summary>
+    /// Maximum delivery results written to the database in one batch (default: 100)
+    /// </summary>
+    public int LogBatchSize { get; set; } = 100;
+
+    public TimeSpan PollingInterval => TimeSpan.FromSeconds(PollingIntervalSeconds);
+
+    public TimeSpan ClaimTimeout => TimeSpan.FromSeconds(ClaimTimeoutSeconds);
+
+    public TimeSpan CircuitBreakerDuration => TimeSpan.FromSeconds(CircuitBreakerDurationSeconds);
+
+    /// <summary>
+    /// Gets the delay before retrying a delivery that has failed <paramref name="attempts"/> times.
+    /// Doubles per attempt up to <see cref="RetryMaxDelaySeconds"/>, with "equal jitter" (50-100% of the delay)
+    /// so retries for a recovering endpoint don't arrive all at once.
+    /// </summary>
+    public TimeSpan GetRetryDelay(int attempts)
+    {
+        var exponent = Math.Clamp(attempts - 1, 0, 20);
+        var seconds = Math.Min(RetryBaseDelaySeconds * Math.Pow(2, exponent), RetryMaxDelaySeconds);
+        return TimeSpan.FromSeconds(seconds / 2 + Random.Shared.NextDouble() * seconds / 2);
+    }
+}
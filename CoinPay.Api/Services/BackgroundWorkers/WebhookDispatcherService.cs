@@ -0,0 +1,442 @@
+using System.Collections.Concurrent;
+using System.Net;
+using System.Text;
+using System.Threading.Channels;
+using CoinPay.Api.Data;
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.Telemetry;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Options;
+using Polly;
+using Polly.CircuitBreaker;
+
+namespace CoinPay.Api.Services.BackgroundWorkers;
+
+/// <summary>
+/// Background service that drains the webhook outbox.
+///
+/// Each polling cycle claims a batch of due pending rows and starts a delivery for every row whose endpoint
+/// has a free slot, so a slow subscriber only ever occupies its own slots. Claiming pushes NextAttemptAt past
+/// ClaimTimeout with FOR UPDATE SKIP LOCKED, so dispatchers on other replicas never send the same row; a row
+/// whose dispatcher stops before saving its result becomes due again when the claim runs out. Claimed rows
+/// whose endpoint is at its cap are handed back straight away. Deliveries share one pooled
+/// keep-alive HttpClient ("Webhooks"), and each endpoint has its own circuit breaker. Results are
+/// written back in batches - outbox status, the next jittered retry time and the delivery logs in one
+/// SaveChanges - and retries are scheduled in the database so they survive restarts.
+/// </summary>
+public class WebhookDispatcherService : BackgroundService
+{
+    public const string HttpClientName = "Webhooks";
+
+    private const int MaxResponseBodyLength = 1024;
+
+    private readonly IServiceProvider _serviceProvider;
+    private readonly IHttpClientFactory _httpClientFactory;
+    private readonly ILogger<WebhookDispatcherService> _logger;
+    private readonly WebhookDeliveryOptions _options;
+
+    private readonly ConcurrentDictionary<string, EndpointState> _endpoints = new();
+    private readonly ConcurrentDictionary<long, Task> _inFlight = new();
+    private readonly Channel<DeliveryResult> _results = Channel.CreateUnbounded<DeliveryResult>(
+        new UnboundedChannelOptions { SingleReader = true });
+
+    public WebhookDispatcherService(
+        IServiceProvider serviceProvider,
+        IHttpClientFactory httpClientFactory,
+        ILogger<WebhookDispatcherService> logger,
+        IOptions<WebhookDeliveryOptions> options)
+    {
+        _serviceProvider = serviceProvider;
+        _httpClientFactory = httpClientFactory;
+        _logger = logger;
+        _options = options.Value;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        _logger.LogInformation(
+            "Webhook Dispatcher Service started. Polling interval: {Interval}s, per-endpoint concurrency: {Concurrency}",
+            _options.PollingIntervalSeconds,
+            _options.MaxConcurrencyPerEndpoint);
+
+        // Results are persisted by a single writer so log and status writes are batched
+        var resultWriter = WriteResultsAsync();
+
+        while (!stoppingToken.IsCancellationRequested)
+        {
+            using (var cycle = CoinPayTelemetry.StartWorkerCycle("webhook_dispatcher"))
+            {
+                try
+                {
+                    await DispatchDueDeliveriesAsync(stoppingToken);
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    cycle.Fail(ex);
+                    _logger.LogError(ex, "Error occurred while dispatching webhooks");
+                }
+            }
+
+            try
+            {
+                await Task.Delay(_options.PollingInterval, stoppingToken);
+            }
+            catch (TaskCanceledException)
+            {
+                // Expected when cancellation is requested
+                break;
+            }
+        }
+
+        // Let in-flight deliveries finish (they observe the stopping token), then flush their results
+        await Task.WhenAll(_inFlight.Values);
+        _results.Writer.TryComplete();
+        await resultWriter;
+
+        _logger.LogInformation("Webhook Dispatcher Service stopped");
+    }
+
+    private async Task DispatchDueDeliveriesAsync(CancellationToken cancellationToken)
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+        var claimedIds = await ClaimDueDeliveriesAsync(db, cancellationToken);
+
+        CoinPayTelemetry.SetWorkerBacklog("webhook_dispatcher", claimedIds.Count);
+
+        if (claimedIds.Count == 0)
+        {
+            return;
+        }
+
+        var dueDeliveries = await db.WebhookOutboxMessages
+            .AsNoTracking()
+            .Where(m => claimedIds.Contains(m.Id))
+            .OrderBy(m => m.Id)
+            .Select(m => new PendingDelivery(
+                m.Id,
+                m.WebhookId,
+                m.Webhook!.Url,
+                m.Webhook.IsActive,
+                m.EventName,
+                m.TransactionId,
+                m.Payload,
+                m.AttemptCount))
+            .ToListAsync(cancellationToken);
+
+        var started = 0;
+        foreach (var delivery in dueDeliveries)
+        {
+            if (!delivery.WebhookActive || !Uri.TryCreate(delivery.Url, UriKind.Absolute, out var uri))
+            {
+                _inFlight[delivery.Id] = Task.CompletedTask;
+                _results.Writer.TryWrite(DeliveryResult.Abandoned(delivery, "Webhook inactive or URL invalid"));
+                continue;
+            }
+
+            var endpoint = _endpoints.GetOrAdd(uri.GetLeftPart(UriPartial.Authority), _ => CreateEndpointState());
+
+            // Hand the claim back when this endpoint is at its concurrency cap, so the row is due again next cycle
+            if (!endpoint.Slots.Wait(0))
+            {
+                _inFlight[delivery.Id] = Task.CompletedTask;
+                _results.Writer.TryWrite(DeliveryResult.Deferred(delivery, DateTime.UtcNow));
+                continue;
+            }
+
+            // Register the row as in flight before the delivery starts, so its result can't be saved first
+            var completion = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+            _inFlight[delivery.Id] = completion.Task;
+
+            _ = Task.Run(async () =>
+            {
+                try
+                {
+                    await DeliverAsync(delivery, uri, endpoint, cancellationToken);
+                }
+                finally
+                {
+                    completion.TrySetResult();
+                }
+            }, CancellationToken.None);
+
+            started++;
+        }
+
+        _logger.LogDebug("Started {Started} of {Due} due webhook deliveries ({InFlight} in flight)",
+            started, dueDeliveries.Count, _inFlight.Count);
+    }
+
+    /// <summary>
+    /// Claims up to BatchSize due rows by moving their NextAttemptAt to the end of the claim timeout, in one
+    /// statement. SKIP LOCKED lets concurrent dispatchers claim disjoint batches instead of waiting on each other.
+    /// </summary>
+    internal async Task<List<long>> ClaimDueDeliveriesAsync(AppDbContext db, CancellationToken cancellationToken)
+    {
+        var now = DateTime.UtcNow;
+        var claimedUntil = now + _options.ClaimTimeout;
+        var inFlightIds = _inFlight.Keys.ToArray();
+
+        if (!db.Database.IsRelational())
+        {
+            // The in-memory provider (tests) has no row locks; claim with a plain update
+            var due = await db.WebhookOutboxMessages
+                .Where(m => m.Status == WebhookDeliveryStatus.Pending &&
+                            m.NextAttemptAt <= now &&
+                            !inFlightIds.Contains(m.Id))
+                .OrderBy(m => m.NextAttemptAt)
+                .Take(_options.BatchSize)
+                .ToListAsync(cancellationToken);
+
+            foreach (var message in due)
+            {
+                message.NextAttemptAt = claimedUntil;
+            }
+
+            await db.SaveChangesAsync(cancellationToken);
+            return due.Select(m => m.Id).ToList();
+        }
+
+        var pending = (int)WebhookDeliveryStatus.Pending;
+
+        return await db.Database.SqlQuery<long>($"""
+            UPDATE "WebhookOutboxMessages" SET "NextAttemptAt" = {claimedUntil}
+            WHERE "Id" IN (
+                SELECT "Id" FROM "WebhookOutboxMessages"
+                WHERE "Status" = {pending} AND "NextAttemptAt" <= {now} AND NOT ("Id" = ANY({inFlightIds}))
+                ORDER BY "NextAttemptAt"
+                LIMIT {_options.BatchSize}
+                FOR UPDATE SKIP LOCKED)
+            RETURNING "Id" AS "Value"
+            """).ToListAsync(cancellationToken);
+    }
+
+    private async Task DeliverAsync(PendingDelivery delivery, Uri uri, EndpointState endpoint, CancellationToken cancellationToken)
+    {
+        var attemptNumber = delivery.AttemptCount + 1;
+
+        try
+        {
+            var client = _httpClientFactory.CreateClient(HttpClientName);
+
+            using var response = await endpoint.CircuitBreaker.ExecuteAsync(async ct =>
+            {
+                using var content = new StringContent(delivery.Payload, Encoding.UTF8, "application/json");
+                return await client.PostAsync(uri, content, ct);
+            }, cancellationToken);
+
+            var body = await response.Content.ReadAsStringAsync(cancellationToken);
+            if (body.Length > MaxResponseBodyLength)
+            {
+                body = body[..MaxResponseBodyLength];
+            }
+
+            _results.Writer.TryWrite(DeliveryResult.Attempted(
+                delivery, attemptNumber, response.IsSuccessStatusCode, (int)response.StatusCode, body, null));
+        }
+        catch (BrokenCircuitException)
+        {
+            // Not an attempt: the endpoint is known to be failing, so just try again once the circuit closes
+            _results.Writer.TryWrite(DeliveryResult.Deferred(delivery, DateTime.UtcNow + _options.CircuitBreakerDuration));
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            // Shutting down - the row stays pending and is picked up again once its claim runs out
+            _inFlight.TryRemove(delivery.Id, out _);
+        }
+        catch (Exception ex)
+        {
+            _results.Writer.TryWrite(DeliveryResult.Attempted(
+                delivery, attemptNumber, false, 0, null, ex.Message));
+        }
+        finally
+        {
+            endpoint.Slots.Release();
+        }
+    }
+
+    /// <summary>
+    /// Persists delivery results in batches: outbox status, retry schedule and delivery logs in one SaveChanges.
+    /// Rows leave the in-flight set only after their result is saved, so they are never dispatched twice.
+    /// </summary>
+    private async Task WriteResultsAsync()
+    {
+        var batch = new List<DeliveryResult>(_options.LogBatchSize);
+
+        while (await _results.Reader.WaitToReadAsync())
+        {
+            while (batch.Count < _options.LogBatchSize && _results.Reader.TryRead(out var result))
+            {
+                batch.Add(result);
+            }
+
+            try
+            {
+                await SaveResultsAsync(batch);
+            }
+            catch (Exception ex)
+            {
+                // The rows stay pending and are retried once their claim runs out
+                _logger.LogError(ex, "Failed to save {Count} webhook delivery results", batch.Count);
+            }
+            finally
+            {
+                foreach (var result in batch)
+                {
+                    _inFlight.TryRemove(result.MessageId, out _);
+                }
+
+                batch.Clear();
+            }
+        }
+    }
+
+    private async Task SaveResultsAsync(List<DeliveryResult> results)
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+        var ids = results.Select(r => r.MessageId).ToList();
+        var messages = await db.WebhookOutboxMessages
+            .Where(m => ids.Contains(m.Id))
+            .ToDictionaryAsync(m => m.Id);
+
+        var now = DateTime.UtcNow;
+        var delivered = 0;
+        var failed = 0;
+
+        foreach (var result in results)
+        {
+            if (!messages.TryGetValue(result.MessageId, out var message))
+                continue;
+
+            if (result.RetryAt.HasValue)
+            {
+                message.NextAttemptAt = result.RetryAt.Value;
+                continue;
+            }
+
+            if (result.AttemptNumber > 0)
+            {
+                message.AttemptCount = result.AttemptNumber;
+                db.WebhookDeliveryLogs.Add(new WebhookDeliveryLog
+                {
+                    WebhookId = result.WebhookId,
+                    EventName = result.EventName,
+                    TransactionId = result.TransactionId,
+                    StatusCode = result.StatusCode,
+                    Success = result.Success,
+                    ResponseBody = result.ResponseBody,
+                    ErrorMessage = result.ErrorMessage,
+                    AttemptNumber = result.AttemptNumber,
+                    Timestamp = now
+                });
+            }
+
+            if (result.Success)
+            {
+                message.Status = WebhookDeliveryStatus.Delivered;
+                message.DeliveredAt = now;
+                message.LastError = null;
+                delivered++;
+            }
+            else if (result.AttemptNumber == 0 || message.AttemptCount >= _options.MaxAttempts)
+            {
+                message.Status = WebhookDeliveryStatus.Failed;
+                message.LastError = result.ErrorMessage ?? $"HTTP {result.StatusCode}";
+                failed++;
+
+                _logger.LogWarning(
+                    "Webhook delivery {MessageId} to webhook {WebhookId} failed permanently after {Attempts} attempts: {Error}",
+                    message.Id, message.WebhookId, message.AttemptCount, message.LastError);
+            }
+            else
+            {
+                message.LastError = result.ErrorMessage ?? $"HTTP {result.StatusCode}";
+                message.NextAttemptAt = now + _options.GetRetryDelay(message.AttemptCount);
+            }
+        }
+
+        await db.SaveChangesAsync();
+
+        _logger.LogDebug(
+            "Saved {Count} webhook delivery results: {Delivered} delivered, {Failed} failed permanently, {Retrying} rescheduled",
+            results.Count, delivered, failed, results.Count - delivered - failed);
+    }
+
+    private EndpointState CreateEndpointState()
+    {
+        var circuitBreaker = Policy
+            .Handle<HttpRequestException>()
+            .Or<TaskCanceledException>()
+            .OrResult<HttpResponseMessage>(r =>
+                (int)r.StatusCode >= 500 || r.StatusCode == HttpStatusCode.TooManyRequests)
+            .CircuitBreakerAsync(
+                handledEventsAllowedBeforeBreaking: _options.CircuitBreakerFailureThreshold,
+                durationOfBreak: _options.CircuitBreakerDuration,
+                onBreak: (outcome, duration) =>
+                {
+                    _logger.LogWarning("Webhook endpoint circuit opened for {Duration}s after repeated failures",
+                        duration.TotalSeconds);
+                },
+                onReset: () =>
+                {
+                    _logger.LogInformation("Webhook endpoint circuit reset");
+                });
+
+        return new EndpointState(
+            new SemaphoreSlim(_options.MaxConcurrencyPerEndpoint, _options.MaxConcurrencyPerEndpoint),
+            circuitBreaker);
+    }
+
+    public override void Dispose()
+    {
+        foreach (var endpoint in _endpoints.Values)
+        {
+            endpoint.Slots.Dispose();
+        }
+
+        base.Dispose();
+    }
+
+    private sealed record EndpointState(
+        SemaphoreSlim Slots,
+        AsyncCircuitBreakerPolicy<HttpResponseMessage> CircuitBreaker);
+
+    private sealed record PendingDelivery(
+        long Id,
+        int WebhookId,
+        string Url,
+        bool WebhookActive,
+        string EventName,
+        int TransactionId,
+        string Payload,
+        int AttemptCount);
+
+    private sealed record DeliveryResult(
+        long MessageId,
+        int WebhookId,
+        string EventName,
+        int TransactionId,
+        int AttemptNumber,
+        bool Success,
+        int StatusCode,
+        string? ResponseBody,
+        string? ErrorMessage,
+        DateTime? RetryAt)
+    {
+        public static DeliveryResult Attempted(
+            PendingDelivery delivery, int attemptNumber, bool success, int statusCode, string? responseBody, string? errorMessage) =>
+            new(delivery.Id, delivery.WebhookId, delivery.EventName, delivery.TransactionId,
+                attemptNumber, success, statusCode, responseBody, errorMessage, null);
+
+        public static DeliveryResult Deferred(PendingDelivery delivery, DateTime retryAt) =>
+            new(delivery.Id, delivery.WebhookId, delivery.EventName, delivery.TransactionId,
+                0, false, 0, null, null, retryAt);
+
+        public static DeliveryResult Abandoned(PendingDelivery delivery, string reason) =>
+            new(delivery.Id, delivery.WebhookId, delivery.EventName, delivery.TransactionId,
+                0, false, 0, null, reason, null);
+    }
+}
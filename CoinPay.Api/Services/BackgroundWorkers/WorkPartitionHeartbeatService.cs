@@ -0,0 +1,83 @@
+using CoinPay.Api.Services.Coordination;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Services.BackgroundWorkers;
+
+/// <summary>
+/// Background service that keeps this node's worker partition leases alive between worker cycles and
+/// rebalances them as replicas join or leave. On shutdown the leases are released so the remaining
+/// replicas take the partitions over on their next heartbeat instead of waiting for expiry.
+/// Registered before the workers so it stops after them.
+/// </summary>
+public class WorkPartitionHeartbeatService : BackgroundService
+{
+    private readonly IWorkPartitionCoordinator _coordinator;
+    private readonly ILogger<WorkPartitionHeartbeatService> _logger;
+    private readonly WorkPartitioningOptions _options;
+
+    public WorkPartitionHeartbeatService(
+        IWorkPartitionCoordinator coordinator,
+        ILogger<WorkPartitionHeartbeatService> logger,
+        IOptions<WorkPartitioningOptions> options)
+    {
+        _coordinator = coordinator;
+        _logger = logger;
+        _options = options.Value;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        if (!_options.Enabled)
+        {
+            _logger.LogInformation("Worker partitioning disabled; every node processes all background work");
+            return;
+        }
+
+        _logger.LogInformation(
+            "Work Partition Heartbeat Service started. Node: {NodeId}, partitions: {Partitions}, heartbeat: {Interval}s",
+            _coordinator.NodeId,
+            _options.PartitionCount,
+            _options.HeartbeatInterval.TotalSeconds);
+
+        while (!stoppingToken.IsCancellationRequested)
+        {
+            try
+            {
+                await Task.Delay(_options.HeartbeatInterval, stoppingToken);
+            }
+            catch (TaskCanceledException)
+            {
+                // Expected when cancellation is requested
+                break;
+            }
+
+            try
+            {
+                await _coordinator.RenewAsync(stoppingToken);
+            }
+            catch (OperationCanceledException)
+            {
+                break;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Error occurred while renewing worker partition leases");
+            }
+        }
+    }
+
+    public override async Task StopAsync(CancellationToken cancellationToken)
+    {
+        await base.StopAsync(cancellationToken);
+
+        try
+        {
+            await _coordinator.ReleaseAsync(cancellationToken);
+        }
+        catch (Exception ex)
+        {
+            // Leases simply expire if they cannot be released
+            _logger.LogWarning(ex, "Failed to release worker partition leases on shutdown");
+        }
+    }
+}
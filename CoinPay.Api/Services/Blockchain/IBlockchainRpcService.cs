@@ -15,6 +15,11 @@ public interface IBlockchainRpcService
     /// </summary>
     Task<decimal> GetNativeBalanceAsync(string walletAddress, CancellationToken cancellationToken = default);
 
+    /// <summary>
+    /// Get the balance of any ERC-20 token for a wallet address, scaled by the token's decimals
+    /// </summary>
+    Task<decimal> GetTokenBalanceAsync(string walletAddress, string tokenContract, int decimals, CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Get transaction receipt by transaction hash
     /// </summary>
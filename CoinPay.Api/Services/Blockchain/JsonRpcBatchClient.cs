@@ -0,0 +1,211 @@
+using System.Net.Http.Json;
+using System.Text.Json;
+using Microsoft.Extensions.Options;
+using CoinPay.Api.Services.Telemetry;
+
+namespace CoinPay.Api.Services.Blockchain;
+
+/// <summary>
+/// JSON-RPC client that combines calls made within a short window into one batch request.
+/// The first call of a batch starts the window; the batch is sent when the window closes
+/// or as soon as it reaches the maximum size, so node round trips grow with batches rather than callers.
+/// </summary>
+public class JsonRpcBatchClient
+{
+    public const string HttpClientName = "PolygonAmoyRpc";
+
+    private readonly IHttpClientFactory _httpClientFactory;
+    private readonly PolygonAmoyRpcOptions _options;
+    private readonly ILogger<JsonRpcBatchClient> _logger;
+
+    private readonly object _gate = new();
+    private List<PendingCall> _pending = new();
+    private long _batchGeneration;
+    private long _nextRequestId;
+
+    public JsonRpcBatchClient(
+        IHttpClientFactory httpClientFactory,
+        IOptions<PolygonAmoyRpcOptions> options,
+        ILogger<JsonRpcBatchClient> logger)
+    {
+        _httpClientFactory = httpClientFactory;
+        _options = options.Value;
+        _logger = logger;
+    }
+
+    /// <summary>
+    /// Queues a call for the current batch and returns its result element.
+    /// Cancelling only stops waiting; the call is still sent with the rest of its batch.
+    /// </summary>
+    public Task<JsonElement> SendAsync(string method, object[] parameters, CancellationToken cancellationToken = default)
+    {
+        var call = new PendingCall(Interlocked.Increment(ref _nextRequestId), method, parameters);
+        List<PendingCall>? fullBatch = null;
+        long? windowGeneration = null;
+
+        lock (_gate)
+        {
+            _pending.Add(call);
+
+            if (_pending.Count >= _options.MaxBatchSize)
+            {
+                fullBatch = TakePendingLocked();
+            }
+            else if (_pending.Count == 1)
+            {
+                windowGeneration = _batchGeneration;
+            }
+        }
+
+        if (fullBatch != null)
+        {
+            _ = SendBatchAsync(fullBatch);
+        }
+        else if (windowGeneration.HasValue)
+        {
+            _ = FlushAfterWindowAsync(windowGeneration.Value);
+        }
+
+        return call.Completion.Task.WaitAsync(cancellationToken);
+    }
+
+    private List<PendingCall> TakePendingLocked()
+    {
+        var batch = _pending;
+        _pending = new List<PendingCall>();
+        _batchGeneration++;
+        return batch;
+    }
+
+    private async Task FlushAfterWindowAsync(long generation)
+    {
+        await Task.Delay(_options.BatchWindow);
+
+        List<PendingCall>? batch = null;
+        lock (_gate)
+        {
+            // The batch may already have been sent because it filled up
+            if (generation == _batchGeneration && _pending.Count > 0)
+            {
+                batch = TakePendingLocked();
+            }
+        }
+
+        if (batch != null)
+        {
+            await SendBatchAsync(batch);
+        }
+    }
+
+    private async Task SendBatchAsync(List<PendingCall> batch)
+    {
+        try
+        {
+            var payload = batch.Select(c => new JsonRpcRequest(c.Id, c.Method, c.Parameters)).ToList();
+
+            var client = _httpClientFactory.CreateClient(HttpClientName);
+            using var request = new HttpRequestMessage(HttpMethod.Post, _options.RpcUrl)
+            {
+                Content = JsonContent.Create(payload)
+            }.WithUpstreamOperation(batch.Count == 1 ? batch[0].Method : "batch");
+            using var response = await client.SendAsync(request);
+            response.EnsureSuccessStatusCode();
+
+            await using var stream = await response.Content.ReadAsStreamAsync();
+            using var document = await JsonDocument.ParseAsync(stream);
+
+            _logger.LogDebug("Sent JSON-RPC batch of {Count} calls", batch.Count);
+
+            CompleteCalls(batch, document.RootElement);
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "JSON-RPC batch of {Count} calls failed", batch.Count);
+
+            foreach (var call in batch)
+            {
+                call.Completion.TrySetException(ex);
+            }
+        }
+    }
+
+    private static void CompleteCalls(List<PendingCall> batch, JsonElement root)
+    {
+        // A node that rejects the whole batch answers with a single error object
+        if (root.ValueKind == JsonValueKind.Object)
+        {
+            var error = ReadError(root) ?? new JsonRpcException(-32603, "Unexpected JSON-RPC batch response");
+            foreach (var call in batch)
+            {
+                call.Completion.TrySetException(error);
+            }
+            return;
+        }
+
+        var callsById = batch.ToDictionary(c => c.Id);
+
+        foreach (var item in root.EnumerateArray())
+        {
+            if (!item.TryGetProperty("id", out var idElement) ||
+                !idElement.TryGetInt64(out var id) ||
+                !callsById.Remove(id, out var call))
+            {
+                continue;
+            }
+
+            var error = ReadError(item);
+            if (error != null)
+            {
+                call.Completion.TrySetException(error);
+            }
+            else if (item.TryGetProperty("result", out var result))
+            {
+                call.Completion.TrySetResult(result.Clone());
+            }
+            else
+            {
+                call.Completion.TrySetException(new JsonRpcException(-32603, $"No result for {call.Method}"));
+            }
+        }
+
+        foreach (var call in callsById.Values)
+        {
+            call.Completion.TrySetException(new JsonRpcException(-32603, $"No response for {call.Method}"));
+        }
+    }
+
+    private static JsonRpcException? ReadError(JsonElement element)
+    {
+        if (!element.TryGetProperty("error", out var error) || error.ValueKind != JsonValueKind.Object)
+        {
+            return null;
+        }
+
+        var code = error.TryGetProperty("code", out var codeElement) && codeElement.TryGetInt32(out var c) ? c : -32603;
+        var message = error.TryGetProperty("message", out var messageElement) ? messageElement.GetString() : null;
+
+        return new JsonRpcException(code, message ?? "JSON-RPC error");
+    }
+
+    private sealed class PendingCall
+    {
+        public PendingCall(long id, string method, object[] parameters)
+        {
+            Id = id;
+            Method = method;
+            Parameters = parameters;
+        }
+
+        public long Id { get; }
+        public string Method { get; }
+        public object[] Parameters { get; }
+
+        public TaskCompletionSource<JsonElement> Completion { get; } =
+            new(TaskCreationOptions.RunContinuationsAsynchronously);
+    }
+
+    private sealed record JsonRpcRequest(long Id, string Method, object[] Params)
+    {
+        public string Jsonrpc => "2.0";
+    }
+}
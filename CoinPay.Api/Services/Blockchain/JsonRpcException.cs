@@ -0,0 +1,15 @@
+namespace CoinPay.Api.Services.Blockchain;
+
+/// <summary>
+/// Exception thrown when a JSON-RPC node returns an error for a call
+/// </summary>
+public class JsonRpcException : Exception
+{
+    public int Code { get; }
+
+    public JsonRpcException(int code, string message)
+        : base(message)
+    {
+        Code = code;
+    }
+}
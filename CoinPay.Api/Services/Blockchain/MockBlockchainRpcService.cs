@@ -38,6 +38,22 @@ public class MockBlockchainRpcService : IBlockchainRpcService
         return Task.FromResult(balance);
     }
 
+    public Task<decimal> GetTokenBalanceAsync(
+        string walletAddress,
+        string tokenContract,
+        int decimals,
+        CancellationToken cancellationToken = default)
+    {
+        _logger.LogInformation("[MockBlockchain] Getting token {Token} balance for address: {Address}", tokenContract, walletAddress);
+
+        // For MVP: Return mock balance between 0 and 10 tokens
+        var balance = (decimal)(_random.NextDouble() * 10);
+        balance = Math.Round(balance, 4);
+
+        _logger.LogDebug("[MockBlockchain] Mock token {Token} balance for {Address}: {Balance}", tokenContract, walletAddress, balance);
+        return Task.FromResult(balance);
+    }
+
     public Task<TransactionReceipt?> GetTransactionReceiptAsync(string txHash, CancellationToken cancellationToken = default)
     {
         _logger.LogInformation("[MockBlockchain] Getting transaction receipt for tx: {TxHash}", txHash);
@@ -0,0 +1,40 @@
+namespace CoinPay.Api.Services.Blockchain;
+
+/// <summary>
+/// Configuration options for the Polygon Amoy JSON-RPC client
+/// </summary>
+public class PolygonAmoyRpcOptions
+{
+    /// <summary>
+    /// JSON-RPC endpoint (default: https://rpc-amoy.polygon.technology)
+    /// </summary>
+    public string RpcUrl { get; set; } = "https://rpc-amoy.polygon.technology";
+
+    /// <summary>
+    /// Circle's USDC contract on Polygon Amoy (default: 0x41E94Eb019C0762f9Bfcf9Fb1E58725BfB0e7582)
+    /// </summary>
+    public string USDCContract { get; set; } = "0x41E94Eb019C0762f9Bfcf9Fb1E58725BfB0e7582";
+
+    /// <summary>
+    /// How long a call waits for other calls to join its batch (default: 5)
+    /// </summary>
+    public int BatchWindowMilliseconds { get; set; } = 5;
+
+    /// <summary>
+    /// Calls per batch; a full batch is sent without waiting for the window (default: 50)
+    /// </summary>
+    public int MaxBatchSize { get; set; } = 50;
+
+    /// <summary>
+    /// How long the latest block number is reused (default: 1000, about half an Amoy block)
+    /// </summary>
+    public int BlockNumberCacheMilliseconds { get; set; } = 1000;
+
+    /// <summary>
+    /// Timeout for a single batch request (default: 30)
+    /// </summary>
+    public int RequestTimeoutSeconds { get; set; } = 30;
+
+    public TimeSpan BatchWindow => TimeSpan.FromMilliseconds(BatchWindowMilliseconds);
+    public TimeSpan BlockNumberCacheDuration => TimeSpan.FromMilliseconds(BlockNumberCacheMilliseconds);
+}
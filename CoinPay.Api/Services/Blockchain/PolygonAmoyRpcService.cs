@@ -1,42 +1,50 @@
-using Nethereum.Web3;
-using Nethereum.Contracts.Standards.ERC20;
+using System.Collections.Concurrent;
+using System.Text.Json;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Options;
 using Nethereum.Hex.HexTypes;
-using Nethereum.RPC.Eth.DTOs;
-using System.Numerics;
+using Nethereum.Web3;
 
 namespace CoinPay.Api.Services.Blockchain;
 
 /// <summary>
 /// Real blockchain RPC service for Polygon Amoy testnet
-/// Queries actual blockchain data using Nethereum
+/// Calls go through <see cref="JsonRpcBatchClient"/>, so concurrent lookups share batch requests.
+/// The latest block number is reused briefly, gas price is cached per block and identical
+/// in-flight receipt lookups share a single call.
 /// </summary>
 public class PolygonAmoyRpcService : IBlockchainRpcService
 {
+    // balanceOf(address)
+    private const string BalanceOfSelector = "0x70a08231";
+
+    private static readonly TimeSpan BlockTimestampCacheDuration = TimeSpan.FromMinutes(30);
+
+    private readonly JsonRpcBatchClient _rpcClient;
+    private readonly IMemoryCache _memoryCache;
     private readonly ILogger<PolygonAmoyRpcService> _logger;
-    private readonly Web3 _web3;
-    private readonly string _usdcContractAddress;
+    private readonly PolygonAmoyRpcOptions _options;
 
-    // Polygon Amoy Testnet RPC URL
-    private const string POLYGON_AMOY_RPC = "https://rpc-amoy.polygon.technology";
+    private readonly ConcurrentDictionary<string, Lazy<Task<TransactionReceipt?>>> _inflightReceipts = new();
+    private readonly ConcurrentDictionary<string, Lazy<Task<long>>> _inflightBlockNumber = new();
+    private const string LatestBlockKey = "latest";
 
-    // USDC Contract Address on Polygon Amoy
-    // Circle's USDC: 0x41E94Eb019C0762f9Bfcf9Fb1E58725BfB0e7582
-    private const string USDC_CONTRACT = "0x41E94Eb019C0762f9Bfcf9Fb1E58725BfB0e7582";
+    private LatestBlock? _latestBlock;
+    private BlockGasPrice? _gasPrice;
 
     public PolygonAmoyRpcService(
+        JsonRpcBatchClient rpcClient,
+        IMemoryCache memoryCache,
         ILogger<PolygonAmoyRpcService> logger,
-        IConfiguration configuration)
+        IOptions<PolygonAmoyRpcOptions> options)
     {
+        _rpcClient = rpcClient;
+        _memoryCache = memoryCache;
         _logger = logger;
-
-        // Get RPC URL from configuration or use default
-        var rpcUrl = configuration["Blockchain:PolygonAmoy:RpcUrl"] ?? POLYGON_AMOY_RPC;
-        _usdcContractAddress = configuration["Blockchain:PolygonAmoy:USDCContract"] ?? USDC_CONTRACT;
+        _options = options.Value;
 
         _logger.LogInformation("Initializing Polygon Amoy RPC Service with RPC: {RpcUrl}, USDC Contract: {USDCContract}",
-            rpcUrl, _usdcContractAddress);
-
-        _web3 = new Web3(rpcUrl);
+            _options.RpcUrl, _options.USDCContract);
     }
 
     /// <summary>
@@ -46,29 +54,62 @@ public class PolygonAmoyRpcService : IBlockchainRpcService
     {
         try
         {
-            _logger.LogInformation("[PolygonAmoy] Fetching USDC balance for address: {Address}", walletAddress);
+            // USDC has 6 decimals
+            var balance = await CallBalanceOfAsync(walletAddress, _options.USDCContract, 6, cancellationToken);
 
-            // Create ERC20 contract service
-            var tokenService = _web3.Eth.ERC20.GetContractService(_usdcContractAddress);
+            _logger.LogDebug("[PolygonAmoy] USDC balance for {Address}: {Balance} USDC", walletAddress, balance);
 
-            // Get balance (returns BigInteger in smallest unit - 6 decimals for USDC)
-            var balanceInSmallestUnit = await tokenService.BalanceOfQueryAsync(walletAddress);
+            return balance;
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            _logger.LogError(ex, "[PolygonAmoy] Failed to fetch USDC balance for {Address}", walletAddress);
+            throw;
+        }
+    }
 
-            // Convert from smallest unit to USDC (divide by 10^6 since USDC has 6 decimals)
-            var balance = (decimal)balanceInSmallestUnit / 1_000_000m;
+    /// <summary>
+    /// Get an ERC-20 token balance from Polygon Amoy blockchain
+    /// </summary>
+    public async Task<decimal> GetTokenBalanceAsync(
+        string walletAddress,
+        string tokenContract,
+        int decimals,
+        CancellationToken cancellationToken = default)
+    {
+        try
+        {
+            var balance = await CallBalanceOfAsync(walletAddress, tokenContract, decimals, cancellationToken);
 
-            _logger.LogInformation("[PolygonAmoy] USDC balance for {Address}: {Balance} USDC",
-                walletAddress, balance);
+            _logger.LogDebug("[PolygonAmoy] Token {Token} balance for {Address}: {Balance}", tokenContract, walletAddress, balance);
 
             return balance;
         }
-        catch (Exception ex)
+        catch (Exception ex) when (ex is not OperationCanceledException)
         {
-            _logger.LogError(ex, "[PolygonAmoy] Failed to fetch USDC balance for {Address}", walletAddress);
+            _logger.LogError(ex, "[PolygonAmoy] Failed to fetch token {Token} balance for {Address}", tokenContract, walletAddress);
             throw;
         }
     }
 
+    private async Task<decimal> CallBalanceOfAsync(
+        string walletAddress,
+        string tokenContract,
+        int decimals,
+        CancellationToken cancellationToken)
+    {
+        var callData = BalanceOfSelector + walletAddress.Replace("0x", string.Empty, StringComparison.OrdinalIgnoreCase)
+            .ToLowerInvariant()
+            .PadLeft(64, '0');
+
+        var result = await _rpcClient.SendAsync(
+            "eth_call",
+            new object[] { new { to = tokenContract, data = callData }, "latest" },
+            cancellationToken);
+
+        return Web3.Convert.FromWei(ParseQuantity(result), decimals);
+    }
+
     /// <summary>
     /// Get native MATIC balance from Polygon Amoy blockchain
     /// </summary>
@@ -76,54 +117,59 @@ public class PolygonAmoyRpcService : IBlockchainRpcService
     {
         try
         {
-            _logger.LogInformation("[PolygonAmoy] Fetching MATIC balance for address: {Address}", walletAddress);
-
-            // Get balance in Wei
-            var balanceInWei = await _web3.Eth.GetBalance.SendRequestAsync(walletAddress);
+            var result = await _rpcClient.SendAsync(
+                "eth_getBalance",
+                new object[] { walletAddress, "latest" },
+                cancellationToken);
 
-            // Convert from Wei to MATIC (divide by 10^18)
-            var balance = Web3.Convert.FromWei(balanceInWei.Value);
+            var balance = Web3.Convert.FromWei(ParseQuantity(result));
 
-            _logger.LogInformation("[PolygonAmoy] MATIC balance for {Address}: {Balance} MATIC",
-                walletAddress, balance);
+            _logger.LogDebug("[PolygonAmoy] MATIC balance for {Address}: {Balance} MATIC", walletAddress, balance);
 
             return balance;
         }
-        catch (Exception ex)
+        catch (Exception ex) when (ex is not OperationCanceledException)
         {
             _logger.LogError(ex, "[PolygonAmoy] Failed to fetch MATIC balance for {Address}", walletAddress);
             throw;
         }
     }
 
+    /// <summary>
+    /// Get a transaction receipt. Concurrent lookups of the same hash share one call.
+    /// </summary>
     public async Task<TransactionReceipt?> GetTransactionReceiptAsync(string txHash, CancellationToken cancellationToken = default)
+    {
+        var key = txHash.ToLowerInvariant();
+        var lookup = _inflightReceipts.GetOrAdd(key, k => new Lazy<Task<TransactionReceipt?>>(() => FetchReceiptAsync(k)));
+
+        return await lookup.Value.WaitAsync(cancellationToken);
+    }
+
+    private async Task<TransactionReceipt?> FetchReceiptAsync(string txHash)
     {
         try
         {
-            _logger.LogInformation("[PolygonAmoy] Fetching transaction receipt for tx: {TxHash}", txHash);
+            var receipt = await _rpcClient.SendAsync("eth_getTransactionReceipt", new object[] { txHash });
 
-            var receipt = await _web3.Eth.Transactions.GetTransactionReceipt.SendRequestAsync(txHash);
-
-            if (receipt == null)
+            if (receipt.ValueKind != JsonValueKind.Object)
             {
                 _logger.LogWarning("[PolygonAmoy] Transaction receipt not found for tx: {TxHash}", txHash);
                 return null;
             }
 
-            // Get block to extract timestamp
-            var block = await _web3.Eth.Blocks.GetBlockWithTransactionsByNumber.SendRequestAsync(
-                new BlockParameter(receipt.BlockNumber));
+            var blockNumberHex = receipt.GetProperty("blockNumber").GetString()!;
 
             var result = new TransactionReceipt
             {
-                TransactionHash = receipt.TransactionHash,
-                BlockHash = receipt.BlockHash,
-                BlockNumber = (long)receipt.BlockNumber.Value,
-                From = receipt.From,
-                To = receipt.To,
-                GasUsed = (decimal)receipt.GasUsed.Value,
-                Status = receipt.Status?.Value == 1 ? "success" : "failed",
-                Timestamp = block != null ? DateTimeOffset.FromUnixTimeSeconds((long)block.Timestamp.Value).UtcDateTime : null
+                TransactionHash = GetString(receipt, "transactionHash"),
+                BlockHash = GetString(receipt, "blockHash"),
+                BlockNumber = (long)new HexBigInteger(blockNumberHex).Value,
+                From = GetString(receipt, "from"),
+                To = GetString(receipt, "to"),
+                GasUsed = (decimal)new HexBigInteger(GetString(receipt, "gasUsed", "0x0")).Value,
+                Status = GetString(receipt, "status") == "0x1" ? "success" : "failed",
+                Timestamp = await GetBlockTimestampAsync(blockNumberHex)
             };
 
             _logger.LogInformation("[PolygonAmoy] Transaction receipt for {TxHash}: Status={Status}, Block={BlockNumber}",
@@ -136,48 +182,121 @@ public class PolygonAmoyRpcService : IBlockchainRpcService
             _logger.LogError(ex, "[PolygonAmoy] Failed to fetch transaction receipt for {TxHash}", txHash);
             throw;
         }
+        finally
+        {
+            // Later lookups of a pending transaction must reach the node again
+            _inflightReceipts.TryRemove(txHash, out _);
+        }
     }
 
+    /// <summary>
+    /// Block timestamps never change, so they are cached by block number. Only the header is fetched.
+    /// </summary>
+    private async Task<DateTime?> GetBlockTimestampAsync(string blockNumberHex)
+    {
+        var cacheKey = $"polygon-amoy:block-timestamp:{blockNumberHex}";
+        if (_memoryCache.TryGetValue(cacheKey, out DateTime timestamp))
+        {
+            return timestamp;
+        }
+
+        var block = await _rpcClient.SendAsync("eth_getBlockByNumber", new object[] { blockNumberHex, false });
+        if (block.ValueKind != JsonValueKind.Object)
+        {
+            return null;
+        }
+
+        timestamp = DateTimeOffset.FromUnixTimeSeconds(
+            (long)new HexBigInteger(GetString(block, "timestamp", "0x0")).Value).UtcDateTime;
+
+        _memoryCache.Set(cacheKey, timestamp, BlockTimestampCacheDuration);
+        return timestamp;
+    }
+
+    /// <summary>
+    /// Get current gas price in Gwei, fetched at most once per block
+    /// </summary>
     public async Task<decimal> GetGasPriceAsync(CancellationToken cancellationToken = default)
     {
         try
         {
-            _logger.LogInformation("[PolygonAmoy] Fetching current gas price");
+            var blockNumber = await GetBlockNumberAsync(cancellationToken);
 
-            var gasPriceInWei = await _web3.Eth.GasPrice.SendRequestAsync();
+            var cached = _gasPrice;
+            if (cached != null && cached.BlockNumber == blockNumber)
+            {
+                return cached.Gwei;
+            }
+
+            var result = await _rpcClient.SendAsync("eth_gasPrice", Array.Empty<object>(), cancellationToken);
+            var gasPriceInGwei = Web3.Convert.FromWei(ParseQuantity(result), Nethereum.Util.UnitConversion.EthUnit.Gwei);
 
-            // Convert from Wei to Gwei
-            var gasPriceInGwei = Web3.Convert.FromWei(gasPriceInWei.Value, Nethereum.Util.UnitConversion.EthUnit.Gwei);
+            _gasPrice = new BlockGasPrice(blockNumber, gasPriceInGwei);
 
-            _logger.LogInformation("[PolygonAmoy] Current gas price: {GasPrice} Gwei", gasPriceInGwei);
+            _logger.LogDebug("[PolygonAmoy] Gas price at block {BlockNumber}: {GasPrice} Gwei", blockNumber, gasPriceInGwei);
 
             return gasPriceInGwei;
         }
-        catch (Exception ex)
+        catch (Exception ex) when (ex is not OperationCanceledException)
         {
             _logger.LogError(ex, "[PolygonAmoy] Failed to fetch gas price");
             throw;
         }
     }
 
+    /// <summary>
+    /// Get the latest block number, reused for <see cref="PolygonAmoyRpcOptions.BlockNumberCacheMilliseconds"/>
+    /// </summary>
     public async Task<long> GetBlockNumberAsync(CancellationToken cancellationToken = default)
     {
-        try
+        var cached = _latestBlock;
+        if (cached != null && DateTime.UtcNow - cached.FetchedAt < _options.BlockNumberCacheDuration)
         {
-            _logger.LogInformation("[PolygonAmoy] Fetching current block number");
+            return cached.Number;
+        }
 
-            var blockNumber = await _web3.Eth.Blocks.GetBlockNumber.SendRequestAsync();
+        var refresh = _inflightBlockNumber.GetOrAdd(LatestBlockKey, _ => new Lazy<Task<long>>(FetchBlockNumberAsync));
+        return await refresh.Value.WaitAsync(cancellationToken);
+    }
 
-            var blockNum = (long)blockNumber.Value;
+    private async Task<long> FetchBlockNumberAsync()
+    {
+        try
+        {
+            var result = await _rpcClient.SendAsync("eth_blockNumber", Array.Empty<object>());
+            var blockNumber = (long)ParseQuantity(result);
 
-            _logger.LogInformation("[PolygonAmoy] Current block number: {BlockNumber}", blockNum);
+            _latestBlock = new LatestBlock(blockNumber, DateTime.UtcNow);
 
-            return blockNum;
+            _logger.LogDebug("[PolygonAmoy] Current block number: {BlockNumber}", blockNumber);
+
+            return blockNumber;
         }
         catch (Exception ex)
         {
             _logger.LogError(ex, "[PolygonAmoy] Failed to fetch block number");
             throw;
         }
+        finally
+        {
+            _inflightBlockNumber.TryRemove(LatestBlockKey, out _);
+        }
     }
+
+    private static System.Numerics.BigInteger ParseQuantity(JsonElement result)
+    {
+        var hex = result.GetString();
+        return string.IsNullOrEmpty(hex) || hex == "0x" ? 0 : new HexBigInteger(hex).Value;
+    }
+
+    private static string GetString(JsonElement element, string property, string fallback = "")
+    {
+        return element.TryGetProperty(property, out var value) && value.ValueKind == JsonValueKind.String
+            ? value.GetString()!
+            : fallback;
+    }
+
+    private sealed record LatestBlock(long Number, DateTime FetchedAt);
+
+    private sealed record BlockGasPrice(long BlockNumber, decimal Gwei);
 }
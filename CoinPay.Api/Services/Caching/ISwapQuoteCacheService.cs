@@ -3,41 +3,29 @@ using CoinPay.Api.Models;
 namespace CoinPay.Api.Services.Caching;
 
 /// <summary>
-/// Service for caching swap quotes to reduce DEX API calls
+/// Service for caching DEX swap quotes to reduce DEX API calls.
+/// Quotes are kept per token pair in amount buckets; amounts between two cached quotes
+/// of the same bucket are interpolated when the rate curve is flat enough.
 /// </summary>
 public interface ISwapQuoteCacheService
 {
     /// <summary>
-    /// Gets a cached swap quote if available
+    /// Gets a cached or interpolated DEX quote, or fetches one from the aggregator on a miss.
+    /// Concurrent misses for the same pair and amount share one aggregator call.
     /// </summary>
     /// <param name="fromToken">Source token address</param>
     /// <param name="toToken">Destination token address</param>
     /// <param name="amount">Swap amount</param>
-    /// <param name="slippage">Slippage tolerance</param>
-    /// <returns>Cached quote or null if not found/expired</returns>
-    Task<SwapQuoteResult?> GetCachedQuoteAsync(
+    /// <param name="fetchQuote">Fetches the quote from the DEX aggregator</param>
+    /// <returns>DEX quote for the requested amount</returns>
+    Task<SwapQuote> GetOrFetchQuoteAsync(
         string fromToken,
         string toToken,
         decimal amount,
-        decimal slippage);
+        Func<Task<SwapQuote>> fetchQuote);
 
     /// <summary>
-    /// Caches a swap quote with TTL
-    /// </summary>
-    /// <param name="quote">Quote to cache</param>
-    /// <param name="fromToken">Source token address</param>
-    /// <param name="toToken">Destination token address</param>
-    /// <param name="amount">Swap amount</param>
-    /// <param name="slippage">Slippage tolerance</param>
-    Task SetCachedQuoteAsync(
-        SwapQuoteResult quote,
-        string fromToken,
-        string toToken,
-        decimal amount,
-        decimal slippage);
-
-    /// <summary>
-    /// Invalidates cached quote for a token pair
+    /// Invalidates all cached quotes for a token pair
     /// </summary>
     /// <param name="fromToken">Source token address</param>
     /// <param name="toToken">Destination token address</param>
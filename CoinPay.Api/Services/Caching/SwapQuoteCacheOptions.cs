@@ -0,0 +1,34 @@
+namespace CoinPay.Api.Services.Caching;
+
+/// <summary>
+/// Configuration options for the swap quote cache ("Swap" section)
+/// </summary>
+public class SwapQuoteCacheOptions
+{
+    /// <summary>
+    /// How long a DEX quote is reused (default: 30)
+    /// </summary>
+    public int CacheTTLSeconds { get; set; } = 30;
+
+    /// <summary>
+    /// Ratio between the upper and lower bound of an amount bucket (default: 1.25, i.e. each bucket spans 25%)
+    /// </summary>
+    public double QuoteBucketGrowthFactor { get; set; } = 1.25;
+
+    /// <summary>
+    /// Maximum quotes kept per amount bucket (default: 8)
+    /// </summary>
+    public int MaxQuotesPerBucket { get; set; } = 8;
+
+    /// <summary>
+    /// Maximum rate difference between the two neighbouring quotes, in percent, for an amount to be
+    /// interpolated instead of quoted upstream (default: 0.1)
+    /// </summary>
+    public decimal InterpolationTolerancePercent { get; set; } = 0.1m;
+
+    /// <summary>
+    /// Fraction of interpolated quotes that are also quoted upstream in the background
+    /// to measure the actual interpolation error (default: 0.01)
+    /// </summary>
+    public double InterpolationSampleRate { get; set; } = 0.01;
+}
@@ -1,111 +1,295 @@
+using System.Collections.Concurrent;
+using System.Diagnostics.Metrics;
 using CoinPay.Api.Models;
-using Microsoft.Extensions.Caching.Distributed;
-using Microsoft.Extensions.Configuration;
+using CoinPay.Api.Services.Swap;
 using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using StackExchange.Redis;
 using System.Text.Json;
 
 namespace CoinPay.Api.Services.Caching;
 
 /// <summary>
-/// Redis-based caching service for swap quotes
+/// Redis-based caching service for DEX swap quotes.
+///
+/// DEX quotes do not depend on slippage, so they are cached per token pair only. Each pair's rate curve
+/// is split into logarithmic amount buckets, stored as one Redis hash per bucket (field = amount).
+/// A request is served from the bucket when:
+/// - the exact amount was quoted, or
+/// - quotes exist on both sides of the amount and their rates differ by at most
+///   InterpolationTolerancePercent, in which case the rate is interpolated linearly
+///
+/// Every bucket key is added to a Redis set per pair, so invalidation deletes exactly the pair's keys
+/// without scanning. Without Redis, quotes are not cached but concurrent identical requests are
+/// still collapsed into one aggregator call.
+///
+/// The service is a singleton, so background interpolation samples resolve the aggregator from their own
+/// scope instead of reusing the caller's request-scoped fetch delegate.
 /// </summary>
 public class SwapQuoteCacheService : ISwapQuoteCacheService
 {
-    private readonly IDistributedCache? _cache;
-    private readonly IConfiguration _configuration;
+    private static readonly Meter Meter = new("CoinPay.Api.SwapQuoteCache");
+    private static readonly Counter<long> RequestCounter = Meter.CreateCounter<long>(
+        "swap_quote_cache.requests", description: "Swap quote cache lookups by result (hit, interpolated, miss)");
+    private static readonly Counter<long> UpstreamCounter = Meter.CreateCounter<long>(
+        "swap_quote_cache.upstream_calls", description: "DEX aggregator quote calls made by the cache");
+    private static readonly Histogram<double> InterpolationErrorHistogram = Meter.CreateHistogram<double>(
+        "swap_quote_cache.interpolation_error", unit: "bp", description: "Interpolated vs. upstream quote difference");
+
+    private readonly IDatabase? _redis;
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly SwapQuoteCacheOptions _options;
     private readonly ILogger<SwapQuoteCacheService> _logger;
+    private readonly ConcurrentDictionary<string, Lazy<Task<SwapQuote>>> _inflightQuotes = new();
+
+    private const string KeyPrefix = "swap:quote:";
 
-    private int CacheTtlSeconds => _configuration.GetValue<int>("Swap:CacheTTLSeconds", 30);
+    // DEX quotes do not depend on slippage, so samples use a fixed value
+    private const decimal SampleSlippageTolerance = 1m;
 
     public SwapQuoteCacheService(
-        IDistributedCache? cache,
-        IConfiguration configuration,
+        IServiceProvider serviceProvider,
+        IServiceScopeFactory scopeFactory,
+        IOptions<SwapQuoteCacheOptions> options,
         ILogger<SwapQuoteCacheService> logger)
     {
-        _cache = cache;
-        _configuration = configuration;
+        _scopeFactory = scopeFactory;
+        _options = options.Value;
         _logger = logger;
 
-        if (_cache == null)
+        // Redis is optional - the multiplexer is only registered when a connection string is configured
+        _redis = serviceProvider.GetService<IConnectionMultiplexer>()?.GetDatabase();
+
+        if (_redis == null)
         {
-            _logger.LogWarning("Distributed cache not available. Quote caching will be disabled.");
+            _logger.LogWarning("Redis not available. Quote caching will be disabled.");
         }
     }
 
-    public async Task<SwapQuoteResult?> GetCachedQuoteAsync(
+    public async Task<SwapQuote> GetOrFetchQuoteAsync(
         string fromToken,
         string toToken,
         decimal amount,
-        decimal slippage)
+        Func<Task<SwapQuote>> fetchQuote)
     {
-        if (_cache == null)
+        var from = fromToken.ToLowerInvariant();
+        var to = toToken.ToLowerInvariant();
+        var bucketKey = BuildBucketKey(from, to, amount);
+
+        var bucketQuotes = await GetBucketQuotesAsync(bucketKey);
+
+        var amountField = FormatAmount(amount);
+        if (bucketQuotes.TryGetValue(amountField, out var exact))
         {
-            return null;
+            RequestCounter.Add(1, new KeyValuePair<string, object?>("result", "hit"));
+            _logger.LogDebug("Cache HIT for swap quote: {BucketKey} {Amount}", bucketKey, amountField);
+            return Copy(exact, amount, exact.ToTokenAmount);
         }
 
-        try
+        var interpolated = TryInterpolate(bucketQuotes.Values, amount, out var spreadPercent);
+        if (interpolated != null)
         {
-            var cacheKey = BuildCacheKey(fromToken, toToken, amount, slippage);
-            var cachedData = await _cache.GetStringAsync(cacheKey);
+            RequestCounter.Add(1, new KeyValuePair<string, object?>("result", "interpolated"));
+            _logger.LogDebug(
+                "Interpolated swap quote: {BucketKey} {Amount}, neighbour rate spread {Spread}%",
+                bucketKey, amountField, spreadPercent);
 
-            if (cachedData != null)
+            if (Random.Shared.NextDouble() < _options.InterpolationSampleRate)
             {
-                _logger.LogInformation("Cache HIT for swap quote: {CacheKey}", cacheKey);
+                StartInterpolationSample(fromToken, toToken, amount, interpolated);
+            }
 
-                var quote = JsonSerializer.Deserialize<SwapQuoteResult>(cachedData);
+            return interpolated;
+        }
 
-                // Verify quote hasn't expired
-                if (quote != null && quote.QuoteValidUntil > DateTime.UtcNow)
-                {
-                    return quote;
-                }
-                else
+        RequestCounter.Add(1, new KeyValuePair<string, object?>("result", "miss"));
+        _logger.LogDebug("Cache MISS for swap quote: {BucketKey} {Amount}", bucketKey, amountField);
+
+        var quote = await FetchSingleFlightAsync(from, to, amount, fetchQuote);
+        return Copy(quote, amount, quote.ToTokenAmount);
+    }
+
+    public async Task InvalidateCacheAsync(string fromToken, string toToken)
+    {
+        if (_redis == null)
+        {
+            return;
+        }
+
+        try
+        {
+            var indexKey = BuildIndexKey(fromToken.ToLowerInvariant(), toToken.ToLowerInvariant());
+            var bucketKeys = await _redis.SetMembersAsync(indexKey);
+
+            var keys = bucketKeys
+                .Select(k => (RedisKey)k.ToString())
+                .Append(indexKey)
+                .ToArray();
+
+            await _redis.KeyDeleteAsync(keys);
+
+            _logger.LogInformation(
+                "Invalidated {Count} cached quote buckets for pair: {FromToken} -> {ToToken}",
+                bucketKeys.Length,
+                fromToken,
+                toToken);
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Error invalidating cache");
+        }
+    }
+
+    /// <summary>
+    /// Runs at most one aggregator call per pair and amount at a time; concurrent callers share its result
+    /// </summary>
+    private async Task<SwapQuote> FetchSingleFlightAsync(
+        string from,
+        string to,
+        decimal amount,
+        Func<Task<SwapQuote>> fetchQuote)
+    {
+        var flightKey = $"{from}:{to}:{FormatAmount(amount)}";
+        var flight = _inflightQuotes.GetOrAdd(flightKey, _ => new Lazy<Task<SwapQuote>>(
+            () => FetchAndStoreAsync(from, to, amount, fetchQuote)));
+
+        try
+        {
+            return await flight.Value;
+        }
+        finally
+        {
+            _inflightQuotes.TryRemove(new KeyValuePair<string, Lazy<Task<SwapQuote>>>(flightKey, flight));
+        }
+    }
+
+    private async Task<SwapQuote> FetchAndStoreAsync(
+        string from,
+        string to,
+        decimal amount,
+        Func<Task<SwapQuote>> fetchQuote)
+    {
+        UpstreamCounter.Add(1);
+        var quote = await fetchQuote();
+
+        await StoreQuoteAsync(from, to, amount, quote);
+        return quote;
+    }
+
+    /// <summary>
+    /// Quotes a sampled interpolated amount upstream in the background and records the real interpolation error.
+    /// The fetched quote is stored as well, which tightens the bucket for later requests.
+    /// The sample outlives the request, so the aggregator is resolved from a scope owned by the task.
+    /// </summary>
+    private void StartInterpolationSample(
+        string fromToken,
+        string toToken,
+        decimal amount,
+        SwapQuote interpolated)
+    {
+        var from = fromToken.ToLowerInvariant();
+        var to = toToken.ToLowerInvariant();
+
+        _ = Task.Run(async () =>
+        {
+            try
+            {
+                using var scope = _scopeFactory.CreateScope();
+                var dexService = scope.ServiceProvider.GetRequiredService<IDexAggregatorService>();
+
+                var actual = await FetchSingleFlightAsync(
+                    from,
+                    to,
+                    amount,
+                    () => dexService.GetQuoteAsync(fromToken, toToken, amount, SampleSlippageTolerance));
+                if (actual.ToTokenAmount > 0)
                 {
-                    _logger.LogDebug("Cached quote expired, invalidating");
-                    await _cache.RemoveAsync(cacheKey);
+                    var errorBps = (double)(Math.Abs(interpolated.ToTokenAmount - actual.ToTokenAmount) / actual.ToTokenAmount * 10_000m);
+                    InterpolationErrorHistogram.Record(errorBps);
                 }
             }
-            else
+            catch (Exception ex)
             {
-                _logger.LogDebug("Cache MISS for swap quote: {CacheKey}", cacheKey);
+                _logger.LogWarning(ex, "Interpolation sample for {From} -> {To} failed", from, to);
+            }
+        });
+    }
+
+    private async Task<Dictionary<string, SwapQuote>> GetBucketQuotesAsync(string bucketKey)
+    {
+        var quotes = new Dictionary<string, SwapQuote>();
+        if (_redis == null)
+        {
+            return quotes;
+        }
+
+        try
+        {
+            var entries = await _redis.HashGetAllAsync(bucketKey);
+            var freshAfter = DateTime.UtcNow.AddSeconds(-_options.CacheTTLSeconds);
+
+            foreach (var entry in entries)
+            {
+                var quote = JsonSerializer.Deserialize<SwapQuote>(entry.Value.ToString());
+                if (quote != null && quote.QuotedAt > freshAfter)
+                {
+                    quotes[entry.Name.ToString()] = quote;
+                }
             }
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, "Error retrieving cached swap quote");
+            _logger.LogError(ex, "Error retrieving cached swap quotes for {BucketKey}", bucketKey);
         }
 
-        return null;
+        return quotes;
     }
 
-    public async Task SetCachedQuoteAsync(
-        SwapQuoteResult quote,
-        string fromToken,
-        string toToken,
-        decimal amount,
-        decimal slippage)
+    private async Task StoreQuoteAsync(string from, string to, decimal amount, SwapQuote quote)
     {
-        if (_cache == null)
+        if (_redis == null)
         {
             return;
         }
 
         try
         {
-            var cacheKey = BuildCacheKey(fromToken, toToken, amount, slippage);
-            var serialized = JsonSerializer.Serialize(quote);
+            var bucketKey = BuildBucketKey(from, to, amount);
+            var indexKey = BuildIndexKey(from, to);
+            var amountField = FormatAmount(amount);
+            var ttl = TimeSpan.FromSeconds(_options.CacheTTLSeconds);
+
+            // Drop expired quotes and, when the bucket is full, the oldest ones. The amount's own field is
+            // overwritten below, so it is never evicted; deleting it would drop the quote just written.
+            var existing = await _redis.HashGetAllAsync(bucketKey);
+            var freshAfter = DateTime.UtcNow - ttl;
+            var others = existing
+                .Where(e => e.Name != amountField)
+                .Select(e => (Field: e.Name, Quote: JsonSerializer.Deserialize<SwapQuote>(e.Value.ToString())))
+                .OrderBy(e => e.Quote?.QuotedAt ?? DateTime.MinValue)
+                .ToList();
+            var evicted = others
+                .Where((e, i) => e.Quote == null ||
+                                 e.Quote.QuotedAt <= freshAfter ||
+                                 i < others.Count - _options.MaxQuotesPerBucket + 1)
+                .Select(e => e.Field)
+                .ToArray();
+
+            var writes = new List<Task>();
 
-            var options = new DistributedCacheEntryOptions
+            if (evicted.Length > 0)
             {
-                AbsoluteExpirationRelativeToNow = TimeSpan.FromSeconds(CacheTtlSeconds)
-            };
+                writes.Add(_redis.HashDeleteAsync(bucketKey, evicted));
+            }
 
-            await _cache.SetStringAsync(cacheKey, serialized, options);
+            writes.Add(_redis.HashSetAsync(bucketKey, amountField, JsonSerializer.Serialize(quote)));
+            writes.Add(_redis.KeyExpireAsync(bucketKey, ttl));
+            writes.Add(_redis.SetAddAsync(indexKey, bucketKey));
+            writes.Add(_redis.KeyExpireAsync(indexKey, ttl * 2));
 
-            _logger.LogInformation(
-                "Cached swap quote: {CacheKey}, TTL: {TTL}s",
-                cacheKey,
-                CacheTtlSeconds);
+            await Task.WhenAll(writes);
+
+            _logger.LogDebug("Cached swap quote: {BucketKey} {Amount}, TTL: {TTL}s", bucketKey, amountField, _options.CacheTTLSeconds);
         }
         catch (Exception ex)
         {
@@ -114,47 +298,88 @@ public class SwapQuoteCacheService : ISwapQuoteCacheService
         }
     }
 
-    public async Task InvalidateCacheAsync(string fromToken, string toToken)
+    /// <summary>
+    /// Interpolates the rate between the nearest cached quotes below and above the amount.
+    /// Returns null when either neighbour is missing or their rates differ by more than the tolerance.
+    /// </summary>
+    private SwapQuote? TryInterpolate(IEnumerable<SwapQuote> quotes, decimal amount, out decimal spreadPercent)
     {
-        if (_cache == null)
+        spreadPercent = 0;
+
+        SwapQuote? lower = null;
+        SwapQuote? upper = null;
+        foreach (var quote in quotes)
         {
-            return;
+            if (quote.FromTokenAmount <= 0)
+                continue;
+
+            if (quote.FromTokenAmount < amount && (lower == null || quote.FromTokenAmount > lower.FromTokenAmount))
+                lower = quote;
+            else if (quote.FromTokenAmount > amount && (upper == null || quote.FromTokenAmount < upper.FromTokenAmount))
+                upper = quote;
         }
 
-        try
+        if (lower == null || upper == null)
         {
-            // Note: This is a simple implementation that doesn't track all possible cache keys
-            // In production, consider using Redis pattern matching or cache key tracking
-            _logger.LogInformation(
-                "Cache invalidation requested for pair: {FromToken} -> {ToToken}",
-                fromToken,
-                toToken);
+            return null;
+        }
 
-            // For now, just log - individual quotes will expire naturally
-            // A full implementation would track and remove all related keys
+        var lowerRate = lower.ToTokenAmount / lower.FromTokenAmount;
+        var upperRate = upper.ToTokenAmount / upper.FromTokenAmount;
+        var maxRate = Math.Max(lowerRate, upperRate);
+        if (maxRate <= 0)
+        {
+            return null;
         }
-        catch (Exception ex)
+
+        spreadPercent = Math.Abs(upperRate - lowerRate) / maxRate * 100;
+        if (spreadPercent > _options.InterpolationTolerancePercent)
         {
-            _logger.LogError(ex, "Error invalidating cache");
+            return null;
         }
+
+        var position = (amount - lower.FromTokenAmount) / (upper.FromTokenAmount - lower.FromTokenAmount);
+        var rate = lowerRate + (upperRate - lowerRate) * position;
+
+        // The interpolated quote is only as fresh as the older of its two sources
+        var interpolated = Copy(lower, amount, amount * rate);
+        interpolated.EstimatedGas = upper.EstimatedGas;
+        interpolated.QuotedAt = lower.QuotedAt < upper.QuotedAt ? lower.QuotedAt : upper.QuotedAt;
+        return interpolated;
     }
 
-    private string BuildCacheKey(
-        string fromToken,
-        string toToken,
-        decimal amount,
-        decimal slippage)
+    private string BuildBucketKey(string from, string to, decimal amount)
     {
-        // Normalize addresses to lowercase
-        var from = fromToken.ToLower();
-        var to = toToken.ToLower();
+        var bucket = (int)Math.Floor(Math.Log((double)amount) / Math.Log(_options.QuoteBucketGrowthFactor));
+        return $"{KeyPrefix}{from}:{to}:b{bucket}";
+    }
 
-        // Round amount to 6 decimals for cache key consistency
-        var amountKey = amount.ToString("F6");
+    private static string BuildIndexKey(string from, string to)
+    {
+        return $"{KeyPrefix}index:{from}:{to}";
+    }
 
-        // Round slippage to 1 decimal
-        var slippageKey = slippage.ToString("F1");
+    private static string FormatAmount(decimal amount)
+    {
+        // Round amount to 6 decimals for cache key consistency
+        return amount.ToString("F6", System.Globalization.CultureInfo.InvariantCulture);
+    }
 
-        return $"swap:quote:{from}:{to}:{amountKey}:{slippageKey}";
+    /// <summary>
+    /// Cached quotes are shared, so callers always get their own copy
+    /// </summary>
+    private static SwapQuote Copy(SwapQuote quote, decimal fromAmount, decimal toAmount)
+    {
+        return new SwapQuote
+        {
+            FromToken = quote.FromToken,
+            ToToken = quote.ToToken,
+            FromTokenAmount = fromAmount,
+            ToTokenAmount = toAmount,
+            ExchangeRate = fromAmount > 0 ? toAmount / fromAmount : quote.ExchangeRate,
+            EstimatedGas = quote.EstimatedGas,
+            Provider = quote.Provider,
+            QuotedAt = quote.QuotedAt
+        };
     }
 }
@@ -0,0 +1,21 @@
+using System.Text.Json.Serialization;
+using CoinPay.Api.Services.Circle.Models;
+
+namespace CoinPay.Api.Services.Circle;
+
+/// <summary>
+/// Source-generated serialization metadata for Circle API response envelopes
+/// </summary>
+[JsonSourceGenerationOptions(PropertyNameCaseInsensitive = true)]
+[JsonSerializable(typeof(CircleEnvelope<CircleRegistrationChallengeResponse>))]
+[JsonSerializable(typeof(CircleEnvelope<CircleAuthenticationChallengeResponse>))]
+[JsonSerializable(typeof(CircleEnvelope<CircleAuthenticationResponse>))]
+[JsonSerializable(typeof(CircleEnvelope<CircleUserResponse>))]
+[JsonSerializable(typeof(CircleEnvelope<CircleWalletResponse>))]
+[JsonSerializable(typeof(CircleEnvelope<CircleTransactionChallengeResponse>))]
+[JsonSerializable(typeof(CircleEnvelope<CircleTransactionData>))]
+[JsonSerializable(typeof(CircleEnvelope<CircleTransactionListData>))]
+[JsonSerializable(typeof(CircleEnvelope<CircleNotificationPublicKey>))]
+internal partial class CircleJsonContext : JsonSerializerContext
+{
+}
@@ -0,0 +1,29 @@
+using System.Text.Json;
+using System.Text.Json.Serialization.Metadata;
+using CoinPay.Api.Services.Circle.Models;
+
+namespace CoinPay.Api.Services.Circle;
+
+/// <summary>
+/// Decodes Circle's { "data": ... } envelope straight from the response stream using
+/// source-generated metadata, without buffering the body as a string or building a JsonDocument.
+/// </summary>
+public static class CircleResponseDecoder
+{
+    /// <summary>
+    /// Reads the envelope from <paramref name="content"/> and returns its data payload.
+    /// </summary>
+    /// <exception cref="InvalidOperationException">Thrown when the body has no data payload</exception>
+    public static async Task<T> ReadDataAsync<T>(
+        HttpContent content,
+        JsonTypeInfo<CircleEnvelope<T>> typeInfo,
+        CancellationToken cancellationToken = default)
+    {
+        await using var stream = await content.ReadAsStreamAsync(cancellationToken);
+        var envelope = await JsonSerializer.DeserializeAsync(stream, typeInfo, cancellationToken);
+
+        return envelope is { Data: not null }
+            ? envelope.Data
+            : throw new InvalidOperationException("Failed to deserialize Circle API response");
+    }
+}
@@ -1,49 +1,51 @@
 using CoinPay.Api.Services.Circle.Models;
+using CoinPay.Api.Services.Telemetry;
 using Microsoft.Extensions.Options;
-using RestSharp;
 using Polly;
 using Polly.Retry;
+using System.Globalization;
 using System.Net;
+using System.Net.Http.Json;
+using System.Runtime.CompilerServices;
+using System.Text.Json.Serialization.Metadata;
 
 namespace CoinPay.Api.Services.Circle;
 
 /// <summary>
 /// Implementation of Circle Web3 Services SDK client for passkey-based wallet management.
 /// Provides resilient HTTP communication with Circle's API using Polly retry policies.
+/// Responses are decoded from the body stream by <see cref="CircleResponseDecoder"/>.
 /// </summary>
 public class CircleService : ICircleService
 {
-    private readonly RestClient _client;
+    public const string HttpClientName = "Circle";
+
+    private readonly IHttpClientFactory _httpClientFactory;
     private readonly CircleOptions _options;
     private readonly ILogger<CircleService> _logger;
     private readonly IEntitySecretEncryptionService _encryptionService;
-    private readonly AsyncRetryPolicy<RestResponse> _retryPolicy;
+    private readonly AsyncRetryPolicy<HttpResponseMessage> _retryPolicy;
 
     /// <summary>
     /// Initializes a new instance of the CircleService.
     /// </summary>
+    /// <param name="httpClientFactory">Factory for the pooled Circle HTTP client</param>
     /// <param name="options">Circle configuration options</param>
     /// <param name="logger">Logger instance for structured logging</param>
     /// <param name="encryptionService">Entity secret encryption service</param>
     public CircleService(
+        IHttpClientFactory httpClientFactory,
         IOptions<CircleOptions> options,
         ILogger<CircleService> logger,
         IEntitySecretEncryptionService encryptionService)
     {
+        _httpClientFactory = httpClientFactory;
         _options = options.Value;
         _logger = logger;
         _encryptionService = encryptionService;
 
-        // Initialize RestSharp client with base URL
-        var restOptions = new RestClientOptions(_options.ApiUrl)
-        {
-            ThrowOnAnyError = false,
-            Timeout = TimeSpan.FromSeconds(30)
-        };
-        _client = new RestClient(restOptions);
-
         // Configure Polly retry policy for transient failures
-        _retryPolicy = Policy<RestResponse>
+        _retryPolicy = Policy<HttpResponseMessage>
             .Handle<HttpRequestException>()
             .OrResult(r => r.StatusCode == HttpStatusCode.RequestTimeout ||
                           r.StatusCode == HttpStatusCode.TooManyRequests ||
@@ -58,6 +60,9 @@ public class CircleService : ICircleService
                         outcome.Result?.StatusCode,
                         timespan.TotalSeconds,
                         retryCount);
+
+                    CoinPayTelemetry.RecordRetry("circle", context.OperationKey ?? "unknown");
+                    outcome.Result?.Dispose();
                 });
     }
 
@@ -72,14 +77,9 @@ public class CircleService : ICircleService
             username,
             correlationId);
 
-        var request = new RestRequest("/users/challenge/registration", Method.Post);
-        request.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        request.AddHeader("X-Circle-App-Id", _options.AppId);
-        request.AddHeader("X-Correlation-Id", correlationId);
-        request.AddJsonBody(new { username });
-
-        var response = await ExecuteWithRetryAsync<CircleRegistrationChallengeResponse>(
-            request,
+        var response = await SendAsync(
+            () => CreateRequest(HttpMethod.Post, "/users/challenge/registration", correlationId, new { username }),
+            CircleJsonContext.Default.CircleEnvelopeCircleRegistrationChallengeResponse,
             correlationId,
             cancellationToken);
 
@@ -97,14 +97,9 @@ public class CircleService : ICircleService
             request.Username,
             correlationId);
 
-        var restRequest = new RestRequest("/users/register", Method.Post);
-        restRequest.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        restRequest.AddHeader("X-Circle-App-Id", _options.AppId);
-        restRequest.AddHeader("X-Correlation-Id", correlationId);
-        restRequest.AddJsonBody(request);
-
-        var response = await ExecuteWithRetryAsync<CircleUserResponse>(
-            restRequest,
+        var response = await SendAsync(
+            () => CreateRequest(HttpMethod.Post, "/users/register", correlationId, request),
+            CircleJsonContext.Default.CircleEnvelopeCircleUserResponse,
             correlationId,
             cancellationToken);
 
@@ -127,14 +122,9 @@ public class CircleService : ICircleService
             username,
             correlationId);
 
-        var request = new RestRequest("/users/challenge/authentication", Method.Post);
-        request.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        request.AddHeader("X-Circle-App-Id", _options.AppId);
-        request.AddHeader("X-Correlation-Id", correlationId);
-        request.AddJsonBody(new { username });
-
-        var response = await ExecuteWithRetryAsync<CircleAuthenticationChallengeResponse>(
-            request,
+        var response = await SendAsync(
+            () => CreateRequest(HttpMethod.Post, "/users/challenge/authentication", correlationId, new { username }),
+            CircleJsonContext.Default.CircleEnvelopeCircleAuthenticationChallengeResponse,
             correlationId,
             cancellationToken);
 
@@ -152,14 +142,9 @@ public class CircleService : ICircleService
             request.Username,
             correlationId);
 
-        var restRequest = new RestRequest("/users/authenticate", Method.Post);
-        restRequest.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        restRequest.AddHeader("X-Circle-App-Id", _options.AppId);
-        restRequest.AddHeader("X-Correlation-Id", correlationId);
-        restRequest.AddJsonBody(request);
-
-        var response = await ExecuteWithRetryAsync<CircleAuthenticationResponse>(
-            restRequest,
+        var response = await SendAsync(
+            () => CreateRequest(HttpMethod.Post, "/users/authenticate", correlationId, request),
+            CircleJsonContext.Default.CircleEnvelopeCircleAuthenticationResponse,
             correlationId,
             cancellationToken);
 
@@ -182,13 +167,9 @@ public class CircleService : ICircleService
             circleUserId,
             correlationId);
 
-        var request = new RestRequest($"/users/{circleUserId}", Method.Get);
-        request.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        request.AddHeader("X-Circle-App-Id", _options.AppId);
-        request.AddHeader("X-Correlation-Id", correlationId);
-
-        var response = await ExecuteWithRetryAsync<CircleUserResponse>(
-            request,
+        var response = await SendAsync(
+            () => CreateRequest(HttpMethod.Get, $"/users/{circleUserId}", correlationId, body: null),
+            CircleJsonContext.Default.CircleEnvelopeCircleUserResponse,
             correlationId,
             cancellationToken);
 
@@ -206,19 +187,16 @@ public class CircleService : ICircleService
             circleUserId,
             correlationId);
 
-        var request = new RestRequest("/wallets", Method.Post);
-        request.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        request.AddHeader("X-Circle-App-Id", _options.AppId);
-        request.AddHeader("X-Correlation-Id", correlationId);
-        request.AddJsonBody(new
+        var body = new
         {
             userId = circleUserId,
             blockchain = "MATIC-AMOY", // Polygon Amoy testnet
             walletType = "SCA" // Smart Contract Account (ERC-4337)
-        });
+        };
 
-        var response = await ExecuteWithRetryAsync<CircleWalletResponse>(
-            request,
+        var response = await SendAsync(
+            () => CreateRequest(HttpMethod.Post, "/wallets", correlationId, body),
+            CircleJsonContext.Default.CircleEnvelopeCircleWalletResponse,
             correlationId,
             cancellationToken);
 
@@ -242,13 +220,9 @@ public class CircleService : ICircleService
             walletId,
             correlationId);
 
-        var request = new RestRequest($"/wallets/{walletId}", Method.Get);
-        request.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        request.AddHeader("X-Circle-App-Id", _options.AppId);
-        request.AddHeader("X-Correlation-Id", correlationId);
-
-        var response = await ExecuteWithRetryAsync<CircleWalletResponse>(
-            request,
+        var response = await SendAsync(
+            () => CreateRequest(HttpMethod.Get, $"/wallets/{walletId}", correlationId, body: null),
+            CircleJsonContext.Default.CircleEnvelopeCircleWalletResponse,
             correlationId,
             cancellationToken);
 
@@ -268,11 +242,7 @@ public class CircleService : ICircleService
             request.Amounts.FirstOrDefault()?.Amount ?? "0",
             correlationId);
 
-        var restRequest = new RestRequest("/transactions/transfer", Method.Post);
-        restRequest.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        restRequest.AddHeader("X-Circle-App-Id", _options.AppId);
-        restRequest.AddHeader("X-Correlation-Id", correlationId);
-        restRequest.AddJsonBody(new
+        var body = new
         {
             userId = request.UserId,
             walletId = request.WalletId,
@@ -281,14 +251,15 @@ public class CircleService : ICircleService
             {
                 amount = a.Amount,
                 token = a.Token
-            }),
+            }).ToList(),
             destinationAddress = request.DestinationAddress,
             tokenAddress = request.TokenAddress,
             feeLevel = request.FeeLevel
-        });
+        };
 
-        var response = await ExecuteWithRetryAsync<CircleTransactionChallengeResponse>(
-            restRequest,
+        var response = await SendAsync(
+            () => CreateRequest(HttpMethod.Post, "/transactions/transfer", correlationId, body),
+            CircleJsonContext.Default.CircleEnvelopeCircleTransactionChallengeResponse,
             correlationId,
             cancellationToken);
 
@@ -311,16 +282,12 @@ public class CircleService : ICircleService
             request.ChallengeId,
             correlationId);
 
-        var restRequest = new RestRequest("/transactions/execute", Method.Post);
-        restRequest.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        restRequest.AddHeader("X-Circle-App-Id", _options.AppId);
-        restRequest.AddHeader("X-Correlation-Id", correlationId);
-        restRequest.AddJsonBody(request);
-
-        var response = await ExecuteWithRetryAsync<CircleTransactionResponse>(
-            restRequest,
+        var transaction = await SendAsync(
+            () => CreateRequest(HttpMethod.Post, "/transactions/execute", correlationId, request),
+            CircleJsonContext.Default.CircleEnvelopeCircleTransactionData,
             correlationId,
             cancellationToken);
+        var response = transaction.ToResponse();
 
         _logger.LogInformation(
             "Transaction executed. TransactionId: {TransactionId}, Status: {Status} [CorrelationId: {CorrelationId}]",
@@ -343,110 +310,109 @@ public class CircleService : ICircleService
             correlationId);
 
         // Use developer endpoint for developer-controlled wallet transactions
-        var request = new RestRequest($"/developer/transactions/{transactionId}", Method.Get);
-        request.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        request.AddHeader("X-Correlation-Id", correlationId);
-
-        // Execute request with custom parsing (Circle wraps response in "data" object)
-        var rawResponse = await _retryPolicy.ExecuteAsync(async () =>
-            await _client.ExecuteAsync(request, cancellationToken));
+        // Response shape: { "data": { "id": "...", "state": "...", ... } }
+        var transaction = await SendAsync(
+            () => CreateRequest(HttpMethod.Get, $"/developer/transactions/{transactionId}", correlationId, body: null, includeAppId: false),
+            CircleJsonContext.Default.CircleEnvelopeCircleTransactionData,
+            correlationId,
+            cancellationToken);
 
-        if (!rawResponse.IsSuccessful)
-        {
-            _logger.LogError(
-                "Circle API request failed. StatusCode: {StatusCode}, Error: {Error}, Content: {Content} [CorrelationId: {CorrelationId}]",
-                rawResponse.StatusCode,
-                rawResponse.ErrorMessage,
-                rawResponse.Content,
-                correlationId);
+        var response = transaction.ToResponse();
 
-            throw new HttpRequestException(
-                $"Circle API request failed with status {rawResponse.StatusCode}: {rawResponse.ErrorMessage ?? rawResponse.Content}");
-        }
+        _logger.LogDebug("Transaction status retrieved: ID={Id}, Status={Status} [CorrelationId: {CorrelationId}]",
+            response.TransactionId, response.Status, correlationId);
 
-        _logger.LogDebug("Circle API Raw Response: {Content} [CorrelationId: {CorrelationId}]",
-            rawResponse.Content, correlationId);
+        return response;
+    }
 
-        // Parse nested response: { "data": { "id": "...", "state": "...", ... } }
-        var jsonDoc = System.Text.Json.JsonDocument.Parse(rawResponse.Content ?? "{}");
-        var dataElement = jsonDoc.RootElement.GetProperty("data");
+    /// <summary>
+    /// Builds a Circle API request. Called once per attempt because a request message cannot be resent.
+    /// </summary>
+    /// <param name="method">HTTP method</param>
+    /// <param name="pathAndQuery">Path relative to <see cref="CircleOptions.ApiUrl"/>, including any query string</param>
+    /// <param name="correlationId">Correlation ID for tracking the request</param>
+    /// <param name="body">JSON body, or null for none</param>
+    /// <param name="includeAppId">Whether to send the X-Circle-App-Id header (user-controlled wallet endpoints)</param>
+    private HttpRequestMessage CreateRequest(
+        HttpMethod method,
+        string pathAndQuery,
+        string correlationId,
+        object? body,
+        bool includeAppId = true)
+    {
+        return CreateRequest(method, new Uri(_options.ApiUrl.TrimEnd('/') + pathAndQuery), correlationId, body, includeAppId);
+    }
 
-        // Map Circle's field names to our model (id -> TransactionId, state -> Status)
-        var response = new CircleTransactionResponse
-        {
-            TransactionId = dataElement.TryGetProperty("id", out var idProp) ? idProp.GetString() ?? string.Empty : string.Empty,
-            Status = dataElement.TryGetProperty("state", out var stateProp) ? stateProp.GetString() ?? string.Empty : string.Empty,
-            TxHash = dataElement.TryGetProperty("txHash", out var txHashProp) ? txHashProp.GetString() : null,
-            Blockchain = dataElement.TryGetProperty("blockchain", out var blockchainProp) ? blockchainProp.GetString() ?? string.Empty : string.Empty,
-            From = dataElement.TryGetProperty("sourceAddress", out var fromProp) ? fromProp.GetString() ?? string.Empty : string.Empty,
-            To = dataElement.TryGetProperty("destinationAddress", out var toProp) ? toProp.GetString() ?? string.Empty : string.Empty,
-            TokenAddress = dataElement.TryGetProperty("tokenId", out var tokenProp) ? tokenProp.GetString() : null
-        };
+    private HttpRequestMessage CreateRequest(
+        HttpMethod method,
+        Uri url,
+        string correlationId,
+        object? body,
+        bool includeAppId = true)
+    {
+        var request = new HttpRequestMessage(method, url);
+        request.Headers.Add("Authorization", $"Bearer {_options.ApiKey}");
+        request.Headers.Add("X-Correlation-Id", correlationId);
 
-        // Parse amounts array
-        if (dataElement.TryGetProperty("amounts", out var amountsProp) && amountsProp.ValueKind == System.Text.Json.JsonValueKind.Array)
+        if (includeAppId)
         {
-            var amountsArray = amountsProp.EnumerateArray().ToList();
-            if (amountsArray.Count > 0)
-            {
-                response.Amount = amountsArray[0].GetString() ?? string.Empty;
-            }
+            request.Headers.Add("X-Circle-App-Id", _options.AppId);
         }
 
-        // Parse timestamps
-        if (dataElement.TryGetProperty("createDate", out var createProp) && createProp.TryGetDateTime(out var createDate))
+        if (body != null)
         {
-            response.CreatedAt = createDate;
-        }
-        if (dataElement.TryGetProperty("updateDate", out var updateProp) && updateProp.TryGetDateTime(out var updateDate))
-        {
-            response.UpdatedAt = updateDate;
+            request.Content = JsonContent.Create(body, body.GetType());
         }
 
-        _logger.LogDebug("Transaction status retrieved: ID={Id}, Status={Status} [CorrelationId: {CorrelationId}]",
-            response.TransactionId, response.Status, correlationId);
-
-        return response;
+        return request;
     }
 
     /// <summary>
-    /// Executes a REST request with retry policy and error handling.
+    /// Sends a request with retry policy and error handling, then decodes the "data" payload from the response stream.
     /// </summary>
-    /// <typeparam name="T">The type to deserialize the response into</typeparam>
-    /// <param name="request">The REST request to execute</param>
+    /// <typeparam name="T">The type of the "data" payload</typeparam>
+    /// <param name="createRequest">Creates the request for each attempt</param>
+    /// <param name="typeInfo">Source-generated metadata for the response envelope</param>
     /// <param name="correlationId">Correlation ID for tracking the request</param>
     /// <param name="cancellationToken">Cancellation token</param>
-    /// <returns>The deserialized response</returns>
+    /// <param name="operation">Operation name for metrics; defaults to the calling method</param>
+    /// <returns>The deserialized response payload</returns>
     /// <exception cref="HttpRequestException">Thrown when the Circle API returns an error</exception>
-    private async Task<T> ExecuteWithRetryAsync<T>(
-        RestRequest request,
+    private async Task<T> SendAsync<T>(
+        Func<HttpRequestMessage> createRequest,
+        JsonTypeInfo<CircleEnvelope<T>> typeInfo,
         string correlationId,
-        CancellationToken cancellationToken) where T : new()
+        CancellationToken cancellationToken,
+        [CallerMemberName] string operation = "")
     {
-        var response = await _retryPolicy.ExecuteAsync(async () =>
-            await _client.ExecuteAsync(request, cancellationToken));
+        var client = _httpClientFactory.CreateClient(HttpClientName);
+        operation = operation.EndsWith("Async", StringComparison.Ordinal) ? operation[..^5] : operation;
+
+        using var response = await _retryPolicy.ExecuteAsync(async (_, ct) =>
+        {
+            using var request = createRequest().WithUpstreamOperation(operation);
+            return await client.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, ct);
+        }, new Context(operation), cancellationToken);
 
-        if (!response.IsSuccessful)
+        if (!response.IsSuccessStatusCode)
         {
+            // Error bodies are small; only these are buffered for the log
+            var content = await response.Content.ReadAsStringAsync(cancellationToken);
+
             _logger.LogError(
                 "Circle API request failed. StatusCode: {StatusCode}, Error: {Error}, Content: {Content} [CorrelationId: {CorrelationId}]",
                 response.StatusCode,
-                response.ErrorMessage,
-                response.Content,
+                response.ReasonPhrase,
+                content,
                 correlationId);
 
             throw new HttpRequestException(
-                $"Circle API request failed with status {response.StatusCode}: {response.ErrorMessage ?? response.Content}");
+                $"Circle API request failed with status {response.StatusCode}: {(string.IsNullOrEmpty(content) ? response.ReasonPhrase : content)}",
+                null,
+                response.StatusCode);
         }
 
-        var data = System.Text.Json.JsonSerializer.Deserialize<T>(
-            response.Content ?? "{}",
-            new System.Text.Json.JsonSerializerOptions
-            {
-                PropertyNameCaseInsensitive = true
-            });
-
-        return data ?? throw new InvalidOperationException("Failed to deserialize Circle API response");
+        return await CircleResponseDecoder.ReadDataAsync(response.Content, typeInfo, cancellationToken);
     }
 
     /// <inheritdoc/>
@@ -463,10 +429,6 @@ public class CircleService : ICircleService
             request.Blockchain,
             correlationId);
 
-        var restRequest = new RestRequest("/developer/transactions/transfer", Method.Post);
-        restRequest.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        restRequest.AddHeader("X-Correlation-Id", correlationId);
-
         // Encrypt entity secret for this transfer (done automatically for each transfer)
         _logger.LogDebug("Encrypting entity secret for transfer [CorrelationId: {CorrelationId}]", correlationId);
         request.EntitySecretCiphertext = _encryptionService.EncryptEntitySecret(_options.EntitySecret);
@@ -496,67 +458,14 @@ public class CircleService : ICircleService
             requestBody["tokenAddress"] = request.TokenAddress;
         }
 
-        restRequest.AddJsonBody(requestBody);
-
-        // Log the request body for debugging
-        _logger.LogDebug("Circle API Request Body: {RequestBody} [CorrelationId: {CorrelationId}]",
-            System.Text.Json.JsonSerializer.Serialize(requestBody), correlationId);
-
-        // Execute request with custom parsing (Circle wraps response in "data" object)
-        var rawResponse = await _retryPolicy.ExecuteAsync(async () =>
-            await _client.ExecuteAsync(restRequest, cancellationToken));
-
-        if (!rawResponse.IsSuccessful)
-        {
-            _logger.LogError(
-                "Circle API request failed. StatusCode: {StatusCode}, Error: {Error}, Content: {Content} [CorrelationId: {CorrelationId}]",
-                rawResponse.StatusCode,
-                rawResponse.ErrorMessage,
-                rawResponse.Content,
-                correlationId);
-
-            throw new HttpRequestException(
-                $"Circle API request failed with status {rawResponse.StatusCode}: {rawResponse.ErrorMessage ?? rawResponse.Content}");
-        }
-
-        _logger.LogDebug("Circle API Raw Response: {Content} [CorrelationId: {CorrelationId}]",
-            rawResponse.Content, correlationId);
-
-        // Parse nested response: { "data": { "id": "...", "state": "...", ... } }
-        var jsonDoc = System.Text.Json.JsonDocument.Parse(rawResponse.Content ?? "{}");
-        var dataElement = jsonDoc.RootElement.GetProperty("data");
-
-        // Map Circle's field names to our model (id -> TransactionId, state -> Status)
-        var response = new CircleTransactionResponse
-        {
-            TransactionId = dataElement.TryGetProperty("id", out var idProp) ? idProp.GetString() ?? string.Empty : string.Empty,
-            Status = dataElement.TryGetProperty("state", out var stateProp) ? stateProp.GetString() ?? string.Empty : string.Empty,
-            TxHash = dataElement.TryGetProperty("txHash", out var txHashProp) ? txHashProp.GetString() : null,
-            Blockchain = dataElement.TryGetProperty("blockchain", out var blockchainProp) ? blockchainProp.GetString() ?? string.Empty : string.Empty,
-            From = dataElement.TryGetProperty("sourceAddress", out var fromProp) ? fromProp.GetString() ?? string.Empty : string.Empty,
-            To = dataElement.TryGetProperty("destinationAddress", out var toProp) ? toProp.GetString() ?? string.Empty : string.Empty,
-            TokenAddress = dataElement.TryGetProperty("tokenId", out var tokenProp) ? tokenProp.GetString() : null
-        };
-
-        // Parse amounts array
-        if (dataElement.TryGetProperty("amounts", out var amountsProp) && amountsProp.ValueKind == System.Text.Json.JsonValueKind.Array)
-        {
-            var amountsArray = amountsProp.EnumerateArray().ToList();
-            if (amountsArray.Count > 0)
-            {
-                response.Amount = amountsArray[0].GetString() ?? string.Empty;
-            }
-        }
+        // Response shape: { "data": { "id": "...", "state": "...", ... } }
+        var transaction = await SendAsync(
+            () => CreateRequest(HttpMethod.Post, "/developer/transactions/transfer", correlationId, requestBody, includeAppId: false),
+            CircleJsonContext.Default.CircleEnvelopeCircleTransactionData,
+            correlationId,
+            cancellationToken);
 
-        // Parse timestamps
-        if (dataElement.TryGetProperty("createDate", out var createProp) && createProp.TryGetDateTime(out var createDate))
-        {
-            response.CreatedAt = createDate;
-        }
-        if (dataElement.TryGetProperty("updateDate", out var updateProp) && updateProp.TryGetDateTime(out var updateDate))
-        {
-            response.UpdatedAt = updateDate;
-        }
+        var response = transaction.ToResponse();
 
         _logger.LogInformation(
             "Developer transfer executed. TransactionId: {TransactionId}, Status: {Status} [CorrelationId: {CorrelationId}]",
@@ -578,46 +487,99 @@ public class CircleService : ICircleService
             walletId,
             correlationId);
 
-        var request = new RestRequest($"/developer/wallets/{walletId}/transactions", Method.Get);
-        request.AddHeader("Authorization", $"Bearer {_options.ApiKey}");
-        request.AddHeader("X-Correlation-Id", correlationId);
+        // Response shape: { "data": { "transactions": [...] } }
+        var data = await SendAsync(
+            () => CreateRequest(HttpMethod.Get, $"/developer/wallets/{walletId}/transactions", correlationId, body: null, includeAppId: false),
+            CircleJsonContext.Default.CircleEnvelopeCircleTransactionListData,
+            correlationId,
+            cancellationToken);
+
+        var transactions = data.Transactions.ConvertAll(t => t.ToResponse());
+
+        _logger.LogInformation(
+            "Retrieved {Count} transactions for WalletId: {WalletId} [CorrelationId: {CorrelationId}]",
+            transactions.Count,
+            walletId,
+            correlationId);
+
+        return transactions;
+    }
+
+    /// <inheritdoc/>
+    public async Task<CircleTransactionPage> GetWalletTransactionsPageAsync(
+        string walletId,
+        DateTime? from = null,
+        string? pageAfter = null,
+        int pageSize = 50,
+        CancellationToken cancellationToken = default)
+    {
+        var correlationId = Guid.NewGuid().ToString();
+        _logger.LogDebug(
+            "Retrieving transaction page for WalletId: {WalletId}, From: {From}, PageAfter: {PageAfter} [CorrelationId: {CorrelationId}]",
+            walletId,
+            from,
+            pageAfter,
+            correlationId);
 
-        var response = await _retryPolicy.ExecuteAsync(async () =>
-            await _client.ExecuteAsync(request, cancellationToken));
+        var path = $"/developer/wallets/{walletId}/transactions?pageSize={pageSize.ToString(CultureInfo.InvariantCulture)}";
 
-        if (!response.IsSuccessful)
+        if (from.HasValue)
         {
-            _logger.LogError(
-                "Circle API request failed. StatusCode: {StatusCode}, Error: {Error}, Content: {Content} [CorrelationId: {CorrelationId}]",
-                response.StatusCode,
-                response.ErrorMessage,
-                response.Content,
-                correlationId);
+            path += "&from=" + Uri.EscapeDataString(
+                from.Value.ToUniversalTime().ToString("yyyy-MM-ddTHH:mm:ssZ", CultureInfo.InvariantCulture));
+        }
 
-            throw new HttpRequestException(
-                $"Circle API request failed with status {response.StatusCode}: {response.ErrorMessage ?? response.Content}");
+        if (!string.IsNullOrEmpty(pageAfter))
+        {
+            path += "&pageAfter=" + Uri.EscapeDataString(pageAfter);
         }
 
-        // Parse the response - Circle API returns { "data": { "transactions": [...] } }
-        var jsonDoc = System.Text.Json.JsonDocument.Parse(response.Content ?? "{}");
-        var transactionsArray = jsonDoc.RootElement
-            .GetProperty("data")
-            .GetProperty("transactions");
+        // Response shape: { "data": { "transactions": [...] } }
+        var data = await SendAsync(
+            () => CreateRequest(HttpMethod.Get, path, correlationId, body: null, includeAppId: false),
+            CircleJsonContext.Default.CircleEnvelopeCircleTransactionListData,
+            correlationId,
+            cancellationToken);
 
-        var transactions = System.Text.Json.JsonSerializer.Deserialize<List<CircleTransactionResponse>>(
-            transactionsArray.GetRawText(),
-            new System.Text.Json.JsonSerializerOptions
-            {
-                PropertyNameCaseInsensitive = true
-            });
+        var page = new CircleTransactionPage
+        {
+            Transactions = data.Transactions.ConvertAll(t => t.ToResponse())
+        };
 
-        _logger.LogInformation(
-            "Retrieved {Count} transactions for WalletId: {WalletId} [CorrelationId: {CorrelationId}]",
-            transactions?.Count ?? 0,
+        // A full page means there may be more; Circle pages forward from the last returned ID
+        page.NextPageAfter = page.Transactions.Count >= pageSize
+            ? page.Transactions[^1].TransactionId
+            : null;
+
+        _logger.LogDebug(
+            "Retrieved {Count} transactions for WalletId: {WalletId}, HasMore: {HasMore} [CorrelationId: {CorrelationId}]",
+            page.Transactions.Count,
             walletId,
+            page.NextPageAfter != null,
             correlationId);
 
-        return transactions ?? new List<CircleTransactionResponse>();
+        return page;
+    }
+
+    /// <inheritdoc/>
+    public async Task<CircleNotificationPublicKey?> GetNotificationPublicKeyAsync(
+        string keyId,
+        CancellationToken cancellationToken = default)
+    {
+        var correlationId = Guid.NewGuid().ToString();
+        _logger.LogInformation(
+            "Retrieving Circle notification public key {KeyId} [CorrelationId: {CorrelationId}]",
+            keyId,
+            correlationId);
+
+        // The notification key endpoint is served from the v2 API root rather than the W3S base path
+        var url = new Uri(new Uri(_options.ApiUrl), $"/v2/notifications/publicKey/{Uri.EscapeDataString(keyId)}");
+
+        return await SendAsync(
+            () => CreateRequest(HttpMethod.Get, url, correlationId, body: null, includeAppId: false),
+            CircleJsonContext.Default.CircleEnvelopeCircleNotificationPublicKey,
+            correlationId,
+            cancellationToken);
     }
 }
 
@@ -1,6 +1,11 @@
 using CoinPay.Api.Data;
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
 using CoinPay.Api.Services.Circle.Models;
+using CoinPay.Api.Services.Wallet;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Options;
+using Npgsql;
 
 namespace CoinPay.Api.Services.Circle;
 
@@ -16,19 +21,26 @@ public interface ICircleWebhookHandler
 }
 
 /// <summary>
-/// Implementation of Circle webhook handler
+/// Implementation of Circle webhook handler.
+/// Webhooks are the primary source of Circle transaction status; each notification is applied once
+/// (deduplicated by NotificationId). Only a notification that moves the transfer to a new Circle state pushes
+/// the row's next fallback poll past the silence window, so repeated notifications cannot starve the poller.
+/// Callers must verify the notification signature (<see cref="ICircleWebhookSignatureVerifier"/>) first.
 /// </summary>
 public class CircleWebhookHandler : ICircleWebhookHandler
 {
     private readonly ILogger<CircleWebhookHandler> _logger;
     private readonly IServiceProvider _serviceProvider;
+    private readonly CircleMonitoringOptions _monitoringOptions;
 
     public CircleWebhookHandler(
         ILogger<CircleWebhookHandler> logger,
-        IServiceProvider serviceProvider)
+        IServiceProvider serviceProvider,
+        IOptions<CircleMonitoringOptions> monitoringOptions)
     {
         _logger = logger;
         _serviceProvider = serviceProvider;
+        _monitoringOptions = monitoringOptions.Value;
     }
 
     /// <inheritdoc/>
@@ -66,32 +78,66 @@ public class CircleWebhookHandler : ICircleWebhookHandler
         using var scope = _serviceProvider.CreateScope();
         var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
 
+        var hasNotificationId = !string.IsNullOrEmpty(notification.NotificationId);
+
+        if (hasNotificationId &&
+            await db.ProcessedCircleNotifications.AnyAsync(n => n.NotificationId == notification.NotificationId, cancellationToken))
+        {
+            _logger.LogDebug("Duplicate Circle webhook ignored: NotificationId={NotificationId}", notification.NotificationId);
+            return;
+        }
+
         var transaction = await db.Transactions
             .FirstOrDefaultAsync(t => t.TransactionId == transactionId, cancellationToken);
 
         if (transaction == null)
         {
+            // Not recorded as processed so a redelivery can still apply once the row exists
             _logger.LogWarning("Transaction not found for CircleTransactionId: {TransactionId}", transactionId);
             return;
         }
 
+        var now = DateTime.UtcNow;
         var previousStatus = transaction.Status;
+        var circleState = state.ToUpperInvariant();
+        var stateChanged = false;
 
-        // Map Circle state to our status
-        transaction.Status = state.ToUpper() switch
+        // Final states are never moved back by late or out-of-order notifications
+        if (previousStatus == "Pending")
         {
-            "CONFIRMED" => "Completed",
-            "COMPLETE" => "Completed",
-            "FAILED" => "Failed",
-            "CANCELLED" => "Failed",
-            "DENIED" => "Failed",
-            _ => "Pending"
-        };
+            stateChanged = circleState != transaction.CircleState;
+            transaction.CircleState = circleState;
+
+            // Map Circle state to our status
+            transaction.Status = circleState switch
+            {
+                "CONFIRMED" => "Completed",
+                "COMPLETE" => "Completed",
+                "FAILED" => "Failed",
+                "CANCELLED" => "Failed",
+                "DENIED" => "Failed",
+                _ => "Pending"
+            };
+        }
+
+        if (!string.IsNullOrEmpty(notification.Notification.TxHash))
+        {
+            transaction.TxHash = notification.Notification.TxHash;
+        }
+
+        transaction.LastWebhookAt = now;
+
+        // Only real progress defers the fallback poll; a repeated state leaves the poll schedule alone
+        if (stateChanged)
+        {
+            transaction.NextStatusCheckAt = now + _monitoringOptions.SilenceWindow;
+            transaction.StatusCheckAttempts = 0;
+        }
 
         // Set completion timestamp if status changed
         if (transaction.Status != "Pending" && previousStatus == "Pending")
         {
-            transaction.CompletedAt = DateTime.UtcNow;
+            transaction.CompletedAt = now;
 
             _logger.LogInformation(
                 "Transaction {Id} status updated via webhook: {OldStatus} → {NewStatus}, CircleTransactionId: {CircleTransactionId}, TxHash: {TxHash}",
@@ -101,16 +147,54 @@ public class CircleWebhookHandler : ICircleWebhookHandler
                 transactionId,
                 notification.Notification.TxHash ?? "N/A");
         }
-        else if (transaction.Status == previousStatus)
+        else
         {
             _logger.LogDebug("Transaction {Id} status unchanged: {Status}", transaction.Id, transaction.Status);
-            return; // No changes, skip save
         }
 
-        await db.SaveChangesAsync(cancellationToken);
+        if (hasNotificationId)
+        {
+            db.ProcessedCircleNotifications.Add(new ProcessedCircleNotification
+            {
+                NotificationId = notification.NotificationId,
+                NotificationType = notification.NotificationType,
+                CircleTransactionId = transactionId,
+                ReceivedAt = now
+            });
+        }
+
+        try
+        {
+            await db.SaveChangesAsync(cancellationToken);
+        }
+        catch (DbUpdateException ex) when (hasNotificationId && IsDuplicateNotification(ex))
+        {
+            // A concurrent delivery of the same notification won the insert
+            _logger.LogDebug(ex, "Circle webhook {NotificationId} was processed concurrently, skipping",
+                notification.NotificationId);
+            return;
+        }
+
+        // A settled transfer changes both wallets' balances
+        if (transaction.Status != "Pending" && previousStatus == "Pending")
+        {
+            var balanceCache = scope.ServiceProvider.GetService<IWalletBalanceCache>();
+            balanceCache?.Invalidate(notification.Notification.SourceAddress ?? string.Empty);
+            balanceCache?.Invalidate(notification.Notification.DestinationAddress ?? string.Empty);
+        }
 
         _logger.LogInformation(
             "Transaction {Id} updated successfully via webhook",
             transaction.Id);
     }
+
+    /// <summary>
+    /// True when the save failed only because the notification ID was already recorded
+    /// </summary>
+    private static bool IsDuplicateNotification(DbUpdateException ex) =>
+        ex.InnerException is PostgresException
+        {
+            SqlState: PostgresErrorCodes.UniqueViolation,
+            ConstraintName: "PK_ProcessedCircleNotifications"
+        };
 }
@@ -0,0 +1,130 @@
+using System.Security.Cryptography;
+using Microsoft.Extensions.Caching.Memory;
+
+namespace CoinPay.Api.Services.Circle;
+
+/// <summary>
+/// Verifies that a webhook notification was signed by Circle
+/// </summary>
+public interface ICircleWebhookSignatureVerifier
+{
+    /// <summary>
+    /// Check the X-Circle-Signature of a raw notification body against the Circle public key named by X-Circle-Key-Id
+    /// </summary>
+    /// <param name="keyId">Value of the X-Circle-Key-Id header</param>
+    /// <param name="signature">Value of the X-Circle-Signature header (base64 ECDSA signature)</param>
+    /// <param name="body">The request body exactly as received</param>
+    /// <param name="cancellationToken">Cancellation token for the async operation</param>
+    /// <returns>True only when the signature is present and valid for the body</returns>
+    Task<bool> VerifyAsync(string? keyId, string? signature, ReadOnlyMemory<byte> body, CancellationToken cancellationToken = default);
+}
+
+/// <summary>
+/// Verifies Circle webhook signatures (ECDSA P-256 over SHA-256). Public keys are fetched from Circle by key ID
+/// and cached; unknown key IDs are cached briefly too, so forged key IDs cannot be used to flood Circle's API.
+/// </summary>
+public class CircleWebhookSignatureVerifier : ICircleWebhookSignatureVerifier
+{
+    private static readonly TimeSpan PublicKeyCacheDuration = TimeSpan.FromHours(24);
+    private static readonly TimeSpan MissingKeyCacheDuration = TimeSpan.FromMinutes(5);
+
+    private readonly ICircleService _circleService;
+    private readonly IMemoryCache _cache;
+    private readonly ILogger<CircleWebhookSignatureVerifier> _logger;
+
+    public CircleWebhookSignatureVerifier(
+        ICircleService circleService,
+        IMemoryCache cache,
+        ILogger<CircleWebhookSignatureVerifier> logger)
+    {
+        _circleService = circleService;
+        _cache = cache;
+        _logger = logger;
+    }
+
+    /// <inheritdoc/>
+    public async Task<bool> VerifyAsync(
+        string? keyId,
+        string? signature,
+        ReadOnlyMemory<byte> body,
+        CancellationToken cancellationToken = default)
+    {
+        if (string.IsNullOrWhiteSpace(keyId) || string.IsNullOrWhiteSpace(signature))
+        {
+            _logger.LogWarning("Circle webhook rejected: signature or key ID header missing");
+            return false;
+        }
+
+        byte[] signatureBytes;
+        try
+        {
+            signatureBytes = Convert.FromBase64String(signature);
+        }
+        catch (FormatException)
+        {
+            _logger.LogWarning("Circle webhook rejected: signature is not valid base64 (key {KeyId})", keyId);
+            return false;
+        }
+
+        var publicKey = await GetPublicKeyAsync(keyId, cancellationToken);
+        if (publicKey == null)
+        {
+            _logger.LogWarning("Circle webhook rejected: unknown signing key {KeyId}", keyId);
+            return false;
+        }
+
+        try
+        {
+            using var ecdsa = ECDsa.Create();
+            ecdsa.ImportSubjectPublicKeyInfo(publicKey, out _);
+
+            var valid = ecdsa.VerifyData(body.Span, signatureBytes, HashAlgorithmName.SHA256, DSASignatureFormat.Rfc3279DerSequence);
+            if (!valid)
+            {
+                _logger.LogWarning("Circle webhook rejected: signature does not match body (key {KeyId})", keyId);
+            }
+
+            return valid;
+        }
+        catch (CryptographicException ex)
+        {
+            _logger.LogWarning(ex, "Circle webhook rejected: signing key {KeyId} could not be used", keyId);
+            return false;
+        }
+    }
+
+    private async Task<byte[]?> GetPublicKeyAsync(string keyId, CancellationToken cancellationToken)
+    {
+        var cacheKey = $"circle-notification-key:{keyId}";
+
+        if (_cache.TryGetValue(cacheKey, out byte[]? cached))
+        {
+            return cached;
+        }
+
+        byte[]? publicKey = null;
+        try
+        {
+            var key = await _circleService.GetNotificationPublicKeyAsync(keyId, cancellationToken);
+            if (!string.IsNullOrEmpty(key?.PublicKey))
+            {
+                publicKey = Convert.FromBase64String(key.PublicKey);
+            }
+        }
+        catch (HttpRequestException ex) when ((int?)ex.StatusCode is >= 400 and < 500)
+        {
+            // Circle does not know the key - remember that like any other missing key
+            _logger.LogWarning(ex, "Circle has no notification public key {KeyId}", keyId);
+        }
+        catch (Exception ex) when (ex is HttpRequestException or FormatException)
+        {
+            // Transient or malformed response - not cached, the next delivery retries the lookup
+            _logger.LogWarning(ex, "Failed to load Circle notification public key {KeyId}", keyId);
+            return null;
+        }
+
+        _cache.Set(cacheKey, publicKey, publicKey != null ? PublicKeyCacheDuration : MissingKeyCacheDuration);
+
+        return publicKey;
+    }
+}
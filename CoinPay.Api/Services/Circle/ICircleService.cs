@@ -104,4 +104,28 @@ public interface ICircleService
     /// <param name="cancellationToken">Cancellation token for the async operation</param>
     /// <returns>List of transactions for the wallet</returns>
     Task<List<CircleTransactionResponse>> GetWalletTransactionsAsync(string walletId, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Gets one page of transactions for a specific wallet, optionally limited to transactions created since a point in time.
+    /// </summary>
+    /// <param name="walletId">The wallet ID to query transactions for</param>
+    /// <param name="from">Only return transactions created at or after this time (UTC)</param>
+    /// <param name="pageAfter">Cursor from the previous page's <see cref="CircleTransactionPage.NextPageAfter"/></param>
+    /// <param name="pageSize">Maximum number of transactions per page (Circle allows up to 50)</param>
+    /// <param name="cancellationToken">Cancellation token for the async operation</param>
+    /// <returns>The page of transactions and the cursor for the next page</returns>
+    Task<CircleTransactionPage> GetWalletTransactionsPageAsync(
+        string walletId,
+        DateTime? from = null,
+        string? pageAfter = null,
+        int pageSize = 50,
+        CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Gets the public key Circle uses to sign webhook notifications.
+    /// </summary>
+    /// <param name="keyId">Key ID from the notification's X-Circle-Key-Id header</param>
+    /// <param name="cancellationToken">Cancellation token for the async operation</param>
+    /// <returns>The public key, or null when no key is available</returns>
+    Task<CircleNotificationPublicKey?> GetNotificationPublicKeyAsync(string keyId, CancellationToken cancellationToken = default);
 }
@@ -240,4 +240,32 @@ public class MockCircleService : ICircleService
 
         return Task.FromResult(transactions);
     }
+
+    public async Task<CircleTransactionPage> GetWalletTransactionsPageAsync(
+        string walletId,
+        DateTime? from = null,
+        string? pageAfter = null,
+        int pageSize = 50,
+        CancellationToken cancellationToken = default)
+    {
+        // Mock history fits on a single page
+        var transactions = await GetWalletTransactionsAsync(walletId, cancellationToken);
+
+        return new CircleTransactionPage
+        {
+            Transactions = transactions
+                .Where(t => !from.HasValue || t.CreatedAt >= from.Value)
+                .Take(pageSize)
+                .ToList(),
+            NextPageAfter = null
+        };
+    }
+
+    public Task<CircleNotificationPublicKey?> GetNotificationPublicKeyAsync(string keyId, CancellationToken cancellationToken = default)
+    {
+        // Mock mode has no signing key, so no webhook signature verifies
+        _logger.LogWarning("[MockCircle] No notification public key available for key {KeyId}", keyId);
+
+        return Task.FromResult<CircleNotificationPublicKey?>(null);
+    }
 }
@@ -0,0 +1,125 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace CoinPay.Api.Services.Circle.Models;
+
+/// <summary>
+/// Circle wraps every response body in a "data" object
+/// </summary>
+public class CircleEnvelope<T>
+{
+    /// <summary>
+    /// Response payload
+    /// </summary>
+    [JsonPropertyName("data")]
+    public T? Data { get; set; }
+}
+
+/// <summary>
+/// Circle transaction as returned on the wire (id, state, sourceAddress, ...)
+/// </summary>
+public class CircleTransactionData
+{
+    [JsonPropertyName("id")]
+    public string? Id { get; set; }
+
+    [JsonPropertyName("state")]
+    public string? State { get; set; }
+
+    [JsonPropertyName("txHash")]
+    public string? TxHash { get; set; }
+
+    [JsonPropertyName("blockchain")]
+    public string? Blockchain { get; set; }
+
+    [JsonPropertyName("sourceAddress")]
+    public string? SourceAddress { get; set; }
+
+    [JsonPropertyName("destinationAddress")]
+    public string? DestinationAddress { get; set; }
+
+    [JsonPropertyName("tokenId")]
+    public string? TokenId { get; set; }
+
+    /// <summary>
+    /// First entry of the "amounts" array; the remaining entries are skipped without being materialized
+    /// </summary>
+    [JsonPropertyName("amounts")]
+    [JsonConverter(typeof(FirstArrayItemConverter))]
+    public string? Amount { get; set; }
+
+    [JsonPropertyName("createDate")]
+    public DateTime? CreateDate { get; set; }
+
+    [JsonPropertyName("updateDate")]
+    public DateTime? UpdateDate { get; set; }
+
+    /// <summary>
+    /// Maps Circle's field names to our model (id -> TransactionId, state -> Status)
+    /// </summary>
+    public CircleTransactionResponse ToResponse()
+    {
+        return new CircleTransactionResponse
+        {
+            TransactionId = Id ?? string.Empty,
+            Status = State ?? string.Empty,
+            TxHash = TxHash,
+            Blockchain = Blockchain ?? string.Empty,
+            From = SourceAddress ?? string.Empty,
+            To = DestinationAddress ?? string.Empty,
+            Amount = Amount ?? string.Empty,
+            TokenAddress = TokenId,
+            CreatedAt = CreateDate ?? default,
+            UpdatedAt = UpdateDate ?? default
+        };
+    }
+}
+
+/// <summary>
+/// Payload of Circle's wallet transaction listing
+/// </summary>
+public class CircleTransactionListData
+{
+    [JsonPropertyName("transactions")]
+    public List<CircleTransactionData> Transactions { get; set; } = new();
+}
+
+/// <summary>
+/// Reads the first string of a JSON array and skips the rest
+/// </summary>
+public sealed class FirstArrayItemConverter : JsonConverter<string?>
+{
+    public override string? Read(ref Utf8JsonReader reader, Type typeToConvert, JsonSerializerOptions options)
+    {
+        if (reader.TokenType != JsonTokenType.StartArray)
+        {
+            reader.Skip();
+            return null;
+        }
+
+        string? first = null;
+        while (reader.Read() && reader.TokenType != JsonTokenType.EndArray)
+        {
+            if (first == null && reader.TokenType == JsonTokenType.String)
+            {
+                first = reader.GetString();
+            }
+            else
+            {
+                reader.Skip();
+            }
+        }
+
+        return first;
+    }
+
+    public override void Write(Utf8JsonWriter writer, string? value, JsonSerializerOptions options)
+    {
+        writer.WriteStartArray();
+        if (value != null)
+        {
+            writer.WriteStringValue(value);
+        }
+        writer.WriteEndArray();
+    }
+}
@@ -0,0 +1,17 @@
+namespace CoinPay.Api.Services.Circle.Models;
+
+/// <summary>
+/// A single page of wallet transactions returned by Circle's transaction listing endpoint.
+/// </summary>
+public class CircleTransactionPage
+{
+    /// <summary>
+    /// The transactions on this page, in the order returned by Circle.
+    /// </summary>
+    public List<CircleTransactionResponse> Transactions { get; set; } = new();
+
+    /// <summary>
+    /// Cursor to pass as pageAfter to fetch the next page, or null when this is the last page.
+    /// </summary>
+    public string? NextPageAfter { get; set; }
+}
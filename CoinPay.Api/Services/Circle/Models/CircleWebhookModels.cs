@@ -127,3 +127,27 @@ public class CircleWebhookData
     [JsonPropertyName("updateDate")]
     public DateTime? UpdateDate { get; set; }
 }
+
+/// <summary>
+/// Public key Circle signs webhook notifications with, looked up by the X-Circle-Key-Id header
+/// </summary>
+public class CircleNotificationPublicKey
+{
+    /// <summary>
+    /// Key ID
+    /// </summary>
+    [JsonPropertyName("id")]
+    public string Id { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Signature algorithm (e.g., "ECDSA_SHA_256")
+    /// </summary>
+    [JsonPropertyName("algorithm")]
+    public string Algorithm { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Base64-encoded DER (SubjectPublicKeyInfo) public key
+    /// </summary>
+    [JsonPropertyName("publicKey")]
+    public string PublicKey { get; set; } = string.Empty;
+}
@@ -0,0 +1,30 @@
+namespace CoinPay.Api.Services.Coordination;
+
+/// <summary>
+/// Splits background worker items across API replicas with database-backed partition leases,
+/// so each item is processed by exactly one replica per cycle
+/// </summary>
+public interface IWorkPartitionCoordinator
+{
+    /// <summary>
+    /// Identifier of this node in the lease tables
+    /// </summary>
+    string NodeId { get; }
+
+    /// <summary>
+    /// Joins the worker's partition leasing if needed, renews and rebalances this node's leases, and returns
+    /// the partitions it may process. Returns no partitions when no lease is currently held.
+    /// Dispose the assignment when the cycle ends; until then its partitions are not handed to other nodes.
+    /// </summary>
+    Task<WorkPartitionAssignment> AcquireAsync(string workerName, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Heartbeat: renews and rebalances the leases of every worker this node has joined
+    /// </summary>
+    Task RenewAsync(CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Gives up all of this node's leases so other replicas can take them over immediately
+    /// </summary>
+    Task ReleaseAsync(CancellationToken cancellationToken = default);
+}
@@ -0,0 +1,85 @@
+namespace CoinPay.Api.Services.Coordination;
+
+/// <summary>
+/// The partitions of a background worker's items that this node holds leases on.
+/// Items are mapped to partitions with a hash that is stable across processes and restarts.
+/// An assignment returned for a worker cycle keeps its partitions in use until it is disposed.
+/// </summary>
+public sealed class WorkPartitionAssignment : IDisposable
+{
+    private const uint FnvOffsetBasis = 2166136261;
+    private const uint FnvPrime = 16777619;
+
+    private readonly HashSet<int> _owned;
+    private Action? _onDispose;
+
+    public WorkPartitionAssignment(int partitionCount, IEnumerable<int> partitions)
+        : this(partitionCount, partitions, null)
+    {
+    }
+
+    internal WorkPartitionAssignment(int partitionCount, IEnumerable<int> partitions, Action? onDispose)
+    {
+        if (partitionCount <= 0)
+            throw new ArgumentOutOfRangeException(nameof(partitionCount), "Partition count must be positive");
+
+        PartitionCount = partitionCount;
+        _owned = partitions.Where(p => p >= 0 && p < partitionCount).ToHashSet();
+        Partitions = _owned.Order().ToArray();
+        _onDispose = onDispose;
+    }
+
+    /// <summary>
+    /// Assignment for a node that processes every item (single node, or partitioning disabled)
+    /// </summary>
+    public static WorkPartitionAssignment All(int partitionCount) =>
+        new(partitionCount, Enumerable.Range(0, partitionCount));
+
+    public static WorkPartitionAssignment None(int partitionCount) =>
+        new(partitionCount, Array.Empty<int>());
+
+    public int PartitionCount { get; }
+
+    /// <summary>
+    /// Owned partition numbers in ascending order
+    /// </summary>
+    public IReadOnlyList<int> Partitions { get; }
+
+    public bool OwnsAll => _owned.Count == PartitionCount;
+
+    public bool IsEmpty => _owned.Count == 0;
+
+    /// <summary>
+    /// Ends the worker cycle this assignment was acquired for, letting the coordinator hand its partitions over
+    /// </summary>
+    public void Dispose() => Interlocked.Exchange(ref _onDispose, null)?.Invoke();
+
+    public bool Owns(int key) => _owned.Contains(GetPartition(key, PartitionCount));
+
+    public bool Owns(Guid key) => _owned.Contains(GetPartition(key, PartitionCount));
+
+    public bool Owns(string key) => _owned.Contains(GetPartition(key, PartitionCount));
+
+    /// <summary>
+    /// Partition of a non-negative integer key. Matches <c>key % partitionCount</c> so the same filter
+    /// can be applied in SQL.
+    /// </summary>
+    public static int GetPartition(int key, int partitionCount) => (int)((uint)key % (uint)partitionCount);
+
+    public static int GetPartition(Guid key, int partitionCount) => GetPartition(key.ToString("N"), partitionCount);
+
+    /// <summary>
+    /// Partition of a string key, using 32-bit FNV-1a over its characters.
+    /// <see cref="string.GetHashCode()"/> is randomized per process and cannot be shared between replicas.
+    /// </summary>
+    public static int GetPartition(string key, int partitionCount)
+    {
+        var hash = FnvOffsetBasis;
+        foreach (var c in key)
+        {
+            hash = (hash ^ c) * FnvPrime;
+        }
+
+        return (int)(hash % (uint)partitionCount);
+    }
+}
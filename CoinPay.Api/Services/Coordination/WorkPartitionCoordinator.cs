@@ -0,0 +1,309 @@
+using System.Collections.Concurrent;
+using CoinPay.Api.Data;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Services.Coordination;
+
+/// <summary>
+/// Postgres-backed partition leasing. Each heartbeat a node records itself in WorkerNodes, works out its fair
+/// share of partitions from the live nodes, hands back leases outside that share and claims free or expired
+/// leases inside it. A partition only moves once its previous owner has released it or let it expire, so two
+/// nodes never hold the same partition at once. All lease times use the database clock.
+///
+/// Partitions handed to a worker cycle stay in use until the cycle disposes its assignment: heartbeats keep
+/// renewing them even when they have left this node's share, and only the first rebalance after the cycle
+/// ends hands them over.
+/// </summary>
+public class WorkPartitionCoordinator : IWorkPartitionCoordinator
+{
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly WorkPartitioningOptions _options;
+    private readonly ILogger<WorkPartitionCoordinator> _logger;
+    private readonly ConcurrentDictionary<string, WorkerLeaseState> _workers = new();
+
+    public WorkPartitionCoordinator(
+        IServiceScopeFactory scopeFactory,
+        IOptions<WorkPartitioningOptions> options,
+        ILogger<WorkPartitionCoordinator> logger)
+    {
+        _scopeFactory = scopeFactory;
+        _options = options.Value;
+        _logger = logger;
+
+        NodeId = $"{Environment.MachineName}:{Environment.ProcessId}:{Guid.NewGuid().ToString("N")[..8]}";
+    }
+
+    public string NodeId { get; }
+
+    public async Task<WorkPartitionAssignment> AcquireAsync(string workerName, CancellationToken cancellationToken = default)
+    {
+        if (!_options.Enabled)
+        {
+            return WorkPartitionAssignment.All(_options.PartitionCount);
+        }
+
+        var state = _workers.GetOrAdd(workerName, _ => new WorkerLeaseState(_options.PartitionCount));
+
+        await state.Gate.WaitAsync(cancellationToken);
+        try
+        {
+            // The worker's previous cycle is over, so this is the point where partitions can be handed over
+            state.EndCycle();
+            await RenewHeldGateAsync(workerName, state, cancellationToken);
+
+            return state.BeginCycle(DateTime.UtcNow);
+        }
+        finally
+        {
+            state.Gate.Release();
+        }
+    }
+
+    public async Task RenewAsync(CancellationToken cancellationToken = default)
+    {
+        foreach (var (workerName, state) in _workers)
+        {
+            await RenewWorkerAsync(workerName, state, cancellationToken);
+        }
+    }
+
+    public async Task ReleaseAsync(CancellationToken cancellationToken = default)
+    {
+        if (!_options.Enabled || _workers.IsEmpty)
+        {
+            return;
+        }
+
+        using var scope = _scopeFactory.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+        if (!db.Database.IsRelational())
+        {
+            return;
+        }
+
+        foreach (var state in _workers.Values)
+        {
+            state.Clear();
+        }
+
+        var released = await db.Database.ExecuteSqlAsync($"""
+            UPDATE "WorkerLeases" SET "OwnerId" = NULL, "ExpiresAt" = now()
+            WHERE "OwnerId" = {NodeId}
+            """, cancellationToken);
+
+        await db.Database.ExecuteSqlAsync($"""
+            DELETE FROM "WorkerNodes" WHERE "NodeId" = {NodeId}
+            """, cancellationToken);
+
+        _logger.LogInformation("Node {NodeId} released {Count} worker partition leases", NodeId, released);
+    }
+
+    /// <summary>
+    /// Partitions a node should hold given the live nodes: partition p belongs to the node at position
+    /// p mod N in ordinal node order, so shares differ by at most one partition.
+    /// </summary>
+    public static IReadOnlyList<int> GetTargetPartitions(string nodeId, IEnumerable<string> liveNodes, int partitionCount)
+    {
+        var nodes = liveNodes
+            .Append(nodeId)
+            .Distinct(StringComparer.Ordinal)
+            .Order(StringComparer.Ordinal)
+            .ToList();
+
+        var index = nodes.IndexOf(nodeId);
+
+        return Enumerable.Range(0, partitionCount)
+            .Where(p => p % nodes.Count == index)
+            .ToList();
+    }
+
+    private async Task RenewWorkerAsync(string workerName, WorkerLeaseState state, CancellationToken cancellationToken)
+    {
+        await state.Gate.WaitAsync(cancellationToken);
+        try
+        {
+            await RenewHeldGateAsync(workerName, state, cancellationToken);
+        }
+        finally
+        {
+            state.Gate.Release();
+        }
+    }
+
+    /// <summary>
+    /// Renews and rebalances one worker's leases; the caller holds the worker's gate
+    /// </summary>
+    private async Task RenewHeldGateAsync(string workerName, WorkerLeaseState state, CancellationToken cancellationToken)
+    {
+        try
+        {
+            // Measured before the round trips so the local view never outlives the lease in the database
+            var renewStartedAt = DateTime.UtcNow;
+
+            using var scope = _scopeFactory.CreateScope();
+            var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+            if (!db.Database.IsRelational())
+            {
+                // The in-memory provider (tests) has no other nodes to share with
+                state.Update(WorkPartitionAssignment.All(_options.PartitionCount), DateTime.MaxValue);
+                return;
+            }
+
+            var owned = await RebalanceAsync(db, workerName, state, cancellationToken);
+            var assignment = new WorkPartitionAssignment(_options.PartitionCount, owned);
+
+            if (!assignment.Partitions.SequenceEqual(state.Assignment.Partitions))
+            {
+                _logger.LogInformation(
+                    "Worker {Worker} on node {NodeId} now leases {Owned} of {Total} partitions",
+                    workerName, NodeId, assignment.Partitions.Count, assignment.PartitionCount);
+            }
+
+            state.Update(assignment, renewStartedAt + _options.LeaseDuration);
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            // Leases already held stay usable until they would have expired
+            _logger.LogWarning(ex, "Failed to renew partition leases for worker {Worker}", workerName);
+        }
+    }
+
+    private async Task<List<int>> RebalanceAsync(
+        AppDbContext db,
+        string workerName,
+        WorkerLeaseState state,
+        CancellationToken cancellationToken)
+    {
+        var leaseDuration = _options.LeaseDuration;
+
+        await db.Database.ExecuteSqlAsync($"""
+            INSERT INTO "WorkerNodes" ("WorkerName", "NodeId", "HeartbeatAt")
+            VALUES ({workerName}, {NodeId}, now())
+            ON CONFLICT ("WorkerName", "NodeId") DO UPDATE SET "HeartbeatAt" = now()
+            """, cancellationToken);
+
+        // Nodes that stopped heartbeating leave the rotation; their leases expire on the same schedule
+        await db.Database.ExecuteSqlAsync($"""
+            DELETE FROM "WorkerNodes"
+            WHERE "WorkerName" = {workerName} AND "HeartbeatAt" < now() - {leaseDuration}
+            """, cancellationToken);
+
+        if (!state.PartitionsSeeded)
+        {
+            await db.Database.ExecuteSqlAsync($"""
+                INSERT INTO "WorkerLeases" ("WorkerName", "Partition", "ExpiresAt")
+                SELECT {workerName}, p, now() FROM generate_series(0, {_options.PartitionCount - 1}) AS p
+                ON CONFLICT DO NOTHING
+                """, cancellationToken);
+
+            state.PartitionsSeeded = true;
+        }
+
+        var liveNodes = await db.WorkerNodes
+            .AsNoTracking()
+            .Where(n => n.WorkerName == workerName)
+            .Select(n => n.NodeId)
+            .ToListAsync(cancellationToken);
+
+        var target = GetTargetPartitions(NodeId, liveNodes, _options.PartitionCount).ToArray();
+        var inUse = state.InUse;
+
+        // Hand back partitions that now belong to another node's share, unless a running cycle still uses them
+        await db.Database.ExecuteSqlAsync($"""
+            UPDATE "WorkerLeases" SET "OwnerId" = NULL, "ExpiresAt" = now()
+            WHERE "WorkerName" = {workerName} AND "OwnerId" = {NodeId}
+              AND NOT ("Partition" = ANY({target})) AND NOT ("Partition" = ANY({inUse}))
+            """, cancellationToken);
+
+        // Renew held leases and claim free or expired ones within this node's share; partitions in use
+        // outside the share are renewed but never claimed
+        return await db.Database.SqlQuery<int>($"""
+            UPDATE "WorkerLeases" SET "OwnerId" = {NodeId}, "ExpiresAt" = now() + {leaseDuration}
+            WHERE "WorkerName" = {workerName}
+              AND (("Partition" = ANY({target}) AND ("OwnerId" IS NULL OR "OwnerId" = {NodeId} OR "ExpiresAt" < now()))
+                OR ("Partition" = ANY({inUse}) AND "OwnerId" = {NodeId}))
+            RETURNING "Partition" AS "Value"
+            """).ToListAsync(cancellationToken);
+    }
+
+    private sealed class WorkerLeaseState
+    {
+        private readonly int _partitionCount;
+        private readonly object _cycleLock = new();
+        private DateTime _validUntil = DateTime.MinValue;
+        private int[] _inUse = Array.Empty<int>();
+        private long _cycle;
+
+        public WorkerLeaseState(int partitionCount)
+        {
+            _partitionCount = partitionCount;
+            Assignment = WorkPartitionAssignment.None(partitionCount);
+        }
+
+        public SemaphoreSlim Gate { get; } = new(1, 1);
+
+        public WorkPartitionAssignment Assignment { get; private set; }
+
+        public bool PartitionsSeeded { get; set; }
+
+        /// <summary>
+        /// Partitions the worker's current cycle is processing; rebalancing never hands these over
+        /// </summary>
+        public int[] InUse
+        {
+            get
+            {
+                lock (_cycleLock)
+                {
+                    return _inUse;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Marks the current assignment as in use and returns it; disposing it ends the cycle
+        /// </summary>
+        public WorkPartitionAssignment BeginCycle(DateTime now)
+        {
+            var assignment = GetAssignment(now);
+
+            lock (_cycleLock)
+            {
+                var cycle = ++_cycle;
+                _inUse = assignment.Partitions.ToArray();
+                return new WorkPartitionAssignment(_partitionCount, assignment.Partitions, () => EndCycle(cycle));
+            }
+        }
+
+        public void EndCycle() => EndCycle(null);
+
+        /// <summary>
+        /// Ends the given cycle, or whichever cycle is running when none is given. A late dispose of an
+        /// older cycle's assignment leaves a newer cycle's partitions in use.
+        /// </summary>
+        private void EndCycle(long? cycle)
+        {
+            lock (_cycleLock)
+            {
+                if (cycle == null || cycle == _cycle)
+                {
+                    _inUse = Array.Empty<int>();
+                }
+            }
+        }
+
+        public void Update(WorkPartitionAssignment assignment, DateTime validUntil)
+        {
+            Assignment = assignment;
+            _validUntil = validUntil;
+        }
+
+        public void Clear() => Update(WorkPartitionAssignment.None(_partitionCount), DateTime.MinValue);
+
+        public WorkPartitionAssignment GetAssignment(DateTime now) =>
+            now < _validUntil ? Assignment : WorkPartitionAssignment.None(_partitionCount);
+    }
+}
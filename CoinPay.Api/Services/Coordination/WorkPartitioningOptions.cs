@@ -0,0 +1,33 @@
+namespace CoinPay.Api.Services.Coordination;
+
+/// <summary>
+/// Configuration options for splitting background worker items across API replicas.
+/// Every replica must use the same partition count.
+/// </summary>
+public class WorkPartitioningOptions
+{
+    /// <summary>
+    /// Whether replicas lease partitions from the database; when disabled every node processes every item (default: true)
+    /// </summary>
+    public bool Enabled { get; set; } = true;
+
+    /// <summary>
+    /// Number of hash partitions each worker's items are split into (default: 64)
+    /// </summary>
+    public int PartitionCount { get; set; } = 64;
+
+    /// <summary>
+    /// How long a lease lasts without renewal; a replica that stops heartbeating loses its partitions
+    /// and its membership after this long (default: 90)
+    /// </summary>
+    public int LeaseDurationSeconds { get; set; } = 90;
+
+    /// <summary>
+    /// How often held leases are renewed and partitions rebalanced between cycles (default: 15)
+    /// </summary>
+    public int HeartbeatIntervalSeconds { get; set; } = 15;
+
+    public TimeSpan LeaseDuration => TimeSpan.FromSeconds(LeaseDurationSeconds);
+
+    public TimeSpan HeartbeatInterval => TimeSpan.FromSeconds(HeartbeatIntervalSeconds);
+}
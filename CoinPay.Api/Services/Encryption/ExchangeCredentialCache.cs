@@ -0,0 +1,72 @@
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Services.Encryption;
+
+/// <summary>
+/// Remembers for CredentialCacheDuration that a connection's credentials decrypted. Only the ciphertext
+/// that was checked is cached; the decrypted key and secret are dropped as soon as the check is done.
+/// Failed checks are not cached, so they are retried on the next lookup.
+/// </summary>
+public class ExchangeCredentialCache : IExchangeCredentialCache, IDisposable
+{
+    private readonly IExchangeCredentialEncryptionService _encryptionService;
+    private readonly ILogger<ExchangeCredentialCache> _logger;
+    private readonly TimeSpan _entryLifetime;
+    private readonly MemoryCache _cache = new(new MemoryCacheOptions());
+
+    public ExchangeCredentialCache(
+        IExchangeCredentialEncryptionService encryptionService,
+        ILogger<ExchangeCredentialCache> logger,
+        IOptions<InvestmentSyncOptions> options)
+    {
+        _encryptionService = encryptionService;
+        _logger = logger;
+        _entryLifetime = options.Value.CredentialCacheDuration;
+    }
+
+    public async Task<bool> CanDecryptAsync(ExchangeConnection connection)
+    {
+        // Entries are keyed by connection but also compared on ciphertext, so rotated keys are checked again
+        if (_cache.TryGetValue(connection.Id, out VerifiedCiphertext? cached) &&
+            cached!.ApiKeyEncrypted == connection.ApiKeyEncrypted &&
+            cached.ApiSecretEncrypted == connection.ApiSecretEncrypted)
+        {
+            return true;
+        }
+
+        try
+        {
+            await _encryptionService.DecryptAsync(connection.ApiKeyEncrypted, connection.UserId);
+            await _encryptionService.DecryptAsync(connection.ApiSecretEncrypted, connection.UserId);
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Failed to decrypt credentials for connection {ConnectionId}", connection.Id);
+            return false;
+        }
+
+        _cache.Set(
+            connection.Id,
+            new VerifiedCiphertext(connection.ApiKeyEncrypted, connection.ApiSecretEncrypted),
+            _entryLifetime);
+
+        _logger.LogDebug("Verified credentials for exchange connection {ConnectionId}", connection.Id);
+
+        return true;
+    }
+
+    public void Invalidate(Guid connectionId)
+    {
+        _cache.Remove(connectionId);
+    }
+
+    public void Dispose()
+    {
+        _cache.Dispose();
+    }
+
+    private sealed record VerifiedCiphertext(string ApiKeyEncrypted, string ApiSecretEncrypted);
+}
@@ -0,0 +1,20 @@
+using CoinPay.Api.Models;
+
+namespace CoinPay.Api.Services.Encryption;
+
+/// <summary>
+/// Short-lived in-memory record of which exchange connections' credentials decrypt
+/// </summary>
+public interface IExchangeCredentialCache
+{
+    /// <summary>
+    /// Check that the connection's API key and secret still decrypt, decrypting only on a cache miss
+    /// or when the connection's encrypted credentials have changed. The plaintext is not kept.
+    /// </summary>
+    Task<bool> CanDecryptAsync(ExchangeConnection connection);
+
+    /// <summary>
+    /// Drop the cached result for a connection so the next check decrypts again
+    /// </summary>
+    void Invalidate(Guid connectionId);
+}
@@ -2,6 +2,7 @@ using System.Security.Cryptography;
 using System.Text;
 using System.Text.Json;
 using CoinPay.Api.DTOs.Exchange;
+using CoinPay.Api.Services.Telemetry;
 
 namespace CoinPay.Api.Services.Exchange.WhiteBit;
 
@@ -10,6 +11,8 @@ namespace CoinPay.Api.Services.Exchange.WhiteBit;
 /// </summary>
 public class WhiteBitApiClient : IWhiteBitApiClient
 {
+    public const string HttpClientName = "WhiteBit";
+
     private readonly IHttpClientFactory _httpClientFactory;
     private readonly ILogger<WhiteBitApiClient> _logger;
     private readonly string _baseUrl;
@@ -180,8 +183,9 @@ public class WhiteBitApiClient : IWhiteBitApiClient
             // Generate HMAC-SHA256 signature
             var signature = GenerateSignature(apiSecret, endpoint, nonce.ToString(), bodyJson);
 
-            var client = _httpClientFactory.CreateClient();
-            var request = new HttpRequestMessage(method, $"{_baseUrl}{endpoint}");
+            var client = _httpClientFactory.CreateClient(HttpClientName);
+            var request = new HttpRequestMessage(method, $"{_baseUrl}{endpoint}")
+                .WithUpstreamOperation(endpoint);
 
             request.Headers.Add("X-TXC-APIKEY", apiKey);
             request.Headers.Add("X-TXC-PAYLOAD", Convert.ToBase64String(Encoding.UTF8.GetBytes(bodyJson)));
@@ -0,0 +1,73 @@
+using CoinPay.Api.Services.FiatGateway;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Services.ExchangeRate;
+
+/// <summary>
+/// Rate source selected by ExchangeRate:Source configuration
+/// Mock returns a fixed rate; RedotPay quotes from the fiat gateway
+/// </summary>
+public class ConfiguredRateSource : IRateSource
+{
+    private readonly IFiatGatewayService _fiatGatewayService;
+    private readonly ExchangeRateOptions _options;
+    private readonly ILogger<ConfiguredRateSource> _logger;
+
+    private const decimal MockRate = 0.9998m; // Mock: 1 USDC ≈ 0.9998 USD
+
+    public ConfiguredRateSource(
+        IFiatGatewayService fiatGatewayService,
+        IOptions<ExchangeRateOptions> options,
+        ILogger<ConfiguredRateSource> logger)
+    {
+        _fiatGatewayService = fiatGatewayService;
+        _options = options.Value;
+        _logger = logger;
+    }
+
+    public async Task<ExchangeRateInfo> FetchRateAsync(string baseCurrency, string quoteCurrency, CancellationToken cancellationToken = default)
+    {
+        // All configured sources currently quote USDC/USD only
+        if (!string.Equals(baseCurrency, "USDC", StringComparison.OrdinalIgnoreCase) ||
+            !string.Equals(quoteCurrency, "USD", StringComparison.OrdinalIgnoreCase))
+        {
+            throw new NotSupportedException($"Rate source {_options.Source} does not quote {baseCurrency}/{quoteCurrency}");
+        }
+
+        _logger.LogInformation("Fetching {Base}/{Quote} exchange rate from {Source}", baseCurrency, quoteCurrency, _options.Source);
+
+        var rate = _options.Source.ToLowerInvariant() switch
+        {
+            "mock" => await FetchMockRateAsync(cancellationToken),
+            "redotpay" => await FetchFromRedotPayAsync(),
+            _ => throw new NotSupportedException($"Unknown exchange rate source {_options.Source}")
+        };
+
+        return new ExchangeRateInfo
+        {
+            Rate = rate,
+            BaseCurrency = baseCurrency.ToUpperInvariant(),
+            QuoteCurrency = quoteCurrency.ToUpperInvariant(),
+            Timestamp = DateTime.UtcNow,
+            ValidForSeconds = _options.ValiditySeconds,
+            Source = _options.Source,
+            IsCached = false
+        };
+    }
+
+    private static async Task<decimal> FetchMockRateAsync(CancellationToken cancellationToken)
+    {
+        // Simulate API call delay
+        await Task.Delay(50, cancellationToken);
+        return MockRate;
+    }
+
+    /// <summary>
+    /// Fetch rate from the RedotPay fiat gateway
+    /// </summary>
+    private async Task<decimal> FetchFromRedotPayAsync()
+    {
+        var response = await _fiatGatewayService.GetExchangeRateAsync();
+        return response.Rate;
+    }
+}
@@ -0,0 +1,27 @@
+namespace CoinPay.Api.Services.ExchangeRate;
+
+/// <summary>
+/// Configuration for exchange rate sourcing and caching ("ExchangeRate" section)
+/// </summary>
+public class ExchangeRateOptions
+{
+    /// <summary>
+    /// Upstream rate source: Mock or RedotPay (default: Mock)
+    /// </summary>
+    public string Source { get; set; } = "Mock";
+
+    /// <summary>
+    /// How long a fetched rate is valid (default: 30)
+    /// </summary>
+    public int ValiditySeconds { get; set; } = 30;
+
+    /// <summary>
+    /// Percentage of the validity period after which a background refresh starts (default: 80)
+    /// </summary>
+    public int RefreshAheadPercent { get; set; } = 80;
+
+    /// <summary>
+    /// How long an expired rate may still be served while a refresh is in flight (default: 10)
+    /// </summary>
+    public int MaxStaleSeconds { get; set; } = 10;
+}
@@ -70,7 +70,7 @@ public class ExchangeRateInfo
     public int ValidForSeconds { get; set; }
 
     /// <summary>
-    /// Rate source identifier (e.g., "CoinGecko", "RedotPay", "Mock")
+    /// Rate source identifier (e.g., "RedotPay", "Mock")
     /// </summary>
     public string Source { get; set; } = string.Empty;
 
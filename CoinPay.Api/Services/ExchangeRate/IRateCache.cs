@@ -0,0 +1,19 @@
+namespace CoinPay.Api.Services.ExchangeRate;
+
+/// <summary>
+/// Shared two-level exchange rate cache (in-process L1 over Redis L2) for any currency pair.
+/// Concurrent misses share one upstream fetch, and rates are refreshed in the background
+/// before they expire.
+/// </summary>
+public interface IRateCache
+{
+    /// <summary>
+    /// Get the rate for a pair, serving from cache when possible
+    /// </summary>
+    Task<ExchangeRateInfo> GetRateAsync(string baseCurrency, string quoteCurrency, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Fetch a fresh rate from the upstream source and store it in both cache levels
+    /// </summary>
+    Task<ExchangeRateInfo> RefreshRateAsync(string baseCurrency, string quoteCurrency, CancellationToken cancellationToken = default);
+}
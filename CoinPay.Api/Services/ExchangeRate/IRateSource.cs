@@ -0,0 +1,13 @@
+namespace CoinPay.Api.Services.ExchangeRate;
+
+/// <summary>
+/// Upstream provider of exchange rates. Only called by <see cref="IRateCache"/> on a cache refresh.
+/// </summary>
+public interface IRateSource
+{
+    /// <summary>
+    /// Fetch the current rate for a currency pair from the configured source
+    /// </summary>
+    /// <exception cref="NotSupportedException">The source does not quote the requested pair</exception>
+    Task<ExchangeRateInfo> FetchRateAsync(string baseCurrency, string quoteCurrency, CancellationToken cancellationToken = default);
+}
@@ -0,0 +1,242 @@
+using System.Collections.Concurrent;
+using System.Text.Json;
+using Microsoft.Extensions.Caching.Distributed;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Options;
+using CoinPay.Api.Services.Telemetry;
+
+namespace CoinPay.Api.Services.ExchangeRate;
+
+/// <summary>
+/// Two-level exchange rate cache with single-flight refresh and stale-while-revalidate.
+///
+/// Each entry moves through three windows:
+/// - fresh: served from L1 as-is
+/// - refresh-ahead (after RefreshAheadPercent of the validity period) and stale (up to MaxStaleSeconds
+///   past expiry): served from L1 while one background refresh runs
+/// - expired beyond the stale window: callers wait on the single in-flight refresh
+///
+/// A refresh first looks in Redis (L2) for a newer rate stored by another node and only calls the
+/// upstream <see cref="IRateSource"/> when there is none, so upstream calls stay at about one per
+/// validity period per node.
+/// </summary>
+public class RateCache : IRateCache
+{
+    private readonly IMemoryCache _memoryCache;
+    private readonly IDistributedCache? _distributedCache;
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly ExchangeRateOptions _options;
+    private readonly ILogger<RateCache> _logger;
+    private readonly ConcurrentDictionary<string, Lazy<Task<ExchangeRateInfo>>> _inflightRefreshes = new();
+
+    private const string CacheKeyPrefix = "rates:";
+    private const string CacheName = "exchange_rate";
+    private const string DistributedCacheName = "exchange_rate_l2";
+
+    public RateCache(
+        IMemoryCache memoryCache,
+        IServiceScopeFactory scopeFactory,
+        IServiceProvider serviceProvider,
+        IOptions<ExchangeRateOptions> options,
+        ILogger<RateCache> logger)
+    {
+        _memoryCache = memoryCache;
+        _scopeFactory = scopeFactory;
+        _options = options.Value;
+        _logger = logger;
+
+        // Redis is optional - without it the cache runs L1-only
+        _distributedCache = serviceProvider.GetService<IDistributedCache>();
+    }
+
+    public async Task<ExchangeRateInfo> GetRateAsync(string baseCurrency, string quoteCurrency, CancellationToken cancellationToken = default)
+    {
+        var key = BuildCacheKey(baseCurrency, quoteCurrency);
+        var now = DateTime.UtcNow;
+
+        if (_memoryCache.TryGetValue(key, out ExchangeRateInfo? cached) && cached != null)
+        {
+            if (now < GetRefreshAt(cached))
+            {
+                CoinPayTelemetry.RecordCacheLookup(CacheName, "hit");
+                return Copy(cached, isCached: true);
+            }
+
+            if (now < cached.ExpiresAt.AddSeconds(_options.MaxStaleSeconds))
+            {
+                // Stale-while-revalidate: serve the current entry and refresh once in the background
+                StartBackgroundRefresh(key, baseCurrency, quoteCurrency);
+                CoinPayTelemetry.RecordCacheLookup(CacheName, "stale");
+                return Copy(cached, isCached: true);
+            }
+        }
+
+        CoinPayTelemetry.RecordCacheLookup(CacheName, "miss");
+        var rate = await RefreshSingleFlightAsync(key, baseCurrency, quoteCurrency).WaitAsync(cancellationToken);
+        return Copy(rate, isCached: rate.Timestamp < now);
+    }
+
+    public async Task<ExchangeRateInfo> RefreshRateAsync(string baseCurrency, string quoteCurrency, CancellationToken cancellationToken = default)
+    {
+        var key = BuildCacheKey(baseCurrency, quoteCurrency);
+        var rate = await RefreshSingleFlightAsync(key, baseCurrency, quoteCurrency, skipDistributedCache: true)
+            .WaitAsync(cancellationToken);
+
+        return Copy(rate, isCached: false);
+    }
+
+    private void StartBackgroundRefresh(string key, string baseCurrency, string quoteCurrency)
+    {
+        if (_inflightRefreshes.ContainsKey(key))
+            return;
+
+        _ = Task.Run(async () =>
+        {
+            try
+            {
+                await RefreshSingleFlightAsync(key, baseCurrency, quoteCurrency);
+            }
+            catch (Exception ex)
+            {
+                _logger.LogWarning(ex, "Background refresh of {Key} failed; serving cached rate until it expires", key);
+            }
+        });
+    }
+
+    /// <summary>
+    /// Runs at most one refresh per key at a time; concurrent callers share its result.
+    /// The shared fetch is not tied to any single caller's cancellation token.
+    /// </summary>
+    private async Task<ExchangeRateInfo> RefreshSingleFlightAsync(
+        string key,
+        string baseCurrency,
+        string quoteCurrency,
+        bool skipDistributedCache = false)
+    {
+        var refresh = _inflightRefreshes.GetOrAdd(key, _ => new Lazy<Task<ExchangeRateInfo>>(
+            () => FetchAndStoreAsync(key, baseCurrency, quoteCurrency, skipDistributedCache)));
+
+        try
+        {
+            return await refresh.Value;
+        }
+        finally
+        {
+            _inflightRefreshes.TryRemove(new KeyValuePair<string, Lazy<Task<ExchangeRateInfo>>>(key, refresh));
+        }
+    }
+
+    private async Task<ExchangeRateInfo> FetchAndStoreAsync(
+        string key,
+        string baseCurrency,
+        string quoteCurrency,
+        bool skipDistributedCache)
+    {
+        if (!skipDistributedCache)
+        {
+            var shared = await TryGetFromDistributedCacheAsync(key);
+            if (shared != null && DateTime.UtcNow < GetRefreshAt(shared))
+            {
+                CoinPayTelemetry.RecordCacheLookup(DistributedCacheName, "hit");
+                _logger.LogDebug("Exchange rate {Key} refreshed from distributed cache", key);
+                SetMemoryCache(key, shared);
+                return shared;
+            }
+
+            if (_distributedCache != null)
+            {
+                CoinPayTelemetry.RecordCacheLookup(DistributedCacheName, "miss");
+            }
+        }
+
+        ExchangeRateInfo rate;
+        using (var scope = _scopeFactory.CreateScope())
+        {
+            var source = scope.ServiceProvider.GetRequiredService<IRateSource>();
+            rate = await source.FetchRateAsync(baseCurrency, quoteCurrency);
+        }
+
+        SetMemoryCache(key, rate);
+        await TrySetDistributedCacheAsync(key, rate);
+
+        _logger.LogInformation("Exchange rate updated: {Rate} {BaseCurrency}/{QuoteCurrency} from {Source} (valid for {Seconds}s)",
+            rate.Rate, rate.BaseCurrency, rate.QuoteCurrency, rate.Source, rate.ValidForSeconds);
+
+        return rate;
+    }
+
+    private void SetMemoryCache(string key, ExchangeRateInfo rate)
+    {
+        _memoryCache.Set(key, rate, new MemoryCacheEntryOptions
+        {
+            AbsoluteExpiration = rate.ExpiresAt.AddSeconds(_options.MaxStaleSeconds),
+            Priority = CacheItemPriority.High
+        });
+    }
+
+    private async Task<ExchangeRateInfo?> TryGetFromDistributedCacheAsync(string key)
+    {
+        if (_distributedCache == null)
+            return null;
+
+        try
+        {
+            var json = await _distributedCache.GetStringAsync(key);
+            return json == null ? null : JsonSerializer.Deserialize<ExchangeRateInfo>(json);
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "Failed to read exchange rate {Key} from distributed cache", key);
+            return null;
+        }
+    }
+
+    private async Task TrySetDistributedCacheAsync(string key, ExchangeRateInfo rate)
+    {
+        if (_distributedCache == null)
+            return;
+
+        try
+        {
+            await _distributedCache.SetStringAsync(
+                key,
+                JsonSerializer.Serialize(rate),
+                new DistributedCacheEntryOptions
+                {
+                    AbsoluteExpiration = rate.ExpiresAt.AddSeconds(_options.MaxStaleSeconds)
+                });
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "Failed to write exchange rate {Key} to distributed cache", key);
+        }
+    }
+
+    private DateTime GetRefreshAt(ExchangeRateInfo rate)
+    {
+        var percent = Math.Clamp(_options.RefreshAheadPercent, 1, 100);
+        return rate.Timestamp.AddSeconds(rate.ValidForSeconds * percent / 100.0);
+    }
+
+    private static string BuildCacheKey(string baseCurrency, string quoteCurrency)
+    {
+        return $"{CacheKeyPrefix}{baseCurrency.ToUpperInvariant()}_{quoteCurrency.ToUpperInvariant()}";
+    }
+
+    /// <summary>
+    /// Cached entries are shared, so callers always get their own copy
+    /// </summary>
+    private static ExchangeRateInfo Copy(ExchangeRateInfo rate, bool isCached)
+    {
+        return new ExchangeRateInfo
+        {
+            Rate = rate.Rate,
+            BaseCurrency = rate.BaseCurrency,
+            QuoteCurrency = rate.QuoteCurrency,
+            Timestamp = rate.Timestamp,
+            ValidForSeconds = rate.ValidForSeconds,
+            Source = rate.Source,
+            IsCached = isCached
+        };
+    }
+}
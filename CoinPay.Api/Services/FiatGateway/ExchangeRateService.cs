@@ -1,29 +1,21 @@
-using CoinPay.Api.Services.Caching;
-using System.Text.Json;
+using CoinPay.Api.Services.ExchangeRate;
 
 namespace CoinPay.Api.Services.FiatGateway;
 
 /// <summary>
-/// Service for managing exchange rates with caching
-/// Fetches rates from Fiat Gateway and caches for 30 seconds
+/// Service for managing exchange rates for fiat payouts
+/// Rates are read from the shared <see cref="IRateCache"/> without a gateway round trip per request.
 /// </summary>
 public class ExchangeRateService : IExchangeRateService
 {
-    private readonly IFiatGatewayService _fiatGatewayService;
-    private readonly ICachingService? _cachingService;
-    private readonly ILogger<ExchangeRateService> _logger;
+    private readonly IRateCache _rateCache;
 
-    private const string CacheKeyPrefix = "exchange_rate:";
-    private const int CacheDurationSeconds = 30;
+    private const string BaseCurrency = "USDC";
+    private const string QuoteCurrency = "USD";
 
-    public ExchangeRateService(
-        IFiatGatewayService fiatGatewayService,
-        ICachingService? cachingService,
-        ILogger<ExchangeRateService> logger)
+    public ExchangeRateService(IRateCache rateCache)
     {
-        _fiatGatewayService = fiatGatewayService;
-        _cachingService = cachingService;
-        _logger = logger;
+        _rateCache = rateCache;
     }
 
     /// <summary>
@@ -31,58 +23,18 @@ public class ExchangeRateService : IExchangeRateService
     /// </summary>
     public async Task<ExchangeRateResponse> GetExchangeRateAsync(bool forceRefresh = false)
     {
-        var cacheKey = $"{CacheKeyPrefix}USDC_USD";
+        var rate = forceRefresh
+            ? await _rateCache.RefreshRateAsync(BaseCurrency, QuoteCurrency)
+            : await _rateCache.GetRateAsync(BaseCurrency, QuoteCurrency);
 
-        // Try cache first (unless force refresh)
-        if (!forceRefresh && _cachingService != null)
+        return new ExchangeRateResponse
         {
-            var cachedJson = await _cachingService.GetAsync(cacheKey);
-            if (cachedJson != null)
-            {
-                try
-                {
-                    var cached = JsonSerializer.Deserialize<ExchangeRateResponse>(cachedJson);
-                    if (cached != null)
-                    {
-                        _logger.LogDebug("Exchange rate retrieved from cache");
-                        return cached;
-                    }
-                }
-                catch (JsonException ex)
-                {
-                    _logger.LogWarning(ex, "Failed to deserialize cached exchange rate, fetching fresh");
-                }
-            }
-        }
-
-        // Fetch from gateway
-        _logger.LogInformation("Fetching fresh exchange rate from gateway");
-        var rate = await _fiatGatewayService.GetExchangeRateAsync();
-
-        // Cache the result
-        if (_cachingService != null)
-        {
-            try
-            {
-                var json = JsonSerializer.Serialize(rate);
-                await _cachingService.SetAsync(cacheKey, json, TimeSpan.FromSeconds(CacheDurationSeconds));
-                _logger.LogDebug("Exchange rate cached for {Seconds} seconds", CacheDurationSeconds);
-            }
-            catch (Exception ex)
-            {
-                _logger.LogWarning(ex, "Failed to cache exchange rate");
-            }
-        }
-
-        return rate;
-    }
-
-    /// <summary>
-    /// Get conversion preview with current exchange rate
-    /// </summary>
-    public async Task<ConversionPreviewResponse> GetConversionPreviewAsync(decimal usdcAmount)
-    {
-        return await _fiatGatewayService.GetConversionPreviewAsync(usdcAmount);
+            Rate = rate.Rate,
+            BaseCurrency = rate.BaseCurrency,
+            QuoteCurrency = rate.QuoteCurrency,
+            Timestamp = rate.Timestamp,
+            ValidForSeconds = rate.ValidForSeconds
+        };
     }
 }
 
@@ -96,9 +48,4 @@ public interface IExchangeRateService
     /// </summary>
     /// <param name="forceRefresh">Force refresh from gateway</param>
     Task<ExchangeRateResponse> GetExchangeRateAsync(bool forceRefresh = false);
-
-    /// <summary>
-    /// Get conversion preview with fees
-    /// </summary>
-    Task<ConversionPreviewResponse> GetConversionPreviewAsync(decimal usdcAmount);
 }
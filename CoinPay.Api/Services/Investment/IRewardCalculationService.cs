@@ -1,3 +1,5 @@
+using CoinPay.Api.Models;
+
 namespace CoinPay.Api.Services.Investment;
 
 /// <summary>
@@ -29,4 +31,15 @@ public interface IRewardCalculationService
     /// Calculate current value (principal + accrued rewards)
     /// </summary>
     decimal CalculateCurrentValue(decimal principal, decimal accruedRewards);
+
+    /// <summary>
+    /// Calculate days held, accrued rewards, current value and projections for many positions in one pass.
+    /// Positions with invalid inputs are logged and left out of the result.
+    /// </summary>
+    IReadOnlyDictionary<Guid, PositionRewardSnapshot> CalculatePortfolio(IEnumerable<InvestmentPosition> positions, DateTime? asOf = null);
+
+    /// <summary>
+    /// Same as <see cref="CalculatePortfolio"/>, but each position's snapshot is cached until the position is next synced
+    /// </summary>
+    IReadOnlyDictionary<Guid, PositionRewardSnapshot> GetPortfolioRewards(IReadOnlyCollection<InvestmentPosition> positions);
 }
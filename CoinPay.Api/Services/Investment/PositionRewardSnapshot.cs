@@ -0,0 +1,19 @@
+namespace CoinPay.Api.Services.Investment;
+
+/// <summary>
+/// Rewards of one investment position as of <see cref="CalculatedAt"/>, calculated in a portfolio batch
+/// </summary>
+public record PositionRewardSnapshot(
+    Guid PositionId,
+    int DaysHeld,
+    decimal AccruedRewards,
+    decimal CurrentValue,
+    decimal DailyReward,
+    IReadOnlyDictionary<int, decimal> ProjectedRewards,
+    DateTime CalculatedAt)
+{
+    /// <summary>
+    /// Projected reward over one of <see cref="RewardCalculationService.ProjectionHorizons"/> (in days)
+    /// </summary>
+    public decimal GetProjectedReward(int days) => ProjectedRewards[days];
+}
@@ -1,3 +1,9 @@
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Api.Services.Telemetry;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Options;
+
 namespace CoinPay.Api.Services.Investment;
 
 /// <summary>
@@ -5,11 +11,25 @@ namespace CoinPay.Api.Services.Investment;
 /// </summary>
 public class RewardCalculationService : IRewardCalculationService
 {
+    private const string CacheName = "position_rewards";
+
+    /// <summary>
+    /// Horizons (in days) projected for every position in a portfolio batch
+    /// </summary>
+    public static readonly IReadOnlyList<int> ProjectionHorizons = new[] { 1, 7, 30, 90, 365 };
+
     private readonly ILogger<RewardCalculationService> _logger;
+    private readonly IMemoryCache _cache;
+    private readonly TimeSpan _snapshotLifetime;
 
-    public RewardCalculationService(ILogger<RewardCalculationService> logger)
+    public RewardCalculationService(
+        ILogger<RewardCalculationService> logger,
+        IMemoryCache cache,
+        IOptions<InvestmentSyncOptions> syncOptions)
     {
         _logger = logger;
+        _cache = cache;
+        _snapshotLifetime = syncOptions.Value.SyncInterval;
     }
 
     public decimal CalculateDailyReward(decimal principal, decimal apy)
@@ -73,4 +93,116 @@ public class RewardCalculationService : IRewardCalculationService
     {
         return Math.Round(principal + accruedRewards, 8);
     }
+
+    public IReadOnlyDictionary<Guid, PositionRewardSnapshot> CalculatePortfolio(IEnumerable<InvestmentPosition> positions, DateTime? asOf = null)
+    {
+        var now = asOf ?? DateTime.UtcNow;
+
+        // APY / 365 / 100 is worked out once per distinct APY and shared by every position at that rate
+        var dailyRates = new Dictionary<decimal, decimal>();
+        var snapshots = new Dictionary<Guid, PositionRewardSnapshot>();
+
+        foreach (var position in positions)
+        {
+            var snapshot = CalculateSnapshot(position, now, dailyRates);
+            if (snapshot != null)
+            {
+                snapshots[position.Id] = snapshot;
+            }
+        }
+
+        _logger.LogDebug(
+            "Calculated rewards for {Count} positions across {Rates} distinct APYs",
+            snapshots.Count, dailyRates.Count);
+
+        return snapshots;
+    }
+
+    public IReadOnlyDictionary<Guid, PositionRewardSnapshot> GetPortfolioRewards(IReadOnlyCollection<InvestmentPosition> positions)
+    {
+        var snapshots = new Dictionary<Guid, PositionRewardSnapshot>(positions.Count);
+        var misses = new List<InvestmentPosition>();
+
+        foreach (var position in positions)
+        {
+            if (_cache.TryGetValue(GetCacheKey(position), out PositionRewardSnapshot? cached) && cached != null)
+            {
+                CoinPayTelemetry.RecordCacheLookup(CacheName, "hit");
+                snapshots[position.Id] = cached;
+            }
+            else
+            {
+                CoinPayTelemetry.RecordCacheLookup(CacheName, "miss");
+                misses.Add(position);
+            }
+        }
+
+        if (misses.Count == 0)
+        {
+            return snapshots;
+        }
+
+        var calculated = CalculatePortfolio(misses);
+        foreach (var position in misses)
+        {
+            if (calculated.TryGetValue(position.Id, out var snapshot))
+            {
+                _cache.Set(GetCacheKey(position), snapshot, _snapshotLifetime);
+                snapshots[position.Id] = snapshot;
+            }
+        }
+
+        return snapshots;
+    }
+
+    /// <summary>
+    /// Same arithmetic and rounding as the single-position methods, with the daily rate looked up per APY.
+    /// Returns null for positions the single-position methods would reject.
+    /// </summary>
+    private PositionRewardSnapshot? CalculateSnapshot(
+        InvestmentPosition position,
+        DateTime now,
+        Dictionary<decimal, decimal> dailyRates)
+    {
+        var startDate = position.StartDate ?? position.CreatedAt;
+        var heldFor = now - startDate;
+
+        if (position.PrincipalAmount <= 0 || position.Apy < 0 || heldFor < TimeSpan.Zero)
+        {
+            _logger.LogWarning(
+                "Skipping reward calculation for position {PositionId}: Principal={Principal}, APY={APY}, StartDate={StartDate}",
+                position.Id, position.PrincipalAmount, position.Apy, startDate);
+            return null;
+        }
+
+        if (!dailyRates.TryGetValue(position.Apy, out var dailyRate))
+        {
+            dailyRate = position.Apy / 365m / 100m;
+            dailyRates[position.Apy] = dailyRate;
+        }
+
+        var dailyReward = Math.Round(position.PrincipalAmount * dailyRate, 8);
+        var accruedRewards = Math.Round(dailyReward * (decimal)heldFor.TotalDays, 8);
+
+        var projectedRewards = new Dictionary<int, decimal>(ProjectionHorizons.Count);
+        foreach (var days in ProjectionHorizons)
+        {
+            projectedRewards[days] = Math.Round(dailyReward * days, 8);
+        }
+
+        return new PositionRewardSnapshot(
+            position.Id,
+            (int)Math.Floor(heldFor.TotalDays),
+            accruedRewards,
+            Math.Round(position.PrincipalAmount + accruedRewards, 8),
+            dailyReward,
+            projectedRewards,
+            now);
+    }
+
+    /// <summary>
+    /// Keyed by the last sync time, so a sync that changes the position also retires its cached snapshot
+    /// </summary>
+    private static string GetCacheKey(InvestmentPosition position) =>
+        $"{CacheName}:{position.Id}:{(position.LastSyncedAt ?? position.CreatedAt).Ticks}";
 }
@@ -0,0 +1,32 @@
+using System.Threading.Channels;
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Services.Payout;
+
+/// <summary>
+/// Bounded in-process queue between <see cref="PayoutAuditService"/> and
+/// <see cref="PayoutAuditWriterService"/>. Enqueueing never waits, so payout requests
+/// do not pay for audit writes.
+/// </summary>
+public class PayoutAuditQueue
+{
+    private readonly Channel<PayoutAuditLog> _channel;
+
+    public PayoutAuditQueue(IOptions<PayoutAuditOptions> options)
+    {
+        _channel = Channel.CreateBounded<PayoutAuditLog>(new BoundedChannelOptions(options.Value.QueueCapacity)
+        {
+            SingleReader = true,
+            FullMode = BoundedChannelFullMode.Wait
+        });
+    }
+
+    public ChannelReader<PayoutAuditLog> Reader => _channel.Reader;
+
+    /// <summary>
+    /// Queues an entry for the writer. Returns false when the queue is full.
+    /// </summary>
+    public bool TryEnqueue(PayoutAuditLog entry) => _channel.Writer.TryWrite(entry);
+}
@@ -1,20 +1,31 @@
+using System.Text.Json;
+using CoinPay.Api.Data;
+using CoinPay.Api.Models;
+using Microsoft.EntityFrameworkCore;
+
 namespace CoinPay.Api.Services.Payout;
 
 /// <summary>
 /// Implementation of payout audit service
-/// Provides comprehensive audit trail for compliance and troubleshooting
+/// Provides comprehensive audit trail for compliance and troubleshooting.
+/// Entries are queued on <see cref="PayoutAuditQueue"/> and persisted to PayoutAuditLogs in batches
+/// by the background writer; every entry is also written to the structured log.
 /// </summary>
 public class PayoutAuditService : IPayoutAuditService
 {
-    private readonly ILogger<PayoutAuditService> _logger;
+    private static readonly JsonSerializerOptions EventDataJsonOptions = new(JsonSerializerDefaults.Web);
 
-    // In a real implementation, this would write to a separate audit database table
-    // For MVP, we're using structured logging which can be indexed by log aggregators
-    private static readonly List<PayoutAuditEntry> _auditTrail = new();
-    private static readonly object _lock = new();
+    private readonly PayoutAuditQueue _queue;
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly ILogger<PayoutAuditService> _logger;
 
-    public PayoutAuditService(ILogger<PayoutAuditService> logger)
+    public PayoutAuditService(
+        PayoutAuditQueue queue,
+        IServiceScopeFactory scopeFactory,
+        ILogger<PayoutAuditService> logger)
     {
+        _queue = queue;
+        _scopeFactory = scopeFactory;
         _logger = logger;
     }
 
@@ -162,36 +173,84 @@ public class PayoutAuditService : IPayoutAuditService
     }
 
     /// <summary>
-    /// Get audit trail for payout
+    /// Get audit trail for payout.
+    /// Entries still waiting in the queue appear once the writer has saved them.
     /// </summary>
-    public Task<List<PayoutAuditEntry>> GetAuditTrailAsync(Guid payoutId)
+    public async Task<List<PayoutAuditEntry>> GetAuditTrailAsync(Guid payoutId)
     {
-        lock (_lock)
-        {
-            var entries = _auditTrail
-                .Where(e => e.PayoutId == payoutId)
-                .OrderBy(e => e.Timestamp)
-                .ToList();
+        using var scope = _scopeFactory.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
 
-            return Task.FromResult(entries);
-        }
+        // Served by IX_PayoutAuditLogs_PayoutTransactionId_CreatedAt
+        var logs = await db.PayoutAuditLogs
+            .AsNoTracking()
+            .Where(a => a.PayoutTransactionId == payoutId)
+            .OrderBy(a => a.CreatedAt)
+            .ToListAsync();
+
+        return logs.ConvertAll(ToEntry);
     }
 
     /// <summary>
-    /// Add audit entry to in-memory store
+    /// Queue audit entry for the background writer
     /// </summary>
     private void AddAuditEntry(PayoutAuditEntry entry)
     {
-        lock (_lock)
+        if (!_queue.TryEnqueue(ToLog(entry)))
         {
-            _auditTrail.Add(entry);
-
-            // Keep only last 10,000 entries in memory (for MVP)
-            // In production, this would be persisted to database
-            if (_auditTrail.Count > 10000)
-            {
-                _auditTrail.RemoveRange(0, 1000);
-            }
+            // The structured AUDIT log line is still written by the caller
+            _logger.LogWarning(
+                "AUDIT: Queue full, entry {AuditId} for payout {PayoutId} ({EventType}) not persisted",
+                entry.Id, entry.PayoutId, entry.EventType);
         }
     }
+
+    /// <summary>
+    /// Maps an audit entry to a PayoutAuditLog row. Status columns are only used for status changes;
+    /// everything else goes into the EventData document.
+    /// </summary>
+    private static PayoutAuditLog ToLog(PayoutAuditEntry entry)
+    {
+        var isStatusChange = entry.EventType == "STATUS_CHANGED";
+
+        return new PayoutAuditLog
+        {
+            Id = entry.Id,
+            PayoutTransactionId = entry.PayoutId,
+            EventType = entry.EventType,
+            PreviousStatus = isStatusChange ? entry.PreviousValue : null,
+            NewStatus = isStatusChange ? entry.NewValue : null,
+            EventData = JsonSerializer.Serialize(
+                new AuditEventData(entry.Description, entry.UserId, entry.PreviousValue, entry.NewValue, entry.Metadata),
+                EventDataJsonOptions),
+            CreatedAt = entry.Timestamp
+        };
+    }
+
+    private static PayoutAuditEntry ToEntry(PayoutAuditLog log)
+    {
+        var data = log.EventData != null
+            ? JsonSerializer.Deserialize<AuditEventData>(log.EventData, EventDataJsonOptions)
+            : null;
+
+        return new PayoutAuditEntry
+        {
+            Id = log.Id,
+            PayoutId = log.PayoutTransactionId,
+            EventType = log.EventType,
+            Description = data?.Description ?? string.Empty,
+            PreviousValue = data?.PreviousValue ?? log.PreviousStatus,
+            NewValue = data?.NewValue ?? log.NewStatus,
+            UserId = data?.UserId,
+            Timestamp = log.CreatedAt,
+            Metadata = data?.Metadata
+        };
+    }
+
+    private sealed record AuditEventData(
+        string Description,
+        int? UserId,
+        string? PreviousValue,
+        string? NewValue,
+        string? Metadata);
 }
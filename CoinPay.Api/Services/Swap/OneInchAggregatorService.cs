@@ -1,11 +1,13 @@
 using CoinPay.Api.Models;
 using CoinPay.Api.Services.Swap.OneInch;
+using CoinPay.Api.Services.Telemetry;
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.Logging;
 using Polly;
 using Polly.CircuitBreaker;
 using Polly.Retry;
 using System.Net;
+using System.Runtime.CompilerServices;
 using System.Text.Json;
 
 namespace CoinPay.Api.Services.Swap;
@@ -15,6 +17,8 @@ namespace CoinPay.Api.Services.Swap;
 /// </summary>
 public class OneInchAggregatorService : IDexAggregatorService
 {
+    public const string HttpClientName = "OneInch";
+
     private readonly IHttpClientFactory _httpClientFactory;
     private readonly IConfiguration _configuration;
     private readonly ILogger<OneInchAggregatorService> _logger;
@@ -54,6 +58,8 @@ public class OneInchAggregatorService : IDexAggregatorService
                         retryCount,
                         timespan.TotalMilliseconds,
                         outcome.Result?.StatusCode);
+
+                    CoinPayTelemetry.RecordRetry("oneinch", context.OperationKey ?? "unknown");
                 });
 
         // Configure circuit breaker
@@ -168,7 +174,10 @@ public class OneInchAggregatorService : IDexAggregatorService
         return Task.FromResult(0.01m); // Fallback estimate
     }
 
-    private async Task<T> SendRequestAsync<T>(string endpoint, Dictionary<string, string> queryParams)
+    private async Task<T> SendRequestAsync<T>(
+        string endpoint,
+        Dictionary<string, string> queryParams,
+        [CallerMemberName] string operation = "")
     {
         // Rate limiting
         await _rateLimiter.WaitAsync();
@@ -181,23 +190,25 @@ public class OneInchAggregatorService : IDexAggregatorService
         var queryString = string.Join("&", queryParams.Select(kvp => $"{kvp.Key}={Uri.EscapeDataString(kvp.Value)}"));
         var url = $"{endpoint}?{queryString}";
 
-        using var client = _httpClientFactory.CreateClient();
-        client.Timeout = TimeSpan.FromSeconds(10);
+        operation = operation.EndsWith("Async", StringComparison.Ordinal) ? operation[..^5] : operation;
+
+        using var client = _httpClientFactory.CreateClient(HttpClientName);
 
         if (!string.IsNullOrEmpty(ApiKey))
         {
             client.DefaultRequestHeaders.Add("Authorization", $"Bearer {ApiKey}");
         }
 
-        var response = await _retryPolicy.ExecuteAsync(async () =>
+        var response = await _retryPolicy.ExecuteAsync(async _ =>
         {
             return await _circuitBreakerPolicy.ExecuteAsync(async () =>
             {
-                var httpResponse = await client.GetAsync(url);
+                using var request = new HttpRequestMessage(HttpMethod.Get, url).WithUpstreamOperation(operation);
+                var httpResponse = await client.SendAsync(request);
                 httpResponse.EnsureSuccessStatusCode();
                 return httpResponse;
             });
-        });
+        }, new Context(operation));
 
         var content = await response.Content.ReadAsStringAsync();
         var result = JsonSerializer.Deserialize<T>(content, new JsonSerializerOptions
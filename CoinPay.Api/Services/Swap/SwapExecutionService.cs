@@ -150,6 +150,9 @@ public class SwapExecutionService : ISwapExecutionService
                 swapRecord.TransactionHash = transactionHash;
                 await _swapRepository.UpdateAsync(swapRecord);
 
+                // The swap will move this wallet's balances; the next check must not reuse the cached ones
+                await _walletService.InvalidateBalanceCacheAsync(walletAddress);
+
                 _logger.LogInformation(
                     "Swap transaction submitted: SwapId={SwapId}, TxHash={TxHash}",
                     swapRecord.Id,
@@ -1,4 +1,5 @@
 using CoinPay.Api.Models;
+using CoinPay.Api.Services.Caching;
 using CoinPay.Api.Services.Swap.OneInch;
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.Logging;
@@ -11,6 +12,7 @@ namespace CoinPay.Api.Services.Swap;
 public class SwapQuoteService : ISwapQuoteService
 {
     private readonly IDexAggregatorService _dexService;
+    private readonly ISwapQuoteCacheService _quoteCache;
     private readonly IFeeCalculationService _feeService;
     private readonly ISlippageToleranceService _slippageService;
     private readonly IConfiguration _configuration;
@@ -20,12 +22,14 @@ public class SwapQuoteService : ISwapQuoteService
 
     public SwapQuoteService(
         IDexAggregatorService dexService,
+        ISwapQuoteCacheService quoteCache,
         IFeeCalculationService feeService,
         ISlippageToleranceService slippageService,
         IConfiguration configuration,
         ILogger<SwapQuoteService> logger)
     {
         _dexService = dexService;
+        _quoteCache = quoteCache;
         _feeService = feeService;
         _slippageService = slippageService;
         _configuration = configuration;
@@ -51,12 +55,17 @@ public class SwapQuoteService : ISwapQuoteService
         // Validate slippage
         _slippageService.ValidateSlippage(slippageTolerance);
 
-        // Get quote from DEX aggregator
-        var dexQuote = await _dexService.GetQuoteAsync(
+        // Get quote from the quote cache, falling back to the DEX aggregator.
+        // DEX quotes don't depend on slippage; it is only applied to the minimum received below.
+        var dexQuote = await _quoteCache.GetOrFetchQuoteAsync(
             fromToken,
             toToken,
             fromAmount,
-            slippageTolerance);
+            () => _dexService.GetQuoteAsync(
+                fromToken,
+                toToken,
+                fromAmount,
+                slippageTolerance));
 
         // Calculate platform fee
         var platformFee = await _feeService.CalculateSwapFeeAsync(
@@ -96,7 +105,7 @@ public class SwapQuoteService : ISwapQuoteService
             PriceImpact = priceImpact,
             SlippageTolerance = slippageTolerance,
             MinimumReceived = minimumReceived,
-            QuoteValidUntil = DateTime.UtcNow.AddSeconds(QuoteTtlSeconds),
+            QuoteValidUntil = dexQuote.QuotedAt.AddSeconds(QuoteTtlSeconds),
             Provider = dexQuote.Provider
         };
 
@@ -1,25 +1,37 @@
 using CoinPay.Api.Models;
+using CoinPay.Api.Services.Blockchain;
+using CoinPay.Api.Services.Swap.OneInch;
 using CoinPay.Api.Services.Wallet;
 using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
 
 namespace CoinPay.Api.Services.Swap;
 
 /// <summary>
-/// Service to validate user has sufficient token balance for swaps
+/// Service to validate user has sufficient token balance for swaps.
+/// Balances come from <see cref="IWalletBalanceCache"/>, which is invalidated when a receipt lands or a
+/// transfer or swap is submitted, so a swap by an active trader usually needs no balance RPC calls.
+/// Tokens the snapshot does not hold are read from the chain directly.
 /// </summary>
 public class TokenBalanceValidationService : ITokenBalanceValidationService
 {
-    private readonly IWalletService _walletService;
+    private readonly IWalletBalanceCache _balanceCache;
+    private readonly IBlockchainRpcService _blockchainRpc;
     private readonly IFeeCalculationService _feeService;
+    private readonly PolygonAmoyRpcOptions _rpcOptions;
     private readonly ILogger<TokenBalanceValidationService> _logger;
 
     public TokenBalanceValidationService(
-        IWalletService walletService,
+        IWalletBalanceCache balanceCache,
+        IBlockchainRpcService blockchainRpc,
         IFeeCalculationService feeService,
+        IOptions<PolygonAmoyRpcOptions> rpcOptions,
         ILogger<TokenBalanceValidationService> logger)
     {
-        _walletService = walletService;
+        _balanceCache = balanceCache;
+        _blockchainRpc = blockchainRpc;
         _feeService = feeService;
+        _rpcOptions = rpcOptions.Value;
         _logger = logger;
     }
 
@@ -36,12 +48,10 @@ public class TokenBalanceValidationService : ITokenBalanceValidationService
             tokenAddress,
             requiredAmount);
 
-        // Get wallet balance
-        var balanceResult = await _walletService.GetWalletBalanceAsync(walletAddress, forceRefresh: true);
+        // Get wallet balance, current as of a recent block
+        var balanceResult = await _balanceCache.GetBalanceAsync(walletAddress);
 
-        // For MVP, we'll use a simplified balance check
-        // In production, this should query actual token balances from Circle or blockchain
-        var currentBalance = GetTokenBalance(balanceResult, tokenAddress);
+        var currentBalance = await GetTokenBalanceAsync(balanceResult, tokenAddress);
 
         // Calculate platform fee
         var platformFee = await _feeService.CalculateSwapFeeAsync(tokenAddress, requiredAmount);
@@ -85,13 +95,23 @@ public class TokenBalanceValidationService : ITokenBalanceValidationService
         return result;
     }
 
-    private decimal GetTokenBalance(object balanceResult, string tokenAddress)
+    private async Task<decimal> GetTokenBalanceAsync(WalletBalanceSnapshot balanceResult, string tokenAddress)
     {
-        // For MVP, return mock balances
-        // In production, parse the actual balance from Circle API response
-        // or query blockchain directly
+        // The snapshot's USDC balance is read from the configured USDC contract
+        if (string.Equals(tokenAddress, _rpcOptions.USDCContract, StringComparison.OrdinalIgnoreCase))
+            return balanceResult.USDCBalance;
 
-        // Mock balances for testing
-        return 1000m; // Assume user has 1000 units of any token
+        if (string.Equals(tokenAddress, TestnetTokens.NATIVE_MATIC, StringComparison.OrdinalIgnoreCase))
+            return balanceResult.NativeBalance;
+
+        if (balanceResult.TokenBalances.TryGetValue(tokenAddress.ToLowerInvariant(), out var tokenBalance))
+            return tokenBalance;
+
+        _logger.LogDebug("Token {Token} is not in the balance snapshot; reading it from the chain", tokenAddress);
+
+        return await _blockchainRpc.GetTokenBalanceAsync(
+            balanceResult.WalletAddress,
+            tokenAddress,
+            TestnetTokens.GetDecimals(tokenAddress));
     }
 }
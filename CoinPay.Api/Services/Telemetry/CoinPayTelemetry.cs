@@ -0,0 +1,108 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+
+namespace CoinPay.Api.Services.Telemetry;
+
+/// <summary>
+/// The API's own ActivitySource and Meter, plus the instruments shared by upstream clients, caches and
+/// background workers. Recording is a no-op until a listener (OpenTelemetry, dotnet-counters) subscribes.
+/// </summary>
+public static class CoinPayTelemetry
+{
+    public const string Name = "CoinPay.Api";
+
+    public static readonly ActivitySource ActivitySource = new(Name);
+
+    private static readonly Meter Meter = new(Name);
+
+    /// <summary>
+    /// Duration of each upstream HTTP attempt, tagged by upstream, operation and outcome
+    /// </summary>
+    public static readonly Histogram<double> UpstreamDuration = Meter.CreateHistogram<double>(
+        "coinpay.upstream.duration", unit: "s", description: "Upstream HTTP attempt duration");
+
+    private static readonly Counter<long> UpstreamRetries = Meter.CreateCounter<long>(
+        "coinpay.upstream.retries", description: "Upstream calls retried by a resilience policy");
+
+    private static readonly Counter<long> UpstreamTimeouts = Meter.CreateCounter<long>(
+        "coinpay.upstream.timeouts", description: "Upstream HTTP attempts that hit the client timeout");
+
+    private static readonly Counter<long> CacheRequests = Meter.CreateCounter<long>(
+        "coinpay.cache.requests", description: "Cache lookups by cache and result");
+
+    private static readonly Histogram<double> WorkerCycleDuration = Meter.CreateHistogram<double>(
+        "coinpay.worker.cycle.duration", unit: "s", description: "Background worker cycle duration");
+
+    private static readonly ConcurrentDictionary<string, long> WorkerBacklogs = new();
+
+    static CoinPayTelemetry()
+    {
+        Meter.CreateObservableGauge(
+            "coinpay.worker.backlog",
+            () => WorkerBacklogs.Select(b => new Measurement<long>(b.Value, new KeyValuePair<string, object?>("worker", b.Key))),
+            description: "Work items found by the worker's last cycle");
+    }
+
+    public static void RecordRetry(string upstream, string operation)
+    {
+        UpstreamRetries.Add(1,
+            new KeyValuePair<string, object?>("upstream", upstream),
+            new KeyValuePair<string, object?>("operation", operation));
+    }
+
+    public static void RecordTimeout(string upstream, string operation)
+    {
+        UpstreamTimeouts.Add(1,
+            new KeyValuePair<string, object?>("upstream", upstream),
+            new KeyValuePair<string, object?>("operation", operation));
+    }
+
+    /// <summary>
+    /// Records a cache lookup; hit ratio is hit / (hit + miss) per cache
+    /// </summary>
+    public static void RecordCacheLookup(string cache, string result)
+    {
+        CacheRequests.Add(1,
+            new KeyValuePair<string, object?>("cache", cache),
+            new KeyValuePair<string, object?>("result", result));
+    }
+
+    public static void SetWorkerBacklog(string worker, long count) => WorkerBacklogs[worker] = count;
+
+    /// <summary>
+    /// Starts timing one worker cycle and opens a span for it. Dispose the result when the cycle ends.
+    /// </summary>
+    public static WorkerCycle StartWorkerCycle(string worker) => new(worker);
+
+    public sealed class WorkerCycle : IDisposable
+    {
+        private readonly string _worker;
+        private readonly long _startedAt = Stopwatch.GetTimestamp();
+        private readonly Activity? _activity;
+        private string _outcome = "success";
+
+        internal WorkerCycle(string worker)
+        {
+            _worker = worker;
+            _activity = ActivitySource.StartActivity($"{worker} cycle");
+            _activity?.SetTag("coinpay.worker", worker);
+        }
+
+        public void Fail(Exception exception)
+        {
+            _outcome = "error";
+            _activity?.SetStatus(ActivityStatusCode.Error, exception.Message);
+        }
+
+        public void Dispose()
+        {
+            WorkerCycleDuration.Record(
+                Stopwatch.GetElapsedTime(_startedAt).TotalSeconds,
+                new KeyValuePair<string, object?>("worker", _worker),
+                new KeyValuePair<string, object?>("outcome", _outcome));
+
+            _activity?.Dispose();
+        }
+    }
+}
@@ -0,0 +1,34 @@
+namespace CoinPay.Api.Services.Telemetry;
+
+/// <summary>
+/// Configuration options for metrics and tracing
+/// </summary>
+public class TelemetryOptions
+{
+    /// <summary>
+    /// Whether the Prometheus scrape endpoint is mapped (default: true)
+    /// </summary>
+    public bool MetricsEnabled { get; set; } = true;
+
+    /// <summary>
+    /// Path of the Prometheus scrape endpoint (default: /metrics)
+    /// </summary>
+    public string MetricsPath { get; set; } = "/metrics";
+
+    /// <summary>
+    /// Local port the scrape endpoint answers on; requests arriving on any other listener get a 404. The host
+    /// must listen on this port (e.g. Kestrel:Endpoints:Metrics:Url) and it must not be published (default: 9464)
+    /// </summary>
+    public int MetricsPort { get; set; } = 9464;
+
+    /// <summary>
+    /// Fraction of new traces that are sampled; requests that arrive with a sampled parent (e.g. from the
+    /// Gateway) follow the parent's decision (default: 0.1)
+    /// </summary>
+    public double TraceSampleRatio { get; set; } = 0.1;
+
+    /// <summary>
+    /// OTLP collector endpoint for traces; traces are not exported when empty (default: empty)
+    /// </summary>
+    public string? OtlpEndpoint { get; set; }
+}
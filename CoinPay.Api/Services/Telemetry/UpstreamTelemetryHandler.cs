@@ -0,0 +1,79 @@
+using System.Diagnostics;
+
+namespace CoinPay.Api.Services.Telemetry;
+
+/// <summary>
+/// Records the duration and outcome of every HTTP attempt made through a named upstream client.
+/// Sits inside the HttpClient, so each retry of a resilience policy is measured on its own.
+/// The operation tag comes from <see cref="OperationOption"/> when the caller sets it, otherwise the HTTP method,
+/// which keeps tag cardinality bounded.
+/// </summary>
+public class UpstreamTelemetryHandler : DelegatingHandler
+{
+    public static readonly HttpRequestOptionsKey<string> OperationOption = new("CoinPay.UpstreamOperation");
+
+    private readonly string _upstream;
+    private readonly TimeSpan _timeout;
+
+    /// <param name="upstream">Upstream name used as the "upstream" tag</param>
+    /// <param name="timeout">The client's timeout; cancellations after this long are counted as timeouts</param>
+    public UpstreamTelemetryHandler(string upstream, TimeSpan timeout)
+    {
+        _upstream = upstream;
+        _timeout = timeout;
+    }
+
+    protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+    {
+        var operation = request.Options.TryGetValue(OperationOption, out var name) ? name : request.Method.Method;
+        var startedAt = Stopwatch.GetTimestamp();
+        var outcome = "error";
+        int? statusCode = null;
+
+        try
+        {
+            var response = await base.SendAsync(request, cancellationToken);
+            statusCode = (int)response.StatusCode;
+            outcome = response.IsSuccessStatusCode ? "success" : "http_error";
+            return response;
+        }
+        catch (OperationCanceledException) when (Stopwatch.GetElapsedTime(startedAt) >= _timeout)
+        {
+            outcome = "timeout";
+            CoinPayTelemetry.RecordTimeout(_upstream, operation);
+            throw;
+        }
+        catch (OperationCanceledException)
+        {
+            outcome = "canceled";
+            throw;
+        }
+        finally
+        {
+            var tags = new TagList
+            {
+                { "upstream", _upstream },
+                { "operation", operation },
+                { "outcome", outcome },
+                { "http.response.status_code", statusCode }
+            };
+
+            CoinPayTelemetry.UpstreamDuration.Record(Stopwatch.GetElapsedTime(startedAt).TotalSeconds, tags);
+        }
+    }
+}
+
+/// <summary>
+/// Extension methods for tagging upstream requests
+/// </summary>
+public static class UpstreamTelemetryExtensions
+{
+    /// <summary>
+    /// Sets the low-cardinality operation name recorded for this request (e.g. "GetWalletTransactionsPage")
+    /// </summary>
+    public static HttpRequestMessage WithUpstreamOperation(this HttpRequestMessage request, string operation)
+    {
+        request.Options.Set(UpstreamTelemetryHandler.OperationOption, operation);
+        return request;
+    }
+}
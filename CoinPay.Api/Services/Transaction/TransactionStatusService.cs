@@ -1,5 +1,4 @@
 using CoinPay.Api.Models;
-using CoinPay.Api.Repositories;
 using CoinPay.Api.Services.Caching;
 using CoinPay.Api.Services.Webhook;
 using CoinPay.Api.Data;
@@ -8,24 +7,23 @@ using Microsoft.EntityFrameworkCore;
 namespace CoinPay.Api.Services.Transaction;
 
 /// <summary>
-/// Service for managing transaction status updates with cache invalidation and events
+/// Service for managing transaction status updates with cache invalidation and events.
+/// Status changes and their webhook outbox rows are written in one SaveChanges, so an event is
+/// queued exactly when the change it describes is committed.
 /// </summary>
 public class TransactionStatusService : ITransactionStatusService
 {
-    private readonly ITransactionRepository _transactionRepository;
     private readonly ICachingService? _cachingService;
     private readonly IWebhookService? _webhookService;
     private readonly AppDbContext _dbContext;
     private readonly ILogger<TransactionStatusService> _logger;
 
     public TransactionStatusService(
-        ITransactionRepository transactionRepository,
         AppDbContext dbContext,
         ILogger<TransactionStatusService> logger,
         ICachingService? cachingService = null,
         IWebhookService? webhookService = null)
     {
-        _transactionRepository = transactionRepository;
         _dbContext = dbContext;
         _cachingService = cachingService;
         _webhookService = webhookService;
@@ -50,22 +48,35 @@ public class TransactionStatusService : ITransactionStatusService
             return;
         }
 
-        // Update status in repository
-        await _transactionRepository.UpdateStatusAsync(transactionId, status, txHash, cancellationToken);
+        var oldStatus = transaction.Status;
 
-        // Invalidate balance cache for affected addresses
-        await InvalidateBalanceCachesAsync(transaction.FromAddress, transaction.ToAddress);
+        transaction.Status = status;
+
+        if (!string.IsNullOrEmpty(txHash))
+        {
+            transaction.TransactionHash = txHash;
+        }
+
+        if (status == TransactionStatus.Confirmed)
+        {
+            transaction.ConfirmedAt = DateTime.UtcNow;
+        }
 
-        // Send webhook notification
+        // Queue webhook notification (saved below with the status change)
         if (_webhookService != null)
         {
             await _webhookService.NotifyTransactionStatusChangeAsync(
                 transaction,
-                transaction.Status == status ? TransactionStatus.Pending : transaction.Status,
+                oldStatus,
                 status,
                 cancellationToken);
         }
 
+        await _dbContext.SaveChangesAsync(cancellationToken);
+
+        // Invalidate balance cache for affected addresses
+        await InvalidateBalanceCachesAsync(transaction.FromAddress, transaction.ToAddress);
+
         _logger.LogInformation("Transaction {TransactionId} status updated successfully", transactionId);
     }
 
@@ -90,23 +101,30 @@ public class TransactionStatusService : ITransactionStatusService
             return;
         }
 
-        // Update with receipt in repository
-        await _transactionRepository.UpdateWithReceiptAsync(transactionId, txHash, blockNumber, gasUsed, cancellationToken);
-
-        // Invalidate balance cache for affected addresses
-        await InvalidateBalanceCachesAsync(transaction.FromAddress, transaction.ToAddress);
+        var oldStatus = transaction.Status;
 
-        _logger.LogInformation("Transaction {TransactionId} updated with receipt successfully", transactionId);
+        transaction.TransactionHash = txHash;
+        transaction.BlockNumber = blockNumber;
+        transaction.GasUsed = gasUsed;
+        transaction.Status = TransactionStatus.Confirmed;
+        transaction.ConfirmedAt = DateTime.UtcNow;
 
-        // Send webhook notification
+        // Queue webhook notification (saved below with the receipt)
         if (_webhookService != null)
         {
             await _webhookService.NotifyTransactionStatusChangeAsync(
                 transaction,
-                TransactionStatus.Pending,
+                oldStatus,
                 TransactionStatus.Confirmed,
                 cancellationToken);
         }
+
+        await _dbContext.SaveChangesAsync(cancellationToken);
+
+        // Invalidate balance cache for affected addresses
+        await InvalidateBalanceCachesAsync(transaction.FromAddress, transaction.ToAddress);
+
+        _logger.LogInformation("Transaction {TransactionId} updated with receipt successfully", transactionId);
     }
 
     public async Task MarkAsFailedAsync(
@@ -0,0 +1,33 @@
+namespace CoinPay.Api.Services.Wallet;
+
+/// <summary>
+/// In-process cache of on-chain wallet balances, tagged with the block they are current as of.
+/// Entries are dropped by events (a receipt recorded for the wallet, a transfer or swap submitted)
+/// rather than by a short TTL, so balance checks can reuse them while the chain has not moved far.
+/// Invalidations reach the other replicas over Redis pub/sub when Redis is configured.
+/// </summary>
+public interface IWalletBalanceCache
+{
+    /// <summary>
+    /// Get the USDC, native and swap token balances of a wallet, serving a cached snapshot when it is recent enough
+    /// </summary>
+    Task<WalletBalanceSnapshot> GetBalanceAsync(string walletAddress, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Drop the cached balance of a wallet on this and every other replica. When the block that changed the
+    /// balance is known, a snapshot already taken at or after that block is kept.
+    /// </summary>
+    void Invalidate(string walletAddress, long? changedInBlock = null);
+}
+
+/// <summary>
+/// Wallet balances read at or after <see cref="BlockNumber"/>.
+/// <see cref="TokenBalances"/> holds the other swap tokens' balances, keyed by lower-case contract address.
+/// </summary>
+public sealed record WalletBalanceSnapshot(
+    string WalletAddress,
+    decimal USDCBalance,
+    decimal NativeBalance,
+    IReadOnlyDictionary<string, decimal> TokenBalances,
+    long BlockNumber,
+    DateTime FetchedAt);
@@ -0,0 +1,180 @@
+using System.Collections.Concurrent;
+using System.Text.Json;
+using CoinPay.Api.Services.Blockchain;
+using CoinPay.Api.Services.Swap.OneInch;
+using CoinPay.Api.Services.Telemetry;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Options;
+using StackExchange.Redis;
+
+namespace CoinPay.Api.Services.Wallet;
+
+/// <summary>
+/// Block-tagged wallet balance cache.
+///
+/// A snapshot is tagged with the latest block number known before its balances were read, so the balances
+/// are current as of at least that block. It is served while it trails the latest block by no more than
+/// <see cref="WalletBalanceCacheOptions.MaxBlockLag"/> and no event has invalidated the wallet since it was read.
+///
+/// Each invalidation bumps the wallet's generation. Snapshots and in-flight fetches carry the generation they
+/// started under, so a read that raced an invalidation is never served afterwards. The USDC, native and swap
+/// token balance calls are issued together and share one JSON-RPC batch; concurrent misses for a wallet share
+/// one fetch.
+///
+/// When Redis is configured, every invalidation is also published on a pub/sub channel and applied by the
+/// other replicas. Pub/sub delivery is best-effort: a replica that misses a message (Redis down, reconnecting)
+/// serves its snapshot until it trails the latest block by more than MaxBlockLag, which stays the staleness bound.
+/// </summary>
+public class WalletBalanceCache : IWalletBalanceCache
+{
+    private readonly IBlockchainRpcService _blockchainRpc;
+    private readonly IMemoryCache _memoryCache;
+    private readonly WalletBalanceCacheOptions _options;
+    private readonly ILogger<WalletBalanceCache> _logger;
+
+    private readonly ConcurrentDictionary<string, long> _generations = new();
+    private readonly ConcurrentDictionary<string, Lazy<Task<WalletBalanceSnapshot>>> _inflightFetches = new();
+    private readonly ISubscriber? _subscriber;
+    private readonly string _nodeId = Guid.NewGuid().ToString("N");
+
+    private const string CacheKeyPrefix = "wallet-balance:";
+    private const string CacheName = "wallet_balance";
+    private static readonly RedisChannel InvalidationChannel = RedisChannel.Literal("coinpay:wallet-balance:invalidate");
+
+    // ERC-20 tokens swaps can start from, besides USDC
+    private static readonly string[] SwapTokens = { TestnetTokens.WETH, TestnetTokens.WMATIC };
+
+    public WalletBalanceCache(
+        IBlockchainRpcService blockchainRpc,
+        IMemoryCache memoryCache,
+        IServiceProvider serviceProvider,
+        IOptions<WalletBalanceCacheOptions> options,
+        ILogger<WalletBalanceCache> logger)
+    {
+        _blockchainRpc = blockchainRpc;
+        _memoryCache = memoryCache;
+        _options = options.Value;
+        _logger = logger;
+
+        // Redis is optional - without it invalidations stay on this replica
+        _subscriber = serviceProvider.GetService<IConnectionMultiplexer>()?.GetSubscriber();
+        _subscriber?.SubscribeAsync(InvalidationChannel, (_, message) => OnInvalidationMessage(message))
+            .ContinueWith(
+                t => _logger.LogWarning(t.Exception, "Subscribing to wallet balance invalidations failed; other replicas' changes are bounded by MaxBlockLag"),
+                TaskContinuationOptions.OnlyOnFaulted);
+    }
+
+    public async Task<WalletBalanceSnapshot> GetBalanceAsync(string walletAddress, CancellationToken cancellationToken = default)
+    {
+        var address = walletAddress.ToLowerInvariant();
+        var generation = GetGeneration(address);
+
+        // Served from the RPC service's short-lived latest-block cache, so this rarely reaches the node
+        var latestBlock = await _blockchainRpc.GetBlockNumberAsync(cancellationToken);
+
+        if (_memoryCache.TryGetValue(CacheKeyPrefix + address, out CachedBalance? cached) &&
+            cached != null &&
+            cached.Generation == generation &&
+            latestBlock - cached.Snapshot.BlockNumber <= _options.MaxBlockLag)
+        {
+            CoinPayTelemetry.RecordCacheLookup(CacheName, "hit");
+            return cached.Snapshot;
+        }
+
+        CoinPayTelemetry.RecordCacheLookup(CacheName, "miss");
+
+        var fetchKey = $"{address}:{generation}";
+        var fetch = _inflightFetches.GetOrAdd(fetchKey, _ => new Lazy<Task<WalletBalanceSnapshot>>(
+            () => FetchAndStoreAsync(address, generation, latestBlock)));
+
+        try
+        {
+            return await fetch.Value.WaitAsync(cancellationToken);
+        }
+        finally
+        {
+            _inflightFetches.TryRemove(new KeyValuePair<string, Lazy<Task<WalletBalanceSnapshot>>>(fetchKey, fetch));
+        }
+    }
+
+    public void Invalidate(string walletAddress, long? changedInBlock = null)
+    {
+        if (string.IsNullOrEmpty(walletAddress))
+            return;
+
+        var address = walletAddress.ToLowerInvariant();
+        InvalidateLocal(address, changedInBlock);
+
+        if (_subscriber != null)
+        {
+            var message = JsonSerializer.Serialize(new InvalidationMessage(_nodeId, address, changedInBlock));
+            _ = _subscriber.PublishAsync(InvalidationChannel, message, CommandFlags.FireAndForget);
+        }
+    }
+
+    private void OnInvalidationMessage(RedisValue message)
+    {
+        try
+        {
+            var invalidation = JsonSerializer.Deserialize<InvalidationMessage>(message.ToString());
+            if (invalidation == null || invalidation.NodeId == _nodeId || string.IsNullOrEmpty(invalidation.WalletAddress))
+                return;
+
+            InvalidateLocal(invalidation.WalletAddress.ToLowerInvariant(), invalidation.ChangedInBlock);
+        }
+        catch (JsonException ex)
+        {
+            _logger.LogWarning(ex, "Ignoring malformed wallet balance invalidation message");
+        }
+    }
+
+    private void InvalidateLocal(string address, long? changedInBlock)
+    {
+        if (changedInBlock != null &&
+            _memoryCache.TryGetValue(CacheKeyPrefix + address, out CachedBalance? cached) &&
+            cached != null &&
+            cached.Snapshot.BlockNumber >= changedInBlock)
+        {
+            // The snapshot was read after the change landed and already reflects it
+            return;
+        }
+
+        _generations.AddOrUpdate(address, 1, (_, generation) => generation + 1);
+        _memoryCache.Remove(CacheKeyPrefix + address);
+
+        _logger.LogDebug("Wallet balance cache invalidated for {WalletAddress} (changed in block {BlockNumber})",
+            address, changedInBlock?.ToString() ?? "unknown");
+    }
+
+    private long GetGeneration(string address) => _generations.TryGetValue(address, out var generation) ? generation : 0;
+
+    private async Task<WalletBalanceSnapshot> FetchAndStoreAsync(string address, long generation, long blockNumber)
+    {
+        // Issued together so all calls join the same JSON-RPC batch
+        var usdcBalance = _blockchainRpc.GetUSDCBalanceAsync(address);
+        var nativeBalance = _blockchainRpc.GetNativeBalanceAsync(address);
+        var tokenBalances = SwapTokens.ToDictionary(
+            token => token.ToLowerInvariant(),
+            token => _blockchainRpc.GetTokenBalanceAsync(address, token, TestnetTokens.GetDecimals(token)));
+        await Task.WhenAll(tokenBalances.Values.Append(usdcBalance).Append(nativeBalance));
+
+        var snapshot = new WalletBalanceSnapshot(
+            address,
+            usdcBalance.Result,
+            nativeBalance.Result,
+            tokenBalances.ToDictionary(t => t.Key, t => t.Value.Result),
+            blockNumber,
+            DateTime.UtcNow);
+
+        _memoryCache.Set(CacheKeyPrefix + address, new CachedBalance(snapshot, generation), _options.EntryLifetime);
+
+        _logger.LogDebug("Wallet balance cached for {WalletAddress} at block {BlockNumber}: {USDCBalance} USDC, {NativeBalance} POL",
+            address, blockNumber, snapshot.USDCBalance, snapshot.NativeBalance);
+
+        return snapshot;
+    }
+
+    private sealed record CachedBalance(WalletBalanceSnapshot Snapshot, long Generation);
+
+    private sealed record InvalidationMessage(string NodeId, string WalletAddress, long? ChangedInBlock);
+}
@@ -0,0 +1,21 @@
+namespace CoinPay.Api.Services.Wallet;
+
+/// <summary>
+/// Configuration for the block-tagged wallet balance cache ("WalletBalanceCache" section)
+/// </summary>
+public class WalletBalanceCacheOptions
+{
+    /// <summary>
+    /// How many blocks a cached balance may trail the latest block and still be served; this bounds staleness
+    /// from transfers the API does not see, such as deposits from outside wallets, and from invalidations
+    /// published by another replica that did not arrive (default: 15, about 30s on Amoy)
+    /// </summary>
+    public int MaxBlockLag { get; set; } = 15;
+
+    /// <summary>
+    /// How long an unused entry is kept in memory (default: 300)
+    /// </summary>
+    public int EntryLifetimeSeconds { get; set; } = 300;
+
+    public TimeSpan EntryLifetime => TimeSpan.FromSeconds(EntryLifetimeSeconds);
+}
@@ -17,6 +17,7 @@ public class WalletService : IWalletService
     private readonly AppDbContext _dbContext;
     private readonly IWalletRepository _walletRepository;
     private readonly ICachingService? _cachingService;
+    private readonly IWalletBalanceCache? _balanceCache;
     private readonly ILogger<WalletService> _logger;
     private const int CacheTTLSeconds = 30;
 
@@ -27,7 +28,8 @@ public class WalletService : IWalletService
         IWalletRepository walletRepository,
         ILogger<WalletService> logger,
         ICachingService? cachingService = null,
-        IDirectTransferService? directTransferService = null)
+        IDirectTransferService? directTransferService = null,
+        IWalletBalanceCache? balanceCache = null)
     {
         _circleService = circleService;
         _blockchainRpc = blockchainRpc;
@@ -35,6 +37,7 @@ public class WalletService : IWalletService
         _walletRepository = walletRepository;
         _cachingService = cachingService;
         _directTransferService = directTransferService;
+        _balanceCache = balanceCache;
         _logger = logger;
     }
 
@@ -200,10 +203,12 @@ public class WalletService : IWalletService
     }
 
     /// <summary>
-    /// Invalidates the balance cache for a wallet address
+    /// Invalidates the balance caches (Redis and the block-tagged balance cache) for a wallet address
     /// </summary>
     public async Task InvalidateBalanceCacheAsync(string walletAddress)
     {
+        _balanceCache?.Invalidate(walletAddress);
+
         if (_cachingService != null)
         {
             var cacheKey = $"wallet:balance:{walletAddress}";
@@ -8,7 +8,9 @@ namespace CoinPay.Api.Services.Webhook;
 public interface IWebhookService
 {
     /// <summary>
-    /// Send webhook notification for transaction status change
+    /// Queue webhook notifications for a transaction status change.
+    /// The outbox rows are added to the request's AppDbContext without saving, so the caller's
+    /// SaveChanges commits them atomically with the status change.
     /// </summary>
     Task NotifyTransactionStatusChangeAsync(
         BlockchainTransaction transaction,
@@ -4,44 +4,27 @@ using System.Text.Json;
 using CoinPay.Api.DTOs;
 using CoinPay.Api.Models;
 using CoinPay.Api.Repositories;
-using Polly;
-using Polly.Retry;
 
 namespace CoinPay.Api.Services.Webhook;
 
 /// <summary>
-/// Service for sending webhook notifications with retry logic
+/// Service for raising webhook notifications.
+/// Deliveries are written to the webhook outbox and sent by the background dispatcher
+/// (<see cref="BackgroundWorkers.WebhookDispatcherService"/>), so slow subscribers never
+/// hold up the status change that raised the event. Outbox rows are saved by the caller,
+/// in the same SaveChanges as the status change.
 /// </summary>
 public class WebhookService : IWebhookService
 {
     private readonly IWebhookRepository _webhookRepository;
-    private readonly IHttpClientFactory _httpClientFactory;
     private readonly ILogger<WebhookService> _logger;
-    private readonly AsyncRetryPolicy<HttpResponseMessage> _retryPolicy;
 
     public WebhookService(
         IWebhookRepository webhookRepository,
-        IHttpClientFactory httpClientFactory,
         ILogger<WebhookService> logger)
     {
         _webhookRepository = webhookRepository;
-        _httpClientFactory = httpClientFactory;
         _logger = logger;
-
-        // Configure retry policy: 3 attempts with exponential backoff
-        _retryPolicy = Policy
-            .HandleResult<HttpResponseMessage>(r => !r.IsSuccessStatusCode)
-            .WaitAndRetryAsync(
-                retryCount: 3,
-                sleepDurationProvider: attempt => TimeSpan.FromSeconds(Math.Pow(2, attempt)),
-                onRetry: (outcome, timespan, retryCount, context) =>
-                {
-                    _logger.LogWarning(
-                        "Webhook delivery attempt {RetryCount} failed with status {StatusCode}. Retrying in {Delay}s",
-                        retryCount,
-                        outcome.Result?.StatusCode,
-                        timespan.TotalSeconds);
-                });
     }
 
     public async Task NotifyTransactionStatusChangeAsync(
@@ -86,26 +69,36 @@ public class WebhookService : IWebhookService
             return;
         }
 
-        _logger.LogInformation("Sending {Count} webhook(s) for transaction {Id} event {Event}",
-            relevantWebhooks.Count, transaction.Id, eventName);
+        var now = DateTime.UtcNow;
+        var messages = relevantWebhooks
+            .Select(webhook => new WebhookOutboxMessage
+            {
+                WebhookId = webhook.Id,
+                EventName = eventName,
+                TransactionId = transaction.Id,
+                Payload = JsonSerializer.Serialize(BuildPayload(webhook, transaction, eventName, now)),
+                Status = WebhookDeliveryStatus.Pending,
+                NextAttemptAt = now,
+                CreatedAt = now
+            })
+            .ToList();
 
-        // Send webhooks in parallel
-        var tasks = relevantWebhooks.Select(webhook =>
-            SendWebhookAsync(webhook, transaction, eventName, cancellationToken));
+        _webhookRepository.AddDeliveries(messages);
 
-        await Task.WhenAll(tasks);
+        _logger.LogInformation("Queued {Count} webhook(s) for transaction {Id} event {Event}",
+            messages.Count, transaction.Id, eventName);
     }
 
-    private async Task SendWebhookAsync(
+    private WebhookPayload BuildPayload(
         WebhookRegistration webhook,
         BlockchainTransaction transaction,
         string eventName,
-        CancellationToken cancellationToken)
+        DateTime timestamp)
     {
-        var payload = new WebhookPayload
+        return new WebhookPayload
         {
             Event = eventName,
-            Timestamp = DateTime.UtcNow,
+            Timestamp = timestamp,
             Transaction = new WebhookTransactionData
             {
                 Id = transaction.Id,
@@ -121,73 +114,6 @@ public class WebhookService : IWebhookService
             },
             Signature = GenerateSignature(webhook.Secret, transaction.Id, transaction.UserOpHash, transaction.Status.ToString())
         };
-
-        var client = _httpClientFactory.CreateClient();
-        client.Timeout = TimeSpan.FromSeconds(10);
-
-        int attemptNumber = 0;
-        HttpResponseMessage? response = null;
-        string? errorMessage = null;
-
-        try
-        {
-            // Execute with retry policy
-            response = await _retryPolicy.ExecuteAsync(async (context) =>
-            {
-                attemptNumber = context.Count;
-                var jsonPayload = JsonSerializer.Serialize(payload);
-                var content = new StringContent(jsonPayload, Encoding.UTF8, "application/json");
-
-                _logger.LogDebug("Sending webhook to {Url} (attempt {Attempt})", webhook.Url, attemptNumber);
-
-                return await client.PostAsync(webhook.Url, content, cancellationToken);
-            }, new Context());
-
-            // Log successful delivery
-            await _webhookRepository.LogDeliveryAsync(new WebhookDeliveryLog
-            {
-                WebhookId = webhook.Id,
-                EventName = eventName,
-                TransactionId = transaction.Id,
-                StatusCode = (int)response.StatusCode,
-                Success = response.IsSuccessStatusCode,
-                ResponseBody = await response.Content.ReadAsStringAsync(cancellationToken),
-                AttemptNumber = attemptNumber
-            }, cancellationToken);
-
-            if (response.IsSuccessStatusCode)
-            {
-                _logger.LogInformation(
-                    "Webhook delivered successfully to {Url} for transaction {Id} (attempt {Attempt})",
-                    webhook.Url, transaction.Id, attemptNumber);
-            }
-            else
-            {
-                _logger.LogWarning(
-                    "Webhook delivery failed after {Attempt} attempts to {Url} with status {StatusCode}",
-                    attemptNumber, webhook.Url, response.StatusCode);
-            }
-        }
-        catch (Exception ex)
-        {
-            errorMessage = ex.Message;
-
-            _logger.LogError(ex,
-                "Webhook delivery exception for {Url} after {Attempt} attempts",
-                webhook.Url, attemptNumber);
-
-            // Log failed delivery
-            await _webhookRepository.LogDeliveryAsync(new WebhookDeliveryLog
-            {
-                WebhookId = webhook.Id,
-                EventName = eventName,
-                TransactionId = transaction.Id,
-                StatusCode = response != null ? (int)response.StatusCode : 0,
-                Success = false,
-                ErrorMessage = errorMessage,
-                AttemptNumber = attemptNumber
-            }, cancellationToken);
-        }
     }
 
     public string GenerateSignature(string secret, int transactionId, string userOpHash, string status)
@@ -0,0 +1,62 @@
+using Microsoft.AspNetCore.OutputCaching;
+using Microsoft.Net.Http.Headers;
+
+namespace CoinPay.Gateway.Caching;
+
+/// <summary>
+/// Output cache policy for public, user-independent GET routes (rates, swap quotes).
+/// Unlike the default policy it also caches requests that carry an Authorization header, because the
+/// frontend sends its token on every call; only attach it to routes whose responses do not depend on the caller.
+/// Concurrent misses for the same URL wait for the first backend response instead of all reaching the API.
+/// </summary>
+public sealed class PublicGetCachePolicy : IOutputCachePolicy
+{
+    private readonly TimeSpan _duration;
+
+    public PublicGetCachePolicy(TimeSpan duration)
+    {
+        _duration = duration;
+    }
+
+    ValueTask IOutputCachePolicy.CacheRequestAsync(OutputCacheContext context, CancellationToken cancellation)
+    {
+        var method = context.HttpContext.Request.Method;
+        var cacheable = HttpMethods.IsGet(method) || HttpMethods.IsHead(method);
+
+        context.EnableOutputCaching = true;
+        context.AllowCacheLookup = cacheable;
+        context.AllowCacheStorage = cacheable;
+        context.AllowLocking = true;
+        context.ResponseExpirationTimeSpan = _duration;
+        context.CacheVaryByRules.QueryKeys = "*";
+
+        return ValueTask.CompletedTask;
+    }
+
+    ValueTask IOutputCachePolicy.ServeFromCacheAsync(OutputCacheContext context, CancellationToken cancellation)
+    {
+        return ValueTask.CompletedTask;
+    }
+
+    ValueTask IOutputCachePolicy.ServeResponseAsync(OutputCacheContext context, CancellationToken cancellation)
+    {
+        var response = context.HttpContext.Response;
+
+        // Only successful responses without per-client state are stored
+        if (response.StatusCode != StatusCodes.Status200OK ||
+            response.Headers.ContainsKey(HeaderNames.SetCookie) ||
+            HasCacheControlDirective(response, "no-store") ||
+            HasCacheControlDirective(response, "private"))
+        {
+            context.AllowCacheStorage = false;
+        }
+
+        return ValueTask.CompletedTask;
+    }
+
+    private static bool HasCacheControlDirective(HttpResponse response, string directive)
+    {
+        return response.Headers.CacheControl.Any(value =>
+            value != null && value.Contains(directive, StringComparison.OrdinalIgnoreCase));
+    }
+}
@@ -1,8 +1,76 @@
+using System.IO.Compression;
+using CoinPay.Gateway.Caching;
+using Microsoft.AspNetCore.ResponseCompression;
+using OpenTelemetry.Metrics;
+using OpenTelemetry.Resources;
+using OpenTelemetry.Trace;
+using Yarp.ReverseProxy.Transforms;
+
 var builder = WebApplication.CreateBuilder(args);
 
-// Add YARP
+// Add YARP. Clusters balance across API replicas by least outstanding requests and probe their
+// readiness endpoints; see the ReverseProxy section for per-cluster HTTP/2 and health check settings.
 builder.Services.AddReverseProxy()
-    .LoadFromConfig(builder.Configuration.GetSection("ReverseProxy"));
+    .LoadFromConfig(builder.Configuration.GetSection("ReverseProxy"))
+    .AddTransforms(transforms =>
+    {
+        // The API rate-limits by X-Real-IP; without it every client would share the gateway's address
+        transforms.AddRequestTransform(context =>
+        {
+            var clientIp = context.HttpContext.Connection.RemoteIpAddress?.ToString();
+            context.ProxyRequest.Headers.Remove("X-Real-IP");
+            if (clientIp != null)
+            {
+                context.ProxyRequest.Headers.TryAddWithoutValidation("X-Real-IP", clientIp);
+            }
+            return ValueTask.CompletedTask;
+        });
+    });
+
+// Add output caching; routes opt in through their OutputCachePolicy, one named policy per TTL
+builder.Services.AddOutputCache(options =>
+{
+    foreach (var policy in builder.Configuration.GetSection("OutputCachePolicies").GetChildren())
+    {
+        var duration = TimeSpan.FromSeconds(policy.GetValue("DurationSeconds", 5));
+        options.AddPolicy(policy.Key, new PublicGetCachePolicy(duration));
+    }
+});
+
+// Add response compression (Brotli preferred, gzip fallback)
+builder.Services.AddResponseCompression(options =>
+{
+    options.Providers.Add<BrotliCompressionProvider>();
+    options.Providers.Add<GzipCompressionProvider>();
+});
+builder.Services.Configure<BrotliCompressionProviderOptions>(options => options.Level = CompressionLevel.Fastest);
+builder.Services.Configure<GzipCompressionProviderOptions>(options => options.Level = CompressionLevel.Fastest);
+
+// Add metrics and tracing; the W3C traceparent of each request is forwarded to the API
+var sampleRatio = builder.Configuration.GetValue("Telemetry:TraceSampleRatio", 0.1);
+var otlpEndpoint = builder.Configuration["Telemetry:OtlpEndpoint"];
+var metricsPort = builder.Configuration.GetValue("Telemetry:MetricsPort", 9464);
+builder.Services.AddOpenTelemetry()
+    .ConfigureResource(resource => resource.AddService("CoinPay.Gateway"))
+    .WithMetrics(metrics => metrics
+        .AddAspNetCoreInstrumentation()
+        .AddHttpClientInstrumentation()
+        .AddMeter("System.Runtime")
+        .AddPrometheusExporter())
+    .WithTracing(tracing =>
+    {
+        tracing
+            .SetSampler(new ParentBasedSampler(new TraceIdRatioBasedSampler(sampleRatio)))
+            .AddSource("Yarp.ReverseProxy")
+            .AddAspNetCoreInstrumentation(options =>
+                options.Filter = context => !context.Request.Path.StartsWithSegments("/metrics"))
+            .AddHttpClientInstrumentation();
+
+        if (!string.IsNullOrEmpty(otlpEndpoint))
+        {
+            tracing.AddOtlpExporter(otlp => otlp.Endpoint = new Uri(otlpEndpoint));
+        }
+    });
 
 // Add CORS
 builder.Services.AddCors(options =>
@@ -20,6 +88,10 @@ var app = builder.Build();
 // Use CORS
 app.UseCors("AllowAll");
 
+// Compression wraps the output cache, so cached entries are stored once and compressed per client encoding
+app.UseResponseCompression();
+app.UseOutputCache();
+
 // Welcome page
 app.MapGet("/", () => Results.Json(new
 {
@@ -33,6 +105,10 @@ app.MapGet("/", () => Results.Json(new
     }
 }));
 
+// Prometheus scrape endpoint, served only on the internal metrics listener so it is never proxied or public
+app.UseOpenTelemetryPrometheusScrapingEndpoint(context =>
+    context.Connection.LocalPort == metricsPort && context.Request.Path == "/metrics");
+
 // Map reverse proxy
 app.MapReverseProxy();
 
@@ -0,0 +1,123 @@
+using System.Collections.Concurrent;
+using System.Net;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Nodes;
+
+namespace CoinPay.Api.Tests.Fakes;
+
+/// <summary>
+/// In-process stand-in for an Ethereum JSON-RPC node. Answers single and batch requests from
+/// in-memory state and counts HTTP round trips and calls per method.
+/// </summary>
+public class StubJsonRpcServer : HttpMessageHandler
+{
+    private int _httpRequests;
+
+    public ConcurrentDictionary<string, int> CallsByMethod { get; } = new();
+    public ConcurrentDictionary<string, JsonNode?> Receipts { get; } = new(StringComparer.OrdinalIgnoreCase);
+
+    public long BlockNumber { get; set; } = 0x100;
+    public long GasPriceWei { get; set; } = 30_000_000_000;
+    public long BlockTimestamp { get; set; } = 1_700_000_000;
+    public long BalanceWei { get; set; } = 1_000_000_000_000_000_000;
+    public long Erc20Balance { get; set; } = 25_000_000;
+
+    /// <summary>
+    /// Simulated node latency per HTTP request
+    /// </summary>
+    public TimeSpan Latency { get; set; } = TimeSpan.Zero;
+
+    public int HttpRequests => _httpRequests;
+
+    public int CallCount(string method) => CallsByMethod.TryGetValue(method, out var count) ? count : 0;
+
+    protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+    {
+        Interlocked.Increment(ref _httpRequests);
+
+        if (Latency > TimeSpan.Zero)
+        {
+            await Task.Delay(Latency, cancellationToken);
+        }
+
+        var body = JsonNode.Parse(await request.Content!.ReadAsStringAsync(cancellationToken))!;
+
+        JsonNode response = body is JsonArray batch
+            ? new JsonArray(batch.Select(call => (JsonNode?)Answer(call!)).ToArray())
+            : Answer(body);
+
+        return new HttpResponseMessage(HttpStatusCode.OK)
+        {
+            Content = new StringContent(response.ToJsonString(), Encoding.UTF8, "application/json")
+        };
+    }
+
+    private JsonObject Answer(JsonNode call)
+    {
+        var method = call["method"]!.GetValue<string>();
+        var parameters = call["params"]?.AsArray();
+        CallsByMethod.AddOrUpdate(method, 1, (_, count) => count + 1);
+
+        var response = new JsonObject
+        {
+            ["jsonrpc"] = "2.0",
+            ["id"] = call["id"]!.DeepClone()
+        };
+
+        switch (method)
+        {
+            case "eth_blockNumber":
+                response["result"] = ToHex(BlockNumber);
+                break;
+            case "eth_gasPrice":
+                response["result"] = ToHex(GasPriceWei);
+                break;
+            case "eth_getBalance":
+                response["result"] = ToHex(BalanceWei);
+                break;
+            case "eth_call":
+                response["result"] = "0x" + Erc20Balance.ToString("x").PadLeft(64, '0');
+                break;
+            case "eth_getTransactionReceipt":
+                var hash = parameters![0]!.GetValue<string>();
+                response["result"] = Receipts.TryGetValue(hash, out var receipt) ? receipt?.DeepClone() : null;
+                break;
+            case "eth_getBlockByNumber":
+                response["result"] = new JsonObject
+                {
+                    ["number"] = parameters![0]!.DeepClone(),
+                    ["timestamp"] = ToHex(BlockTimestamp)
+                };
+                break;
+            default:
+                response["error"] = new JsonObject
+                {
+                    ["code"] = -32601,
+                    ["message"] = $"Method {method} not found"
+                };
+                break;
+        }
+
+        return response;
+    }
+
+    /// <summary>
+    /// Adds a mined receipt for the given transaction hash
+    /// </summary>
+    public void AddReceipt(string txHash, long blockNumber, bool success = true)
+    {
+        Receipts[txHash] = new JsonObject
+        {
+            ["transactionHash"] = txHash,
+            ["blockHash"] = "0x" + new string('b', 64),
+            ["blockNumber"] = ToHex(blockNumber),
+            ["from"] = "0x" + new string('1', 40),
+            ["to"] = "0x" + new string('2', 40),
+            ["gasUsed"] = ToHex(21000),
+            ["status"] = success ? "0x1" : "0x0"
+        };
+    }
+
+    private static string ToHex(long value) => "0x" + value.ToString("x");
+}
@@ -0,0 +1,134 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.Services.Circle;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using System.Net;
+using System.Text;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class CircleServiceTests
+{
+    private readonly StubCircleHandler _handler;
+    private readonly CircleService _service;
+
+    public CircleServiceTests()
+    {
+        _handler = new StubCircleHandler();
+
+        var mockHttpClientFactory = new Mock<IHttpClientFactory>();
+        mockHttpClientFactory
+            .Setup(f => f.CreateClient(CircleService.HttpClientName))
+            .Returns(() => new HttpClient(_handler, disposeHandler: false));
+
+        _service = new CircleService(
+            mockHttpClientFactory.Object,
+            Options.Create(new CircleOptions { ApiUrl = "https://circle.test/v1/w3s", ApiKey = "key", AppId = "app" }),
+            new Mock<ILogger<CircleService>>().Object,
+            new Mock<IEntitySecretEncryptionService>().Object);
+    }
+
+    [Fact]
+    public async Task GetTransactionStatusAsync_ShouldDecodeDataEnvelope()
+    {
+        // Arrange
+        _handler.Respond(HttpStatusCode.OK, """
+            {
+              "data": {
+                "id": "tx-1",
+                "state": "CONFIRMED",
+                "txHash": "0xabc",
+                "blockchain": "MATIC-AMOY",
+                "sourceAddress": "0xfrom",
+                "destinationAddress": "0xto",
+                "tokenId": "token-1",
+                "amounts": ["1.5", "2.5"],
+                "createDate": "2025-01-01T10:00:00Z",
+                "updateDate": "2025-01-01T10:05:00Z",
+                "unknownField": { "nested": [1, 2, 3] }
+              }
+            }
+            """);
+
+        // Act
+        var result = await _service.GetTransactionStatusAsync("tx-1");
+
+        // Assert
+        result.TransactionId.Should().Be("tx-1");
+        result.Status.Should().Be("CONFIRMED");
+        result.TxHash.Should().Be("0xabc");
+        result.From.Should().Be("0xfrom");
+        result.To.Should().Be("0xto");
+        result.TokenAddress.Should().Be("token-1");
+        result.Amount.Should().Be("1.5");
+        result.UpdatedAt.Should().Be(new DateTime(2025, 1, 1, 10, 5, 0, DateTimeKind.Utc));
+        _handler.LastRequestUri!.AbsolutePath.Should().Be("/v1/w3s/developer/transactions/tx-1");
+    }
+
+    [Fact]
+    public async Task GetWalletTransactionsPageAsync_ShouldMapTransactionsAndReturnCursor_WhenPageIsFull()
+    {
+        // Arrange
+        _handler.Respond(HttpStatusCode.OK, """
+            {
+              "data": {
+                "transactions": [
+                  { "id": "tx-1", "state": "COMPLETE", "amounts": ["1"] },
+                  { "id": "tx-2", "state": "PENDING", "amounts": [] }
+                ]
+              }
+            }
+            """);
+
+        // Act
+        var page = await _service.GetWalletTransactionsPageAsync("wallet-1", pageAfter: "tx-0", pageSize: 2);
+
+        // Assert
+        page.Transactions.Select(t => t.TransactionId).Should().Equal("tx-1", "tx-2");
+        page.Transactions[0].Amount.Should().Be("1");
+        page.Transactions[1].Amount.Should().BeEmpty();
+        page.NextPageAfter.Should().Be("tx-2");
+        _handler.LastRequestUri!.Query.Should().Contain("pageSize=2").And.Contain("pageAfter=tx-0");
+    }
+
+    [Fact]
+    public async Task GetWalletAsync_ShouldThrowHttpRequestException_WhenCircleReturnsError()
+    {
+        // Arrange
+        _handler.Respond(HttpStatusCode.BadRequest, """{ "code": 2, "message": "Invalid wallet" }""");
+
+        // Act
+        var act = () => _service.GetWalletAsync("missing");
+
+        // Assert
+        var exception = await act.Should().ThrowAsync<HttpRequestException>();
+        exception.Which.StatusCode.Should().Be(HttpStatusCode.BadRequest);
+        exception.Which.Message.Should().Contain("Invalid wallet");
+    }
+
+    private sealed class StubCircleHandler : HttpMessageHandler
+    {
+        private HttpStatusCode _statusCode = HttpStatusCode.OK;
+        private string _body = "{}";
+
+        public Uri? LastRequestUri { get; private set; }
+
+        public void Respond(HttpStatusCode statusCode, string body)
+        {
+            _statusCode = statusCode;
+            _body = body;
+        }
+
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            LastRequestUri = request.RequestUri;
+
+            return Task.FromResult(new HttpResponseMessage(_statusCode)
+            {
+                Content = new StringContent(_body, Encoding.UTF8, "application/json")
+            });
+        }
+    }
+}
@@ -0,0 +1,162 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.Data;
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Api.Services.Circle;
+using CoinPay.Api.Services.Circle.Models;
+using CoinPay.Api.Services.Coordination;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class CircleTransactionMonitoringServiceTests : IDisposable
+{
+    private readonly Mock<ICircleService> _mockCircle = new();
+    private readonly ServiceProvider _serviceProvider;
+    private readonly CircleTransactionMonitoringService _service;
+
+    public CircleTransactionMonitoringServiceTests()
+    {
+        var databaseName = Guid.NewGuid().ToString();
+        var services = new ServiceCollection();
+        services.AddDbContext<AppDbContext>(options => options.UseInMemoryDatabase(databaseName));
+        services.AddSingleton(_mockCircle.Object);
+        _serviceProvider = services.BuildServiceProvider();
+
+        var partitions = new Mock<IWorkPartitionCoordinator>();
+        partitions
+            .Setup(p => p.AcquireAsync(It.IsAny<string>(), It.IsAny<CancellationToken>()))
+            .ReturnsAsync(WorkPartitionAssignment.All(64));
+
+        _service = new CircleTransactionMonitoringService(
+            _serviceProvider,
+            NullLogger<CircleTransactionMonitoringService>.Instance,
+            Options.Create(new CircleMonitoringOptions()),
+            partitions.Object);
+    }
+
+    [Fact]
+    public async Task MonitorPendingCircleTransactionsAsync_ShouldFetchEachWalletOnce_AndFollowPages()
+    {
+        // Arrange
+        var first = await SeedPendingTransactionAsync("tx-1", "wallet-a");
+        var second = await SeedPendingTransactionAsync("tx-2", "wallet-a");
+        var third = await SeedPendingTransactionAsync("tx-3", "wallet-b");
+
+        SetupPage("wallet-a", null, "page-2", Circle("tx-1", "COMPLETE"));
+        SetupPage("wallet-a", "page-2", null, Circle("tx-2", "FAILED"));
+        SetupPage("wallet-b", null, null, Circle("tx-3", "SENT"));
+
+        // Act
+        await _service.MonitorPendingCircleTransactionsAsync(CancellationToken.None);
+
+        // Assert
+        (await FindAsync(first)).Status.Should().Be("Completed");
+        (await FindAsync(second)).Status.Should().Be("Failed");
+
+        var stillPending = await FindAsync(third);
+        stillPending.Status.Should().Be("Pending");
+        stillPending.StatusCheckAttempts.Should().Be(1);
+
+        _mockCircle.Verify(c => c.GetWalletTransactionsPageAsync(
+            "wallet-a", It.IsAny<DateTime?>(), It.IsAny<string?>(), It.IsAny<int>(), It.IsAny<CancellationToken>()),
+            Times.Exactly(2));
+        _mockCircle.Verify(c => c.GetWalletTransactionsPageAsync(
+            "wallet-b", It.IsAny<DateTime?>(), It.IsAny<string?>(), It.IsAny<int>(), It.IsAny<CancellationToken>()),
+            Times.Once);
+    }
+
+    [Fact]
+    public async Task MonitorPendingCircleTransactionsAsync_ShouldStopPaging_OnceAllPendingRowsMatched()
+    {
+        // Arrange
+        var id = await SeedPendingTransactionAsync("tx-1", "wallet-a");
+        SetupPage("wallet-a", null, "page-2", Circle("tx-1", "CONFIRMED"));
+
+        // Act
+        await _service.MonitorPendingCircleTransactionsAsync(CancellationToken.None);
+
+        // Assert
+        (await FindAsync(id)).Status.Should().Be("Completed");
+        _mockCircle.Verify(c => c.GetWalletTransactionsPageAsync(
+            "wallet-a", It.IsAny<DateTime?>(), "page-2", It.IsAny<int>(), It.IsAny<CancellationToken>()),
+            Times.Never);
+    }
+
+    [Fact]
+    public async Task MonitorPendingCircleTransactionsAsync_ShouldSkipRowsWithoutWallet()
+    {
+        // Arrange
+        var id = await SeedPendingTransactionAsync("tx-legacy", null);
+
+        // Act
+        await _service.MonitorPendingCircleTransactionsAsync(CancellationToken.None);
+
+        // Assert
+        var transaction = await FindAsync(id);
+        transaction.Status.Should().Be("Pending");
+        transaction.NextStatusCheckAt.Should().NotBeNull();
+        _mockCircle.Verify(c => c.GetWalletTransactionsPageAsync(
+            It.IsAny<string>(), It.IsAny<DateTime?>(), It.IsAny<string?>(), It.IsAny<int>(), It.IsAny<CancellationToken>()),
+            Times.Never);
+    }
+
+    private void SetupPage(string walletId, string? pageAfter, string? nextPageAfter, params CircleTransactionResponse[] transactions)
+    {
+        _mockCircle
+            .Setup(c => c.GetWalletTransactionsPageAsync(
+                walletId, It.IsAny<DateTime?>(), pageAfter, It.IsAny<int>(), It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new CircleTransactionPage
+            {
+                Transactions = transactions.ToList(),
+                NextPageAfter = nextPageAfter
+            });
+    }
+
+    private static CircleTransactionResponse Circle(string transactionId, string status) => new()
+    {
+        TransactionId = transactionId,
+        Status = status,
+        From = "0xfrom",
+        To = "0xto"
+    };
+
+    private async Task<int> SeedPendingTransactionAsync(string circleTransactionId, string? circleWalletId)
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+        // Silent for longer than the webhook window, so the poller picks it up
+        var transaction = new Transaction
+        {
+            TransactionId = circleTransactionId,
+            Amount = 1.5m,
+            Currency = "POL",
+            Type = "Transfer",
+            Status = "Pending",
+            CircleWalletId = circleWalletId,
+            CreatedAt = DateTime.UtcNow.AddMinutes(-10)
+        };
+
+        db.Transactions.Add(transaction);
+        await db.SaveChangesAsync();
+        return transaction.Id;
+    }
+
+    private async Task<Transaction> FindAsync(int id)
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        return await db.Transactions.SingleAsync(t => t.Id == id);
+    }
+
+    public void Dispose()
+    {
+        _serviceProvider.Dispose();
+    }
+}
@@ -0,0 +1,184 @@
+using Xunit;
+using FluentAssertions;
+using CoinPay.Api.Data;
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Api.Services.Circle;
+using CoinPay.Api.Services.Circle.Models;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class CircleWebhookHandlerTests : IDisposable
+{
+    private readonly ServiceProvider _serviceProvider;
+    private readonly CircleMonitoringOptions _options = new() { SilenceWindowSeconds = 120 };
+    private readonly CircleWebhookHandler _handler;
+
+    public CircleWebhookHandlerTests()
+    {
+        var databaseName = Guid.NewGuid().ToString();
+        var services = new ServiceCollection();
+        services.AddDbContext<AppDbContext>(options => options.UseInMemoryDatabase(databaseName));
+        _serviceProvider = services.BuildServiceProvider();
+
+        _handler = new CircleWebhookHandler(
+            NullLogger<CircleWebhookHandler>.Instance,
+            _serviceProvider,
+            Options.Create(_options));
+    }
+
+    [Fact]
+    public async Task ProcessWebhookAsync_ShouldCompleteTransaction_AndDeferFallbackPoll()
+    {
+        // Arrange
+        var id = await SeedPendingTransactionAsync("circle-tx-1");
+
+        // Act
+        await _handler.ProcessWebhookAsync(CreateNotification("notif-1", "circle-tx-1", "CONFIRMED"));
+
+        // Assert
+        var transaction = await FindAsync(id);
+        transaction.Status.Should().Be("Completed");
+        transaction.CompletedAt.Should().NotBeNull();
+        transaction.LastWebhookAt.Should().NotBeNull();
+        transaction.NextStatusCheckAt.Should().BeCloseTo(
+            transaction.LastWebhookAt!.Value + _options.SilenceWindow, TimeSpan.FromSeconds(1));
+        transaction.StatusCheckAttempts.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task ProcessWebhookAsync_ShouldIgnoreDuplicateNotificationId()
+    {
+        // Arrange
+        var id = await SeedPendingTransactionAsync("circle-tx-2");
+        await _handler.ProcessWebhookAsync(CreateNotification("notif-2", "circle-tx-2", "SENT"));
+
+        // Act - the same notification redelivered with a different payload must not be applied
+        await _handler.ProcessWebhookAsync(CreateNotification("notif-2", "circle-tx-2", "FAILED"));
+
+        // Assert
+        var transaction = await FindAsync(id);
+        transaction.Status.Should().Be("Pending");
+
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        (await db.ProcessedCircleNotifications.CountAsync()).Should().Be(1);
+    }
+
+    [Fact]
+    public async Task ProcessWebhookAsync_ShouldNotRegressFinalStatus()
+    {
+        // Arrange
+        var id = await SeedPendingTransactionAsync("circle-tx-3");
+        await _handler.ProcessWebhookAsync(CreateNotification("notif-3a", "circle-tx-3", "COMPLETE"));
+
+        // Act - a late, out-of-order notification
+        await _handler.ProcessWebhookAsync(CreateNotification("notif-3b", "circle-tx-3", "SENT"));
+
+        // Assert
+        var transaction = await FindAsync(id);
+        transaction.Status.Should().Be("Completed");
+    }
+
+    [Fact]
+    public async Task ProcessWebhookAsync_ShouldKeepPollSchedule_WhenStateIsRepeated()
+    {
+        // Arrange
+        var id = await SeedPendingTransactionAsync("circle-tx-5");
+        await _handler.ProcessWebhookAsync(CreateNotification("notif-5a", "circle-tx-5", "SENT"));
+
+        var dueAt = DateTime.UtcNow.AddMinutes(-1);
+        using (var scope = _serviceProvider.CreateScope())
+        {
+            var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+            var row = await db.Transactions.SingleAsync(t => t.Id == id);
+            row.NextStatusCheckAt = dueAt;
+            row.StatusCheckAttempts = 3;
+            await db.SaveChangesAsync();
+        }
+
+        // Act - a new notification that reports the same state again
+        await _handler.ProcessWebhookAsync(CreateNotification("notif-5b", "circle-tx-5", "SENT"));
+
+        // Assert - the poller still checks the row when it was due
+        var transaction = await FindAsync(id);
+        transaction.CircleState.Should().Be("SENT");
+        transaction.NextStatusCheckAt.Should().Be(dueAt);
+        transaction.StatusCheckAttempts.Should().Be(3);
+    }
+
+    [Fact]
+    public async Task ProcessWebhookAsync_ShouldNotRecordNotification_WhenTransactionUnknown()
+    {
+        // Act
+        await _handler.ProcessWebhookAsync(CreateNotification("notif-4", "unknown-tx", "CONFIRMED"));
+
+        // Assert - left unrecorded so Circle's redelivery can still be applied
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        (await db.ProcessedCircleNotifications.AnyAsync()).Should().BeFalse();
+    }
+
+    [Theory]
+    [InlineData(1, 30)]
+    [InlineData(2, 60)]
+    [InlineData(3, 120)]
+    [InlineData(10, 600)]
+    public void GetPollBackoff_ShouldDoublePerAttempt_UpToMaximum(int attempts, int expectedSeconds)
+    {
+        var options = new CircleMonitoringOptions { InitialBackoffSeconds = 30, MaxBackoffSeconds = 600 };
+
+        options.GetPollBackoff(attempts).Should().Be(TimeSpan.FromSeconds(expectedSeconds));
+    }
+
+    private async Task<int> SeedPendingTransactionAsync(string circleTransactionId)
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+        var transaction = new Transaction
+        {
+            TransactionId = circleTransactionId,
+            Amount = 1.5m,
+            Currency = "POL",
+            Type = "Transfer",
+            Status = "Pending",
+            CircleWalletId = "wallet-1"
+        };
+
+        db.Transactions.Add(transaction);
+        await db.SaveChangesAsync();
+        return transaction.Id;
+    }
+
+    private async Task<Transaction> FindAsync(int id)
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        return await db.Transactions.SingleAsync(t => t.Id == id);
+    }
+
+    private static CircleWebhookNotification CreateNotification(string notificationId, string transactionId, string state)
+    {
+        return new CircleWebhookNotification
+        {
+            NotificationId = notificationId,
+            NotificationType = "transactions.updated",
+            Timestamp = DateTime.UtcNow,
+            Notification = new CircleWebhookData
+            {
+                Id = transactionId,
+                State = state
+            }
+        };
+    }
+
+    public void Dispose()
+    {
+        _serviceProvider.Dispose();
+    }
+}
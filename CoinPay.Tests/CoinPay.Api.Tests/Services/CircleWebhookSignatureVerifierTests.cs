@@ -0,0 +1,98 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using System.Security.Cryptography;
+using System.Text;
+using CoinPay.Api.Services.Circle;
+using CoinPay.Api.Services.Circle.Models;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class CircleWebhookSignatureVerifierTests : IDisposable
+{
+    private const string KeyId = "key-1";
+    private const string Body = """{"notificationId":"notif-1","notificationType":"transactions.updated","notification":{"id":"circle-tx-1","state":"COMPLETE"}}""";
+
+    private readonly ECDsa _signingKey = ECDsa.Create(ECCurve.NamedCurves.nistP256);
+    private readonly Mock<ICircleService> _mockCircle = new();
+    private readonly MemoryCache _memoryCache = new(new MemoryCacheOptions());
+    private readonly CircleWebhookSignatureVerifier _verifier;
+
+    public CircleWebhookSignatureVerifierTests()
+    {
+        _mockCircle
+            .Setup(c => c.GetNotificationPublicKeyAsync(KeyId, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new CircleNotificationPublicKey
+            {
+                Id = KeyId,
+                Algorithm = "ECDSA_SHA_256",
+                PublicKey = Convert.ToBase64String(_signingKey.ExportSubjectPublicKeyInfo())
+            });
+
+        _verifier = new CircleWebhookSignatureVerifier(
+            _mockCircle.Object,
+            _memoryCache,
+            NullLogger<CircleWebhookSignatureVerifier>.Instance);
+    }
+
+    [Fact]
+    public async Task VerifyAsync_ShouldAcceptBodySignedByCircleKey()
+    {
+        // Act
+        var valid = await _verifier.VerifyAsync(KeyId, Sign(Body), Encoding.UTF8.GetBytes(Body));
+
+        // Assert
+        valid.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task VerifyAsync_ShouldRejectTamperedBody()
+    {
+        // Arrange
+        var signature = Sign(Body);
+        var tampered = Body.Replace("COMPLETE", "FAILED");
+
+        // Act
+        var valid = await _verifier.VerifyAsync(KeyId, signature, Encoding.UTF8.GetBytes(tampered));
+
+        // Assert
+        valid.Should().BeFalse();
+    }
+
+    [Theory]
+    [InlineData(null, "c2ln")]
+    [InlineData(KeyId, null)]
+    [InlineData(KeyId, "not base64!")]
+    [InlineData("unknown-key", "c2ln")]
+    public async Task VerifyAsync_ShouldRejectMissingOrUnusableSignature(string? keyId, string? signature)
+    {
+        // Act
+        var valid = await _verifier.VerifyAsync(keyId, signature, Encoding.UTF8.GetBytes(Body));
+
+        // Assert
+        valid.Should().BeFalse();
+    }
+
+    [Fact]
+    public async Task VerifyAsync_ShouldFetchEachPublicKeyOnce()
+    {
+        // Act
+        await _verifier.VerifyAsync(KeyId, Sign(Body), Encoding.UTF8.GetBytes(Body));
+        await _verifier.VerifyAsync(KeyId, Sign(Body), Encoding.UTF8.GetBytes(Body));
+
+        // Assert
+        _mockCircle.Verify(c => c.GetNotificationPublicKeyAsync(KeyId, It.IsAny<CancellationToken>()), Times.Once);
+    }
+
+    private string Sign(string body) =>
+        Convert.ToBase64String(_signingKey.SignData(
+            Encoding.UTF8.GetBytes(body), HashAlgorithmName.SHA256, DSASignatureFormat.Rfc3279DerSequence));
+
+    public void Dispose()
+    {
+        _signingKey.Dispose();
+        _memoryCache.Dispose();
+    }
+}
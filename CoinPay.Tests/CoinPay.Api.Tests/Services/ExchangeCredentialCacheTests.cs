@@ -0,0 +1,116 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Api.Services.Encryption;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class ExchangeCredentialCacheTests : IDisposable
+{
+    private readonly Mock<IExchangeCredentialEncryptionService> _mockEncryption;
+    private readonly ExchangeCredentialCache _cache;
+
+    public ExchangeCredentialCacheTests()
+    {
+        _mockEncryption = new Mock<IExchangeCredentialEncryptionService>();
+        _mockEncryption
+            .Setup(e => e.DecryptAsync(It.IsAny<string>(), It.IsAny<Guid>()))
+            .ReturnsAsync((string ciphertext, Guid _) => $"plain-{ciphertext}");
+
+        _cache = new ExchangeCredentialCache(
+            _mockEncryption.Object,
+            new Mock<ILogger<ExchangeCredentialCache>>().Object,
+            Options.Create(new InvestmentSyncOptions { CredentialCacheSeconds = 300 }));
+    }
+
+    [Fact]
+    public async Task CanDecryptAsync_ShouldDecryptOnlyOnce_ForRepeatedLookups()
+    {
+        // Arrange
+        var connection = CreateConnection("key-1", "secret-1");
+
+        // Act
+        var first = await _cache.CanDecryptAsync(connection);
+        var second = await _cache.CanDecryptAsync(connection);
+
+        // Assert
+        first.Should().BeTrue();
+        second.Should().BeTrue();
+        _mockEncryption.Verify(e => e.DecryptAsync(It.IsAny<string>(), It.IsAny<Guid>()), Times.Exactly(2));
+    }
+
+    [Fact]
+    public async Task CanDecryptAsync_ShouldDecryptAgain_WhenCredentialsRotated()
+    {
+        // Arrange
+        var connection = CreateConnection("key-1", "secret-1");
+        await _cache.CanDecryptAsync(connection);
+
+        connection.ApiKeyEncrypted = "key-2";
+        connection.ApiSecretEncrypted = "secret-2";
+
+        // Act
+        var result = await _cache.CanDecryptAsync(connection);
+
+        // Assert
+        result.Should().BeTrue();
+        _mockEncryption.Verify(e => e.DecryptAsync("key-2", connection.UserId), Times.Once);
+        _mockEncryption.Verify(e => e.DecryptAsync(It.IsAny<string>(), It.IsAny<Guid>()), Times.Exactly(4));
+    }
+
+    [Fact]
+    public async Task CanDecryptAsync_ShouldReturnFalse_AndRetry_WhenDecryptionFails()
+    {
+        // Arrange
+        var connection = CreateConnection("broken-key", "secret-1");
+        _mockEncryption
+            .Setup(e => e.DecryptAsync("broken-key", It.IsAny<Guid>()))
+            .ThrowsAsync(new System.Security.Cryptography.CryptographicException("bad key"));
+
+        // Act
+        var first = await _cache.CanDecryptAsync(connection);
+        var second = await _cache.CanDecryptAsync(connection);
+
+        // Assert
+        first.Should().BeFalse();
+        second.Should().BeFalse();
+        _mockEncryption.Verify(e => e.DecryptAsync("broken-key", It.IsAny<Guid>()), Times.Exactly(2));
+    }
+
+    [Fact]
+    public async Task Invalidate_ShouldForceDecryptionOnNextLookup()
+    {
+        // Arrange
+        var connection = CreateConnection("key-1", "secret-1");
+        await _cache.CanDecryptAsync(connection);
+
+        // Act
+        _cache.Invalidate(connection.Id);
+        var result = await _cache.CanDecryptAsync(connection);
+
+        // Assert
+        result.Should().BeTrue();
+        _mockEncryption.Verify(e => e.DecryptAsync(It.IsAny<string>(), It.IsAny<Guid>()), Times.Exactly(4));
+    }
+
+    private static ExchangeConnection CreateConnection(string apiKeyEncrypted, string apiSecretEncrypted)
+    {
+        return new ExchangeConnection
+        {
+            Id = Guid.NewGuid(),
+            UserId = Guid.NewGuid(),
+            ExchangeName = "whitebit",
+            ApiKeyEncrypted = apiKeyEncrypted,
+            ApiSecretEncrypted = apiSecretEncrypted
+        };
+    }
+
+    public void Dispose()
+    {
+        _cache.Dispose();
+    }
+}
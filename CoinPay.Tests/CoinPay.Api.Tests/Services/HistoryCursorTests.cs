@@ -0,0 +1,69 @@
+using Xunit;
+using FluentAssertions;
+using System.Text;
+using CoinPay.Api.Repositories;
+using Microsoft.AspNetCore.WebUtilities;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class HistoryCursorTests
+{
+    [Theory]
+    [InlineData("42")]
+    [InlineData("6f9619ff-8b86-d011-b42d-00cf4fc964ff")]
+    [InlineData("id:with:colons")]
+    public void Encode_ShouldRoundTripThroughTryParse(string id)
+    {
+        // Arrange
+        var cursor = new HistoryCursor(new DateTime(2025, 11, 18, 12, 30, 15, 123, DateTimeKind.Utc).AddTicks(4567), id);
+
+        // Act
+        var parsed = HistoryCursor.TryParse(cursor.Encode(), out var decoded);
+
+        // Assert
+        parsed.Should().BeTrue();
+        decoded.Should().Be(cursor);
+        decoded.CreatedAt.Kind.Should().Be(DateTimeKind.Utc);
+    }
+
+    [Fact]
+    public void Encode_ShouldProduceUrlSafeToken()
+    {
+        // Act
+        var token = new HistoryCursor(DateTime.UtcNow, "?/+=").Encode();
+
+        // Assert
+        token.Should().MatchRegex("^[A-Za-z0-9_-]+$");
+    }
+
+    [Theory]
+    [InlineData(null)]
+    [InlineData("")]
+    [InlineData("   ")]
+    [InlineData("not a cursor!")]
+    public void TryParse_ShouldRejectMissingOrMalformedTokens(string? token)
+    {
+        // Act
+        var parsed = HistoryCursor.TryParse(token, out var cursor);
+
+        // Assert
+        parsed.Should().BeFalse();
+        cursor.Should().Be(default(HistoryCursor));
+    }
+
+    [Theory]
+    [InlineData("no-separator")]
+    [InlineData(":42")]
+    [InlineData("-5:42")]
+    [InlineData("abc:42")]
+    [InlineData("99999999999999999999:42")]
+    [InlineData("3155378976000000000:42")]
+    public void TryParse_ShouldRejectTokensWithInvalidPayload(string raw)
+    {
+        // Arrange
+        var token = WebEncoders.Base64UrlEncode(Encoding.UTF8.GetBytes(raw));
+
+        // Act & Assert
+        HistoryCursor.TryParse(token, out _).Should().BeFalse();
+    }
+}
@@ -0,0 +1,100 @@
+using Xunit;
+using FluentAssertions;
+using CoinPay.Api.Data;
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Api.Services.Payout;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class PayoutAuditServiceTests : IDisposable
+{
+    private readonly ServiceProvider _serviceProvider;
+    private readonly PayoutAuditOptions _options = new() { BatchSize = 2, FlushIntervalMilliseconds = 10 };
+
+    public PayoutAuditServiceTests()
+    {
+        var databaseName = Guid.NewGuid().ToString();
+        var services = new ServiceCollection();
+        services.AddDbContext<AppDbContext>(options => options.UseInMemoryDatabase(databaseName));
+        _serviceProvider = services.BuildServiceProvider();
+    }
+
+    [Fact]
+    public async Task GetAuditTrailAsync_ShouldReturnPersistedEntriesInOrder_AfterWriterDrainsQueue()
+    {
+        // Arrange
+        var queue = new PayoutAuditQueue(Options.Create(_options));
+        var service = CreateService(queue);
+        var writer = new PayoutAuditWriterService(
+            _serviceProvider,
+            queue,
+            NullLogger<PayoutAuditWriterService>.Instance,
+            Options.Create(_options));
+
+        var payoutId = Guid.NewGuid();
+        var otherPayoutId = Guid.NewGuid();
+
+        // Act
+        await service.LogPayoutInitiatedAsync(payoutId, 7, 100m, Guid.NewGuid());
+        await service.LogStatusChangeAsync(payoutId, "pending", "processing", "gateway accepted");
+        await service.LogPayoutCancelledAsync(otherPayoutId, 8);
+        await service.LogPayoutFailedAsync(payoutId, "Bank rejected the transfer because the account is closed");
+
+        await writer.StartAsync(CancellationToken.None);
+        await writer.StopAsync(CancellationToken.None);
+
+        var trail = await service.GetAuditTrailAsync(payoutId);
+
+        // Assert
+        trail.Select(e => e.EventType).Should().Equal("PAYOUT_INITIATED", "STATUS_CHANGED", "PAYOUT_FAILED");
+        trail[0].UserId.Should().Be(7);
+        trail[0].Description.Should().Be("Payout initiated by user 7");
+        trail[1].PreviousValue.Should().Be("pending");
+        trail[1].NewValue.Should().Be("processing");
+        trail[1].Metadata.Should().Contain("gateway accepted");
+        trail[2].NewValue.Should().Be("Bank rejected the transfer because the account is closed");
+
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        var failedRow = await db.PayoutAuditLogs.SingleAsync(a => a.EventType == "PAYOUT_FAILED");
+        failedRow.NewStatus.Should().BeNull("only status changes use the status columns");
+        (await db.PayoutAuditLogs.CountAsync()).Should().Be(4);
+    }
+
+    [Fact]
+    public async Task LogStatusChangeAsync_ShouldNotBlock_WhenQueueIsFull()
+    {
+        // Arrange
+        var queue = new PayoutAuditQueue(Options.Create(new PayoutAuditOptions { QueueCapacity = 1 }));
+        var service = CreateService(queue);
+        var payoutId = Guid.NewGuid();
+
+        // Act
+        var act = async () =>
+        {
+            await service.LogStatusChangeAsync(payoutId, "pending", "processing");
+            await service.LogStatusChangeAsync(payoutId, "processing", "completed");
+        };
+
+        // Assert
+        await act.Should().CompleteWithinAsync(TimeSpan.FromSeconds(1));
+        queue.Reader.Count.Should().Be(1);
+    }
+
+    private PayoutAuditService CreateService(PayoutAuditQueue queue)
+    {
+        return new PayoutAuditService(
+            queue,
+            _serviceProvider.GetRequiredService<IServiceScopeFactory>(),
+            NullLogger<PayoutAuditService>.Instance);
+    }
+
+    public void Dispose()
+    {
+        _serviceProvider.Dispose();
+    }
+}
@@ -0,0 +1,169 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.Services.Blockchain;
+using CoinPay.Api.Tests.Fakes;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class PolygonAmoyRpcServiceTests : IDisposable
+{
+    private readonly StubJsonRpcServer _rpcServer;
+    private readonly MemoryCache _memoryCache;
+    private readonly PolygonAmoyRpcService _rpcService;
+
+    public PolygonAmoyRpcServiceTests()
+    {
+        _rpcServer = new StubJsonRpcServer { Latency = TimeSpan.FromMilliseconds(20) };
+
+        var mockHttpClientFactory = new Mock<IHttpClientFactory>();
+        mockHttpClientFactory
+            .Setup(f => f.CreateClient(JsonRpcBatchClient.HttpClientName))
+            .Returns(() => new HttpClient(_rpcServer, disposeHandler: false));
+
+        var options = Options.Create(new PolygonAmoyRpcOptions
+        {
+            RpcUrl = "http://localhost:8545",
+            BatchWindowMilliseconds = 20,
+            MaxBatchSize = 50
+        });
+
+        var rpcClient = new JsonRpcBatchClient(
+            mockHttpClientFactory.Object,
+            options,
+            new Mock<ILogger<JsonRpcBatchClient>>().Object);
+
+        _memoryCache = new MemoryCache(new MemoryCacheOptions());
+        _rpcService = new PolygonAmoyRpcService(
+            rpcClient,
+            _memoryCache,
+            new Mock<ILogger<PolygonAmoyRpcService>>().Object,
+            options);
+    }
+
+    [Fact]
+    public async Task GetBalances_ShouldShareOneBatchRequest_ForConcurrentCalls()
+    {
+        // Arrange
+        var addresses = Enumerable.Range(1, 10)
+            .Select(i => "0x" + i.ToString("x").PadLeft(40, '0'))
+            .ToList();
+
+        // Act
+        var usdcTask = Task.WhenAll(addresses.Select(a => _rpcService.GetUSDCBalanceAsync(a)));
+        var nativeTask = Task.WhenAll(addresses.Select(a => _rpcService.GetNativeBalanceAsync(a)));
+        var usdcBalances = await usdcTask;
+        var nativeBalances = await nativeTask;
+
+        // Assert
+        usdcBalances.Should().OnlyContain(b => b == 25m);
+        nativeBalances.Should().OnlyContain(b => b == 1m);
+        _rpcServer.HttpRequests.Should().Be(1);
+        _rpcServer.CallCount("eth_call").Should().Be(10);
+        _rpcServer.CallCount("eth_getBalance").Should().Be(10);
+    }
+
+    [Fact]
+    public async Task GetBalances_ShouldSplitIntoBatches_WhenMaxBatchSizeReached()
+    {
+        // Arrange
+        var addresses = Enumerable.Range(1, 120)
+            .Select(i => "0x" + i.ToString("x").PadLeft(40, '0'))
+            .ToList();
+
+        // Act
+        await Task.WhenAll(addresses.Select(a => _rpcService.GetNativeBalanceAsync(a)));
+
+        // Assert
+        _rpcServer.HttpRequests.Should().Be(3);
+        _rpcServer.CallCount("eth_getBalance").Should().Be(120);
+    }
+
+    [Fact]
+    public async Task GetTransactionReceiptAsync_ShouldDedupeInFlightLookups()
+    {
+        // Arrange
+        var txHash = "0x" + new string('a', 64);
+        _rpcServer.AddReceipt(txHash, blockNumber: 0x80);
+
+        // Act
+        var receipts = await Task.WhenAll(Enumerable.Range(0, 25)
+            .Select(_ => _rpcService.GetTransactionReceiptAsync(txHash)));
+
+        // Assert
+        receipts.Should().OnlyContain(r => r != null && r.BlockNumber == 0x80 && r.Status == "success");
+        receipts[0]!.Timestamp.Should().Be(DateTimeOffset.FromUnixTimeSeconds(_rpcServer.BlockTimestamp).UtcDateTime);
+        _rpcServer.CallCount("eth_getTransactionReceipt").Should().Be(1);
+        _rpcServer.CallCount("eth_getBlockByNumber").Should().Be(1);
+    }
+
+    [Fact]
+    public async Task GetTransactionReceiptAsync_ShouldQueryAgain_WhenReceiptWasPending()
+    {
+        // Arrange
+        var txHash = "0x" + new string('c', 64);
+
+        // Act
+        var pending = await _rpcService.GetTransactionReceiptAsync(txHash);
+        _rpcServer.AddReceipt(txHash, blockNumber: 0x90, success: false);
+        var mined = await _rpcService.GetTransactionReceiptAsync(txHash);
+
+        // Assert
+        pending.Should().BeNull();
+        mined.Should().NotBeNull();
+        mined!.Status.Should().Be("failed");
+        _rpcServer.CallCount("eth_getTransactionReceipt").Should().Be(2);
+    }
+
+    [Fact]
+    public async Task GetGasPriceAsync_ShouldFetchOncePerBlock()
+    {
+        // Act
+        var first = await _rpcService.GetGasPriceAsync();
+        var second = await _rpcService.GetGasPriceAsync();
+
+        // Assert
+        first.Should().Be(30m);
+        second.Should().Be(30m);
+        _rpcServer.CallCount("eth_blockNumber").Should().Be(1);
+        _rpcServer.CallCount("eth_gasPrice").Should().Be(1);
+    }
+
+    [Fact]
+    public async Task GetBlockNumberAsync_ShouldShareOneCall_ForConcurrentCallers()
+    {
+        // Act
+        var blockNumbers = await Task.WhenAll(Enumerable.Range(0, 20)
+            .Select(_ => _rpcService.GetBlockNumberAsync()));
+
+        // Assert
+        blockNumbers.Should().OnlyContain(n => n == 0x100);
+        _rpcServer.CallCount("eth_blockNumber").Should().Be(1);
+    }
+
+    [Fact]
+    public async Task SendAsync_ShouldThrowJsonRpcException_ForNodeErrors()
+    {
+        // Arrange
+        var client = new JsonRpcBatchClient(
+            Mock.Of<IHttpClientFactory>(f => f.CreateClient(JsonRpcBatchClient.HttpClientName) == new HttpClient(_rpcServer, false)),
+            Options.Create(new PolygonAmoyRpcOptions { RpcUrl = "http://localhost:8545" }),
+            new Mock<ILogger<JsonRpcBatchClient>>().Object);
+
+        // Act
+        var act = () => client.SendAsync("eth_unknownMethod", Array.Empty<object>());
+
+        // Assert
+        var exception = await act.Should().ThrowAsync<JsonRpcException>();
+        exception.Which.Code.Should().Be(-32601);
+    }
+
+    public void Dispose()
+    {
+        _memoryCache.Dispose();
+        _rpcServer.Dispose();
+    }
+}
@@ -0,0 +1,100 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.Services.ExchangeRate;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class RateCacheTests : IDisposable
+{
+    private readonly Mock<IRateSource> _mockSource;
+    private readonly MemoryCache _memoryCache;
+    private readonly ServiceProvider _serviceProvider;
+    private readonly RateCache _rateCache;
+    private int _upstreamCalls;
+
+    public RateCacheTests()
+    {
+        _mockSource = new Mock<IRateSource>();
+        _mockSource
+            .Setup(s => s.FetchRateAsync(It.IsAny<string>(), It.IsAny<string>(), It.IsAny<CancellationToken>()))
+            .Returns(async (string baseCurrency, string quoteCurrency, CancellationToken _) =>
+            {
+                Interlocked.Increment(ref _upstreamCalls);
+                await Task.Delay(50);
+                return new ExchangeRateInfo
+                {
+                    Rate = 0.9998m,
+                    BaseCurrency = baseCurrency,
+                    QuoteCurrency = quoteCurrency,
+                    Timestamp = DateTime.UtcNow,
+                    ValidForSeconds = 30,
+                    Source = "Mock"
+                };
+            });
+
+        var services = new ServiceCollection();
+        services.AddScoped(_ => _mockSource.Object);
+        _serviceProvider = services.BuildServiceProvider();
+
+        _memoryCache = new MemoryCache(new MemoryCacheOptions());
+        _rateCache = new RateCache(
+            _memoryCache,
+            _serviceProvider.GetRequiredService<IServiceScopeFactory>(),
+            _serviceProvider,
+            Options.Create(new ExchangeRateOptions()),
+            new Mock<ILogger<RateCache>>().Object);
+    }
+
+    [Fact]
+    public async Task GetRateAsync_ShouldCallSourceOnce_ForConcurrentMisses()
+    {
+        // Act
+        var rates = await Task.WhenAll(Enumerable.Range(0, 20)
+            .Select(_ => _rateCache.GetRateAsync("USDC", "USD")));
+
+        // Assert
+        rates.Should().OnlyContain(r => r.Rate == 0.9998m);
+        _upstreamCalls.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task GetRateAsync_ShouldServeFromCache_AfterFirstFetch()
+    {
+        // Arrange
+        var first = await _rateCache.GetRateAsync("USDC", "USD");
+
+        // Act
+        var second = await _rateCache.GetRateAsync("usdc", "usd");
+
+        // Assert
+        first.IsCached.Should().BeFalse();
+        second.IsCached.Should().BeTrue();
+        second.Timestamp.Should().Be(first.Timestamp);
+        _upstreamCalls.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task RefreshRateAsync_ShouldAlwaysCallSource()
+    {
+        // Arrange
+        await _rateCache.GetRateAsync("USDC", "USD");
+
+        // Act
+        var refreshed = await _rateCache.RefreshRateAsync("USDC", "USD");
+
+        // Assert
+        refreshed.IsCached.Should().BeFalse();
+        _upstreamCalls.Should().Be(2);
+    }
+
+    public void Dispose()
+    {
+        _memoryCache.Dispose();
+        _serviceProvider.Dispose();
+    }
+}
@@ -0,0 +1,109 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Api.Services.Investment;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class RewardCalculationServiceTests : IDisposable
+{
+    private static readonly DateTime Now = new(2025, 11, 17, 12, 0, 0, DateTimeKind.Utc);
+
+    private readonly MemoryCache _memoryCache;
+    private readonly RewardCalculationService _service;
+
+    public RewardCalculationServiceTests()
+    {
+        _memoryCache = new MemoryCache(new MemoryCacheOptions());
+        _service = new RewardCalculationService(
+            new Mock<ILogger<RewardCalculationService>>().Object,
+            _memoryCache,
+            Options.Create(new InvestmentSyncOptions()));
+    }
+
+    [Fact]
+    public void CalculatePortfolio_ShouldMatchSinglePositionCalculations()
+    {
+        // Arrange
+        var positions = new[]
+        {
+            CreatePosition(500m, 8.5m, Now.AddDays(-12.25)),
+            CreatePosition(1234.56789m, 8.5m, Now.AddDays(-400)),
+            CreatePosition(75m, 4.25m, Now.AddHours(-5))
+        };
+
+        // Act
+        var snapshots = _service.CalculatePortfolio(positions, Now);
+
+        // Assert
+        snapshots.Should().HaveCount(3);
+        foreach (var position in positions)
+        {
+            var snapshot = snapshots[position.Id];
+            var accrued = _service.CalculateAccruedReward(position.PrincipalAmount, position.Apy, position.StartDate!.Value, Now);
+
+            snapshot.AccruedRewards.Should().Be(accrued);
+            snapshot.CurrentValue.Should().Be(_service.CalculateCurrentValue(position.PrincipalAmount, accrued));
+            snapshot.DailyReward.Should().Be(_service.CalculateDailyReward(position.PrincipalAmount, position.Apy));
+            snapshot.DaysHeld.Should().Be(_service.CalculateDaysHeld(position.StartDate!.Value, Now));
+
+            foreach (var days in RewardCalculationService.ProjectionHorizons)
+            {
+                snapshot.GetProjectedReward(days)
+                    .Should().Be(_service.CalculateProjectedReward(position.PrincipalAmount, position.Apy, days));
+            }
+        }
+    }
+
+    [Fact]
+    public void CalculatePortfolio_ShouldSkipInvalidPositions()
+    {
+        // Arrange
+        var valid = CreatePosition(500m, 8.5m, Now.AddDays(-1));
+        var zeroPrincipal = CreatePosition(0m, 8.5m, Now.AddDays(-1));
+        var futureStart = CreatePosition(500m, 8.5m, Now.AddDays(1));
+
+        // Act
+        var snapshots = _service.CalculatePortfolio(new[] { valid, zeroPrincipal, futureStart }, Now);
+
+        // Assert
+        snapshots.Keys.Should().BeEquivalentTo(new[] { valid.Id });
+    }
+
+    [Fact]
+    public void GetPortfolioRewards_ShouldReuseSnapshot_UntilPositionIsSynced()
+    {
+        // Arrange
+        var position = CreatePosition(500m, 8.5m, DateTime.UtcNow.AddDays(-3));
+
+        // Act
+        var first = _service.GetPortfolioRewards(new[] { position })[position.Id];
+        var second = _service.GetPortfolioRewards(new[] { position })[position.Id];
+        position.LastSyncedAt = DateTime.UtcNow.AddSeconds(1);
+        var afterSync = _service.GetPortfolioRewards(new[] { position })[position.Id];
+
+        // Assert
+        second.Should().BeSameAs(first);
+        afterSync.Should().NotBeSameAs(first);
+    }
+
+    private static InvestmentPosition CreatePosition(decimal principal, decimal apy, DateTime startDate) => new()
+    {
+        Id = Guid.NewGuid(),
+        PrincipalAmount = principal,
+        Apy = apy,
+        StartDate = startDate,
+        LastSyncedAt = startDate,
+        Status = InvestmentStatus.Active
+    };
+
+    public void Dispose()
+    {
+        _memoryCache.Dispose();
+    }
+}
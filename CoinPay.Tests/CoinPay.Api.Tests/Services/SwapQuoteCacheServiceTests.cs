@@ -0,0 +1,229 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.Caching;
+using CoinPay.Api.Services.Swap;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using StackExchange.Redis;
+using System.Text.Json;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class SwapQuoteCacheServiceTests
+{
+    private const string Usdc = "0xUSDC";
+    private const string Weth = "0xWETH";
+
+    private readonly Mock<IDatabase> _mockRedis;
+    private readonly Mock<IServiceProvider> _mockServiceProvider;
+    private readonly Mock<IDexAggregatorService> _mockAggregator;
+    private readonly ServiceProvider _scopeProvider;
+    private int _fetchCount;
+
+    public SwapQuoteCacheServiceTests()
+    {
+        _mockRedis = new Mock<IDatabase>();
+        _mockRedis
+            .Setup(r => r.HashGetAllAsync(It.IsAny<RedisKey>(), It.IsAny<CommandFlags>()))
+            .ReturnsAsync(Array.Empty<HashEntry>());
+
+        var mockMultiplexer = new Mock<IConnectionMultiplexer>();
+        mockMultiplexer
+            .Setup(m => m.GetDatabase(It.IsAny<int>(), It.IsAny<object>()))
+            .Returns(_mockRedis.Object);
+
+        _mockServiceProvider = new Mock<IServiceProvider>();
+        _mockServiceProvider
+            .Setup(s => s.GetService(typeof(IConnectionMultiplexer)))
+            .Returns(mockMultiplexer.Object);
+
+        // Background samples resolve the aggregator from their own scope
+        _mockAggregator = new Mock<IDexAggregatorService>();
+        var services = new ServiceCollection();
+        services.AddScoped(_ => _mockAggregator.Object);
+        _scopeProvider = services.BuildServiceProvider();
+    }
+
+    [Fact]
+    public async Task GetOrFetchQuoteAsync_ShouldFetchOnce_ForConcurrentIdenticalMisses()
+    {
+        // Arrange
+        var service = CreateService();
+
+        // Act
+        var quotes = await Task.WhenAll(Enumerable.Range(0, 10)
+            .Select(_ => service.GetOrFetchQuoteAsync(Usdc, Weth, 100m, () => FetchAsync(100m, 0.0005m))));
+
+        // Assert
+        quotes.Should().OnlyContain(q => q.ToTokenAmount == 0.05m);
+        _fetchCount.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task GetOrFetchQuoteAsync_ShouldInterpolate_WhenNeighbourRatesAreWithinTolerance()
+    {
+        // Arrange
+        SetupBucket(CreateQuote(100m, 0.000500m), CreateQuote(120m, 0.000500m * 1.0008m));
+        var service = CreateService();
+
+        // Act
+        var quote = await service.GetOrFetchQuoteAsync(Usdc, Weth, 110m, () => FetchAsync(110m, 0.0005m));
+
+        // Assert
+        _fetchCount.Should().Be(0);
+        quote.FromTokenAmount.Should().Be(110m);
+        quote.ToTokenAmount.Should().Be(110m * 0.000500m * 1.0004m);
+    }
+
+    [Fact]
+    public async Task GetOrFetchQuoteAsync_ShouldFetch_WhenNeighbourRatesDifferTooMuch()
+    {
+        // Arrange
+        SetupBucket(CreateQuote(100m, 0.000500m), CreateQuote(120m, 0.000490m));
+        var service = CreateService();
+
+        // Act
+        var quote = await service.GetOrFetchQuoteAsync(Usdc, Weth, 110m, () => FetchAsync(110m, 0.000495m));
+
+        // Assert
+        _fetchCount.Should().Be(1);
+        quote.ToTokenAmount.Should().Be(110m * 0.000495m);
+    }
+
+    [Fact]
+    public async Task GetOrFetchQuoteAsync_ShouldSampleInterpolation_WithAggregatorFromItsOwnScope()
+    {
+        // Arrange
+        var sampled = new TaskCompletionSource<decimal>(TaskCreationOptions.RunContinuationsAsynchronously);
+        _mockAggregator
+            .Setup(a => a.GetQuoteAsync(Usdc, Weth, 110m, It.IsAny<decimal>()))
+            .Returns(() =>
+            {
+                sampled.TrySetResult(110m);
+                return Task.FromResult(CreateQuote(110m, 0.0005m));
+            });
+        SetupBucket(CreateQuote(100m, 0.000500m), CreateQuote(120m, 0.000500m * 1.0008m));
+        var service = CreateService(interpolationSampleRate: 1);
+
+        // Act
+        await service.GetOrFetchQuoteAsync(Usdc, Weth, 110m, () => FetchAsync(110m, 0.0005m));
+        var sampledAmount = await sampled.Task.WaitAsync(TimeSpan.FromSeconds(5));
+
+        // Assert
+        sampledAmount.Should().Be(110m);
+        _fetchCount.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task GetOrFetchQuoteAsync_ShouldCacheRefetchedQuote_WhenTheAmountsOldEntryExpired()
+    {
+        // Arrange - a full bucket whose oldest entry is the requested amount's expired quote
+        var bucket = UseInMemoryBucket();
+        var expired = CreateQuote(100m, 0.0005m);
+        expired.QuotedAt = DateTime.UtcNow.AddMinutes(-5);
+        bucket[expired.FromTokenAmount.ToString("F6")] = JsonSerializer.Serialize(expired);
+        foreach (var amount in Enumerable.Range(101, 7))
+        {
+            bucket[amount.ToString("F6")] = JsonSerializer.Serialize(CreateQuote(amount, 0.0005m));
+        }
+
+        var service = CreateService();
+
+        // Act
+        await service.GetOrFetchQuoteAsync(Usdc, Weth, 100m, () => FetchAsync(100m, 0.0005m));
+        var cached = await service.GetOrFetchQuoteAsync(Usdc, Weth, 100m, () => FetchAsync(100m, 0.0005m));
+
+        // Assert
+        _fetchCount.Should().Be(1);
+        cached.QuotedAt.Should().BeAfter(expired.QuotedAt);
+        bucket.Should().ContainKey("100.000000");
+        bucket.Should().HaveCount(8);
+    }
+
+    [Fact]
+    public async Task InvalidateCacheAsync_ShouldDeleteIndexedBucketsAndIndex()
+    {
+        // Arrange
+        _mockRedis
+            .Setup(r => r.SetMembersAsync("swap:quote:index:0xusdc:0xweth", It.IsAny<CommandFlags>()))
+            .ReturnsAsync(new RedisValue[] { "swap:quote:0xusdc:0xweth:b20", "swap:quote:0xusdc:0xweth:b21" });
+        var service = CreateService();
+
+        // Act
+        await service.InvalidateCacheAsync(Usdc, Weth);
+
+        // Assert
+        _mockRedis.Verify(r => r.KeyDeleteAsync(
+            It.Is<RedisKey[]>(keys => keys.Length == 3 && keys.Contains("swap:quote:index:0xusdc:0xweth")),
+            It.IsAny<CommandFlags>()), Times.Once);
+    }
+
+    private SwapQuoteCacheService CreateService(double interpolationSampleRate = 0)
+    {
+        return new SwapQuoteCacheService(
+            _mockServiceProvider.Object,
+            _scopeProvider.GetRequiredService<IServiceScopeFactory>(),
+            Options.Create(new SwapQuoteCacheOptions { InterpolationSampleRate = interpolationSampleRate }),
+            new Mock<ILogger<SwapQuoteCacheService>>().Object);
+    }
+
+    private void SetupBucket(params SwapQuote[] quotes)
+    {
+        _mockRedis
+            .Setup(r => r.HashGetAllAsync(It.IsAny<RedisKey>(), It.IsAny<CommandFlags>()))
+            .ReturnsAsync(quotes
+                .Select(q => new HashEntry(q.FromTokenAmount.ToString("F6"), JsonSerializer.Serialize(q)))
+                .ToArray());
+    }
+
+    /// <summary>
+    /// Backs the bucket hash with a dictionary so stored quotes can be read back
+    /// </summary>
+    private Dictionary<string, string> UseInMemoryBucket()
+    {
+        var bucket = new Dictionary<string, string>();
+        _mockRedis
+            .Setup(r => r.HashGetAllAsync(It.IsAny<RedisKey>(), It.IsAny<CommandFlags>()))
+            .ReturnsAsync(() => bucket.Select(e => new HashEntry(e.Key, e.Value)).ToArray());
+        _mockRedis
+            .Setup(r => r.HashSetAsync(It.IsAny<RedisKey>(), It.IsAny<RedisValue>(), It.IsAny<RedisValue>(), It.IsAny<When>(), It.IsAny<CommandFlags>()))
+            .Callback<RedisKey, RedisValue, RedisValue, When, CommandFlags>((_, field, value, _, _) => bucket[field.ToString()] = value.ToString())
+            .ReturnsAsync(true);
+        _mockRedis
+            .Setup(r => r.HashDeleteAsync(It.IsAny<RedisKey>(), It.IsAny<RedisValue[]>(), It.IsAny<CommandFlags>()))
+            .Callback<RedisKey, RedisValue[], CommandFlags>((_, fields, _) =>
+            {
+                foreach (var field in fields)
+                {
+                    bucket.Remove(field.ToString());
+                }
+            })
+            .ReturnsAsync((RedisKey _, RedisValue[] fields, CommandFlags _) => fields.Length);
+        return bucket;
+    }
+
+    private async Task<SwapQuote> FetchAsync(decimal amount, decimal rate)
+    {
+        Interlocked.Increment(ref _fetchCount);
+        await Task.Delay(50);
+        return CreateQuote(amount, rate);
+    }
+
+    private static SwapQuote CreateQuote(decimal amount, decimal rate)
+    {
+        return new SwapQuote
+        {
+            FromToken = Usdc,
+            ToToken = Weth,
+            FromTokenAmount = amount,
+            ToTokenAmount = amount * rate,
+            ExchangeRate = rate,
+            EstimatedGas = "150000",
+            Provider = "1inch",
+            QuotedAt = DateTime.UtcNow
+        };
+    }
+}
@@ -0,0 +1,83 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.Services.Blockchain;
+using CoinPay.Api.Services.Swap;
+using CoinPay.Api.Services.Swap.OneInch;
+using CoinPay.Api.Services.Wallet;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class TokenBalanceValidationServiceTests
+{
+    private const string WalletAddress = "0x742d35cc6634c0532925a3b844bc9e7595f0beb";
+    private const string OtherToken = "0x1111111111111111111111111111111111111111";
+
+    private readonly Mock<IBlockchainRpcService> _mockRpc;
+    private readonly TokenBalanceValidationService _service;
+
+    public TokenBalanceValidationServiceTests()
+    {
+        var tokenBalances = new Dictionary<string, decimal>
+        {
+            [TestnetTokens.WETH.ToLowerInvariant()] = 3m,
+            [TestnetTokens.WMATIC.ToLowerInvariant()] = 40m
+        };
+
+        var balanceCache = new Mock<IWalletBalanceCache>();
+        balanceCache
+            .Setup(c => c.GetBalanceAsync(WalletAddress, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new WalletBalanceSnapshot(WalletAddress, 100m, 2m, tokenBalances, 1000, DateTime.UtcNow));
+
+        _mockRpc = new Mock<IBlockchainRpcService>();
+        _mockRpc
+            .Setup(r => r.GetTokenBalanceAsync(WalletAddress, OtherToken, 18, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(5m);
+
+        var feeService = new Mock<IFeeCalculationService>();
+        feeService
+            .Setup(f => f.CalculateSwapFeeAsync(It.IsAny<string>(), It.IsAny<decimal>()))
+            .ReturnsAsync((string _, decimal amount) => amount * 0.01m);
+
+        _service = new TokenBalanceValidationService(
+            balanceCache.Object,
+            _mockRpc.Object,
+            feeService.Object,
+            Options.Create(new PolygonAmoyRpcOptions()),
+            NullLogger<TokenBalanceValidationService>.Instance);
+    }
+
+    [Theory]
+    [InlineData(TestnetTokens.USDC, 50, 100, true)]
+    [InlineData(TestnetTokens.USDC, 100, 100, false)]
+    [InlineData(TestnetTokens.NATIVE_MATIC, 1, 2, true)]
+    [InlineData(TestnetTokens.NATIVE_MATIC, 2, 2, false)]
+    [InlineData(TestnetTokens.WETH, 2, 3, true)]
+    [InlineData(TestnetTokens.WETH, 3, 3, false)]
+    [InlineData(TestnetTokens.WMATIC, 30, 40, true)]
+    public async Task ValidateBalanceAsync_ShouldUseSnapshotBalance_OfTheSwappedToken(
+        string tokenAddress, decimal amount, decimal expectedBalance, bool expectedSufficient)
+    {
+        // Act
+        var result = await _service.ValidateBalanceAsync(Guid.NewGuid(), WalletAddress, tokenAddress, amount);
+
+        // Assert
+        result.CurrentBalance.Should().Be(expectedBalance);
+        result.HasSufficientBalance.Should().Be(expectedSufficient);
+        _mockRpc.Verify(r => r.GetTokenBalanceAsync(
+            It.IsAny<string>(), It.IsAny<string>(), It.IsAny<int>(), It.IsAny<CancellationToken>()), Times.Never);
+    }
+
+    [Fact]
+    public async Task ValidateBalanceAsync_ShouldReadBalanceFromChain_ForTokensNotInTheSnapshot()
+    {
+        // Act
+        var result = await _service.ValidateBalanceAsync(Guid.NewGuid(), WalletAddress, OtherToken, 4m);
+
+        // Assert
+        result.CurrentBalance.Should().Be(5m);
+        result.HasSufficientBalance.Should().BeTrue();
+    }
+}
@@ -0,0 +1,208 @@
+using Xunit;
+using FluentAssertions;
+using CoinPay.Api.Data;
+using CoinPay.Api.Models;
+using CoinPay.Api.Repositories;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Internal;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class TransactionRepositoryTests : IDisposable
+{
+    private const int WalletId = 42;
+    private static readonly DateTime Now = new(2025, 11, 18, 12, 0, 0, DateTimeKind.Utc);
+
+    private readonly AppDbContext _context;
+    private readonly TestClock _clock = new();
+    private readonly MemoryCache _memoryCache;
+    private readonly TransactionRepository _repository;
+
+    public TransactionRepositoryTests()
+    {
+        var options = new DbContextOptionsBuilder<AppDbContext>()
+            .UseInMemoryDatabase(Guid.NewGuid().ToString())
+            .Options;
+
+        _context = new AppDbContext(options);
+        _memoryCache = new MemoryCache(new MemoryCacheOptions { Clock = _clock });
+        _repository = new TransactionRepository(_context, NullLogger<TransactionRepository>.Instance, _memoryCache);
+    }
+
+    [Fact]
+    public async Task GetPendingBatchAsync_ShouldContinueFromCursor_InWalletThenIdOrder()
+    {
+        // Arrange
+        _context.BlockchainTransactions.AddRange(
+            CreateLive(1, Now, TransactionStatus.Pending, walletId: 2),
+            CreateLive(2, Now, TransactionStatus.Pending, walletId: 1),
+            CreateLive(3, Now, TransactionStatus.Confirmed, walletId: 1),
+            CreateLive(4, Now, TransactionStatus.Pending, walletId: 1),
+            CreateLive(5, Now, TransactionStatus.Pending, walletId: 3));
+        await _context.SaveChangesAsync();
+
+        // Act
+        var first = await _repository.GetPendingBatchAsync(0, 0, batchSize: 2);
+        var last = first[^1];
+        var second = await _repository.GetPendingBatchAsync(last.WalletId, last.Id, batchSize: 2);
+        var end = second[^1];
+        var third = await _repository.GetPendingBatchAsync(end.WalletId, end.Id, batchSize: 2);
+
+        // Assert
+        first.Select(t => t.Id).Should().Equal(2, 4);
+        second.Select(t => t.Id).Should().Equal(1, 5);
+        third.Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task UpdateWithReceiptsAsync_ShouldConfirmFoundPendingRows_AndSkipTheRest()
+    {
+        // Arrange
+        _context.BlockchainTransactions.AddRange(
+            CreateLive(1, Now, TransactionStatus.Pending),
+            CreateLive(2, Now, TransactionStatus.Failed),
+            CreateLive(3, Now, TransactionStatus.Pending));
+        await _context.SaveChangesAsync();
+
+        var updates = new[]
+        {
+            new BlockchainReceiptUpdate(1, "0xhash1", 100, 21000m),
+            new BlockchainReceiptUpdate(2, "0xhash2", 101, 21000m),
+            new BlockchainReceiptUpdate(99, "0xhash99", 102, 21000m)
+        };
+
+        // Act
+        var confirmed = await _repository.UpdateWithReceiptsAsync(updates);
+
+        // Assert
+        confirmed.Should().Be(1);
+
+        var first = await _context.BlockchainTransactions.SingleAsync(t => t.Id == 1);
+        first.Status.Should().Be(TransactionStatus.Confirmed);
+        first.TransactionHash.Should().Be("0xhash1");
+        first.BlockNumber.Should().Be(100);
+        first.ConfirmedAt.Should().NotBeNull();
+
+        var failed = await _context.BlockchainTransactions.SingleAsync(t => t.Id == 2);
+        failed.Status.Should().Be(TransactionStatus.Failed);
+        failed.TransactionHash.Should().BeNull();
+
+        (await _context.BlockchainTransactions.SingleAsync(t => t.Id == 3)).Status.Should().Be(TransactionStatus.Pending);
+    }
+
+    [Fact]
+    public async Task GetHistoryPageAsync_ShouldPageAcrossLiveAndArchivedTransactions()
+    {
+        // Arrange
+        _context.BlockchainTransactions.AddRange(
+            CreateLive(4, Now.AddDays(-1), TransactionStatus.Pending),
+            CreateLive(3, Now.AddDays(-2), TransactionStatus.Confirmed));
+        _context.ArchivedBlockchainTransactions.AddRange(
+            CreateArchived(2, Now.AddDays(-40)),
+            CreateArchived(1, Now.AddDays(-50)));
+        await _context.SaveChangesAsync();
+
+        var filter = new TransactionHistoryFilter();
+
+        // Act
+        var first = await _repository.GetHistoryPageAsync(WalletId, filter, pageSize: 3);
+        HistoryCursor.TryParse(first.NextCursor, out var cursor).Should().BeTrue();
+        var second = await _repository.GetHistoryPageAsync(WalletId, filter, cursor, pageSize: 3);
+        var count = await _repository.GetHistoryCountAsync(WalletId, filter);
+
+        // Assert
+        first.Items.Select(t => t.TransactionId).Should().Equal(4, 3, 2);
+        first.NextCursor.Should().NotBeNull();
+        second.Items.Select(t => t.TransactionId).Should().Equal(1);
+        second.NextCursor.Should().BeNull();
+        count.Should().Be(4);
+    }
+
+    [Fact]
+    public async Task GetHistoryCountAsync_ShouldServeCachedCount_ForThirtySecondsPerFilter()
+    {
+        // Arrange
+        _context.BlockchainTransactions.Add(CreateLive(1, Now, TransactionStatus.Confirmed));
+        await _context.SaveChangesAsync();
+
+        var all = new TransactionHistoryFilter();
+        var confirmed = new TransactionHistoryFilter(Status: TransactionStatus.Confirmed);
+
+        // Act
+        var first = await _repository.GetHistoryCountAsync(WalletId, all);
+
+        _context.BlockchainTransactions.Add(CreateLive(2, Now, TransactionStatus.Confirmed));
+        await _context.SaveChangesAsync();
+
+        var cached = await _repository.GetHistoryCountAsync(WalletId, all);
+        var otherFilter = await _repository.GetHistoryCountAsync(WalletId, confirmed);
+
+        _clock.UtcNow = _clock.UtcNow.AddSeconds(31);
+        var expired = await _repository.GetHistoryCountAsync(WalletId, all);
+
+        // Assert
+        first.Should().Be(1);
+        cached.Should().Be(1);
+        otherFilter.Should().Be(2);
+        expired.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task GetByIdAsync_ShouldFallBackToArchive_WhenTransactionWasMoved()
+    {
+        // Arrange
+        _context.Wallets.Add(new Wallet { Id = WalletId, UserId = 1, Address = "0xabc" });
+        _context.ArchivedBlockchainTransactions.Add(CreateArchived(7, Now.AddDays(-60)));
+        await _context.SaveChangesAsync();
+
+        // Act
+        var transaction = await _repository.GetByIdAsync(7);
+        var byHash = await _repository.GetByUserOpHashAsync("0xop7");
+
+        // Assert
+        transaction.Should().NotBeNull();
+        transaction!.Status.Should().Be(TransactionStatus.Confirmed);
+        transaction.Wallet!.Address.Should().Be("0xabc");
+        byHash!.Id.Should().Be(7);
+        (await _repository.ExistsAsync("0xop7")).Should().BeTrue();
+    }
+
+    private static BlockchainTransaction CreateLive(
+        int id,
+        DateTime createdAt,
+        TransactionStatus status,
+        int walletId = WalletId) => new()
+    {
+        Id = id,
+        WalletId = walletId,
+        UserOpHash = $"0xop{id}",
+        AmountDecimal = id,
+        Status = status,
+        CreatedAt = createdAt
+    };
+
+    private static ArchivedBlockchainTransaction CreateArchived(int id, DateTime createdAt) => new()
+    {
+        Id = id,
+        WalletId = WalletId,
+        UserOpHash = $"0xop{id}",
+        AmountDecimal = id,
+        Status = TransactionStatus.Confirmed,
+        CreatedAt = createdAt,
+        ConfirmedAt = createdAt,
+        ArchivedAt = Now
+    };
+
+    public void Dispose()
+    {
+        _context.Dispose();
+        _memoryCache.Dispose();
+    }
+
+    private sealed class TestClock : ISystemClock
+    {
+        public DateTimeOffset UtcNow { get; set; } = DateTimeOffset.UtcNow;
+    }
+}
@@ -0,0 +1,140 @@
+using Xunit;
+using FluentAssertions;
+using CoinPay.Api.Data;
+using CoinPay.Api.Models;
+using CoinPay.Api.Repositories;
+using CoinPay.Api.Services.Transaction;
+using CoinPay.Api.Services.Webhook;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Diagnostics;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class TransactionStatusServiceTests : IDisposable
+{
+    private readonly SaveCounter _saveCounter = new();
+    private readonly AppDbContext _context;
+    private readonly TransactionStatusService _service;
+
+    public TransactionStatusServiceTests()
+    {
+        var options = new DbContextOptionsBuilder<AppDbContext>()
+            .UseInMemoryDatabase(Guid.NewGuid().ToString())
+            .AddInterceptors(_saveCounter)
+            .Options;
+
+        _context = new AppDbContext(options);
+
+        var webhookService = new WebhookService(
+            new WebhookRepository(_context, NullLogger<WebhookRepository>.Instance),
+            NullLogger<WebhookService>.Instance);
+
+        _service = new TransactionStatusService(
+            _context,
+            NullLogger<TransactionStatusService>.Instance,
+            webhookService: webhookService);
+    }
+
+    [Fact]
+    public async Task UpdateStatusAsync_ShouldSaveOutboxRows_InTheSameSaveAsTheStatusChange()
+    {
+        // Arrange
+        await SeedAsync();
+
+        // Act
+        await _service.UpdateStatusAsync(1, TransactionStatus.Failed);
+
+        // Assert
+        _saveCounter.Saves.Should().Be(1);
+        _saveCounter.OutboxRowsPerSave.Should().Equal(1);
+
+        var transaction = await _context.BlockchainTransactions.SingleAsync(t => t.Id == 1);
+        transaction.Status.Should().Be(TransactionStatus.Failed);
+
+        var message = await _context.WebhookOutboxMessages.SingleAsync();
+        message.EventName.Should().Be("transaction.failed");
+        message.TransactionId.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task UpdateWithReceiptAsync_ShouldSaveOutboxRows_InTheSameSaveAsTheReceipt()
+    {
+        // Arrange
+        await SeedAsync();
+
+        // Act
+        await _service.UpdateWithReceiptAsync(1, "0xhash", 100, 21000m);
+
+        // Assert
+        _saveCounter.Saves.Should().Be(1);
+        _saveCounter.OutboxRowsPerSave.Should().Equal(1);
+
+        var transaction = await _context.BlockchainTransactions.SingleAsync(t => t.Id == 1);
+        transaction.Status.Should().Be(TransactionStatus.Confirmed);
+        transaction.BlockNumber.Should().Be(100);
+
+        var message = await _context.WebhookOutboxMessages.SingleAsync();
+        message.EventName.Should().Be("transaction.confirmed");
+    }
+
+    private async Task SeedAsync()
+    {
+        _context.Wallets.Add(new Wallet { Id = 1, UserId = 7, Address = "0xabc" });
+        _context.WebhookRegistrations.Add(new WebhookRegistration
+        {
+            Id = 1,
+            UserId = 7,
+            Url = "https://hooks.example/coinpay",
+            Secret = "secret",
+            Events = "transaction.confirmed,transaction.failed",
+            IsActive = true
+        });
+        _context.BlockchainTransactions.Add(new BlockchainTransaction
+        {
+            Id = 1,
+            WalletId = 1,
+            UserOpHash = "0xop1",
+            AmountDecimal = 1,
+            Status = TransactionStatus.Pending
+        });
+        await _context.SaveChangesAsync();
+
+        _context.ChangeTracker.Clear();
+        _saveCounter.Reset();
+    }
+
+    public void Dispose()
+    {
+        _context.Dispose();
+    }
+
+    /// <summary>
+    /// Counts saves and how many outbox rows each one inserted
+    /// </summary>
+    private sealed class SaveCounter : SaveChangesInterceptor
+    {
+        public int Saves { get; private set; }
+
+        public List<int> OutboxRowsPerSave { get; } = new();
+
+        public void Reset()
+        {
+            Saves = 0;
+            OutboxRowsPerSave.Clear();
+        }
+
+        public override ValueTask<InterceptionResult<int>> SavingChangesAsync(
+            DbContextEventData eventData,
+            InterceptionResult<int> result,
+            CancellationToken cancellationToken = default)
+        {
+            Saves++;
+            OutboxRowsPerSave.Add(eventData.Context!.ChangeTracker
+                .Entries<WebhookOutboxMessage>()
+                .Count(e => e.State == EntityState.Added));
+
+            return base.SavingChangesAsync(eventData, result, cancellationToken);
+        }
+    }
+}
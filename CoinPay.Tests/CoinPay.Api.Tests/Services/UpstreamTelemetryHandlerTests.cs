@@ -0,0 +1,109 @@
+using Xunit;
+using FluentAssertions;
+using CoinPay.Api.Services.Telemetry;
+using System.Diagnostics.Metrics;
+using System.Net;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class UpstreamTelemetryHandlerTests : IDisposable
+{
+    private readonly MeterListener _listener = new();
+    private readonly List<(string Instrument, double Value, Dictionary<string, object?> Tags)> _measurements = new();
+    private readonly string _upstream = $"test_{Guid.NewGuid():N}";
+
+    public UpstreamTelemetryHandlerTests()
+    {
+        _listener.InstrumentPublished = (instrument, listener) =>
+        {
+            if (instrument.Meter.Name == CoinPayTelemetry.Name)
+            {
+                listener.EnableMeasurementEvents(instrument);
+            }
+        };
+        _listener.SetMeasurementEventCallback<double>((instrument, value, tags, _) => Record(instrument, value, tags));
+        _listener.SetMeasurementEventCallback<long>((instrument, value, tags, _) => Record(instrument, value, tags));
+        _listener.Start();
+    }
+
+    [Fact]
+    public async Task SendAsync_ShouldRecordDuration_WithOperationAndOutcome()
+    {
+        // Arrange
+        using var client = CreateClient(_ => new HttpResponseMessage(HttpStatusCode.OK), TimeSpan.FromSeconds(5));
+        using var request = new HttpRequestMessage(HttpMethod.Get, "http://upstream/quote")
+            .WithUpstreamOperation("GetQuote");
+
+        // Act
+        await client.SendAsync(request);
+
+        // Assert
+        var duration = _measurements.Should().ContainSingle(m => m.Instrument == "coinpay.upstream.duration").Subject;
+        duration.Tags["operation"].Should().Be("GetQuote");
+        duration.Tags["outcome"].Should().Be("success");
+        duration.Tags["http.response.status_code"].Should().Be(200);
+    }
+
+    [Fact]
+    public async Task SendAsync_ShouldCountTimeout_WhenAttemptExceedsClientTimeout()
+    {
+        // Arrange
+        using var client = CreateClient(_ => throw new TaskCanceledException(), TimeSpan.Zero);
+
+        // Act
+        var act = () => client.GetAsync("http://upstream/slow");
+
+        // Assert
+        await act.Should().ThrowAsync<TaskCanceledException>();
+        _measurements.Should().ContainSingle(m => m.Instrument == "coinpay.upstream.timeouts")
+            .Which.Tags["operation"].Should().Be("GET");
+        _measurements.Should().ContainSingle(m => m.Instrument == "coinpay.upstream.duration")
+            .Which.Tags["outcome"].Should().Be("timeout");
+    }
+
+    private HttpClient CreateClient(Func<HttpRequestMessage, HttpResponseMessage> respond, TimeSpan timeout)
+    {
+        var handler = new UpstreamTelemetryHandler(_upstream, timeout)
+        {
+            InnerHandler = new StubHandler(respond)
+        };
+
+        return new HttpClient(handler);
+    }
+
+    private void Record(Instrument instrument, double value, ReadOnlySpan<KeyValuePair<string, object?>> tags)
+    {
+        var tagMap = new Dictionary<string, object?>();
+        foreach (var tag in tags)
+        {
+            tagMap[tag.Key] = tag.Value;
+        }
+
+        // Other tests may record through the shared meter concurrently
+        if (!Equals(tagMap.GetValueOrDefault("upstream"), _upstream))
+            return;
+
+        lock (_measurements)
+        {
+            _measurements.Add((instrument.Name, value, tagMap));
+        }
+    }
+
+    public void Dispose()
+    {
+        _listener.Dispose();
+    }
+
+    private sealed class StubHandler : HttpMessageHandler
+    {
+        private readonly Func<HttpRequestMessage, HttpResponseMessage> _respond;
+
+        public StubHandler(Func<HttpRequestMessage, HttpResponseMessage> respond)
+        {
+            _respond = respond;
+        }
+
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+            => Task.FromResult(_respond(request));
+    }
+}
@@ -0,0 +1,161 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.Services.Blockchain;
+using CoinPay.Api.Services.Swap.OneInch;
+using CoinPay.Api.Services.Wallet;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using StackExchange.Redis;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class WalletBalanceCacheTests : IDisposable
+{
+    private const string WalletAddress = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb";
+
+    private readonly Mock<IBlockchainRpcService> _mockRpc;
+    private readonly MemoryCache _memoryCache;
+    private readonly WalletBalanceCache _cache;
+    private long _latestBlock = 1000;
+    private int _balanceCalls;
+
+    public WalletBalanceCacheTests()
+    {
+        _mockRpc = new Mock<IBlockchainRpcService>();
+        _mockRpc
+            .Setup(r => r.GetBlockNumberAsync(It.IsAny<CancellationToken>()))
+            .ReturnsAsync(() => _latestBlock);
+        _mockRpc
+            .Setup(r => r.GetUSDCBalanceAsync(It.IsAny<string>(), It.IsAny<CancellationToken>()))
+            .ReturnsAsync(() =>
+            {
+                Interlocked.Increment(ref _balanceCalls);
+                return 250m;
+            });
+        _mockRpc
+            .Setup(r => r.GetNativeBalanceAsync(It.IsAny<string>(), It.IsAny<CancellationToken>()))
+            .ReturnsAsync(1.5m);
+        _mockRpc
+            .Setup(r => r.GetTokenBalanceAsync(It.IsAny<string>(), TestnetTokens.WETH, 18, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(0.25m);
+
+        _memoryCache = new MemoryCache(new MemoryCacheOptions());
+        _cache = CreateCache(_memoryCache, new ServiceCollection().BuildServiceProvider());
+    }
+
+    [Fact]
+    public async Task GetBalanceAsync_ShouldServeSnapshot_WhileWithinBlockLag()
+    {
+        // Act
+        var first = await _cache.GetBalanceAsync(WalletAddress);
+        _latestBlock += 5;
+        var second = await _cache.GetBalanceAsync(WalletAddress);
+
+        // Assert
+        first.BlockNumber.Should().Be(1000);
+        first.USDCBalance.Should().Be(250m);
+        first.NativeBalance.Should().Be(1.5m);
+        first.TokenBalances.Should().ContainKey(TestnetTokens.WETH.ToLowerInvariant())
+            .WhoseValue.Should().Be(0.25m);
+        first.TokenBalances.Should().ContainKey(TestnetTokens.WMATIC.ToLowerInvariant());
+        second.Should().BeSameAs(first);
+        _balanceCalls.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task GetBalanceAsync_ShouldRefetch_WhenSnapshotTrailsLatestBlock()
+    {
+        // Act
+        await _cache.GetBalanceAsync(WalletAddress);
+        _latestBlock += 6;
+        var refreshed = await _cache.GetBalanceAsync(WalletAddress);
+
+        // Assert
+        refreshed.BlockNumber.Should().Be(1006);
+        _balanceCalls.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task Invalidate_ShouldForceRefetch_ForAnyCasingOfTheAddress()
+    {
+        // Arrange
+        await _cache.GetBalanceAsync(WalletAddress);
+
+        // Act
+        _cache.Invalidate(WalletAddress.ToUpperInvariant());
+        await _cache.GetBalanceAsync(WalletAddress);
+
+        // Assert
+        _balanceCalls.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task Invalidate_ShouldKeepSnapshot_TakenAfterTheChangingBlock()
+    {
+        // Arrange
+        await _cache.GetBalanceAsync(WalletAddress);
+
+        // Act
+        _cache.Invalidate(WalletAddress, changedInBlock: 998);
+        await _cache.GetBalanceAsync(WalletAddress);
+        _cache.Invalidate(WalletAddress, changedInBlock: 1001);
+        await _cache.GetBalanceAsync(WalletAddress);
+
+        // Assert
+        _balanceCalls.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task Invalidate_ShouldDropSnapshot_OnOtherReplicas()
+    {
+        // Arrange - two replicas share one Redis channel that delivers synchronously
+        var handlers = new List<Action<RedisChannel, RedisValue>>();
+        var subscriber = new Mock<ISubscriber>();
+        subscriber
+            .Setup(s => s.SubscribeAsync(It.IsAny<RedisChannel>(), It.IsAny<Action<RedisChannel, RedisValue>>(), It.IsAny<CommandFlags>()))
+            .Callback<RedisChannel, Action<RedisChannel, RedisValue>, CommandFlags>((_, handler, _) => handlers.Add(handler))
+            .Returns(Task.CompletedTask);
+        subscriber
+            .Setup(s => s.PublishAsync(It.IsAny<RedisChannel>(), It.IsAny<RedisValue>(), It.IsAny<CommandFlags>()))
+            .Callback<RedisChannel, RedisValue, CommandFlags>((channel, message, _) => handlers.ForEach(h => h(channel, message)))
+            .ReturnsAsync(1L);
+
+        var multiplexer = new Mock<IConnectionMultiplexer>();
+        multiplexer.Setup(m => m.GetSubscriber(It.IsAny<object?>())).Returns(subscriber.Object);
+        var services = new ServiceCollection().AddSingleton(multiplexer.Object).BuildServiceProvider();
+
+        using var firstMemory = new MemoryCache(new MemoryCacheOptions());
+        using var secondMemory = new MemoryCache(new MemoryCacheOptions());
+        var first = CreateCache(firstMemory, services);
+        var second = CreateCache(secondMemory, services);
+
+        await first.GetBalanceAsync(WalletAddress);
+        await second.GetBalanceAsync(WalletAddress);
+
+        // Act
+        first.Invalidate(WalletAddress);
+        await second.GetBalanceAsync(WalletAddress);
+
+        // Assert
+        handlers.Should().HaveCount(2);
+        _balanceCalls.Should().Be(3);
+    }
+
+    private WalletBalanceCache CreateCache(IMemoryCache memoryCache, IServiceProvider serviceProvider)
+    {
+        return new WalletBalanceCache(
+            _mockRpc.Object,
+            memoryCache,
+            serviceProvider,
+            Options.Create(new WalletBalanceCacheOptions { MaxBlockLag = 5 }),
+            new Mock<ILogger<WalletBalanceCache>>().Object);
+    }
+
+    public void Dispose()
+    {
+        _memoryCache.Dispose();
+    }
+}
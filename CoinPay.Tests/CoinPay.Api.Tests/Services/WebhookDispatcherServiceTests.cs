@@ -0,0 +1,97 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.Data;
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class WebhookDispatcherServiceTests : IDisposable
+{
+    private readonly ServiceProvider _serviceProvider;
+    private readonly WebhookDeliveryOptions _options = new() { BatchSize = 2, ClaimTimeoutSeconds = 120 };
+
+    public WebhookDispatcherServiceTests()
+    {
+        var databaseName = Guid.NewGuid().ToString();
+        var services = new ServiceCollection();
+        services.AddDbContext<AppDbContext>(options => options.UseInMemoryDatabase(databaseName));
+        _serviceProvider = services.BuildServiceProvider();
+    }
+
+    [Fact]
+    public async Task ClaimDueDeliveriesAsync_ShouldHideClaimedRows_FromOtherDispatchers()
+    {
+        // Arrange
+        await SeedAsync(
+            CreateMessage(1, DateTime.UtcNow.AddSeconds(-3)),
+            CreateMessage(2, DateTime.UtcNow.AddSeconds(-2)),
+            CreateMessage(3, DateTime.UtcNow.AddSeconds(-1)),
+            CreateMessage(4, DateTime.UtcNow.AddMinutes(5)));
+
+        using var first = CreateDispatcher();
+        using var second = CreateDispatcher();
+
+        // Act
+        var firstClaim = await ClaimAsync(first);
+        var secondClaim = await ClaimAsync(second);
+        var thirdClaim = await ClaimAsync(second);
+
+        // Assert
+        firstClaim.Should().Equal(1, 2);
+        secondClaim.Should().Equal(3);
+        thirdClaim.Should().BeEmpty();
+
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        var claimed = await db.WebhookOutboxMessages.Where(m => m.Id <= 3).ToListAsync();
+        claimed.Should().OnlyContain(m =>
+            m.Status == WebhookDeliveryStatus.Pending &&
+            m.NextAttemptAt > DateTime.UtcNow.AddSeconds(_options.ClaimTimeoutSeconds - 10));
+    }
+
+    private WebhookDispatcherService CreateDispatcher()
+    {
+        return new WebhookDispatcherService(
+            _serviceProvider,
+            new Mock<IHttpClientFactory>().Object,
+            NullLogger<WebhookDispatcherService>.Instance,
+            Options.Create(_options));
+    }
+
+    private async Task<List<long>> ClaimAsync(WebhookDispatcherService dispatcher)
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        return await dispatcher.ClaimDueDeliveriesAsync(db, CancellationToken.None);
+    }
+
+    private async Task SeedAsync(params WebhookOutboxMessage[] messages)
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+        db.WebhookOutboxMessages.AddRange(messages);
+        await db.SaveChangesAsync();
+    }
+
+    private static WebhookOutboxMessage CreateMessage(long id, DateTime nextAttemptAt) => new()
+    {
+        Id = id,
+        WebhookId = 1,
+        EventName = "transaction.confirmed",
+        TransactionId = (int)id,
+        Payload = "{}",
+        Status = WebhookDeliveryStatus.Pending,
+        NextAttemptAt = nextAttemptAt
+    };
+
+    public void Dispose()
+    {
+        _serviceProvider.Dispose();
+    }
+}
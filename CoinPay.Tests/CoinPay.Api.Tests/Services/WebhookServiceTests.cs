@@ -0,0 +1,96 @@
+using Xunit;
+using Moq;
+using FluentAssertions;
+using CoinPay.Api.DTOs;
+using CoinPay.Api.Models;
+using CoinPay.Api.Repositories;
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Api.Services.Webhook;
+using Microsoft.Extensions.Logging;
+using System.Text.Json;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class WebhookServiceTests
+{
+    private readonly Mock<IWebhookRepository> _mockRepository;
+    private readonly WebhookService _service;
+    private List<WebhookOutboxMessage> _enqueued = new();
+
+    public WebhookServiceTests()
+    {
+        _mockRepository = new Mock<IWebhookRepository>();
+        _mockRepository
+            .Setup(r => r.AddDeliveries(It.IsAny<IReadOnlyCollection<WebhookOutboxMessage>>()))
+            .Callback((IReadOnlyCollection<WebhookOutboxMessage> messages) => _enqueued = messages.ToList());
+
+        _service = new WebhookService(
+            _mockRepository.Object,
+            new Mock<ILogger<WebhookService>>().Object);
+    }
+
+    [Fact]
+    public async Task NotifyTransactionStatusChangeAsync_ShouldEnqueueOneDeliveryPerSubscribedWebhook()
+    {
+        // Arrange
+        _mockRepository
+            .Setup(r => r.GetActiveWebhooksForUserAsync(7, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new List<WebhookRegistration>
+            {
+                new() { Id = 1, UserId = 7, Url = "https://a.example/hook", Secret = "s1", Events = "transaction.confirmed" },
+                new() { Id = 2, UserId = 7, Url = "https://b.example/hook", Secret = "s2", Events = "transaction.failed" },
+                new() { Id = 3, UserId = 7, Url = "https://c.example/hook", Secret = "s3", Events = "transaction.confirmed,transaction.failed" }
+            });
+
+        var transaction = new BlockchainTransaction
+        {
+            Id = 42,
+            UserOpHash = "0xop",
+            Status = TransactionStatus.Confirmed,
+            Wallet = new Wallet { UserId = 7 }
+        };
+
+        // Act
+        await _service.NotifyTransactionStatusChangeAsync(transaction, TransactionStatus.Pending, TransactionStatus.Confirmed);
+
+        // Assert
+        _enqueued.Select(m => m.WebhookId).Should().BeEquivalentTo(new[] { 1, 3 });
+        _enqueued.Should().OnlyContain(m =>
+            m.Status == WebhookDeliveryStatus.Pending &&
+            m.EventName == "transaction.confirmed" &&
+            m.TransactionId == 42);
+
+        var payload = JsonSerializer.Deserialize<WebhookPayload>(_enqueued.Single(m => m.WebhookId == 3).Payload);
+        payload!.Signature.Should().Be(_service.GenerateSignature("s3", 42, "0xop", "Confirmed"));
+    }
+
+    [Fact]
+    public async Task NotifyTransactionStatusChangeAsync_ShouldNotEnqueue_ForPendingStatus()
+    {
+        // Arrange
+        var transaction = new BlockchainTransaction { Id = 42, Wallet = new Wallet { UserId = 7 } };
+
+        // Act
+        await _service.NotifyTransactionStatusChangeAsync(transaction, TransactionStatus.Pending, TransactionStatus.Pending);
+
+        // Assert
+        _mockRepository.Verify(r => r.AddDeliveries(
+            It.IsAny<IReadOnlyCollection<WebhookOutboxMessage>>()), Times.Never);
+    }
+
+    [Fact]
+    public void GetRetryDelay_ShouldStayWithinJitteredExponentialBounds()
+    {
+        // Arrange
+        var options = new WebhookDeliveryOptions { RetryBaseDelaySeconds = 5, RetryMaxDelaySeconds = 60 };
+
+        // Act & Assert
+        for (var attempt = 1; attempt <= 10; attempt++)
+        {
+            var ceiling = Math.Min(5 * Math.Pow(2, attempt - 1), 60);
+            var delay = options.GetRetryDelay(attempt).TotalSeconds;
+
+            delay.Should().BeGreaterThanOrEqualTo(ceiling / 2).And.BeLessThanOrEqualTo(ceiling);
+        }
+    }
+}
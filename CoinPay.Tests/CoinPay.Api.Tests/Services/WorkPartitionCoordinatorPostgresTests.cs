@@ -0,0 +1,94 @@
+using Xunit;
+using FluentAssertions;
+using CoinPay.Api.Data;
+using CoinPay.Api.Services.Coordination;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+using Testcontainers.PostgreSql;
+
+namespace CoinPay.Api.Tests.Services;
+
+/// <summary>
+/// Lease handover between two coordinators on a real PostgreSQL instance (requires Docker)
+/// </summary>
+public class WorkPartitionCoordinatorPostgresTests : IAsyncLifetime
+{
+    private const string WorkerName = "test_worker";
+    private const int PartitionCount = 4;
+
+    private readonly PostgreSqlContainer _container = new PostgreSqlBuilder()
+        .WithImage("postgres:15-alpine")
+        .Build();
+
+    private ServiceProvider _serviceProvider = null!;
+
+    public async Task InitializeAsync()
+    {
+        await _container.StartAsync();
+
+        var services = new ServiceCollection();
+        services.AddDbContext<AppDbContext>(options => options.UseNpgsql(_container.GetConnectionString()));
+        _serviceProvider = services.BuildServiceProvider();
+
+        using var scope = _serviceProvider.CreateScope();
+        await scope.ServiceProvider.GetRequiredService<AppDbContext>().Database.MigrateAsync();
+    }
+
+    [Fact]
+    public async Task RenewAsync_ShouldKeepPartitionsInUse_WhenRebalancingMidCycle()
+    {
+        // Arrange - the first node owns every partition and starts a cycle
+        var first = CreateCoordinator();
+        var second = CreateCoordinator();
+
+        var cycle = await first.AcquireAsync(WorkerName);
+        cycle.OwnsAll.Should().BeTrue();
+
+        // Act - a second node joins and the first node's heartbeat rebalances while its cycle is running
+        var secondDuringCycle = await second.AcquireAsync(WorkerName);
+        await first.RenewAsync();
+        var secondAfterRenew = await second.AcquireAsync(WorkerName);
+
+        // Assert - nothing moved while the cycle still used it
+        secondDuringCycle.IsEmpty.Should().BeTrue();
+        secondAfterRenew.IsEmpty.Should().BeTrue();
+        (await GetOwnersAsync()).Values.Should().OnlyContain(owner => owner == first.NodeId);
+
+        // Act - the cycle ends and both nodes start their next cycle
+        cycle.Dispose();
+        using var firstNext = await first.AcquireAsync(WorkerName);
+        using var secondNext = await second.AcquireAsync(WorkerName);
+
+        // Assert - the partitions are now split without overlap
+        var nodes = new[] { first.NodeId, second.NodeId };
+        firstNext.Partitions.Should().Equal(WorkPartitionCoordinator.GetTargetPartitions(first.NodeId, nodes, PartitionCount));
+        secondNext.Partitions.Should().Equal(WorkPartitionCoordinator.GetTargetPartitions(second.NodeId, nodes, PartitionCount));
+        firstNext.Partitions.Should().NotIntersectWith(secondNext.Partitions);
+    }
+
+    private WorkPartitionCoordinator CreateCoordinator()
+    {
+        return new WorkPartitionCoordinator(
+            _serviceProvider.GetRequiredService<IServiceScopeFactory>(),
+            Options.Create(new WorkPartitioningOptions { PartitionCount = PartitionCount, LeaseDurationSeconds = 60 }),
+            NullLogger<WorkPartitionCoordinator>.Instance);
+    }
+
+    private async Task<Dictionary<int, string?>> GetOwnersAsync()
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+        return await db.WorkerLeases
+            .Where(l => l.WorkerName == WorkerName)
+            .ToDictionaryAsync(l => l.Partition, l => l.OwnerId);
+    }
+
+    public async Task DisposeAsync()
+    {
+        await _serviceProvider.DisposeAsync();
+        await _container.DisposeAsync();
+    }
+}
@@ -0,0 +1,67 @@
+using Xunit;
+using FluentAssertions;
+using CoinPay.Api.Services.Coordination;
+
+namespace CoinPay.Api.Tests.Services;
+
+public class WorkPartitionCoordinatorTests
+{
+    private const int PartitionCount = 64;
+
+    [Fact]
+    public void GetTargetPartitions_ShouldGiveEachPartitionToExactlyOneLiveNode()
+    {
+        // Arrange
+        var nodes = new[] { "api-2:1:b", "api-1:1:a", "api-3:1:c" };
+
+        // Act
+        var shares = nodes
+            .Select(node => WorkPartitionCoordinator.GetTargetPartitions(node, nodes, PartitionCount))
+            .ToList();
+
+        // Assert
+        shares.SelectMany(s => s).Should().BeEquivalentTo(Enumerable.Range(0, PartitionCount));
+        shares.Select(s => s.Count).Should().OnlyContain(count => count == 21 || count == 22);
+    }
+
+    [Fact]
+    public void GetTargetPartitions_ShouldIncludeCallingNode_BeforeItsFirstHeartbeatIsVisible()
+    {
+        // Act
+        var share = WorkPartitionCoordinator.GetTargetPartitions("api-2:1:b", new[] { "api-1:1:a" }, PartitionCount);
+
+        // Assert
+        share.Should().HaveCount(PartitionCount / 2);
+        share.Should().OnlyContain(p => p % 2 == 1);
+    }
+
+    [Fact]
+    public void GetPartition_ShouldBeStable_ForStringAndGuidKeys()
+    {
+        // Arrange
+        var walletId = "b5e5a8a3-4c4c-5bd7-8b1b-0c2f9a0d1e2f";
+        var connectionId = Guid.Parse("0f8fad5b-d9cb-469f-a165-70867728950e");
+
+        // Act & Assert
+        WorkPartitionAssignment.GetPartition(walletId, PartitionCount)
+            .Should().Be(WorkPartitionAssignment.GetPartition(new string(walletId.ToCharArray()), PartitionCount));
+        WorkPartitionAssignment.GetPartition(walletId, PartitionCount).Should().BeInRange(0, PartitionCount - 1);
+        WorkPartitionAssignment.GetPartition(connectionId, PartitionCount)
+            .Should().Be(WorkPartitionAssignment.GetPartition(connectionId.ToString("N"), PartitionCount));
+    }
+
+    [Fact]
+    public void Owns_ShouldMatchOnlyKeysInLeasedPartitions()
+    {
+        // Arrange
+        var assignment = new WorkPartitionAssignment(PartitionCount, new[] { 1, 5 });
+
+        // Act & Assert
+        assignment.Owns(65).Should().BeTrue();
+        assignment.Owns(69).Should().BeTrue();
+        assignment.Owns(64).Should().BeFalse();
+        assignment.OwnsAll.Should().BeFalse();
+        WorkPartitionAssignment.All(PartitionCount).OwnsAll.Should().BeTrue();
+        WorkPartitionAssignment.None(PartitionCount).IsEmpty.Should().BeTrue();
+    }
+}
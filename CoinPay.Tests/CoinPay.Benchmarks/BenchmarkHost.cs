@@ -0,0 +1,96 @@
+using CoinPay.Api.Data;
+using CoinPay.Api.Repositories;
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Api.Services.Circle;
+using CoinPay.Benchmarks.Measurement;
+using CoinPay.Benchmarks.StandIns;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging;
+
+namespace CoinPay.Benchmarks;
+
+/// <summary>
+/// Builds the service container the workers run in: the API's real services and repositories, wired the
+/// same way as Program.cs, but pointed at the stand-ins and the benchmark database.
+/// </summary>
+public static class BenchmarkHost
+{
+    public const string ExchangeMasterKey = "benchmark-master-key";
+
+    public static ServiceProvider Build(string connectionString, StandInSet standIns, DbCommandCounter commandCounter)
+    {
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                ["Circle:ApiUrl"] = standIns.Circle.ApiUrl,
+                ["Circle:ApiKey"] = "benchmark",
+                ["Circle:AppId"] = "benchmark",
+                ["Circle:BundlerUrl"] = standIns.JsonRpc.BaseUrl,
+                ["Blockchain:PolygonAmoy:RpcUrl"] = standIns.JsonRpc.BaseUrl,
+                ["OneInch:ApiBaseUrl"] = standIns.OneInch.ApiBaseUrl,
+                ["WhiteBit:BaseUrl"] = standIns.WhiteBit.BaseUrl,
+                ["ExchangeCredentialEncryption:MasterKey"] = ExchangeMasterKey
+            })
+            .Build();
+
+        var services = new ServiceCollection();
+
+        services.AddSingleton<IConfiguration>(configuration);
+
+        // Worker logging is switched off so console output doesn't dominate cycle times
+        services.AddLogging(logging => logging.ClearProviders());
+        services.AddMemoryCache();
+
+        services.AddSingleton(commandCounter);
+        services.AddDbContext<AppDbContext>((sp, options) => options
+            .UseNpgsql(connectionString)
+            .AddInterceptors(sp.GetRequiredService<DbCommandCounter>()));
+
+        // Worker options use their defaults, as in production
+        services.Configure<CircleOptions>(configuration.GetSection("Circle"));
+        services.Configure<CircleMonitoringOptions>(_ => { });
+        services.Configure<InvestmentSyncOptions>(_ => { });
+
+        // A single benchmark process owns every partition, so lease round trips are left out of cycle times
+        services.Configure<CoinPay.Api.Services.Coordination.WorkPartitioningOptions>(options => options.Enabled = false);
+        services.AddSingleton<CoinPay.Api.Services.Coordination.IWorkPartitionCoordinator, CoinPay.Api.Services.Coordination.WorkPartitionCoordinator>();
+
+        services.AddHttpClient(CircleService.HttpClientName, client =>
+        {
+            client.Timeout = TimeSpan.FromSeconds(30);
+        })
+        .ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler
+        {
+            PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+            AutomaticDecompression = System.Net.DecompressionMethods.All
+        })
+        .SetHandlerLifetime(Timeout.InfiniteTimeSpan);
+
+        services.AddHttpClient("CircleBundler", client =>
+        {
+            client.BaseAddress = new Uri(configuration["Circle:BundlerUrl"]!);
+            client.DefaultRequestHeaders.Add("Authorization", $"Bearer {configuration["Circle:ApiKey"]}");
+            client.Timeout = TimeSpan.FromSeconds(30);
+        });
+
+        services.AddSingleton<IEntitySecretEncryptionService, EntitySecretEncryptionService>();
+        services.AddScoped<ICircleService, CircleService>();
+
+        services.AddScoped<IWalletRepository, WalletRepository>();
+        services.AddScoped<ITransactionRepository, TransactionRepository>();
+        services.AddScoped<IExchangeConnectionRepository, ExchangeConnectionRepository>();
+        services.AddScoped<IInvestmentRepository, InvestmentRepository>();
+
+        services.AddScoped<CoinPay.Api.Services.Paymaster.IPaymasterService, CoinPay.Api.Services.Paymaster.MockPaymasterService>();
+        services.AddScoped<CoinPay.Api.Services.UserOperation.IUserOperationService, CoinPay.Api.Services.UserOperation.UserOperationService>();
+
+        services.AddScoped<CoinPay.Api.Services.Exchange.WhiteBit.IWhiteBitApiClient, CoinPay.Api.Services.Exchange.WhiteBit.WhiteBitApiClient>();
+        services.AddSingleton<CoinPay.Api.Services.Encryption.IExchangeCredentialEncryptionService, CoinPay.Api.Services.Encryption.ExchangeCredentialEncryptionService>();
+        services.AddSingleton<CoinPay.Api.Services.Encryption.IExchangeCredentialCache, CoinPay.Api.Services.Encryption.ExchangeCredentialCache>();
+        services.AddScoped<CoinPay.Api.Services.Investment.IRewardCalculationService, CoinPay.Api.Services.Investment.RewardCalculationService>();
+
+        return services.BuildServiceProvider(validateScopes: true);
+    }
+}
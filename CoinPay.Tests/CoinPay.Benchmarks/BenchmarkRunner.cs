@@ -0,0 +1,103 @@
+using System.Diagnostics;
+using CoinPay.Benchmarks.Measurement;
+using CoinPay.Benchmarks.Scenarios;
+using CoinPay.Benchmarks.StandIns;
+
+namespace CoinPay.Benchmarks;
+
+/// <summary>
+/// Runs each selected worker at each scale: warm-up cycles first, then measured cycles on freshly seeded data.
+/// </summary>
+public class BenchmarkRunner
+{
+    private readonly BenchmarkSettings _settings;
+    private readonly StandInSet _standIns;
+    private readonly DbCommandCounter _commandCounter;
+    private readonly IReadOnlyList<WorkerScenario> _scenarios;
+
+    public BenchmarkRunner(
+        BenchmarkSettings settings,
+        StandInSet standIns,
+        DbCommandCounter commandCounter,
+        IServiceProvider services)
+    {
+        _settings = settings;
+        _standIns = standIns;
+        _commandCounter = commandCounter;
+
+        var scenarios = new WorkerScenario[]
+        {
+            new CircleMonitoringScenario(services, standIns, settings),
+            new TransactionMonitoringScenario(services, standIns, settings),
+            new InvestmentSyncScenario(services, standIns, settings)
+        };
+
+        _scenarios = scenarios.Where(s => settings.Workers.Contains(s.Name)).ToList();
+    }
+
+    public async Task<List<ScenarioResult>> RunAsync(CancellationToken cancellationToken)
+    {
+        var results = new List<ScenarioResult>();
+
+        foreach (var scenario in _scenarios)
+        {
+            foreach (var scale in _settings.Scales)
+            {
+                for (var warmup = 0; warmup < _settings.Warmups; warmup++)
+                {
+                    await MeasureCycleAsync(scenario, scale, cancellationToken);
+                }
+
+                var samples = new List<CycleSample>();
+                for (var iteration = 0; iteration < _settings.Iterations; iteration++)
+                {
+                    samples.Add(await MeasureCycleAsync(scenario, scale, cancellationToken));
+                }
+
+                var result = ScenarioResult.FromSamples(scenario.Name, scale, samples);
+                results.Add(result);
+
+                Console.WriteLine(
+                    $"  {result.Key,-32} {result.CycleMilliseconds,10:F1} ms  {result.UpstreamCalls,8:F0} calls  {result.DbRoundTrips,6:F0} round trips");
+            }
+        }
+
+        return results;
+    }
+
+    private async Task<CycleSample> MeasureCycleAsync(WorkerScenario scenario, int scale, CancellationToken cancellationToken)
+    {
+        await scenario.ResetAsync(cancellationToken);
+        await scenario.SeedAsync(scale, cancellationToken);
+
+        // Settle seeding garbage so it isn't collected (and counted) during the cycle
+        GC.Collect();
+        GC.WaitForPendingFinalizers();
+        GC.Collect();
+
+        _standIns.ResetCounters();
+        _commandCounter.Reset();
+
+        var gen0 = GC.CollectionCount(0);
+        var gen1 = GC.CollectionCount(1);
+        var gen2 = GC.CollectionCount(2);
+        var allocatedBefore = GC.GetTotalAllocatedBytes(precise: true);
+        var stopwatch = Stopwatch.StartNew();
+
+        await scenario.RunCycleAsync(cancellationToken);
+
+        stopwatch.Stop();
+        var allocated = GC.GetTotalAllocatedBytes(precise: true) - allocatedBefore;
+
+        return new CycleSample(
+            stopwatch.Elapsed.TotalMilliseconds,
+            _standIns.TotalRequests,
+            _standIns.RequestsByRoute(),
+            _standIns.MaxConcurrentRequests,
+            _commandCounter.Commands,
+            allocated,
+            GC.CollectionCount(0) - gen0,
+            GC.CollectionCount(1) - gen1,
+            GC.CollectionCount(2) - gen2);
+    }
+}
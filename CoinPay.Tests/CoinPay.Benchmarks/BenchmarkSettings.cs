@@ -0,0 +1,167 @@
+using System.Globalization;
+using CoinPay.Benchmarks.StandIns;
+
+namespace CoinPay.Benchmarks;
+
+/// <summary>
+/// Command line settings for the benchmark harness
+/// </summary>
+public class BenchmarkSettings
+{
+    public static readonly string[] AllWorkers = { "circle-monitoring", "transaction-monitoring", "investment-sync" };
+
+    /// <summary>
+    /// "run" measures worker cycles; "serve" only starts the stand-ins for manual use
+    /// </summary>
+    public string Command { get; set; } = "run";
+
+    public List<string> Workers { get; set; } = new(AllWorkers);
+
+    public List<int> Scales { get; set; } = new() { 1_000, 10_000 };
+
+    public int Iterations { get; set; } = 3;
+
+    public int Warmups { get; set; } = 1;
+
+    /// <summary>
+    /// Seeded rows per Circle wallet, blockchain wallet or exchange connection
+    /// </summary>
+    public int RowsPerOwner { get; set; } = 100;
+
+    /// <summary>
+    /// Fraction of seeded pending rows the stand-ins report as settled
+    /// </summary>
+    public double SettledRatio { get; set; } = 0.8;
+
+    /// <summary>
+    /// PostgreSQL connection string; when omitted a throwaway container is started
+    /// </summary>
+    public string? ConnectionString { get; set; }
+
+    public string BaselinePath { get; set; } = "baseline.json";
+
+    public bool UpdateBaseline { get; set; }
+
+    public string? BaselineDescription { get; set; }
+
+    public string? OutputPath { get; set; }
+
+    public double TimeTolerance { get; set; } = 0.25;
+
+    public double CountTolerance { get; set; } = 0.10;
+
+    public StandInOptions StandIn { get; set; } = new();
+
+    /// <summary>
+    /// First of four consecutive stand-in ports; 0 picks free ports (serve defaults to 5500)
+    /// </summary>
+    public int PortBase { get; set; }
+
+    public static BenchmarkSettings Parse(string[] args)
+    {
+        var settings = new BenchmarkSettings();
+        var index = 0;
+
+        if (args.Length > 0 && !args[0].StartsWith("--"))
+        {
+            settings.Command = args[0];
+            index = 1;
+        }
+
+        if (settings.Command is not ("run" or "serve"))
+            throw new ArgumentException($"Unknown command '{settings.Command}'. Use 'run' or 'serve'.");
+
+        for (; index < args.Length; index++)
+        {
+            var name = args[index];
+
+            if (name == "--update-baseline")
+            {
+                settings.UpdateBaseline = true;
+                continue;
+            }
+
+            if (index + 1 >= args.Length)
+                throw new ArgumentException($"Missing value for {name}");
+
+            var value = args[++index];
+
+            switch (name)
+            {
+                case "--workers":
+                    settings.Workers = value.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries).ToList();
+                    var unknown = settings.Workers.Except(AllWorkers).ToList();
+                    if (unknown.Count > 0)
+                        throw new ArgumentException($"Unknown worker(s): {string.Join(", ", unknown)}");
+                    break;
+                case "--scales":
+                    settings.Scales = value.Split(',', StringSplitOptions.RemoveEmptyEntries)
+                        .Select(s => ParseInt(name, s))
+                        .ToList();
+                    break;
+                case "--iterations":
+                    settings.Iterations = Math.Max(1, ParseInt(name, value));
+                    break;
+                case "--warmups":
+                    settings.Warmups = Math.Max(0, ParseInt(name, value));
+                    break;
+                case "--rows-per-owner":
+                    settings.RowsPerOwner = Math.Max(1, ParseInt(name, value));
+                    break;
+                case "--settled-ratio":
+                    settings.SettledRatio = Math.Clamp(ParseDouble(name, value), 0, 1);
+                    break;
+                case "--connection-string":
+                    settings.ConnectionString = value;
+                    break;
+                case "--baseline":
+                    settings.BaselinePath = value;
+                    break;
+                case "--description":
+                    settings.BaselineDescription = value;
+                    break;
+                case "--output":
+                    settings.OutputPath = value;
+                    break;
+                case "--time-tolerance":
+                    settings.TimeTolerance = ParseDouble(name, value);
+                    break;
+                case "--count-tolerance":
+                    settings.CountTolerance = ParseDouble(name, value);
+                    break;
+                case "--latency-ms":
+                    settings.StandIn.LatencyMilliseconds = ParseInt(name, value);
+                    break;
+                case "--jitter-ms":
+                    settings.StandIn.JitterMilliseconds = ParseInt(name, value);
+                    break;
+                case "--error-rate":
+                    settings.StandIn.ErrorRate = Math.Clamp(ParseDouble(name, value), 0, 1);
+                    break;
+                case "--throttle-rate":
+                    settings.StandIn.ThrottleRate = Math.Clamp(ParseDouble(name, value), 0, 1);
+                    break;
+                case "--port-base":
+                    settings.PortBase = ParseInt(name, value);
+                    break;
+                case "--seed":
+                    settings.StandIn.Seed = ParseInt(name, value);
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown option {name}");
+            }
+        }
+
+        return settings;
+    }
+
+    private static int ParseInt(string name, string value) =>
+        int.TryParse(value, NumberStyles.Integer, CultureInfo.InvariantCulture, out var result)
+            ? result
+            : throw new ArgumentException($"{name} expects an integer, got '{value}'");
+
+    private static double ParseDouble(string name, string value) =>
+        double.TryParse(value, NumberStyles.Float, CultureInfo.InvariantCulture, out var result)
+            ? result
+            : throw new ArgumentException($"{name} expects a number, got '{value}'");
+}
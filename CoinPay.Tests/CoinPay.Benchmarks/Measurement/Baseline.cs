@@ -0,0 +1,96 @@
+using System.Text.Json;
+
+namespace CoinPay.Benchmarks.Measurement;
+
+/// <summary>
+/// Stored median figures per worker and scale, compared against new runs to flag throughput regressions
+/// </summary>
+public class Baseline
+{
+    private static readonly JsonSerializerOptions JsonOptions = new(JsonSerializerDefaults.Web) { WriteIndented = true };
+
+    public DateTime RecordedAt { get; set; }
+
+    public string? Description { get; set; }
+
+    public Dictionary<string, BaselineEntry> Entries { get; set; } = new();
+
+    public static async Task<Baseline?> LoadAsync(string path, CancellationToken cancellationToken = default)
+    {
+        if (!File.Exists(path))
+            return null;
+
+        await using var stream = File.OpenRead(path);
+        return await JsonSerializer.DeserializeAsync<Baseline>(stream, JsonOptions, cancellationToken);
+    }
+
+    public async Task SaveAsync(string path, CancellationToken cancellationToken = default)
+    {
+        await using var stream = File.Create(path);
+        await JsonSerializer.SerializeAsync(stream, this, JsonOptions, cancellationToken);
+    }
+
+    /// <summary>
+    /// Replaces the entries measured in this run and keeps the rest
+    /// </summary>
+    public void Update(IEnumerable<ScenarioResult> results, string? description)
+    {
+        RecordedAt = DateTime.UtcNow;
+        Description = description;
+
+        foreach (var result in results)
+        {
+            Entries[result.Key] = new BaselineEntry
+            {
+                CycleMilliseconds = result.CycleMilliseconds,
+                UpstreamCalls = result.UpstreamCalls,
+                DbRoundTrips = result.DbRoundTrips,
+                AllocatedBytes = result.AllocatedBytes
+            };
+        }
+    }
+
+    /// <summary>
+    /// Lists every metric that got worse than the baseline by more than its tolerance.
+    /// Timings and allocations use <paramref name="timeTolerance"/>; call and round-trip counts use
+    /// <paramref name="countTolerance"/>, since they only vary when errors are injected.
+    /// </summary>
+    public List<Regression> Compare(IEnumerable<ScenarioResult> results, double timeTolerance, double countTolerance)
+    {
+        var regressions = new List<Regression>();
+
+        foreach (var result in results)
+        {
+            if (!Entries.TryGetValue(result.Key, out var entry))
+                continue;
+
+            Check(result.Key, "cycle ms", entry.CycleMilliseconds, result.CycleMilliseconds, timeTolerance);
+            Check(result.Key, "allocated bytes", entry.AllocatedBytes, result.AllocatedBytes, timeTolerance);
+            Check(result.Key, "upstream calls", entry.UpstreamCalls, result.UpstreamCalls, countTolerance);
+            Check(result.Key, "db round trips", entry.DbRoundTrips, result.DbRoundTrips, countTolerance);
+        }
+
+        return regressions;
+
+        void Check(string key, string metric, double baseline, double current, double tolerance)
+        {
+            if (current > baseline * (1 + tolerance))
+            {
+                regressions.Add(new Regression(key, metric, baseline, current));
+            }
+        }
+    }
+}
+
+public class BaselineEntry
+{
+    public double CycleMilliseconds { get; set; }
+    public double UpstreamCalls { get; set; }
+    public double DbRoundTrips { get; set; }
+    public double AllocatedBytes { get; set; }
+}
+
+public record Regression(string Key, string Metric, double Baseline, double Current)
+{
+    public double Change => Baseline == 0 ? double.PositiveInfinity : (Current - Baseline) / Baseline;
+}
@@ -0,0 +1,73 @@
+using System.Text.Json;
+
+namespace CoinPay.Benchmarks.Measurement;
+
+/// <summary>
+/// Console and JSON output for a benchmark run
+/// </summary>
+public static class BenchmarkReport
+{
+    private static readonly JsonSerializerOptions JsonOptions = new(JsonSerializerDefaults.Web) { WriteIndented = true };
+
+    public static void Print(IReadOnlyList<ScenarioResult> results)
+    {
+        Console.WriteLine();
+        Console.WriteLine($"{"Worker",-24} {"Rows",8} {"Cycle ms",10} {"Upstream",9} {"Peak",5} {"DB trips",9} {"Alloc MB",9} {"GC 0/1/2",10}");
+        Console.WriteLine(new string('-', 91));
+
+        foreach (var result in results)
+        {
+            var gc = $"{result.Samples.Max(s => s.Gen0Collections)}/{result.Samples.Max(s => s.Gen1Collections)}/{result.Samples.Max(s => s.Gen2Collections)}";
+            Console.WriteLine(
+                $"{result.Worker,-24} {result.Scale,8} {result.CycleMilliseconds,10:F1} {result.UpstreamCalls,9:F0} {result.MaxConcurrentUpstreamCalls,5} " +
+                $"{result.DbRoundTrips,9:F0} {result.AllocatedBytes / (1024 * 1024),9:F1} {gc,10}");
+        }
+
+        Console.WriteLine();
+        foreach (var result in results.Where(r => r.UpstreamCallsByRoute.Count > 0))
+        {
+            Console.WriteLine($"{result.Key} upstream calls:");
+            foreach (var (route, count) in result.UpstreamCallsByRoute)
+            {
+                Console.WriteLine($"  {count,8}  {route}");
+            }
+        }
+    }
+
+    public static void PrintComparison(Baseline? baseline, IReadOnlyList<Regression> regressions, string baselinePath)
+    {
+        Console.WriteLine();
+
+        if (baseline == null)
+        {
+            Console.WriteLine($"No baseline at {baselinePath}; run with --update-baseline to record one.");
+            return;
+        }
+
+        if (regressions.Count == 0)
+        {
+            Console.WriteLine($"No regressions against baseline recorded {baseline.RecordedAt:u}.");
+            return;
+        }
+
+        Console.WriteLine($"REGRESSIONS against baseline recorded {baseline.RecordedAt:u}:");
+        foreach (var regression in regressions)
+        {
+            Console.WriteLine(
+                $"  {regression.Key,-32} {regression.Metric,-16} {regression.Baseline,14:F1} -> {regression.Current,14:F1} ({regression.Change:+0.0%})");
+        }
+    }
+
+    public static async Task WriteJsonAsync(string path, BenchmarkSettings settings, IReadOnlyList<ScenarioResult> results, CancellationToken cancellationToken)
+    {
+        await using var stream = File.Create(path);
+        await JsonSerializer.SerializeAsync(stream, new
+        {
+            RecordedAt = DateTime.UtcNow,
+            settings.StandIn,
+            settings.RowsPerOwner,
+            settings.SettledRatio,
+            Results = results
+        }, JsonOptions, cancellationToken);
+    }
+}
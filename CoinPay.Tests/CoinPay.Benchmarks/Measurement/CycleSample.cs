@@ -0,0 +1,50 @@
+namespace CoinPay.Benchmarks.Measurement;
+
+/// <summary>
+/// Measurements for one worker cycle
+/// </summary>
+public record CycleSample(
+    double CycleMilliseconds,
+    int UpstreamCalls,
+    IReadOnlyDictionary<string, int> UpstreamCallsByRoute,
+    int MaxConcurrentUpstreamCalls,
+    int DbRoundTrips,
+    long AllocatedBytes,
+    int Gen0Collections,
+    int Gen1Collections,
+    int Gen2Collections);
+
+/// <summary>
+/// Median figures for a worker at one seeded scale, across all measured iterations
+/// </summary>
+public record ScenarioResult(
+    string Worker,
+    int Scale,
+    double CycleMilliseconds,
+    double UpstreamCalls,
+    double DbRoundTrips,
+    double AllocatedBytes,
+    int MaxConcurrentUpstreamCalls,
+    IReadOnlyDictionary<string, int> UpstreamCallsByRoute,
+    IReadOnlyList<CycleSample> Samples)
+{
+    public string Key => $"{Worker}@{Scale}";
+
+    public static ScenarioResult FromSamples(string worker, int scale, IReadOnlyList<CycleSample> samples) => new(
+        worker,
+        scale,
+        Median(samples.Select(s => s.CycleMilliseconds)),
+        Median(samples.Select(s => (double)s.UpstreamCalls)),
+        Median(samples.Select(s => (double)s.DbRoundTrips)),
+        Median(samples.Select(s => (double)s.AllocatedBytes)),
+        samples.Max(s => s.MaxConcurrentUpstreamCalls),
+        samples[^1].UpstreamCallsByRoute,
+        samples);
+
+    private static double Median(IEnumerable<double> values)
+    {
+        var sorted = values.OrderBy(v => v).ToArray();
+        var middle = sorted.Length / 2;
+        return sorted.Length % 2 == 1 ? sorted[middle] : (sorted[middle - 1] + sorted[middle]) / 2;
+    }
+}
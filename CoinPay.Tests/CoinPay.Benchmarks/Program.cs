@@ -0,0 +1,137 @@
+using CoinPay.Api.Data;
+using CoinPay.Benchmarks.Measurement;
+using CoinPay.Benchmarks.StandIns;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+using Testcontainers.PostgreSql;
+
+namespace CoinPay.Benchmarks;
+
+/// <summary>
+/// Worker benchmark harness.
+///   dotnet run -c Release -- run [options]    measure worker cycles and compare against the baseline
+///   dotnet run -c Release -- serve [options]  start the stand-ins only, for pointing a local API at them
+/// See README.md for the options.
+/// </summary>
+public static class Program
+{
+    public static async Task<int> Main(string[] args)
+    {
+        BenchmarkSettings settings;
+        try
+        {
+            settings = BenchmarkSettings.Parse(args);
+        }
+        catch (ArgumentException ex)
+        {
+            Console.Error.WriteLine(ex.Message);
+            return 2;
+        }
+
+        using var cancellation = new CancellationTokenSource();
+        Console.CancelKeyPress += (_, e) =>
+        {
+            e.Cancel = true;
+            cancellation.Cancel();
+        };
+
+        return settings.Command == "serve"
+            ? await ServeAsync(settings, cancellation.Token)
+            : await RunAsync(settings, cancellation.Token);
+    }
+
+    private static async Task<int> ServeAsync(BenchmarkSettings settings, CancellationToken cancellationToken)
+    {
+        await using var standIns = new StandInSet(settings.StandIn, settings.PortBase == 0 ? 5500 : settings.PortBase);
+        await standIns.StartAsync(cancellationToken);
+
+        Console.WriteLine("Stand-ins running. Point the API at them with:");
+        Console.WriteLine($"  Circle__ApiUrl={standIns.Circle.ApiUrl}");
+        Console.WriteLine($"  Circle__BundlerUrl={standIns.JsonRpc.BaseUrl}");
+        Console.WriteLine($"  Blockchain__PolygonAmoy__RpcUrl={standIns.JsonRpc.BaseUrl}");
+        Console.WriteLine($"  OneInch__ApiBaseUrl={standIns.OneInch.ApiBaseUrl}");
+        Console.WriteLine($"  WhiteBit__BaseUrl={standIns.WhiteBit.BaseUrl}");
+        Console.WriteLine("Press Ctrl+C to stop.");
+
+        try
+        {
+            await Task.Delay(Timeout.Infinite, cancellationToken);
+        }
+        catch (OperationCanceledException)
+        {
+        }
+
+        return 0;
+    }
+
+    private static async Task<int> RunAsync(BenchmarkSettings settings, CancellationToken cancellationToken)
+    {
+        await using var standIns = new StandInSet(settings.StandIn, settings.PortBase);
+        await standIns.StartAsync(cancellationToken);
+
+        PostgreSqlContainer? container = null;
+        var connectionString = settings.ConnectionString;
+
+        if (string.IsNullOrEmpty(connectionString))
+        {
+            Console.WriteLine("Starting PostgreSQL container...");
+            container = new PostgreSqlBuilder()
+                .WithImage("postgres:15-alpine")
+                .Build();
+            await container.StartAsync(cancellationToken);
+            connectionString = container.GetConnectionString();
+        }
+        else
+        {
+            Console.WriteLine("Using the given database. Its worker tables are truncated between iterations.");
+        }
+
+        try
+        {
+            var commandCounter = new DbCommandCounter();
+            await using var services = BenchmarkHost.Build(connectionString, standIns, commandCounter);
+
+            using (var scope = services.CreateScope())
+            {
+                await scope.ServiceProvider.GetRequiredService<AppDbContext>().Database.MigrateAsync(cancellationToken);
+            }
+
+            Console.WriteLine(
+                $"Workers: {string.Join(", ", settings.Workers)}; scales: {string.Join(", ", settings.Scales)}; " +
+                $"latency {settings.StandIn.LatencyMilliseconds}+{settings.StandIn.JitterMilliseconds} ms, " +
+                $"errors {settings.StandIn.ErrorRate:P1}, throttled {settings.StandIn.ThrottleRate:P1}");
+
+            var runner = new BenchmarkRunner(settings, standIns, commandCounter, services);
+            var results = await runner.RunAsync(cancellationToken);
+
+            BenchmarkReport.Print(results);
+
+            if (settings.OutputPath != null)
+            {
+                await BenchmarkReport.WriteJsonAsync(settings.OutputPath, settings, results, cancellationToken);
+            }
+
+            var baseline = await Baseline.LoadAsync(settings.BaselinePath, cancellationToken);
+            var regressions = baseline?.Compare(results, settings.TimeTolerance, settings.CountTolerance) ?? new List<Regression>();
+            BenchmarkReport.PrintComparison(baseline, regressions, settings.BaselinePath);
+
+            if (settings.UpdateBaseline)
+            {
+                baseline ??= new Baseline();
+                baseline.Update(results, settings.BaselineDescription);
+                await baseline.SaveAsync(settings.BaselinePath, cancellationToken);
+                Console.WriteLine($"Baseline written to {settings.BaselinePath}");
+                return 0;
+            }
+
+            return regressions.Count == 0 ? 0 : 1;
+        }
+        finally
+        {
+            if (container != null)
+            {
+                await container.DisposeAsync();
+            }
+        }
+    }
+}
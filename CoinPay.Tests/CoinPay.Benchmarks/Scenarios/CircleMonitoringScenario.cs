@@ -0,0 +1,67 @@
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Benchmarks.StandIns;
+using Microsoft.Extensions.DependencyInjection;
+
+namespace CoinPay.Benchmarks.Scenarios;
+
+/// <summary>
+/// <see cref="CircleTransactionMonitoringService"/>: pending POL transfers that have gone quiet past the webhook
+/// silence window, spread over Circle wallets, each listed by the Circle stand-in.
+/// </summary>
+public class CircleMonitoringScenario : WorkerScenario
+{
+    public CircleMonitoringScenario(IServiceProvider services, StandInSet standIns, BenchmarkSettings settings)
+        : base(services, standIns, settings)
+    {
+    }
+
+    public override string Name => "circle-monitoring";
+
+    public override async Task ResetAsync(CancellationToken cancellationToken)
+    {
+        StandIns.Circle.Clear();
+        await TruncateAsync(cancellationToken, "Transactions", "ProcessedCircleNotifications");
+    }
+
+    public override async Task SeedAsync(int scale, CancellationToken cancellationToken)
+    {
+        var walletCount = OwnerCount(scale, Settings.RowsPerOwner);
+
+        // Old enough to be past the silence window, young enough not to be failed as stuck
+        var oldest = DateTime.UtcNow.AddMinutes(-30);
+
+        var rows = Enumerable.Range(0, scale).Select(i =>
+        {
+            var walletId = $"bench-wallet-{i % walletCount:D5}";
+            var circleId = $"bench-tx-{i:D7}";
+            var createdAt = oldest.AddMilliseconds(i);
+            var settled = IsSettled(i);
+
+            StandIns.Circle.AddTransaction(walletId, new CircleStandInTransaction(
+                circleId,
+                settled ? "COMPLETE" : "PENDING",
+                settled ? "0x" + i.ToString("x64") : null,
+                createdAt,
+                1.5m));
+
+            return new CoinPay.Api.Models.Transaction
+            {
+                TransactionId = circleId,
+                Amount = 1.5m,
+                Currency = "POL",
+                Type = "Transfer",
+                Status = "Pending",
+                CircleWalletId = walletId,
+                CreatedAt = createdAt
+            };
+        });
+
+        await InsertAsync(rows, cancellationToken);
+    }
+
+    public override async Task RunCycleAsync(CancellationToken cancellationToken)
+    {
+        var worker = ActivatorUtilities.CreateInstance<CircleTransactionMonitoringService>(Services);
+        await worker.MonitorPendingCircleTransactionsAsync(cancellationToken);
+    }
+}
@@ -0,0 +1,91 @@
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Api.Services.Encryption;
+using CoinPay.Benchmarks.StandIns;
+using Microsoft.Extensions.DependencyInjection;
+
+namespace CoinPay.Benchmarks.Scenarios;
+
+/// <summary>
+/// <see cref="InvestmentPositionSyncService"/>: active positions grouped under exchange connections with
+/// encrypted credentials, so each cycle decrypts, accrues rewards and bulk-saves like production.
+/// </summary>
+public class InvestmentSyncScenario : WorkerScenario
+{
+    public InvestmentSyncScenario(IServiceProvider services, StandInSet standIns, BenchmarkSettings settings)
+        : base(services, standIns, settings)
+    {
+    }
+
+    public override string Name => "investment-sync";
+
+    public override async Task ResetAsync(CancellationToken cancellationToken)
+    {
+        await TruncateAsync(cancellationToken, "InvestmentTransactions", "InvestmentPositions", "ExchangeConnections");
+    }
+
+    public override async Task SeedAsync(int scale, CancellationToken cancellationToken)
+    {
+        var userId = await GetBenchmarkUserIdAsync(cancellationToken);
+        var encryption = Services.GetRequiredService<IExchangeCredentialEncryptionService>();
+        var connectionCount = OwnerCount(scale, Settings.RowsPerOwner);
+        var now = DateTime.UtcNow;
+
+        var connections = new List<ExchangeConnection>(connectionCount);
+        for (var c = 0; c < connectionCount; c++)
+        {
+            // Connections are unique per (UserId, ExchangeName), so each one gets its own owner GUID
+            var ownerId = Guid.NewGuid();
+            connections.Add(new ExchangeConnection
+            {
+                Id = Guid.NewGuid(),
+                UserId = ownerId,
+                UserId1 = userId,
+                ExchangeName = "whitebit",
+                ApiKeyEncrypted = await encryption.EncryptAsync($"bench-key-{c}", ownerId),
+                ApiSecretEncrypted = await encryption.EncryptAsync($"bench-secret-{c}", ownerId),
+                IsActive = true,
+                CreatedAt = now,
+                UpdatedAt = now
+            });
+        }
+
+        await InsertAsync(connections, cancellationToken);
+
+        var positions = Enumerable.Range(0, scale).Select(i =>
+        {
+            var connection = connections[i % connectionCount];
+            return new InvestmentPosition
+            {
+                Id = Guid.NewGuid(),
+                UserId = connection.UserId,
+                UserId1 = userId,
+                ExchangeConnectionId = connection.Id,
+                ExternalPositionId = $"bench-inv-{i:D7}",
+                PlanId = "flex-usdc-1",
+                PrincipalAmount = 1_000m,
+                CurrentValue = 1_000m,
+                Apy = 8.5m,
+                Status = InvestmentStatus.Active,
+                StartDate = now.AddDays(-(i % 90) - 1),
+                CreatedAt = now,
+                UpdatedAt = now
+            };
+        });
+
+        await InsertAsync(positions, cancellationToken);
+    }
+
+    public override async Task RunCycleAsync(CancellationToken cancellationToken)
+    {
+        var worker = ActivatorUtilities.CreateInstance<InvestmentPositionSyncService>(Services);
+        try
+        {
+            await worker.SyncPositionsAsync(cancellationToken);
+        }
+        finally
+        {
+            worker.Dispose();
+        }
+    }
+}
@@ -0,0 +1,79 @@
+using CoinPay.Api.Models;
+using CoinPay.Api.Services.BackgroundWorkers;
+using CoinPay.Benchmarks.StandIns;
+using Microsoft.Extensions.DependencyInjection;
+
+namespace CoinPay.Benchmarks.Scenarios;
+
+/// <summary>
+/// <see cref="TransactionMonitoringService"/>: pending UserOperations spread over wallets, with receipts served by
+/// the JSON-RPC stand-in acting as the bundler.
+/// </summary>
+public class TransactionMonitoringScenario : WorkerScenario
+{
+    public TransactionMonitoringScenario(IServiceProvider services, StandInSet standIns, BenchmarkSettings settings)
+        : base(services, standIns, settings)
+    {
+    }
+
+    public override string Name => "transaction-monitoring";
+
+    public override async Task ResetAsync(CancellationToken cancellationToken)
+    {
+        StandIns.JsonRpc.Clear();
+        await TruncateAsync(cancellationToken, "BlockchainTransactions", "Wallets");
+    }
+
+    public override async Task SeedAsync(int scale, CancellationToken cancellationToken)
+    {
+        var userId = await GetBenchmarkUserIdAsync(cancellationToken);
+        var walletCount = OwnerCount(scale, Settings.RowsPerOwner);
+        var now = DateTime.UtcNow;
+
+        var wallets = Enumerable.Range(0, walletCount).Select(w => new Wallet
+        {
+            UserId = userId,
+            Address = "0x" + w.ToString("x40"),
+            CircleWalletId = $"bench-wallet-{w:D5}",
+            Blockchain = "MATIC-AMOY",
+            WalletType = "SCA",
+            CreatedAt = now
+        }).ToList();
+
+        await InsertAsync(wallets, cancellationToken);
+
+        var rows = Enumerable.Range(0, scale).Select(i =>
+        {
+            var wallet = wallets[i % walletCount];
+            var userOpHash = "0x" + i.ToString("x64");
+
+            if (IsSettled(i))
+            {
+                StandIns.JsonRpc.AddUserOperationReceipt(userOpHash, "0x" + (i + 1).ToString("x64"));
+            }
+
+            return new BlockchainTransaction
+            {
+                WalletId = wallet.Id,
+                UserOpHash = userOpHash,
+                FromAddress = wallet.Address,
+                ToAddress = "0x" + new string('2', 40),
+                TokenAddress = "0x41E94Eb019C0762f9Bfcf9Fb1E58725BfB0e7582",
+                Amount = "1500000",
+                AmountDecimal = 1.5m,
+                Status = TransactionStatus.Pending,
+                ChainId = 80002,
+                CreatedAt = now.AddMinutes(-5),
+                SubmittedAt = now.AddMinutes(-5)
+            };
+        });
+
+        await InsertAsync(rows, cancellationToken);
+    }
+
+    public override async Task RunCycleAsync(CancellationToken cancellationToken)
+    {
+        var worker = ActivatorUtilities.CreateInstance<TransactionMonitoringService>(Services);
+        await worker.MonitorPendingTransactionsAsync(cancellationToken);
+    }
+}
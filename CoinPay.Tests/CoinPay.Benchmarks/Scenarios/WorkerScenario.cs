@@ -0,0 +1,96 @@
+using CoinPay.Api.Data;
+using CoinPay.Api.Models;
+using CoinPay.Benchmarks.StandIns;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+
+namespace CoinPay.Benchmarks.Scenarios;
+
+/// <summary>
+/// A background worker measured by the harness. Each iteration resets the worker's tables, seeds pending
+/// work at the requested scale (database rows plus matching stand-in state) and then runs one worker cycle.
+/// </summary>
+public abstract class WorkerScenario
+{
+    private const int SeedChunkSize = 1_000;
+    private const string BenchmarkUsername = "benchmark";
+
+    protected WorkerScenario(IServiceProvider services, StandInSet standIns, BenchmarkSettings settings)
+    {
+        Services = services;
+        StandIns = standIns;
+        Settings = settings;
+    }
+
+    public abstract string Name { get; }
+
+    protected IServiceProvider Services { get; }
+
+    protected StandInSet StandIns { get; }
+
+    protected BenchmarkSettings Settings { get; }
+
+    /// <summary>
+    /// Empties the tables this worker reads and writes, and the stand-in state it queries
+    /// </summary>
+    public abstract Task ResetAsync(CancellationToken cancellationToken);
+
+    public abstract Task SeedAsync(int scale, CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Runs exactly one polling cycle of a freshly constructed worker
+    /// </summary>
+    public abstract Task RunCycleAsync(CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Whether the row at <paramref name="index"/> is reported as settled upstream. Spread evenly over the
+    /// seeded rows so every wallet gets the same mix.
+    /// </summary>
+    protected bool IsSettled(int index) => (index * 7919L % 1000) < Settings.SettledRatio * 1000;
+
+    protected static int OwnerCount(int scale, int rowsPerOwner) => (scale + rowsPerOwner - 1) / rowsPerOwner;
+
+    protected async Task TruncateAsync(CancellationToken cancellationToken, params string[] tables)
+    {
+        using var scope = Services.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+        var tableList = string.Join(", ", tables.Select(t => $"\"{t}\""));
+        var sql = $"TRUNCATE TABLE {tableList} RESTART IDENTITY CASCADE";
+        await db.Database.ExecuteSqlRawAsync(sql, cancellationToken);
+    }
+
+    /// <summary>
+    /// Inserts entities in chunks, each on a fresh context so the change tracker stays small
+    /// </summary>
+    protected async Task InsertAsync<T>(IEnumerable<T> entities, CancellationToken cancellationToken) where T : class
+    {
+        foreach (var chunk in entities.Chunk(SeedChunkSize))
+        {
+            using var scope = Services.CreateScope();
+            var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+            db.Set<T>().AddRange(chunk);
+            await db.SaveChangesAsync(cancellationToken);
+        }
+    }
+
+    /// <summary>
+    /// Returns the ID of the user that owns all seeded rows, creating it on first use
+    /// </summary>
+    protected async Task<int> GetBenchmarkUserIdAsync(CancellationToken cancellationToken)
+    {
+        using var scope = Services.CreateScope();
+        var db = scope.ServiceProvider.GetRequiredService<AppDbContext>();
+
+        var user = await db.Users.FirstOrDefaultAsync(u => u.Username == BenchmarkUsername, cancellationToken);
+        if (user == null)
+        {
+            user = new User { Username = BenchmarkUsername, CreatedAt = DateTime.UtcNow };
+            db.Users.Add(user);
+            await db.SaveChangesAsync(cancellationToken);
+        }
+
+        return user.Id;
+    }
+}
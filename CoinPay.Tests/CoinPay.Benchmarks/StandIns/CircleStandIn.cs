@@ -0,0 +1,110 @@
+using System.Collections.Concurrent;
+using System.Globalization;
+using Microsoft.AspNetCore.Builder;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Routing;
+
+namespace CoinPay.Benchmarks.StandIns;
+
+/// <summary>
+/// Stand-in for the Circle W3S developer API. Serves wallet transaction listings with Circle's
+/// newest-first, pageAfter cursor paging and single transaction lookups from seeded state.
+/// </summary>
+public class CircleStandIn : StandInServer
+{
+    private readonly ConcurrentDictionary<string, List<CircleStandInTransaction>> _walletTransactions = new();
+    private readonly ConcurrentDictionary<string, CircleStandInTransaction> _transactions = new();
+
+    public CircleStandIn(StandInOptions options) : base(options)
+    {
+    }
+
+    public override string Name => "Circle";
+
+    /// <summary>
+    /// Value for Circle:ApiUrl
+    /// </summary>
+    public string ApiUrl => $"{BaseUrl}/v1/w3s";
+
+    public void Clear()
+    {
+        _walletTransactions.Clear();
+        _transactions.Clear();
+    }
+
+    public void AddTransaction(string walletId, CircleStandInTransaction transaction)
+    {
+        var list = _walletTransactions.GetOrAdd(walletId, _ => new List<CircleStandInTransaction>());
+        lock (list)
+        {
+            list.Add(transaction);
+        }
+
+        _transactions[transaction.Id] = transaction;
+    }
+
+    protected override void MapRoutes(IEndpointRouteBuilder endpoints)
+    {
+        endpoints.MapGet("/v1/w3s/developer/wallets/{walletId}/transactions", ListWalletTransactions);
+        endpoints.MapGet("/v1/w3s/developer/transactions/{id}", (string id) =>
+            _transactions.TryGetValue(id, out var transaction)
+                ? Results.Json(new { data = ToWire(transaction) }, JsonOptions)
+                : Results.NotFound());
+    }
+
+    private IResult ListWalletTransactions(string walletId, HttpRequest request)
+    {
+        var pageSize = int.TryParse(request.Query["pageSize"], out var size) ? Math.Clamp(size, 1, 50) : 10;
+        DateTime? from = DateTime.TryParse(request.Query["from"], CultureInfo.InvariantCulture,
+            DateTimeStyles.AdjustToUniversal | DateTimeStyles.AssumeUniversal, out var parsed)
+            ? parsed
+            : null;
+        string? pageAfter = request.Query["pageAfter"];
+
+        if (!_walletTransactions.TryGetValue(walletId, out var list))
+        {
+            return Results.Json(new { data = new { transactions = Array.Empty<object>() } }, JsonOptions);
+        }
+
+        List<CircleStandInTransaction> ordered;
+        lock (list)
+        {
+            ordered = list
+                .Where(t => from == null || t.CreateDate >= from)
+                .OrderByDescending(t => t.CreateDate)
+                .ThenByDescending(t => t.Id, StringComparer.Ordinal)
+                .ToList();
+        }
+
+        var start = 0;
+        if (!string.IsNullOrEmpty(pageAfter))
+        {
+            start = ordered.FindIndex(t => t.Id == pageAfter) + 1;
+        }
+
+        var page = ordered.Skip(start).Take(pageSize).Select(ToWire).ToList();
+        return Results.Json(new { data = new { transactions = page } }, JsonOptions);
+    }
+
+    private static object ToWire(CircleStandInTransaction transaction) => new
+    {
+        id = transaction.Id,
+        state = transaction.State,
+        txHash = transaction.TxHash,
+        blockchain = "MATIC-AMOY",
+        sourceAddress = transaction.SourceAddress,
+        destinationAddress = transaction.DestinationAddress,
+        amounts = new[] { transaction.Amount.ToString(CultureInfo.InvariantCulture) },
+        createDate = transaction.CreateDate,
+        updateDate = transaction.CreateDate
+    };
+}
+
+public record CircleStandInTransaction(
+    string Id,
+    string State,
+    string? TxHash,
+    DateTime CreateDate,
+    decimal Amount,
+    string SourceAddress = "0x0000000000000000000000000000000000000001",
+    string DestinationAddress = "0x0000000000000000000000000000000000000002");
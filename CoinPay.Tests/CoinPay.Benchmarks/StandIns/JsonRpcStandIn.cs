@@ -0,0 +1,124 @@
+using System.Collections.Concurrent;
+using System.Text.Json.Nodes;
+using Microsoft.AspNetCore.Builder;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Routing;
+
+namespace CoinPay.Benchmarks.StandIns;
+
+/// <summary>
+/// Stand-in for a JSON-RPC endpoint. Serves the ERC-4337 bundler's eth_getUserOperationReceipt as well as
+/// the node methods used by the Polygon Amoy RPC service, for single and batch requests.
+/// </summary>
+public class JsonRpcStandIn : StandInServer
+{
+    private readonly ConcurrentDictionary<string, JsonObject> _userOperationReceipts = new(StringComparer.OrdinalIgnoreCase);
+    private readonly ConcurrentDictionary<string, int> _callsByMethod = new();
+
+    public JsonRpcStandIn(StandInOptions options) : base(options)
+    {
+    }
+
+    public override string Name => "JsonRpc";
+
+    public long BlockNumber { get; set; } = 0x100;
+
+    public IReadOnlyDictionary<string, int> CallsByMethod => _callsByMethod;
+
+    public void Clear()
+    {
+        _userOperationReceipts.Clear();
+        _callsByMethod.Clear();
+    }
+
+    /// <summary>
+    /// Adds a mined UserOperation receipt for the given hash
+    /// </summary>
+    public void AddUserOperationReceipt(string userOpHash, string transactionHash, bool success = true)
+    {
+        _userOperationReceipts[userOpHash] = new JsonObject
+        {
+            ["userOpHash"] = userOpHash,
+            ["transactionHash"] = transactionHash,
+            ["entryPoint"] = "0x5FF137D4b0FDCD49DcA30c7CF57E578a026d2789",
+            ["sender"] = "0x" + new string('1', 40),
+            ["nonce"] = "0x1",
+            ["success"] = success,
+            ["actualGasCost"] = "0x0",
+            ["actualGasUsed"] = "0x5208",
+            ["blockNumber"] = ToHex(BlockNumber)
+        };
+    }
+
+    protected override void MapRoutes(IEndpointRouteBuilder endpoints)
+    {
+        endpoints.MapPost("/", HandleAsync);
+    }
+
+    private async Task<IResult> HandleAsync(HttpRequest request)
+    {
+        var body = await JsonNode.ParseAsync(request.Body, cancellationToken: request.HttpContext.RequestAborted);
+
+        JsonNode response = body is JsonArray batch
+            ? new JsonArray(batch.Select(call => (JsonNode?)Answer(call!)).ToArray())
+            : Answer(body!);
+
+        return Results.Text(response.ToJsonString(), "application/json");
+    }
+
+    private JsonObject Answer(JsonNode call)
+    {
+        var method = call["method"]!.GetValue<string>();
+        var parameters = call["params"]?.AsArray();
+        _callsByMethod.AddOrUpdate(method, 1, (_, count) => count + 1);
+
+        var response = new JsonObject
+        {
+            ["jsonrpc"] = "2.0",
+            ["id"] = call["id"]?.DeepClone()
+        };
+
+        switch (method)
+        {
+            case "eth_getUserOperationReceipt":
+                var userOpHash = parameters![0]!.GetValue<string>();
+                response["result"] = _userOperationReceipts.TryGetValue(userOpHash, out var receipt)
+                    ? receipt.DeepClone()
+                    : null;
+                break;
+            case "eth_blockNumber":
+                response["result"] = ToHex(BlockNumber);
+                break;
+            case "eth_gasPrice":
+                response["result"] = ToHex(30_000_000_000);
+                break;
+            case "eth_getBalance":
+                response["result"] = ToHex(1_000_000_000_000_000_000);
+                break;
+            case "eth_call":
+                response["result"] = "0x" + 25_000_000L.ToString("x").PadLeft(64, '0');
+                break;
+            case "eth_getTransactionReceipt":
+                response["result"] = null;
+                break;
+            case "eth_getBlockByNumber":
+                response["result"] = new JsonObject
+                {
+                    ["number"] = parameters![0]!.DeepClone(),
+                    ["timestamp"] = ToHex(DateTimeOffset.UtcNow.ToUnixTimeSeconds())
+                };
+                break;
+            default:
+                response["error"] = new JsonObject
+                {
+                    ["code"] = -32601,
+                    ["message"] = $"Method {method} not found"
+                };
+                break;
+        }
+
+        return response;
+    }
+
+    private static string ToHex(long value) => "0x" + value.ToString("x");
+}
@@ -0,0 +1,78 @@
+using System.Globalization;
+using System.Numerics;
+using Microsoft.AspNetCore.Builder;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Routing;
+
+namespace CoinPay.Benchmarks.StandIns;
+
+/// <summary>
+/// Stand-in for the 1inch aggregation API (v5 quote and swap). Prices every pair at a fixed rate.
+/// </summary>
+public class OneInchStandIn : StandInServer
+{
+    public OneInchStandIn(StandInOptions options) : base(options)
+    {
+    }
+
+    public override string Name => "1inch";
+
+    /// <summary>
+    /// Value for OneInch:ApiBaseUrl
+    /// </summary>
+    public string ApiBaseUrl => $"{BaseUrl}/v5.0";
+
+    /// <summary>
+    /// Units of the destination token returned per unit of the source token
+    /// </summary>
+    public decimal Rate { get; set; } = 0.998m;
+
+    protected override void MapRoutes(IEndpointRouteBuilder endpoints)
+    {
+        endpoints.MapGet("/v5.0/{chainId:int}/quote", (HttpRequest request) =>
+            Results.Json(BuildQuote(request), JsonOptions));
+
+        endpoints.MapGet("/v5.0/{chainId:int}/swap", (HttpRequest request) =>
+        {
+            var quote = BuildQuote(request);
+            return Results.Json(new
+            {
+                quote.FromToken,
+                quote.ToToken,
+                quote.FromTokenAmount,
+                quote.ToTokenAmount,
+                tx = new
+                {
+                    from = request.Query["fromAddress"].ToString(),
+                    to = "0x1111111254eeb25477b68fb85ed929f73a960582",
+                    data = "0x12aa3caf",
+                    value = "0",
+                    gas = 180_000L,
+                    gasPrice = "30000000000"
+                }
+            }, JsonOptions);
+        });
+    }
+
+    private Quote BuildQuote(HttpRequest request)
+    {
+        var fromAddress = request.Query["fromTokenAddress"].ToString();
+        var toAddress = request.Query["toTokenAddress"].ToString();
+        var amount = BigInteger.TryParse(request.Query["amount"], NumberStyles.None, CultureInfo.InvariantCulture, out var wei)
+            ? wei
+            : BigInteger.Zero;
+
+        var toAmount = amount * new BigInteger(Rate * 1_000_000m) / 1_000_000;
+
+        return new Quote(
+            new Token(fromAddress, "TKN", "Token", 18),
+            new Token(toAddress, "TKN", "Token", 18),
+            amount.ToString(CultureInfo.InvariantCulture),
+            toAmount.ToString(CultureInfo.InvariantCulture),
+            180_000L);
+    }
+
+    private record Token(string Address, string Symbol, string Name, int Decimals);
+
+    private record Quote(Token FromToken, Token ToToken, string FromTokenAmount, string ToTokenAmount, long EstimatedGas);
+}
@@ -0,0 +1,47 @@
+namespace CoinPay.Benchmarks.StandIns;
+
+/// <summary>
+/// Upstream behaviour injected by every stand-in server
+/// </summary>
+public class StandInOptions
+{
+    /// <summary>
+    /// Base latency added to every response (default: 0)
+    /// </summary>
+    public int LatencyMilliseconds { get; set; }
+
+    /// <summary>
+    /// Random extra latency of up to this many milliseconds (default: 0)
+    /// </summary>
+    public int JitterMilliseconds { get; set; }
+
+    /// <summary>
+    /// Fraction of requests answered with a 503 instead of a result (default: 0)
+    /// </summary>
+    public double ErrorRate { get; set; }
+
+    /// <summary>
+    /// Fraction of requests answered with a 429 and Retry-After: 1 (default: 0)
+    /// </summary>
+    public double ThrottleRate { get; set; }
+
+    /// <summary>
+    /// Seed for the latency jitter and error injection, so runs are repeatable (default: 42)
+    /// </summary>
+    public int Seed { get; set; } = 42;
+
+    /// <summary>
+    /// Fixed port to listen on; 0 picks a free port (default: 0)
+    /// </summary>
+    public int Port { get; set; }
+
+    public StandInOptions WithPort(int port) => new()
+    {
+        LatencyMilliseconds = LatencyMilliseconds,
+        JitterMilliseconds = JitterMilliseconds,
+        ErrorRate = ErrorRate,
+        ThrottleRate = ThrottleRate,
+        Seed = Seed,
+        Port = port
+    };
+}
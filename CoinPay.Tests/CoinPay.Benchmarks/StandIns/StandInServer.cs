@@ -0,0 +1,152 @@
+using System.Collections.Concurrent;
+using System.Text.Json;
+using Microsoft.AspNetCore.Builder;
+using Microsoft.AspNetCore.Hosting;
+using Microsoft.AspNetCore.Hosting.Server;
+using Microsoft.AspNetCore.Hosting.Server.Features;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Routing;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging;
+
+namespace CoinPay.Benchmarks.StandIns;
+
+/// <summary>
+/// Base for the local upstream stand-ins. Hosts a Kestrel server on loopback, injects latency, 503s and 429s
+/// in front of every route, and counts requests per route and peak concurrency.
+/// </summary>
+public abstract class StandInServer : IAsyncDisposable
+{
+    private readonly StandInOptions _options;
+    private readonly Random _random;
+    private readonly object _randomLock = new();
+    private WebApplication? _app;
+    private int _inFlight;
+    private int _maxInFlight;
+    private int _injectedErrors;
+
+    protected StandInServer(StandInOptions options)
+    {
+        _options = options;
+        _random = new Random(options.Seed);
+    }
+
+    /// <summary>
+    /// Display name used in reports
+    /// </summary>
+    public abstract string Name { get; }
+
+    /// <summary>
+    /// Root URL of the running server, e.g. http://127.0.0.1:5123
+    /// </summary>
+    public string BaseUrl { get; private set; } = string.Empty;
+
+    public ConcurrentDictionary<string, int> RequestsByRoute { get; } = new();
+
+    public int TotalRequests => RequestsByRoute.Values.Sum();
+
+    public int MaxConcurrentRequests => _maxInFlight;
+
+    public int InjectedErrors => _injectedErrors;
+
+    protected static readonly JsonSerializerOptions JsonOptions = new(JsonSerializerDefaults.Web);
+
+    /// <summary>
+    /// Maps the upstream API's routes
+    /// </summary>
+    protected abstract void MapRoutes(IEndpointRouteBuilder endpoints);
+
+    public async Task StartAsync(CancellationToken cancellationToken = default)
+    {
+        var builder = WebApplication.CreateSlimBuilder();
+        builder.Logging.ClearProviders();
+        builder.WebHost.UseUrls($"http://127.0.0.1:{_options.Port}");
+
+        _app = builder.Build();
+        _app.Use(InjectFaultsAsync);
+        MapRoutes(_app);
+
+        await _app.StartAsync(cancellationToken);
+
+        var addresses = _app.Services.GetRequiredService<IServer>().Features.Get<IServerAddressesFeature>()!;
+        BaseUrl = addresses.Addresses.First().TrimEnd('/');
+    }
+
+    public void ResetCounters()
+    {
+        RequestsByRoute.Clear();
+        Interlocked.Exchange(ref _maxInFlight, 0);
+        Interlocked.Exchange(ref _injectedErrors, 0);
+    }
+
+    private async Task InjectFaultsAsync(HttpContext context, RequestDelegate next)
+    {
+        var inFlight = Interlocked.Increment(ref _inFlight);
+        UpdateMax(inFlight);
+
+        try
+        {
+            // Route templates keep counts per endpoint instead of per wallet or hash
+            var route = (context.GetEndpoint() as RouteEndpoint)?.RoutePattern.RawText ?? context.Request.Path.Value ?? "/";
+            RequestsByRoute.AddOrUpdate($"{context.Request.Method} {route}", 1, (_, count) => count + 1);
+
+            double roll;
+            int jitter;
+            lock (_randomLock)
+            {
+                roll = _random.NextDouble();
+                jitter = _options.JitterMilliseconds > 0 ? _random.Next(_options.JitterMilliseconds + 1) : 0;
+            }
+
+            var delay = _options.LatencyMilliseconds + jitter;
+            if (delay > 0)
+            {
+                await Task.Delay(delay, context.RequestAborted);
+            }
+
+            if (roll < _options.ErrorRate)
+            {
+                Interlocked.Increment(ref _injectedErrors);
+                context.Response.StatusCode = StatusCodes.Status503ServiceUnavailable;
+                return;
+            }
+
+            if (roll < _options.ErrorRate + _options.ThrottleRate)
+            {
+                Interlocked.Increment(ref _injectedErrors);
+                context.Response.StatusCode = StatusCodes.Status429TooManyRequests;
+                context.Response.Headers.RetryAfter = "1";
+                return;
+            }
+
+            await next(context);
+        }
+        finally
+        {
+            Interlocked.Decrement(ref _inFlight);
+        }
+    }
+
+    private void UpdateMax(int inFlight)
+    {
+        var current = Volatile.Read(ref _maxInFlight);
+        while (inFlight > current)
+        {
+            var observed = Interlocked.CompareExchange(ref _maxInFlight, inFlight, current);
+            if (observed == current)
+                break;
+            current = observed;
+        }
+    }
+
+    public async ValueTask DisposeAsync()
+    {
+        if (_app != null)
+        {
+            await _app.StopAsync();
+            await _app.DisposeAsync();
+        }
+
+        GC.SuppressFinalize(this);
+    }
+}
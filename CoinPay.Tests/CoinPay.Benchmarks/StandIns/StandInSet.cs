@@ -0,0 +1,63 @@
+namespace CoinPay.Benchmarks.StandIns;
+
+/// <summary>
+/// The Circle, JSON-RPC (bundler and node), 1inch and WhiteBit stand-ins, started and measured together
+/// </summary>
+public sealed class StandInSet : IAsyncDisposable
+{
+    public StandInSet(StandInOptions options, int portBase)
+    {
+        int Port(int offset) => portBase == 0 ? 0 : portBase + offset;
+
+        Circle = new CircleStandIn(options.WithPort(Port(0)));
+        JsonRpc = new JsonRpcStandIn(options.WithPort(Port(1)));
+        OneInch = new OneInchStandIn(options.WithPort(Port(2)));
+        WhiteBit = new WhiteBitStandIn(options.WithPort(Port(3)));
+    }
+
+    public CircleStandIn Circle { get; }
+
+    public JsonRpcStandIn JsonRpc { get; }
+
+    public OneInchStandIn OneInch { get; }
+
+    public WhiteBitStandIn WhiteBit { get; }
+
+    public IEnumerable<StandInServer> All => new StandInServer[] { Circle, JsonRpc, OneInch, WhiteBit };
+
+    public int TotalRequests => All.Sum(s => s.TotalRequests);
+
+    public int MaxConcurrentRequests => All.Max(s => s.MaxConcurrentRequests);
+
+    public async Task StartAsync(CancellationToken cancellationToken = default)
+    {
+        foreach (var server in All)
+        {
+            await server.StartAsync(cancellationToken);
+        }
+    }
+
+    public void ResetCounters()
+    {
+        foreach (var server in All)
+        {
+            server.ResetCounters();
+        }
+    }
+
+    /// <summary>
+    /// Requests per stand-in and route since the last reset
+    /// </summary>
+    public Dictionary<string, int> RequestsByRoute() => All
+        .SelectMany(s => s.RequestsByRoute.Select(r => (Key: $"{s.Name} {r.Key}", r.Value)))
+        .OrderBy(r => r.Key, StringComparer.Ordinal)
+        .ToDictionary(r => r.Key, r => r.Value);
+
+    public async ValueTask DisposeAsync()
+    {
+        foreach (var server in All)
+        {
+            await server.DisposeAsync();
+        }
+    }
+}
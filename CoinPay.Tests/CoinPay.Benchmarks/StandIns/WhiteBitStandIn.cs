@@ -0,0 +1,39 @@
+using Microsoft.AspNetCore.Builder;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Routing;
+
+namespace CoinPay.Benchmarks.StandIns;
+
+/// <summary>
+/// Stand-in for the WhiteBit v4 private API. Only the endpoints <c>WhiteBitApiClient</c> actually calls are
+/// served; the investment endpoints are still answered locally by the client.
+/// </summary>
+public class WhiteBitStandIn : StandInServer
+{
+    public WhiteBitStandIn(StandInOptions options) : base(options)
+    {
+    }
+
+    public override string Name => "WhiteBit";
+
+    public Dictionary<string, decimal> Balances { get; } = new()
+    {
+        ["USDC"] = 10_000m
+    };
+
+    protected override void MapRoutes(IEndpointRouteBuilder endpoints)
+    {
+        endpoints.MapPost("/api/v4/main-account/balance", (HttpRequest request) =>
+        {
+            // Signed requests always carry all three headers
+            if (!request.Headers.ContainsKey("X-TXC-APIKEY") ||
+                !request.Headers.ContainsKey("X-TXC-PAYLOAD") ||
+                !request.Headers.ContainsKey("X-TXC-SIGNATURE"))
+            {
+                return Results.Unauthorized();
+            }
+
+            return Results.Json(new { balances = Balances }, JsonOptions);
+        });
+    }
+}
@@ -0,0 +1,70 @@
+/**
+ * K6 Throughput Test - Gateway read tier
+ *
+ * Test Scenario:
+ * - "hot": public GETs the gateway caches (USDC rate, a popular swap quote)
+ * - "spread": GETs with a unique query per request, so every request reaches an API replica
+ *   and exercises least-requests load balancing
+ *
+ * Both scenarios push a fixed arrival rate; compare http_reqs/s, latency percentiles and
+ * dropped_iterations between a run against one replica and a run against the gateway.
+ *
+ * Run: see README.md (docker compose --profile bench run k6)
+ */
+
+import http from 'k6/http';
+import { check } from 'k6';
+
+const BASE_URL = __ENV.BASE_URL || 'http://localhost:5000';
+const HOT_RATE = parseInt(__ENV.HOT_RATE || '2000');
+const SPREAD_RATE = parseInt(__ENV.SPREAD_RATE || '500');
+const DURATION = __ENV.DURATION || '1m';
+
+// WETH -> USDC on Polygon Amoy
+const SWAP_QUOTE_PATH = '/api/swap/quote?fromToken=0x360ad4f9a9A8EFe9A8DCB5f461c4Cc1047E1Dcf9'
+  + '&toToken=0x41E94Eb019C0762f9Bfcf9Fb1E58725BfB0e7582&amount=10&slippage=1';
+
+export const options = {
+  discardResponseBodies: true,
+  scenarios: {
+    hot: {
+      executor: 'constant-arrival-rate',
+      exec: 'hot',
+      rate: HOT_RATE,
+      timeUnit: '1s',
+      duration: DURATION,
+      preAllocatedVUs: 200,
+      maxVUs: 1000,
+    },
+    spread: {
+      executor: 'constant-arrival-rate',
+      exec: 'spread',
+      rate: SPREAD_RATE,
+      timeUnit: '1s',
+      duration: DURATION,
+      preAllocatedVUs: 100,
+      maxVUs: 500,
+    },
+  },
+  thresholds: {
+    'http_req_failed{scenario:hot}': ['rate<0.01'],
+    'http_req_failed{scenario:spread}': ['rate<0.01'],
+  },
+  summaryTrendStats: ['avg', 'med', 'p(95)', 'p(99)', 'max'],
+};
+
+const params = {
+  headers: { 'Accept-Encoding': 'br, gzip' },
+};
+
+export function hot() {
+  const path = Math.random() < 0.7 ? '/api/rates/usdc-usd' : SWAP_QUOTE_PATH;
+  const res = http.get(`${BASE_URL}${path}`, params);
+  check(res, { 'hot read ok': (r) => r.status === 200 });
+}
+
+export function spread() {
+  const usdAmount = (Math.random() * 10000 + 1).toFixed(2);
+  const res = http.get(`${BASE_URL}/api/rates/fees/calculate?usdAmount=${usdAmount}`, params);
+  check(res, { 'spread read ok': (r) => r.status === 200 });
+}
@@ -77,7 +77,9 @@ export interface InvestmentTransaction {
 
 export interface ProjectedRewards {
   daily: number;
+  weekly: number;
   monthly: number;
+  quarterly: number;
   yearly: number;
 }
 
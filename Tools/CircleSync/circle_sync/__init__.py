@@ -0,0 +1,5 @@
+"""Concurrent backfill/sync of Circle wallet transactions into the CoinPay database."""
+
+__all__ = ["__version__"]
+
+__version__ = "1.0.0"
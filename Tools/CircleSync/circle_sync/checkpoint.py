@@ -0,0 +1,80 @@
+"""Resumable per-wallet progress, stored as a small JSON file."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class WalletCheckpoint:
+    # Cursor of the next page to fetch; None means start from the first page
+    page_after: str | None = None
+    done: bool = False
+
+
+class CheckpointStore:
+    """Tracks how far each wallet has been written.
+
+    A wallet's cursor only moves after the rows from its pages have been committed,
+    so an interrupted run resumes without skipping anything. The file is keyed by the
+    run's ``since``; a checkpoint written for a different window is ignored.
+    """
+
+    def __init__(self, path: Path, since: datetime | None = None):
+        self._path = Path(path)
+        self._run_key = _run_key(since)
+        self._wallets: dict[str, WalletCheckpoint] = {}
+
+    def load(self) -> None:
+        if not self._path.exists():
+            return
+        raw = json.loads(self._path.read_text(encoding="utf-8"))
+        if raw.get("since") != self._run_key:
+            logger.info("Ignoring checkpoint written for --since %s", raw.get("since") or "(none)")
+            return
+        self._wallets = {
+            wallet_id: WalletCheckpoint(page_after=state.get("page_after"), done=bool(state.get("done")))
+            for wallet_id, state in raw.get("wallets", {}).items()
+        }
+
+    def reset(self) -> None:
+        self._wallets.clear()
+        if self._path.exists():
+            self._path.unlink()
+
+    def get(self, wallet_id: str) -> WalletCheckpoint:
+        return self._wallets.get(wallet_id) or WalletCheckpoint()
+
+    def advance(self, wallet_id: str, page_after: str) -> None:
+        self._wallets[wallet_id] = WalletCheckpoint(page_after=page_after)
+
+    def complete(self, wallet_id: str) -> None:
+        self._wallets[wallet_id] = WalletCheckpoint(done=True)
+
+    def save(self) -> None:
+        """Writes atomically so a crash never leaves a half-written checkpoint."""
+        payload = {
+            "since": self._run_key,
+            "wallets": {
+                wallet_id: {"page_after": state.page_after, "done": state.done}
+                for wallet_id, state in self._wallets.items()
+            }
+        }
+        temp_path = self._path.with_suffix(self._path.suffix + ".tmp")
+        temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(temp_path, self._path)
+
+
+def _run_key(since: datetime | None) -> str | None:
+    if since is None:
+        return None
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return since.astimezone(timezone.utc).isoformat()
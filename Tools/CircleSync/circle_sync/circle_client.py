@@ -0,0 +1,124 @@
+"""Rate-limited Circle API client over a pooled aiohttp session."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """Token bucket shared by all workers: ``rate`` requests per second, bursts up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int | None = None, clock=time.monotonic):
+        self._rate = rate
+        self._capacity = float(burst or max(1, int(rate)))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class CircleApiError(Exception):
+    def __init__(self, status: int, body: str):
+        super().__init__(f"Circle API request failed with status {status}: {body}")
+        self.status = status
+
+
+class CircleClient:
+    """Fetches wallet-transaction pages, retrying throttled and transient failures."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        api_url: str,
+        api_key: str,
+        rate_limiter: RateLimiter,
+        max_retries: int = 5,
+        retry_base_delay: float = 1.0,
+    ):
+        self._session = session
+        self._api_url = api_url.rstrip("/")
+        self._api_key = api_key
+        self._rate_limiter = rate_limiter
+        self._max_retries = max_retries
+        self._retry_base_delay = retry_base_delay
+
+    async def fetch_wallet_transactions(
+        self,
+        wallet_id: str,
+        page_after: str | None,
+        page_size: int,
+        since: datetime | None = None,
+    ) -> bytes:
+        """Returns the raw body of one /developer/wallets/{id}/transactions page."""
+        params = {"pageSize": str(page_size)}
+        if page_after:
+            params["pageAfter"] = page_after
+        if since:
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            params["from"] = since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        url = f"{self._api_url}/developer/wallets/{wallet_id}/transactions"
+
+        for attempt in range(self._max_retries + 1):
+            await self._rate_limiter.acquire()
+
+            headers = {
+                "Authorization": f"Bearer {self._api_key}",
+                "X-Correlation-Id": str(uuid.uuid4()),
+            }
+
+            try:
+                async with self._session.get(url, params=params, headers=headers) as response:
+                    if response.status == 200:
+                        return await response.read()
+
+                    body = await response.text()
+                    if response.status not in RETRYABLE_STATUSES or attempt == self._max_retries:
+                        raise CircleApiError(response.status, body)
+
+                    delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                    logger.warning(
+                        "Circle returned %s for wallet %s, retrying in %.1fs (attempt %d/%d)",
+                        response.status, wallet_id, delay, attempt + 1, self._max_retries)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as ex:
+                if attempt == self._max_retries:
+                    raise
+                delay = self._retry_delay(attempt, None)
+                logger.warning(
+                    "Circle request for wallet %s failed (%s), retrying in %.1fs", wallet_id, ex, delay)
+
+            await asyncio.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    def _retry_delay(self, attempt: int, retry_after: str | None) -> float:
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return self._retry_base_delay * (2 ** attempt)
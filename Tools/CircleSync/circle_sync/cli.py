@@ -0,0 +1,109 @@
+"""Command line entry point: python -m circle_sync"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .checkpoint import CheckpointStore
+from .sync import SyncOptions, run_sync
+
+logger = logging.getLogger("circle_sync")
+
+
+def parse_since(value: str) -> datetime:
+    """ISO timestamp; one without an offset is taken as UTC, not local time."""
+    since = datetime.fromisoformat(value)
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return since
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="circle_sync",
+        description="Backfill Circle transaction status, tx hash and completion time into CoinPay's Transactions table.",
+    )
+    parser.add_argument("--connection-string", default=os.environ.get("COINPAY_DB_CONNECTION"),
+                        help="postgres:// URL or Host=...;Database=... (env: COINPAY_DB_CONNECTION)")
+    parser.add_argument("--api-url", default=os.environ.get("CIRCLE_API_URL", "https://api.circle.com/v1/w3s"),
+                        help="Circle API base URL (env: CIRCLE_API_URL)")
+    parser.add_argument("--api-key", default=os.environ.get("CIRCLE_API_KEY"),
+                        help="Circle API key (env: CIRCLE_API_KEY)")
+    parser.add_argument("--wallet", action="append", dest="wallets",
+                        help="Sync only this Circle wallet ID (repeatable); default is every wallet in the database")
+    parser.add_argument("--since", type=parse_since,
+                        help="Only fetch transactions created at or after this ISO timestamp (UTC if no offset)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Wallets paged in parallel (default: 8)")
+    parser.add_argument("--rate-limit", type=float, default=10.0, help="Circle requests per second (default: 10)")
+    parser.add_argument("--page-size", type=int, default=50, help="Transactions per Circle page (default: 50)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Transactions per database batch (default: 1000)")
+    parser.add_argument("--checkpoint", type=Path, default=Path(".circle-sync-checkpoint.json"),
+                        help="Checkpoint file for resuming (default: .circle-sync-checkpoint.json)")
+    parser.add_argument("--reset", action="store_true", help="Ignore and delete the existing checkpoint")
+    parser.add_argument("--verbose", action="store_true", help="Debug logging")
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> int:
+    import aiohttp
+
+    from .circle_client import CircleClient, RateLimiter
+    from .store import PostgresTransactionStore
+
+    checkpoints = CheckpointStore(args.checkpoint, args.since)
+    if args.reset:
+        checkpoints.reset()
+    else:
+        checkpoints.load()
+
+    store = await PostgresTransactionStore.connect(args.connection_string)
+    try:
+        wallet_ids = args.wallets or await store.load_wallet_ids()
+        logger.info("Syncing %d Circle wallets", len(wallet_ids))
+
+        connector = aiohttp.TCPConnector(limit=args.concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            client = CircleClient(session, args.api_url, args.api_key, RateLimiter(args.rate_limit))
+            options = SyncOptions(
+                concurrency=args.concurrency,
+                page_size=args.page_size,
+                batch_size=args.batch_size,
+                since=args.since,
+            )
+
+            started = time.monotonic()
+            stats = await run_sync(client, store, checkpoints, wallet_ids, options)
+    finally:
+        await store.close()
+
+    logger.info(
+        "Done in %.1fs: %d wallets, %d pages, %d transactions read, %d rows updated, %d wallets failed",
+        time.monotonic() - started, stats.wallets, stats.pages, stats.transactions, stats.updated,
+        len(stats.failed_wallets))
+
+    # Failed wallets keep their checkpoint; rerun to resume them
+    return 1 if stats.failed_wallets else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    if not args.connection_string:
+        logger.error("A database connection string is required (--connection-string or COINPAY_DB_CONNECTION)")
+        return 2
+    if not args.api_key:
+        logger.error("A Circle API key is required (--api-key or CIRCLE_API_KEY)")
+        return 2
+
+    return asyncio.run(_run(args))
@@ -0,0 +1,74 @@
+"""Parsing of Circle wallet-transaction pages into status updates."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+# Same mapping as CircleTransactionMonitoringService / CircleWebhookHandler
+_STATUS_BY_STATE = {
+    "CONFIRMED": "Completed",
+    "COMPLETE": "Completed",
+    "FAILED": "Failed",
+    "CANCELLED": "Failed",
+    "DENIED": "Failed",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionUpdate:
+    """Status of one Circle transaction, keyed by Circle transaction ID."""
+
+    circle_transaction_id: str
+    status: str
+    tx_hash: str | None
+    completed_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedPage:
+    updates: list[TransactionUpdate]
+    next_page_after: str | None
+
+
+def map_status(state: str | None) -> str:
+    return _STATUS_BY_STATE.get((state or "").upper(), "Pending")
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    # Circle returns RFC 3339 with a trailing Z
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def parse_page(body: bytes, page_size: int) -> ParsedPage:
+    """Parses a { "data": { "transactions": [...] } } page.
+
+    Only the fields the sync writes are read. A full page means there may be more;
+    Circle pages forward from the last returned ID.
+    """
+    document = json.loads(body)
+    items = (document.get("data") or {}).get("transactions") or []
+
+    updates = []
+    last_id = None
+    for item in items:
+        circle_id = item.get("id")
+        if not circle_id:
+            continue
+        last_id = circle_id
+
+        status = map_status(item.get("state"))
+        updates.append(
+            TransactionUpdate(
+                circle_transaction_id=circle_id,
+                status=status,
+                tx_hash=item.get("txHash") or None,
+                completed_at=_parse_timestamp(item.get("updateDate")) if status != "Pending" else None,
+            )
+        )
+
+    next_page_after = last_id if len(items) >= page_size else None
+    return ParsedPage(updates=updates, next_page_after=next_page_after)
@@ -0,0 +1,115 @@
+"""PostgreSQL access: wallet discovery and COPY-based bulk status updates."""
+
+from __future__ import annotations
+
+from typing import Iterable, Protocol
+
+from .parser import TransactionUpdate
+
+# ADO.NET keys used in appsettings ConnectionStrings -> asyncpg.connect arguments
+_CONNECTION_STRING_KEYS = {
+    "host": "host",
+    "server": "host",
+    "port": "port",
+    "database": "database",
+    "username": "user",
+    "user id": "user",
+    "userid": "user",
+    "password": "password",
+}
+
+_CREATE_STAGING_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS circle_sync_staging (
+    circle_transaction_id text PRIMARY KEY,
+    status text NOT NULL,
+    tx_hash text,
+    completed_at timestamptz
+) ON COMMIT DELETE ROWS
+"""
+
+# Final states are never moved back, matching CircleWebhookHandler
+_APPLY_UPDATES_SQL = """
+UPDATE "Transactions" AS t
+SET "Status" = CASE WHEN t."Status" = 'Pending' THEN s.status ELSE t."Status" END,
+    "TxHash" = COALESCE(s.tx_hash, t."TxHash"),
+    "CompletedAt" = CASE
+        WHEN t."Status" = 'Pending' AND s.status <> 'Pending' THEN COALESCE(s.completed_at, now())
+        ELSE t."CompletedAt"
+    END
+FROM circle_sync_staging AS s
+WHERE t."TransactionId" = s.circle_transaction_id
+  AND ((t."Status" = 'Pending' AND s.status <> 'Pending')
+       OR (s.tx_hash IS NOT NULL AND t."TxHash" IS DISTINCT FROM s.tx_hash))
+"""
+
+_WALLET_IDS_SQL = """
+SELECT DISTINCT "CircleWalletId"
+FROM "Wallets"
+WHERE "CircleWalletId" IS NOT NULL AND "CircleWalletId" <> ''
+ORDER BY "CircleWalletId"
+"""
+
+
+class TransactionStore(Protocol):
+    async def load_wallet_ids(self) -> list[str]: ...
+
+    async def apply_updates(self, updates: Iterable[TransactionUpdate]) -> int: ...
+
+
+def parse_connection_string(value: str) -> dict:
+    """Accepts a postgres:// URL or the Host=...;Port=...; form used in appsettings."""
+    if value.startswith(("postgres://", "postgresql://")):
+        return {"dsn": value}
+
+    kwargs = {}
+    for part in value.split(";"):
+        if "=" not in part:
+            continue
+        key, _, raw = part.partition("=")
+        mapped = _CONNECTION_STRING_KEYS.get(key.strip().lower())
+        if mapped:
+            kwargs[mapped] = int(raw) if mapped == "port" else raw.strip()
+    return kwargs
+
+
+class PostgresTransactionStore:
+    """Writes status updates by COPYing them into a temp staging table and joining once."""
+
+    def __init__(self, pool):
+        self._pool = pool
+
+    @classmethod
+    async def connect(cls, connection_string: str, max_connections: int = 4) -> "PostgresTransactionStore":
+        import asyncpg
+
+        pool = await asyncpg.create_pool(min_size=1, max_size=max_connections, **parse_connection_string(connection_string))
+        return cls(pool)
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+    async def load_wallet_ids(self) -> list[str]:
+        async with self._pool.acquire() as connection:
+            rows = await connection.fetch(_WALLET_IDS_SQL)
+        return [row[0] for row in rows]
+
+    async def apply_updates(self, updates: Iterable[TransactionUpdate]) -> int:
+        # The same transaction can appear on two pages; the latest page wins
+        latest = {u.circle_transaction_id: u for u in updates}
+        if not latest:
+            return 0
+
+        records = [(u.circle_transaction_id, u.status, u.tx_hash, u.completed_at) for u in latest.values()]
+
+        async with self._pool.acquire() as connection:
+            async with connection.transaction():
+                await connection.execute(_CREATE_STAGING_SQL)
+                await connection.copy_records_to_table(
+                    "circle_sync_staging",
+                    records=records,
+                    columns=["circle_transaction_id", "status", "tx_hash", "completed_at"],
+                )
+                result = await connection.execute(_APPLY_UPDATES_SQL)
+
+        # asyncpg returns the command tag, e.g. "UPDATE 42"
+        return int(result.split()[-1])
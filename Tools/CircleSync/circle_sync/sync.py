@@ -0,0 +1,168 @@
+"""Concurrent wallet paging with a single batching writer."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .checkpoint import CheckpointStore
+from .parser import ParsedPage, TransactionUpdate, parse_page
+from .store import TransactionStore
+
+if TYPE_CHECKING:
+    from .circle_client import CircleClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SyncOptions:
+    concurrency: int = 8
+    page_size: int = 50
+    batch_size: int = 1000
+    since: datetime | None = None
+
+
+@dataclass(slots=True)
+class SyncStats:
+    wallets: int = 0
+    pages: int = 0
+    transactions: int = 0
+    updated: int = 0
+    failed_wallets: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _WalletPage:
+    wallet_id: str
+    page: ParsedPage
+
+
+async def run_sync(
+    client: CircleClient,
+    store: TransactionStore,
+    checkpoints: CheckpointStore,
+    wallet_ids: list[str],
+    options: SyncOptions,
+) -> SyncStats:
+    """Pages every wallet concurrently and streams parsed pages to one writer.
+
+    Workers take wallets from a shared queue and fetch each wallet's pages in order.
+    The writer groups updates into batches of ``batch_size`` and advances the
+    checkpoint of every page in a batch only after the batch is committed.
+    The checkpoint is cleared once every wallet has been synced.
+    """
+    stats = SyncStats()
+    wallet_queue: asyncio.Queue[str] = asyncio.Queue()
+    for wallet_id in wallet_ids:
+        if not checkpoints.get(wallet_id).done:
+            wallet_queue.put_nowait(wallet_id)
+    stats.wallets = wallet_queue.qsize()
+
+    # Bounded so fetchers slow down when the database falls behind
+    page_queue: asyncio.Queue[_WalletPage | None] = asyncio.Queue(maxsize=options.concurrency * 4)
+
+    writer = asyncio.create_task(_write_pages(page_queue, store, checkpoints, options, stats))
+    workers = [
+        asyncio.create_task(_fetch_wallets(wallet_queue, page_queue, client, checkpoints, options, stats))
+        for _ in range(max(1, options.concurrency))
+    ]
+
+    fetching = asyncio.gather(*workers)
+    try:
+        # A failed write stops the run; otherwise wait for every wallet to be paged
+        await asyncio.wait({fetching, writer}, return_when=asyncio.FIRST_COMPLETED)
+        if writer.done():
+            writer.result()
+        await fetching
+        await page_queue.put(None)
+        await writer
+    except BaseException:
+        for task in (*workers, writer):
+            task.cancel()
+        await asyncio.gather(*workers, writer, return_exceptions=True)
+        raise
+
+    # Nothing left to resume; the next run starts from the first page again
+    if not stats.failed_wallets:
+        checkpoints.reset()
+
+    return stats
+
+
+async def _fetch_wallets(
+    wallet_queue: asyncio.Queue[str],
+    page_queue: asyncio.Queue[_WalletPage | None],
+    client: CircleClient,
+    checkpoints: CheckpointStore,
+    options: SyncOptions,
+    stats: SyncStats,
+) -> None:
+    while True:
+        try:
+            wallet_id = wallet_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+
+        page_after = checkpoints.get(wallet_id).page_after
+        try:
+            while True:
+                body = await client.fetch_wallet_transactions(wallet_id, page_after, options.page_size, options.since)
+                page = parse_page(body, options.page_size)
+                stats.pages += 1
+                stats.transactions += len(page.updates)
+
+                await page_queue.put(_WalletPage(wallet_id, page))
+
+                if page.next_page_after is None:
+                    break
+                page_after = page.next_page_after
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The wallet resumes from its last committed page on the next run
+            logger.exception("Failed to sync wallet %s", wallet_id)
+            stats.failed_wallets.append(wallet_id)
+
+
+async def _write_pages(
+    page_queue: asyncio.Queue[_WalletPage | None],
+    store: TransactionStore,
+    checkpoints: CheckpointStore,
+    options: SyncOptions,
+    stats: SyncStats,
+) -> None:
+    pending_pages: list[_WalletPage] = []
+    pending_updates: list[TransactionUpdate] = []
+
+    async def flush() -> None:
+        if not pending_pages:
+            return
+
+        stats.updated += await store.apply_updates(pending_updates)
+
+        for item in pending_pages:
+            if item.page.next_page_after is None:
+                checkpoints.complete(item.wallet_id)
+            else:
+                checkpoints.advance(item.wallet_id, item.page.next_page_after)
+        checkpoints.save()
+
+        logger.info("Wrote %d transactions from %d pages", len(pending_updates), len(pending_pages))
+        pending_pages.clear()
+        pending_updates.clear()
+
+    while True:
+        item = await page_queue.get()
+        if item is None:
+            await flush()
+            return
+
+        pending_pages.append(item)
+        pending_updates.extend(item.page.updates)
+
+        if len(pending_updates) >= options.batch_size:
+            await flush()
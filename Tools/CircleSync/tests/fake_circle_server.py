@@ -0,0 +1,86 @@
+"""Local stand-in for Circle's wallet-transaction listing, for tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+
+from aiohttp import web
+
+
+class FakeCircleServer:
+    """Serves /developer/wallets/{id}/transactions with Circle's paging semantics.
+
+    ``throttle_first`` makes the first N requests per wallet answer 429 with Retry-After,
+    so clients must retry. ``latency`` holds each page response open for that many
+    seconds, so requests from concurrent workers overlap.
+    """
+
+    def __init__(self, transactions_by_wallet: dict[str, list[dict]], api_key: str = "test-key", throttle_first: int = 0,
+                 latency: float = 0.005):
+        self.transactions_by_wallet = transactions_by_wallet
+        self.api_key = api_key
+        self.throttle_first = throttle_first
+        self.latency = latency
+        self.requests_by_wallet: dict[str, int] = defaultdict(int)
+        self.max_concurrent = 0
+        self._in_flight = 0
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests_by_wallet.values())
+
+    async def __aenter__(self) -> "FakeCircleServer":
+        app = web.Application()
+        app.router.add_get("/v1/w3s/developer/wallets/{wallet_id}/transactions", self._list_transactions)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/v1/w3s"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._runner.cleanup()
+
+    async def _list_transactions(self, request: web.Request) -> web.Response:
+        if request.headers.get("Authorization") != f"Bearer {self.api_key}":
+            return web.json_response({"code": 401, "message": "Invalid credentials."}, status=401)
+
+        wallet_id = request.match_info["wallet_id"]
+        self.requests_by_wallet[wallet_id] += 1
+
+        if self.requests_by_wallet[wallet_id] <= self.throttle_first:
+            return web.json_response({"code": 429, "message": "Too many requests."}, status=429,
+                                     headers={"Retry-After": "0"})
+
+        self._in_flight += 1
+        self.max_concurrent = max(self.max_concurrent, self._in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            transactions = self.transactions_by_wallet.get(wallet_id, [])
+            page_size = int(request.query.get("pageSize", "10"))
+            page_after = request.query.get("pageAfter")
+
+            start = 0
+            if page_after:
+                start = next(i for i, t in enumerate(transactions) if t["id"] == page_after) + 1
+
+            return web.json_response({"data": {"transactions": transactions[start:start + page_size]}})
+        finally:
+            self._in_flight -= 1
+
+
+def make_transaction(transaction_id: str, state: str = "COMPLETE", tx_hash: str | None = "0xhash") -> dict:
+    return {
+        "id": transaction_id,
+        "state": state,
+        "txHash": tx_hash,
+        "blockchain": "MATIC-AMOY",
+        "amounts": ["1.0"],
+        "createDate": "2025-11-01T10:00:00Z",
+        "updateDate": "2025-11-01T10:01:00Z",
+    }
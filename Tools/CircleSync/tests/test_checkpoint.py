@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+
+from circle_sync.checkpoint import CheckpointStore
+from circle_sync.cli import build_parser
+
+
+def test_checkpoint_round_trips_through_file(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    store = CheckpointStore(path)
+    store.advance("wallet-1", "tx-50")
+    store.complete("wallet-2")
+    store.save()
+
+    reloaded = CheckpointStore(path)
+    reloaded.load()
+
+    assert reloaded.get("wallet-1").page_after == "tx-50"
+    assert not reloaded.get("wallet-1").done
+    assert reloaded.get("wallet-2").done
+    assert reloaded.get("wallet-3").page_after is None
+    assert not (tmp_path / "checkpoint.json.tmp").exists()
+
+
+def test_reset_deletes_checkpoint(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    store = CheckpointStore(path)
+    store.complete("wallet-1")
+    store.save()
+
+    store.reset()
+
+    assert not path.exists()
+    assert not store.get("wallet-1").done
+
+
+def test_checkpoint_for_another_since_is_ignored(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    store = CheckpointStore(path, since=datetime(2025, 11, 1, tzinfo=timezone.utc))
+    store.complete("wallet-1")
+    store.save()
+
+    same_window = CheckpointStore(path, since=datetime(2025, 11, 1))
+    same_window.load()
+    other_window = CheckpointStore(path, since=datetime(2025, 12, 1, tzinfo=timezone.utc))
+    other_window.load()
+    full_history = CheckpointStore(path)
+    full_history.load()
+
+    assert same_window.get("wallet-1").done
+    assert not other_window.get("wallet-1").done
+    assert not full_history.get("wallet-1").done
+
+
+def test_since_without_offset_is_utc():
+    args = build_parser().parse_args(["--since", "2025-11-01T00:00:00"])
+
+    assert args.since == datetime(2025, 11, 1, tzinfo=timezone.utc)
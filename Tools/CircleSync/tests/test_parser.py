@@ -0,0 +1,43 @@
+import json
+from datetime import datetime, timezone
+
+from circle_sync.parser import map_status, parse_page
+
+
+def _body(transactions):
+    return json.dumps({"data": {"transactions": transactions}}).encode()
+
+
+def test_parse_page_maps_states_and_reads_only_needed_fields():
+    page = parse_page(_body([
+        {"id": "a", "state": "COMPLETE", "txHash": "0x1", "updateDate": "2025-11-01T10:01:00Z", "amounts": ["5"]},
+        {"id": "b", "state": "DENIED", "txHash": None, "updateDate": "2025-11-01T10:02:00Z"},
+        {"id": "c", "state": "QUEUED", "updateDate": "2025-11-01T10:03:00Z"},
+    ]), page_size=50)
+
+    assert [(u.circle_transaction_id, u.status, u.tx_hash) for u in page.updates] == [
+        ("a", "Completed", "0x1"),
+        ("b", "Failed", None),
+        ("c", "Pending", None),
+    ]
+    assert page.updates[0].completed_at == datetime(2025, 11, 1, 10, 1, tzinfo=timezone.utc)
+    assert page.updates[2].completed_at is None
+    assert page.next_page_after is None
+
+
+def test_parse_page_returns_cursor_when_page_is_full():
+    page = parse_page(_body([{"id": "a", "state": "COMPLETE"}, {"id": "b", "state": "SENT"}]), page_size=2)
+
+    assert page.next_page_after == "b"
+
+
+def test_parse_page_tolerates_missing_data():
+    page = parse_page(b'{"data": {}}', page_size=50)
+
+    assert page.updates == []
+    assert page.next_page_after is None
+
+
+def test_map_status_is_case_insensitive():
+    assert map_status("confirmed") == "Completed"
+    assert map_status(None) == "Pending"
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from circle_sync.checkpoint import CheckpointStore  # noqa: E402
+from circle_sync.circle_client import CircleClient, RateLimiter  # noqa: E402
+from circle_sync.sync import SyncOptions, run_sync  # noqa: E402
+from fake_circle_server import FakeCircleServer, make_transaction  # noqa: E402
+
+
+class InMemoryTransactionStore:
+    """Records applied updates instead of writing to PostgreSQL."""
+
+    def __init__(self, fail_after_batches=None):
+        self.updates = {}
+        self.batches = 0
+        self._fail_after_batches = fail_after_batches
+
+    async def load_wallet_ids(self):
+        return []
+
+    async def apply_updates(self, updates):
+        if self._fail_after_batches is not None and self.batches >= self._fail_after_batches:
+            raise RuntimeError("database unavailable")
+        self.batches += 1
+        for update in updates:
+            self.updates[update.circle_transaction_id] = update
+        return len(updates)
+
+
+def _wallets(count, per_wallet):
+    return {
+        f"wallet-{w}": [make_transaction(f"w{w}-tx-{i}") for i in range(per_wallet)]
+        for w in range(count)
+    }
+
+
+async def _sync(server, store, checkpoints, wallet_ids, **options):
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=8)) as session:
+        client = CircleClient(session, server.url, "test-key", RateLimiter(rate=1000, burst=100), retry_base_delay=0)
+        return await run_sync(client, store, checkpoints, wallet_ids, SyncOptions(**options))
+
+
+def test_sync_pages_all_wallets_concurrently(tmp_path):
+    async def scenario():
+        wallets = _wallets(count=20, per_wallet=25)
+        async with FakeCircleServer(wallets) as server:
+            store = InMemoryTransactionStore()
+            stats = await _sync(server, store, CheckpointStore(tmp_path / "cp.json"), list(wallets),
+                                concurrency=8, page_size=10, batch_size=100)
+            return server, store, stats
+
+    server, store, stats = asyncio.run(scenario())
+
+    assert len(store.updates) == 20 * 25
+    assert stats.pages == 20 * 3
+    assert stats.failed_wallets == []
+    assert server.max_concurrent > 1
+    assert store.batches < stats.pages
+
+
+def test_sync_retries_throttled_requests(tmp_path):
+    async def scenario():
+        wallets = _wallets(count=3, per_wallet=5)
+        async with FakeCircleServer(wallets, throttle_first=2) as server:
+            store = InMemoryTransactionStore()
+            stats = await _sync(server, store, CheckpointStore(tmp_path / "cp.json"), list(wallets),
+                                concurrency=3, page_size=10, batch_size=100)
+            return store, stats
+
+    store, stats = asyncio.run(scenario())
+
+    assert len(store.updates) == 15
+    assert stats.failed_wallets == []
+
+
+def test_sync_resumes_from_checkpoint_after_write_failure(tmp_path):
+    checkpoint_path = tmp_path / "cp.json"
+    wallets = _wallets(count=1, per_wallet=30)
+
+    async def first_run():
+        async with FakeCircleServer(wallets) as server:
+            store = InMemoryTransactionStore(fail_after_batches=1)
+            with pytest.raises(RuntimeError):
+                await _sync(server, store, CheckpointStore(checkpoint_path), list(wallets),
+                            concurrency=1, page_size=10, batch_size=10)
+
+    async def second_run():
+        checkpoints = CheckpointStore(checkpoint_path)
+        checkpoints.load()
+        async with FakeCircleServer(wallets) as server:
+            store = InMemoryTransactionStore()
+            await _sync(server, store, checkpoints, list(wallets), concurrency=1, page_size=10, batch_size=10)
+            return server, store, checkpoints
+
+    asyncio.run(first_run())
+    server, store, checkpoints = asyncio.run(second_run())
+
+    # The first page was committed before the failure, so the rerun starts at page two
+    assert sorted(store.updates) == sorted(f"w0-tx-{i}" for i in range(10, 30))
+    assert server.total_requests == 3
+    assert not checkpoint_path.exists()
+    assert not checkpoints.get("wallet-0").done
+
+
+def test_sync_after_completed_run_fetches_every_wallet_again(tmp_path):
+    checkpoint_path = tmp_path / "cp.json"
+    wallets = _wallets(count=2, per_wallet=15)
+
+    async def run():
+        checkpoints = CheckpointStore(checkpoint_path)
+        checkpoints.load()
+        async with FakeCircleServer(wallets) as server:
+            store = InMemoryTransactionStore()
+            stats = await _sync(server, store, checkpoints, list(wallets), concurrency=2, page_size=10, batch_size=10)
+            return server, store, stats
+
+    asyncio.run(run())
+    server, store, stats = asyncio.run(run())
+
+    # A finished run leaves nothing marked done, so the next run is a full sync
+    assert stats.wallets == 2
+    assert len(store.updates) == 30
+    assert server.total_requests == 4